@@ -35,7 +35,7 @@ logger = logging.getLogger(__name__)
 
 try:
     from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
-    from fastapi.responses import HTMLResponse, JSONResponse
+    from fastapi.responses import HTMLResponse, JSONResponse, Response
     from fastapi.staticfiles import StaticFiles
     from fastapi.templating import Jinja2Templates
     from fastapi.middleware.cors import CORSMiddleware
@@ -138,6 +138,9 @@ except ImportError as e:
         def __init__(self):
             pass
 
+from dart_planner.communication.telemetry_block import TelemetryHistory
+from dart_planner.communication.telemetry_broadcast import TelemetryBroadcaster
+
 # --- Demo Configuration ---
 DEMO_SCENARIOS = {
     "obstacle_avoidance": {
@@ -204,6 +207,7 @@ class DemoState:
         }
         self.start_time = None
         self.connected_clients = set()
+        self.history = TelemetryHistory(capacity=30000)
         
     def reset(self):
         self.is_running = False
@@ -277,20 +281,31 @@ templates = Jinja2Templates(directory=str(templates_dir))
 
 # --- WebSocket Connection Manager ---
 class ConnectionManager:
+    """Tracks dashboard clients; fan-out goes through a TelemetryBroadcaster so
+    each message is encoded once and a slow browser cannot stall the others."""
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[str, WebSocket] = {}
+        self.broadcaster = TelemetryBroadcaster(queue_size=8, on_client_removed=self._forget)
+        
+    def _forget(self, client_id: str):
+        # Client dropped by the broadcaster after a failed send
+        self.active_connections.pop(client_id, None)
+        demo_state.connected_clients.discard(client_id)
+        logger.info(f"Client {client_id} dropped. Total connections: {len(self.active_connections)}")
         
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
         client_id = str(uuid.uuid4())
+        self.active_connections[client_id] = websocket
+        self.broadcaster.add_client(client_id, websocket)
         demo_state.connected_clients.add(client_id)
         logger.info(f"Client {client_id} connected. Total connections: {len(self.active_connections)}")
         return client_id
         
-    def disconnect(self, websocket: WebSocket, client_id: str):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+    async def disconnect(self, websocket: WebSocket, client_id: str):
+        self.active_connections.pop(client_id, None)
+        await self.broadcaster.remove_client(client_id)
         demo_state.connected_clients.discard(client_id)
         logger.info(f"Client {client_id} disconnected. Total connections: {len(self.active_connections)}")
         
@@ -298,19 +313,11 @@ class ConnectionManager:
         await websocket.send_text(message)
         
     async def broadcast(self, message: dict):
-        message_str = json.dumps(message)
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_str)
-            except Exception as e:
-                logger.error(f"Error sending message to client: {e}")
-                disconnected.append(connection)
-        
-        # Remove disconnected clients
-        for connection in disconnected:
-            if connection in self.active_connections:
-                self.active_connections.remove(connection)
+        # Encodes once and only queues; per-client sender tasks do the I/O
+        self.broadcaster.broadcast_raw(message)
+
+    def get_client_metrics(self) -> Dict[str, Dict]:
+        return self.broadcaster.get_client_metrics()
 
 manager = ConnectionManager()
 
@@ -369,6 +376,11 @@ async def simulate_autonomous_flight(scenario_name: str):
         # Update drone state
         demo_state.drone_state.position = current_pos.tolist()
         demo_state.trajectory.append(current_pos.tolist())
+        demo_state.history.append({
+            "timestamp": time.time(),
+            "position": current_pos,
+            "velocity": velocity if distance > 0.5 else [0.0, 0.0, 0.0],
+        })
         
         # Update performance metrics
         demo_state.performance_metrics.update({
@@ -429,6 +441,7 @@ async def get_status():
         "is_running": demo_state.is_running,
         "current_scenario": demo_state.current_scenario,
         "connected_clients": len(demo_state.connected_clients),
+        "client_send_metrics": manager.get_client_metrics(),
         "performance_metrics": demo_state.performance_metrics,
         "dart_planner_available": DART_PLANNER_AVAILABLE
     }
@@ -464,6 +477,12 @@ async def stop_demo():
     
     return {"message": "Demo stopped"}
 
+@app.get("/api/telemetry/history")
+async def get_telemetry_history(start: float = 0.0, end: float = float("inf")):
+    """Telemetry between two timestamps as one columnar block (bulk transfer)"""
+    block = demo_state.history.query(start, end)
+    return Response(content=block.encode(), media_type="application/octet-stream")
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
@@ -509,7 +528,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 break
                 
     finally:
-        manager.disconnect(websocket, client_id)
+        await manager.disconnect(websocket, client_id)
 
 # --- Main Application Entry Point ---
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark configuration loading with and without compiled snapshots.
+
+Loads a YAML configuration through a fresh ConfigurationManager (parse,
+environment overrides, full Pydantic validation), through the snapshot
+cache keyed by the same sources, and from an exported worker snapshot,
+then compares nested attribute reads with flat snapshot lookups.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+os.environ.setdefault("DART_JWT_SECRET_KEY", "benchmark_secret_key_that_is_long_enough")
+
+from dart_planner.config.frozen_config import (
+    ConfigurationManager,
+    DARTPlannerFrozenConfig,
+    read_snapshot_file,
+)
+
+
+def per_call_us(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--config", help="YAML/JSON config file (default: a dump of the defaults)")
+    parser.add_argument("--loads", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = args.config
+        if config_path is None:
+            import yaml
+            data = DARTPlannerFrozenConfig().model_dump(mode="json", exclude={"custom_settings"})
+            config_path = os.path.join(tmp, "dart.yaml")
+            with open(config_path, "w", encoding="utf-8") as f:
+                yaml.safe_dump(data, f)
+        cache_dir = os.path.join(tmp, "cache")
+        manager = ConfigurationManager(config_path, cache_dir=cache_dir)
+        worker_path = manager.export_snapshot(os.path.join(tmp, "worker.pickle"))
+        snapshot = manager.get_snapshot()
+        config = snapshot.config
+
+        print(f"{'case':>28} {'us/op':>10}")
+        rows = [
+            ("load + validate", lambda: ConfigurationManager(config_path, cache_dir="").load_config(), args.loads),
+            ("load from snapshot cache", lambda: ConfigurationManager(config_path, cache_dir=cache_dir).load_config(), args.loads),
+            ("load worker snapshot", lambda: read_snapshot_file(worker_path), args.loads),
+            ("nested attribute read", lambda: config.communication.heartbeat_interval_ms, args.reads),
+            ("flat snapshot read", lambda: snapshot["communication.heartbeat_interval_ms"], args.reads),
+        ]
+        for label, func, calls in rows:
+            print(f"{label:>28} {per_call_us(func, calls):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark DIContainerV2.resolve for already-built dependencies.
+
+Resolves a finalized singleton and a factory in a tight loop through the
+full locked path (lock, cycle tracking, lifecycle update; what every
+resolve did before resolution plans) and through ``resolve`` on the
+compiled plan. Optionally repeats the singleton case from several threads
+to show lock contention.
+"""
+
+import argparse
+import logging
+import threading
+import time
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dart_planner.common.di_container_v2 import ContainerConfig, DIContainerV2
+
+
+class Service:
+    pass
+
+
+class Message:
+    pass
+
+
+def per_call_ns(func, calls: int, threads: int = 1) -> float:
+    def worker():
+        for _ in range(calls):
+            func()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter_ns()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return (time.perf_counter_ns() - start) / (calls * threads)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+    logging.getLogger("dart_planner").setLevel(logging.WARNING)
+
+    container = DIContainerV2(ContainerConfig())
+    container.register_singleton(Service, Service)
+    container.register_factory(Message, Message)
+    container.finalize()
+    container.resolve(Service)
+    container.resolve(Message)
+
+    cases = [
+        ("singleton, locked path", lambda: per_call_ns(lambda: container._resolve_locked(Service), args.calls)),
+        ("singleton, plan", lambda: per_call_ns(lambda: container.resolve(Service), args.calls)),
+        ("factory, locked path", lambda: per_call_ns(lambda: container._resolve_locked(Message), args.calls)),
+        ("factory, plan", lambda: per_call_ns(lambda: container.resolve(Message), args.calls)),
+        (f"singleton, locked, {args.threads} threads",
+         lambda: per_call_ns(lambda: container._resolve_locked(Service), args.calls, args.threads)),
+        (f"singleton, plan, {args.threads} threads",
+         lambda: per_call_ns(lambda: container.resolve(Service), args.calls, args.threads)),
+    ]
+    print(f"{'case':>34} {'ns/resolve':>11}")
+    for label, run in cases:
+        print(f"{label:>34} {run():>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
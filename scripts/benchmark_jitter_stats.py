@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cost of scheduler jitter monitoring.
+
+Compares, per simulated second of N tasks at a given rate:
+- recompute: appending to per-task deques and rebuilding mean/std/min/max
+  and a 20-bin ``np.histogram`` from every deque once per second (the
+  previous QuarticScheduler monitoring loop)
+- sketch: recording into windowed quantile sketches, plus one p50/p99/p99.9
+  query per task per second
+- batched: appending to the per-task deques only and folding them into
+  the sketches whenever half a deque has filled (QuarticScheduler's
+  dispatch path), plus the same query
+Reports CPU milliseconds per simulated second (lower is better) and the
+memory held by one task's sketch after the run.
+"""
+
+import argparse
+import itertools
+import time
+from collections import deque
+
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dart_planner.common.streaming_stats import WindowedQuantileSketch
+
+
+def _samples(rate_hz: int) -> list:
+    return [float(v) for v in np.random.default_rng(0).normal(0.05, 0.02, rate_hz)]
+
+
+def recompute(task_count: int, rate_hz: int, seconds: int) -> float:
+    samples = _samples(rate_hz)
+    histories = [deque(maxlen=1000) for _ in range(task_count)]
+    start = time.perf_counter()
+    for second in range(seconds):
+        times = [second + i / rate_hz for i in range(rate_hz)]
+        for history in histories:
+            append = history.append
+            for value in samples:
+                append(value)
+        for history in histories:
+            values = np.array(list(history))
+            float(np.mean(values)), float(np.std(values)), float(np.max(values)), float(np.min(values))
+            np.histogram(values, bins=20)
+    return (time.perf_counter() - start) / seconds * 1e3
+
+
+def sketch(task_count: int, rate_hz: int, seconds: int) -> float:
+    samples = _samples(rate_hz)
+    sketches = [WindowedQuantileSketch() for _ in range(task_count)]
+    start = time.perf_counter()
+    for second in range(seconds):
+        times = [second + i / rate_hz for i in range(rate_hz)]  # the scheduler already has these
+        for stats in sketches:
+            record = stats.record
+            for value, now in zip(samples, times):
+                record(value, now)
+        for stats in sketches:
+            stats.snapshot(second + 1.0).quantiles((0.5, 0.99, 0.999))
+    return (time.perf_counter() - start) / seconds * 1e3
+
+
+def batched(task_count: int, rate_hz: int, seconds: int) -> float:
+    samples = _samples(rate_hz)
+    histories = [deque(maxlen=1000) for _ in range(task_count)]
+    sketches = [WindowedQuantileSketch() for _ in range(task_count)]
+    feed_every = min(rate_hz, 500)
+    start = time.perf_counter()
+    for second in range(seconds):
+        for chunk in range(0, rate_hz, feed_every):
+            for history in histories:
+                append = history.append
+                for value in samples[chunk:chunk + feed_every]:
+                    append(value)
+            now = second + (chunk + feed_every) / rate_hz
+            for history, stats in zip(histories, sketches):
+                stats.record_many(np.fromiter(itertools.islice(reversed(history), feed_every),
+                                              dtype=np.float64, count=feed_every), now)
+        for stats in sketches:
+            stats.snapshot(second + 1.0).quantiles((0.5, 0.99, 0.999))
+    return (time.perf_counter() - start) / seconds * 1e3
+
+
+def sketch_bytes(rate_hz: int, seconds: int) -> int:
+    stats = WindowedQuantileSketch()
+    samples = _samples(rate_hz)
+    for second in range(seconds):
+        stats.record_many(samples, second + 0.5)
+    stats.snapshot(float(seconds))
+    return sum(s._counts.nbytes for s in stats._slices if s._counts is not None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--rate-hz", type=int, default=1000)
+    parser.add_argument("--seconds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>6} {'recompute_ms/s':>15} {'sketch_ms/s':>12} {'batched_ms/s':>13}")
+    for count in args.tasks:
+        print(f"{count:>6} {recompute(count, args.rate_hz, args.seconds):>15.2f} "
+              f"{sketch(count, args.rate_hz, args.seconds):>12.2f} "
+              f"{batched(count, args.rate_hz, args.seconds):>13.2f}")
+    print(f"sketch counts per windowed sketch: {sketch_bytes(args.rate_hz, 10)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cost of a log call made from inside a control loop.
+
+Logs structured (JSON) records to a file with the synchronous handlers and
+with the asynchronous queue pipeline, timing every call individually so
+the tail (file writes, JSON encoding) shows up next to the mean. Calls are
+paced like a 1 kHz loop so the background writer is not permanently
+saturated.
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dart_planner.common.logging_config import flush_logging, get_log_queue_stats, get_logger, setup_logging
+
+
+def measure(enable_async: bool, calls: int, log_file: str, rate_hz: float):
+    setup_logging(level="INFO", log_file=log_file, enable_console=False, enable_file=True,
+                  enable_structured=True, enable_async=enable_async)
+    structured = get_logger("dart_planner.benchmark.control")
+    plain = logging.getLogger("dart_planner.benchmark.plain")
+    period = 1.0 / rate_hz
+
+    results = {}
+    for label, log in (("structured", lambda i: structured.info("control step", step=i, thrust=9.81)),
+                       ("stdlib", lambda i: plain.info("control step %d", i))):
+        costs = np.empty(calls)
+        next_tick = time.perf_counter()
+        for i in range(calls):
+            start = time.perf_counter_ns()
+            log(i)
+            costs[i] = (time.perf_counter_ns() - start) / 1000.0
+            next_tick += period
+            while time.perf_counter() < next_tick:
+                pass
+        flush_logging(timeout=10.0)
+        results[label] = (costs.mean(), np.percentile(costs, 50), np.percentile(costs, 99), costs.max())
+    return results, get_log_queue_stats()['dropped']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--rate", type=float, default=1000.0, help="log calls per second")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for enable_async in (False, True):
+            results, dropped = measure(enable_async, args.calls, str(Path(tmp) / "bench.log"), args.rate)
+            rows.append(("async" if enable_async else "sync", results, dropped))
+
+    print(f"{'pipeline':>8} {'logger':>10} {'mean us':>8} {'p50 us':>8} {'p99 us':>8} {'max us':>8} {'dropped':>8}")
+    for mode, results, dropped in rows:
+        for label, (mean, p50, p99, worst) in results.items():
+            print(f"{mode:>8} {label:>10} {mean:>8.2f} {p50:>8.2f} {p99:>8.2f} {worst:>8.1f} {dropped:>8}")
+
+
+if __name__ == "__main__":
+    main()
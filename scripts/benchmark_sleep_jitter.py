@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark periodic wakeup jitter of the async sleep implementations.
+
+Runs a fixed-rate loop with absolute deadlines and reports how late each
+wakeup is (microseconds) for:
+- executor: ``high_res_sleep_until`` with the executor backend
+  (clock_nanosleep in a thread-pool executor, the default)
+- asyncio: plain ``asyncio.sleep``
+- timerfd: ``high_res_sleep_until`` with the event-loop timerfd backend
+- timerfd+spin: the same with a calibrated busy-spin before the deadline
+
+and which backend ``calibrate_backend`` selects on this machine.
+"""
+
+import argparse
+import asyncio
+import time
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dart_planner.common.timing_utils import (
+    calibrate_backend,
+    calibrate_spin,
+    high_res_sleep_until,
+    set_sleep_backend,
+)
+
+
+async def _executor_sleep_until(deadline: float) -> None:
+    set_sleep_backend("executor")
+    await high_res_sleep_until(deadline, spin_s=0.0)
+
+
+async def _asyncio_sleep_until(deadline: float) -> None:
+    await asyncio.sleep(max(deadline - time.perf_counter(), 0.0))
+
+
+async def _timerfd_sleep_until(deadline: float) -> None:
+    set_sleep_backend("timerfd")
+    await high_res_sleep_until(deadline, spin_s=0.0)
+
+
+async def _spin_sleep_until(deadline: float) -> None:
+    set_sleep_backend("timerfd")
+    await high_res_sleep_until(deadline)
+
+
+async def measure(sleep_until, period_s: float, iterations: int):
+    lateness = []
+    deadline = time.perf_counter()
+    for _ in range(iterations):
+        deadline += period_s
+        await sleep_until(deadline)
+        now = time.perf_counter()
+        lateness.append((now - deadline) * 1e6)
+        if now - deadline > period_s:
+            deadline = now  # resynchronize after an overrun
+    return sorted(lateness)
+
+
+def _summary(values):
+    n = len(values)
+    return (sum(values) / n, values[n // 2], values[min(n - 1, int(n * 0.99))], values[-1])
+
+
+async def run(periods, iterations) -> None:
+    print(f"calibrated backend: {await calibrate_backend()}")
+    set_sleep_backend("timerfd")
+    spin = await calibrate_spin()
+    print(f"calibrated spin: {spin * 1e6:.1f} us")
+    methods = [
+        ("executor", _executor_sleep_until),
+        ("asyncio", _asyncio_sleep_until),
+        ("timerfd", _timerfd_sleep_until),
+        ("timerfd+spin", _spin_sleep_until),
+    ]
+    print(f"{'period_ms':>9} {'method':>13} {'mean_us':>9} {'p50_us':>9} {'p99_us':>9} {'max_us':>9}")
+    for period_ms in periods:
+        for name, sleep_until in methods:
+            stats = _summary(await measure(sleep_until, period_ms / 1000.0, iterations))
+            print(f"{period_ms:>9.2f} {name:>13} " + " ".join(f"{v:>9.1f}" for v in stats))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--periods-ms", type=float, nargs="+", default=[1.0, 2.5])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.periods_ms, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
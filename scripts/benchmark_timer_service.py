@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark periodic loops on the shared timer service versus one sleeping coroutine each.
+
+Runs N no-op loops at mixed rates for a few seconds of real time, first as
+independent coroutines sleeping on ``high_res_sleep_until`` (the previous
+pattern of every loop class), then as registrations on the process-wide
+TimerService. Reports CPU time, event-loop wakeups and release lateness.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dart_planner.common.timer_service import get_timer_service
+from dart_planner.common.timing_utils import high_res_sleep_until
+
+RATES_HZ = (1000.0, 400.0, 200.0, 100.0, 50.0, 10.0)
+
+
+async def run_sleeping_loops(count: int, duration: float):
+    lateness = []
+
+    async def loop(period: float):
+        deadline = (time.perf_counter() // period + 1) * period
+        while True:
+            await high_res_sleep_until(deadline)
+            lateness.append(time.perf_counter() - deadline)
+            deadline += period
+
+    tasks = [asyncio.ensure_future(loop(1.0 / RATES_HZ[i % len(RATES_HZ)])) for i in range(count)]
+    await asyncio.sleep(duration)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    # Each release is its own wakeup
+    return lateness, len(lateness)
+
+
+async def run_timer_service(count: int, duration: float):
+    service = get_timer_service()
+    lateness = []
+    timers = []
+
+    def make_tick(timers_index: int):
+        def tick():
+            # The timer's deadline is the release being dispatched
+            lateness.append(time.perf_counter() - timers[timers_index].deadline)
+        return tick
+
+    for i in range(count):
+        timers.append(service.call_every(1.0 / RATES_HZ[i % len(RATES_HZ)], make_tick(i), name=f"loop_{i}"))
+    await asyncio.sleep(duration)
+    wakeups = service.wakeups
+    for timer in timers:
+        timer.cancel()
+    return lateness, wakeups
+
+
+def measure(runner, count: int, duration: float):
+    cpu_start = time.process_time()
+    lateness, wakeups = asyncio.run(runner(count, duration))
+    cpu = (time.process_time() - cpu_start) / duration * 100.0
+    lateness_us = np.array(lateness) * 1e6
+    return cpu, wakeups / duration, np.percentile(lateness_us, 50), np.percentile(lateness_us, 99)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--loops", type=int, nargs="+", default=[6, 60])
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+    logging.getLogger("dart_planner").setLevel(logging.WARNING)
+
+    print(f"{'loops':>6} {'mode':>10} {'cpu %':>7} {'wakeups/s':>10} {'p50 late us':>12} {'p99 late us':>12}")
+    for count in args.loops:
+        for mode, runner in (("sleeping", run_sleeping_loops), ("service", run_timer_service)):
+            cpu, wakeups, p50, p99 = measure(runner, count, args.duration)
+            print(f"{count:>6} {mode:>10} {cpu:>7.1f} {wakeups:>10.0f} {p50:>12.1f} {p99:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-tick trajectory lookup with the compiled piecewise-polynomial evaluator.
+
+Samples a planner-sized trajectory at control-loop rate the way consumers
+did before (``searchsorted`` plus per-field linear blends, and a linear
+Python scan over timestamps) and with ``PiecewiseTrajectory.evaluate``
+(cursor lookup) and ``evaluate_many`` (one batched call). Compile cost is
+reported separately since it is paid once per received trajectory; the
+identity check consumers run before reusing a compiled form is per tick.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dart_planner.common.piecewise_trajectory import PiecewiseTrajectory
+from dart_planner.common.types import Trajectory
+
+
+def searchsorted_linear(trajectory: Trajectory, t: float):
+    times = trajectory.timestamps
+    idx = np.searchsorted(times, t) - 1
+    alpha = (t - times[idx]) / (times[idx + 1] - times[idx])
+    pos = (1 - alpha) * trajectory.positions[idx] + alpha * trajectory.positions[idx + 1]
+    vel = (1 - alpha) * trajectory.velocities[idx] + alpha * trajectory.velocities[idx + 1]
+    acc = (1 - alpha) * trajectory.accelerations[idx] + alpha * trajectory.accelerations[idx + 1]
+    return pos, vel, acc
+
+
+def scan_linear(trajectory: Trajectory, t: float):
+    times = trajectory.timestamps
+    for i in range(len(times) - 1):
+        if times[i] <= t <= times[i + 1]:
+            alpha = (t - times[i]) / (times[i + 1] - times[i])
+            pos = (1 - alpha) * trajectory.positions[i] + alpha * trajectory.positions[i + 1]
+            vel = (1 - alpha) * trajectory.velocities[i] + alpha * trajectory.velocities[i + 1]
+            return pos, vel
+    return None
+
+
+def per_call_us(func, queries) -> float:
+    start = time.perf_counter()
+    for t in queries:
+        func(t)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--knots", type=int, default=200, help="trajectory samples")
+    parser.add_argument("--ticks", type=int, default=20000, help="lookups at increasing times")
+    args = parser.parse_args()
+
+    knots = np.arange(args.knots) * 0.05
+    trajectory = Trajectory(
+        timestamps=knots,
+        positions=np.stack([np.sin(knots), np.cos(knots), 0.1 * knots], axis=1),
+        velocities=np.stack([np.cos(knots), -np.sin(knots), np.full_like(knots, 0.1)], axis=1),
+        accelerations=np.stack([-np.sin(knots), -np.cos(knots), np.zeros_like(knots)], axis=1),
+    )
+    queries = np.linspace(knots[0], knots[-1], args.ticks, endpoint=False)
+
+    start = time.perf_counter()
+    compiled = PiecewiseTrajectory.from_trajectory(trajectory)
+    compile_us = (time.perf_counter() - start) * 1e6
+
+    rows = [
+        ("searchsorted + linear blend", per_call_us(lambda t: searchsorted_linear(trajectory, t), queries)),
+        ("python scan + linear blend", per_call_us(lambda t: scan_linear(trajectory, t), queries)),
+        ("compiled evaluate (cursor)", per_call_us(compiled.evaluate, queries)),
+        ("compiled sample_motion", per_call_us(compiled.sample_motion, queries)),
+        ("compiles() identity check", per_call_us(lambda t: compiled.compiles(trajectory), queries)),
+    ]
+    start = time.perf_counter()
+    compiled.evaluate_many(queries)
+    rows.append(("compiled evaluate_many", (time.perf_counter() - start) / len(queries) * 1e6))
+
+    print(f"{args.knots} knots, compile once: {compile_us:.0f} us")
+    print(f"{'lookup':>30} {'us per tick':>12}")
+    for label, cost in rows:
+        print(f"{label:>30} {cost:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-state construction cost of DroneState with and without the unit fast path.
+
+Compares building a DroneState the way adapters used to (``Q_`` per field,
+then ``__post_init__`` validation through ``ensure_units``) with the
+validated constructor on the cached conversion path and with
+``DroneState.from_si_arrays``, which only attaches units. Also times
+``ensure_units`` alone for identical and convertible units.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from pint import Quantity
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import dart_planner.common.types as types_module
+from dart_planner.common.types import DroneState
+from dart_planner.common.units import Q_, ensure_units, get_ureg
+
+
+def uncached_ensure_units(value, expected_unit: str, context: str = ""):
+    # The conversion path before the fast path: always go through pint
+    if isinstance(value, Quantity):
+        return value.to(expected_unit)
+    return get_ureg().Quantity(value, expected_unit)
+
+
+def time_call(func, iterations: int) -> np.ndarray:
+    costs = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        func()
+        costs[i] = (time.perf_counter_ns() - start) / 1000.0
+    return costs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    position, velocity = np.array([1.0, 2.0, -3.0]), np.array([0.5, 0.0, 0.1])
+    attitude, rates = np.array([0.01, -0.02, 1.2]), np.array([0.0, 0.1, 0.0])
+
+    def adapter_state():
+        return DroneState(timestamp=0.0, position=Q_(position, 'm'), velocity=Q_(velocity, 'm/s'),
+                          attitude=Q_(attitude, 'rad'), angular_velocity=Q_(rates, 'rad/s'))
+
+    def legacy_adapter_state():
+        ureg = get_ureg()
+        return DroneState(timestamp=0.0, position=ureg.Quantity(position, 'm'),
+                          velocity=ureg.Quantity(velocity, 'm/s'), attitude=ureg.Quantity(attitude, 'rad'),
+                          angular_velocity=ureg.Quantity(rates, 'rad/s'))
+
+    # DroneState.__post_init__ looks ensure_units up in its module
+    types_module.ensure_units = uncached_ensure_units
+    results = [("DroneState(Q_...) before", time_call(legacy_adapter_state, args.iterations))]
+    types_module.ensure_units = ensure_units
+
+    centimeters, degrees = Q_(position * 100.0, 'cm'), Q_(45.0, 'deg')
+    cases_after = [
+        ("DroneState(Q_...) after", adapter_state),
+        ("DroneState.from_si_arrays", lambda: DroneState.from_si_arrays(0.0, position, velocity, attitude, rates)),
+        ("ensure_units same unit before", lambda: uncached_ensure_units(centimeters, 'cm')),
+        ("ensure_units same unit after", lambda: ensure_units(centimeters, 'cm')),
+        ("ensure_units cm->m before", lambda: uncached_ensure_units(centimeters, 'm')),
+        ("ensure_units cm->m after", lambda: ensure_units(centimeters, 'm')),
+        ("ensure_units deg->rad before", lambda: uncached_ensure_units(degrees, 'rad')),
+        ("ensure_units deg->rad after", lambda: ensure_units(degrees, 'rad')),
+    ]
+    results += [(label, time_call(func, args.iterations)) for label, func in cases_after]
+
+    print(f"{'case':>30} {'mean us':>8} {'p50 us':>8} {'p99 us':>8}")
+    for label, costs in results:
+        print(f"{label:>30} {costs.mean():>8.2f} {np.percentile(costs, 50):>8.2f} {np.percentile(costs, 99):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
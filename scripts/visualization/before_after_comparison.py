@@ -5,12 +5,18 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from dart_planner.common.flight_recorder import flight_log_as_csv
+
 
 def create_before_after_comparison():
     """Create a side-by-side comparison of original vs improved system"""
 
     # Find log files
-    improved_files = glob.glob("improved_trajectory_log_*.csv")
+    improved_files = glob.glob("improved_trajectory_log_*.fdr") + glob.glob("improved_trajectory_log_*.csv")
     original_files = glob.glob("trajectory_log_*.csv")
     original_files = [f for f in original_files if not f.startswith("improved_")]
 
@@ -24,7 +30,7 @@ def create_before_after_comparison():
 
     # Load data
     try:
-        improved_data = pd.read_csv(latest_improved)
+        improved_data = pd.read_csv(flight_log_as_csv(latest_improved))
         original_data = pd.read_csv(latest_original)
         print(f"Loaded data:")
         print(f"  Original: {len(original_data)} points from {latest_original}")
@@ -6,6 +6,12 @@ import numpy as np
 import pandas as pd
 from mpl_toolkits.mplot3d import Axes3D
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from dart_planner.common.flight_recorder import flight_log_as_csv
+
 
 def create_comprehensive_visualization(improved_log_file, original_log_files=None):
     """
@@ -14,7 +20,7 @@ def create_comprehensive_visualization(improved_log_file, original_log_files=Non
     # Read improved data
     print(f"Reading improved log: {improved_log_file}")
     try:
-        improved_data = pd.read_csv(improved_log_file)
+        improved_data = pd.read_csv(flight_log_as_csv(improved_log_file))
     except FileNotFoundError:
         print(f"Error: Improved log file not found: {improved_log_file}")
         return
@@ -501,7 +507,7 @@ def compare_with_original_logs():
     Create a comparison visualization between improved and original systems
     """
     # Find log files
-    improved_files = glob.glob("improved_trajectory_log_*.csv")
+    improved_files = glob.glob("improved_trajectory_log_*.fdr") + glob.glob("improved_trajectory_log_*.csv")
     original_files = glob.glob("trajectory_log_*.csv")
     original_files = [f for f in original_files if not f.startswith("improved_")]
 
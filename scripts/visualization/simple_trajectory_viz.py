@@ -3,12 +3,18 @@ import numpy as np
 import pandas as pd
 from mpl_toolkits.mplot3d import Axes3D
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from dart_planner.common.flight_recorder import flight_log_as_csv
+
 
 def create_clean_trajectory_viz(log_file):
     """Create a clean, professional 3D trajectory visualization"""
 
     try:
-        data = pd.read_csv(log_file)
+        data = pd.read_csv(flight_log_as_csv(log_file))
         print(f"Loaded {len(data)} data points from {log_file}")
     except FileNotFoundError:
         print(f"Error: Log file not found: {log_file}")
@@ -191,11 +197,9 @@ if __name__ == "__main__":
     import glob
 
     # Find latest improved log
-    improved_files = glob.glob("improved_trajectory_log_*.csv")
+    improved_files = glob.glob("improved_trajectory_log_*.fdr") + glob.glob("improved_trajectory_log_*.csv")
     if improved_files:
-        latest_file = max(
-            improved_files, key=lambda x: x.split("_")[-1].replace(".csv", "")
-        )
+        latest_file = max(improved_files, key=lambda x: Path(x).stem.split("_")[-1])
         print(f"Visualizing: {latest_file}")
         create_clean_trajectory_viz(latest_file)
     else:
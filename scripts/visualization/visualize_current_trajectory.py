@@ -3,21 +3,34 @@
 Current Trajectory Visualization
 """
 
+import glob
+import os
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from mpl_toolkits.mplot3d import Axes3D
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from dart_planner.common.flight_recorder import flight_log_as_csv
+
 
 def visualize_current_trajectory():
     """Visualize the most recent trajectory log."""
 
     # Load the latest log
-    log_file = "improved_trajectory_log_1751102498.csv"
+    log_files = glob.glob("improved_trajectory_log_*.fdr") + glob.glob("improved_trajectory_log_*.csv")
+    if not log_files:
+        print("No improved trajectory log files found!")
+        return
+    log_file = max(log_files, key=os.path.getctime)
     print(f"📊 Visualizing trajectory from: {log_file}")
 
     try:
-        df = pd.read_csv(log_file)
+        df = pd.read_csv(flight_log_as_csv(log_file))
         print(f"  📈 Loaded {len(df)} data points")
 
         # Create figure with subplots
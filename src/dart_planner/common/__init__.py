@@ -1,37 +1,21 @@
 """
 Common utilities and shared components for DART-Planner.
+
+Re-exports are resolved on first access, so importing a single submodule
+(e.g. ``dart_planner.common.errors``) does not load the DI container or
+the unit registry.
 """
 
-from .di_container_v2 import (
-    DIContainerV2 as DIContainer,
-    ContainerConfig,
-    get_container,
-)
-from .units import (
-    Q_,
-    to_float,
-    ensure_units,
-    angular_velocity_to_rad_s,
-    angular_velocity_to_deg_s,
-    GRAVITY,
-    DEG_TO_RAD,
-    RAD_TO_DEG,
-    AngularVelocity,
-    LinearVelocity,
-    Force,
-    Mass,
-    Length,
-    Time,
-)
+from .lazy_imports import lazy_exports
 
 __all__ = [
     # DI Container
     "DIContainer",
-    "ContainerConfig", 
+    "ContainerConfig",
     "get_container",
     # Units
     "Q_",
-    "to_float", 
+    "to_float",
     "ensure_units",
     "angular_velocity_to_rad_s",
     "angular_velocity_to_deg_s",
@@ -41,7 +25,14 @@ __all__ = [
     "AngularVelocity",
     "LinearVelocity",
     "Force",
-    "Mass", 
+    "Mass",
     "Length",
     "Time",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "DIContainer": "di_container_v2:DIContainerV2",
+    "ContainerConfig": "di_container_v2",
+    "get_container": "di_container_v2",
+    **{name: "units" for name in __all__[3:]},
+})
@@ -0,0 +1,215 @@
+"""
+Pluggable Time Sources for DART-Planner
+
+Schedulers, timing managers and edge loops read time and sleep through a
+Clock instead of calling ``time``/``asyncio`` directly:
+- SystemClock: ``time.perf_counter`` / ``time.time`` and high-resolution
+  sleeps (event-loop timerfd wakeups on Linux, see timing_utils)
+- VirtualClock: simulated time that only moves when the loop is idle, so a
+  closed-loop run executes deterministically and as fast as the CPU allows
+- VirtualTimeEventLoop / run_virtual(): an asyncio loop whose ``time()`` is
+  the virtual clock; plain ``asyncio.sleep`` and timeouts become virtual too
+
+Under virtual time, work must not depend on real threads finishing:
+``run_in_executor`` completions still arrive in real time while virtual
+timers fire immediately. Components that would offload synchronous work to
+an executor run it inline when their clock is virtual.
+"""
+
+import asyncio
+import selectors
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Optional, TypeVar
+
+from .timing_utils import high_res_sleep, high_res_sleep_until
+
+T = TypeVar("T")
+
+
+class Clock(ABC):
+    """Time source interface used by the real-time components."""
+
+    #: True when time only advances under the control of the clock itself
+    is_virtual: bool = False
+
+    @abstractmethod
+    def now(self) -> float:
+        """Monotonic time in seconds (for intervals, deadlines, jitter)."""
+        pass
+
+    @abstractmethod
+    def time(self) -> float:
+        """Wall-clock time in seconds (for timestamps on states and logs)."""
+        pass
+
+    @abstractmethod
+    async def sleep(self, duration_s: float) -> None:
+        """Suspend the calling coroutine for ``duration_s`` of clock time."""
+        pass
+
+    async def sleep_until(self, deadline: float) -> None:
+        """Suspend the calling coroutine until ``now() >= deadline``."""
+        await self.sleep(deadline - self.now())
+
+    @abstractmethod
+    def sleep_sync(self, duration_s: float) -> None:
+        """Blocking sleep for threaded loops."""
+        pass
+
+
+class SystemClock(Clock):
+    """Real time from the operating system."""
+
+    def now(self) -> float:
+        return time.perf_counter()
+
+    def time(self) -> float:
+        return time.time()
+
+    async def sleep(self, duration_s: float) -> None:
+        await high_res_sleep(duration_s)
+
+    async def sleep_until(self, deadline: float) -> None:
+        # Absolute deadline straight to the timer: no drift from computing a duration
+        await high_res_sleep_until(deadline)
+
+    def sleep_sync(self, duration_s: float) -> None:
+        if duration_s > 0:
+            time.sleep(duration_s)
+
+
+class VirtualClock(Clock):
+    """
+    Simulated time, advanced explicitly or by a VirtualTimeEventLoop.
+
+    Args:
+        start: Initial monotonic time in seconds
+        epoch: Wall-clock time corresponding to ``start``; the default keeps
+            virtual timestamps small and reproducible
+    """
+
+    is_virtual = True
+
+    def __init__(self, start: float = 0.0, epoch: float = 0.0):
+        self._now = float(start)
+        self._epoch_offset = float(epoch) - float(start)
+
+    def now(self) -> float:
+        return self._now
+
+    def time(self) -> float:
+        return self._now + self._epoch_offset
+
+    def advance(self, duration_s: float) -> float:
+        """Move time forward and return the new time."""
+        if duration_s > 0:
+            self._now += duration_s
+        return self._now
+
+    def advance_to(self, target: float) -> float:
+        """Move time forward to ``target`` (never backwards)."""
+        if target > self._now:
+            self._now = target
+        return self._now
+
+    async def sleep(self, duration_s: float) -> None:
+        # Inside a VirtualTimeEventLoop asyncio timers already run on this
+        # clock; anywhere else advance directly so callers never block
+        loop = asyncio.get_running_loop()
+        if isinstance(loop, VirtualTimeEventLoop) and loop.clock is self:
+            await asyncio.sleep(max(duration_s, 0.0))
+        else:
+            self.advance(duration_s)
+            await asyncio.sleep(0)
+
+    def sleep_sync(self, duration_s: float) -> None:
+        self.advance(duration_s)
+
+
+class _VirtualTimeSelector:
+    """Selector wrapper that replaces idle waits with virtual clock jumps."""
+
+    def __init__(self, selector: selectors.BaseSelector, clock: VirtualClock):
+        self._selector = selector
+        self._clock = clock
+
+    def select(self, timeout: Optional[float] = None):
+        events = self._selector.select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            # Nothing scheduled: only real I/O or another thread can wake us
+            return self._selector.select(None)
+        self._clock.advance(timeout)
+        return []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop running on a VirtualClock.
+
+    Whenever no callback is ready, the loop jumps the clock to the next
+    scheduled timer instead of waiting for it.
+    """
+
+    def __init__(self, clock: Optional[VirtualClock] = None):
+        self.clock = clock or VirtualClock()
+        super().__init__(selector=_VirtualTimeSelector(selectors.DefaultSelector(), self.clock))
+
+    def time(self) -> float:
+        return self.clock.now()
+
+
+def run_virtual(main: Awaitable[T], clock: Optional[VirtualClock] = None) -> T:
+    """
+    Run a coroutine to completion on virtual time, like ``asyncio.run``.
+
+    The clock is installed as the process default (``get_clock()``) for the
+    duration of the run so components created inside pick it up.
+    """
+    clock = clock or VirtualClock()
+    loop = VirtualTimeEventLoop(clock)
+    previous = set_clock(clock)
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+            set_clock(previous)
+
+
+# Process-wide default clock
+_clock: Clock = SystemClock()
+_clock_lock = threading.Lock()
+
+
+def get_clock() -> Clock:
+    """Get the default clock used by components created without one."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Install a default clock and return the previous one."""
+    global _clock
+    with _clock_lock:
+        previous, _clock = _clock, clock
+    return previous
+
+
+def reset_clock() -> None:
+    """Restore the system clock as the default."""
+    set_clock(SystemClock())
@@ -8,18 +8,27 @@ This module provides a modern DI container with:
 - No global singletons
 - Cycle detection
 - Dependency resolution tracking
+- Compiled resolution plan: ``finalize()`` validates the graph once and
+  publishes an immutable plan (topological order plus type -> instance and
+  type -> factory maps); resolving an already-built singleton is then a
+  single dict lookup without locking
 """
 
+import inspect
 import logging
 import threading
+import typing
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Any, Callable, Dict, Generic, List, Optional, Set, Type, TypeVar
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generic, List, Mapping, Optional, Set, Tuple, Type, TypeVar, Union
 
 T = TypeVar('T')
 
+_MISSING = object()
+
 
 class RegistrationStage(Enum):
     """Stages of dependency registration."""
@@ -167,6 +176,29 @@ class DependencyGraph:
         
         return cycles
     
+    def find_cycle(self, start: Type[Any]) -> Optional[List[Type[Any]]]:
+        """First cycle reachable from ``start``, if any."""
+        visited: Set[Type[Any]] = set()
+        path: List[Type[Any]] = []
+        on_path: Set[Type[Any]] = set()
+        
+        def dfs(node: Type[Any]) -> Optional[List[Type[Any]]]:
+            visited.add(node)
+            path.append(node)
+            on_path.add(node)
+            for neighbor in self.edges.get(node, set()):
+                if neighbor in on_path:
+                    return path[path.index(neighbor):] + [neighbor]
+                if neighbor not in visited:
+                    cycle = dfs(neighbor)
+                    if cycle:
+                        return cycle
+            on_path.remove(node)
+            path.pop()
+            return None
+        
+        return dfs(start)
+    
     def get_dependency_order(self) -> List[Type[Any]]:
         """Get topological sort of dependencies."""
         result: List[Type[Any]] = []
@@ -195,6 +227,33 @@ class DependencyGraph:
         return result
 
 
+@dataclass(frozen=True)
+class ResolutionPlan:
+    """
+    Immutable resolution plan published by ``DIContainerV2.finalize()``.
+    
+    The container replaces the whole plan when a singleton is first built,
+    so readers never need a lock.
+    """
+    order: Tuple[Type[Any], ...]
+    singletons: Mapping[Type[Any], Any] = field(default_factory=lambda: MappingProxyType({}))
+    factories: Mapping[Type[Any], Callable[[], Any]] = field(default_factory=lambda: MappingProxyType({}))
+    
+    def publish(self, interface: Type[Any], provider: DependencyProvider[Any], instance: Any) -> 'ResolutionPlan':
+        """Plan with a built dependency added to the fast-path maps."""
+        if isinstance(provider, FactoryProvider):
+            return replace(self, factories=MappingProxyType({**self.factories, interface: provider.get}))
+        return replace(self, singletons=MappingProxyType({**self.singletons, interface: instance}))
+    
+    def without(self, interface: Type[Any]) -> 'ResolutionPlan':
+        """Plan with ``interface`` removed from the fast-path maps."""
+        return replace(
+            self,
+            singletons=MappingProxyType({k: v for k, v in self.singletons.items() if k is not interface}),
+            factories=MappingProxyType({k: v for k, v in self.factories.items() if k is not interface}),
+        )
+
+
 class DIContainerV2:
     """
     Advanced dependency injection container with staged registration and validation.
@@ -218,6 +277,11 @@ class DIContainerV2:
         self._lock = threading.RLock()
         self._resolution_stack: List[Type[Any]] = []
         self._lifecycle_managers: Dict[Type[Any], 'LifecycleManager'] = {}
+        # Dependency edges are (re)computed when the graph is next needed
+        self._graph_dirty = False
+        self._cycle_checked: Set[Type[Any]] = set()
+        # Published by finalize(); read without the lock
+        self._plan: Optional[ResolutionPlan] = None
         
         self.logger = logging.getLogger(f"{__name__}.{id(self)}")
         
@@ -343,45 +407,132 @@ class DIContainerV2:
     
     def _add_provider(self, interface: Type[Any], provider: DependencyProvider[Any], metadata: DependencyMetadata) -> None:
         """Add a provider to the container."""
-        self._providers[interface] = provider
-        self._metadata[interface] = metadata
-        
-        # Add to dependency graph
-        if self.config.enable_validation:
-            self._analyze_dependencies(interface, metadata)
-        
-        # Create lifecycle manager if enabled
-        if self.config.enable_lifecycle_management:
-            self._lifecycle_managers[interface] = LifecycleManager(metadata)
+        with self._lock:
+            previous = (self._providers.get(interface), self._metadata.get(interface))
+            self._providers[interface] = provider
+            self._metadata[interface] = metadata
+            self._graph_dirty = True
+            self._cycle_checked.clear()
+            
+            if self._plan is not None:
+                # Dynamic registration after finalize: validate the new edges and recompile
+                cycle = self._find_cycle(interface)
+                if cycle:
+                    self._restore_provider(interface, *previous)
+                    raise DependencyError(f"Circular dependency detected: {' -> '.join(t.__name__ for t in cycle)}")
+                self._compile_plan(self._plan.without(interface))
+            
+            # Create lifecycle manager if enabled
+            if self.config.enable_lifecycle_management:
+                self._lifecycle_managers[interface] = LifecycleManager(metadata)
         
         self.logger.debug(f"Registered {interface.__name__} -> {metadata.implementation.__name__} (stage: {metadata.stage.value})")
     
+    def _restore_provider(self, interface: Type[Any], provider: Optional[DependencyProvider[Any]],
+                          metadata: Optional[DependencyMetadata]) -> None:
+        if provider is None:
+            self._providers.pop(interface, None)
+            self._metadata.pop(interface, None)
+        else:
+            self._providers[interface] = provider
+            self._metadata[interface] = metadata
+        self._graph_dirty = True
+    
     def _analyze_dependencies(self, interface: Type[Any], metadata: DependencyMetadata) -> None:
-        """Analyze dependencies for graph construction."""
-        # This would analyze the implementation class to find its dependencies
-        # For now, we'll use a simplified approach
+        """Add the registered types a constructor takes as edges of the graph."""
+        if isinstance(self._providers.get(interface), InstanceProvider):
+            return  # already built
         try:
-            # Check constructor parameters
-            import inspect
-            sig = inspect.signature(metadata.implementation.__init__)
-            for param_name, param in sig.parameters.items():
-                if param_name != 'self' and param.annotation != inspect.Parameter.empty:
-                    if param.annotation in self._providers:
-                        self._graph.add_dependency(interface, param.annotation)
-                        metadata.dependencies.add(param.annotation)
+            init = metadata.implementation.__init__
+            try:
+                # Resolves string (forward-reference) annotations
+                hints = typing.get_type_hints(init)
+            except Exception:
+                hints = {
+                    name: param.annotation
+                    for name, param in inspect.signature(init).parameters.items()
+                    if param.annotation is not inspect.Parameter.empty
+                }
+            for param_name, annotation in hints.items():
+                if param_name in ('self', 'return'):
+                    continue
+                for candidate in _annotation_types(annotation):
+                    if candidate in self._providers:
+                        self._graph.add_dependency(interface, candidate)
+                        metadata.dependencies.add(candidate)
         except Exception as e:
             self.logger.warning(f"Could not analyze dependencies for {interface.__name__}: {e}")
     
+    def _ensure_graph(self) -> DependencyGraph:
+        """Dependency graph of the current registrations."""
+        if self._graph_dirty:
+            self._graph = DependencyGraph()
+            for interface, metadata in self._metadata.items():
+                self._graph.edges.setdefault(interface, set())
+                metadata.dependencies.clear()
+                if self.config.enable_validation:
+                    self._analyze_dependencies(interface, metadata)
+            self._graph_dirty = False
+        return self._graph
+    
+    def _find_cycle(self, dependency_type: Type[Any]) -> Optional[List[Type[Any]]]:
+        config = self.config
+        if not config.enable_validation or not config.strict_mode or config.allow_circular_dependencies:
+            return None
+        return self._ensure_graph().find_cycle(dependency_type)
+    
+    def _compile_plan(self, previous: Optional[ResolutionPlan] = None) -> None:
+        """Publish a resolution plan for the current registrations."""
+        singletons: Dict[Type[Any], Any] = dict(previous.singletons) if previous else {}
+        factories: Dict[Type[Any], Callable[[], Any]] = dict(previous.factories) if previous else {}
+        for interface, provider in self._providers.items():
+            # Pre-created instances and singletons built before finalize()
+            instance = getattr(provider, '_instance', None)
+            if instance is not None and interface not in singletons:
+                singletons[interface] = instance
+                if interface in self._lifecycle_managers:
+                    self._lifecycle_managers[interface].set_phase(LifecyclePhase.READY)
+        self._plan = ResolutionPlan(
+            order=tuple(self._ensure_graph().get_dependency_order()),
+            singletons=MappingProxyType(singletons),
+            factories=MappingProxyType(factories),
+        )
+    
     def resolve(self, dependency_type: Type[T]) -> T:
-        """Resolve a dependency by type."""
+        """
+        Resolve a dependency by type.
+        
+        Once the container is finalized, a dependency that has been built
+        before is served from the resolution plan without taking the lock.
+        """
+        plan = self._plan
+        if plan is not None:
+            instance = plan.singletons.get(dependency_type, _MISSING)
+            if instance is not _MISSING:
+                return instance
+            factory = plan.factories.get(dependency_type)
+            if factory is not None:
+                return factory()
+        return self._resolve_locked(dependency_type)
+    
+    def _resolve_locked(self, dependency_type: Type[T]) -> T:
+        """Full resolution: validation, cycle tracking and lifecycle updates."""
         with self._lock:
             if dependency_type not in self._providers:
                 raise DependencyError(f"Dependency not registered: {dependency_type.__name__}")
             
-            # Check for circular dependencies
-            if self.config.strict_mode and dependency_type in self._resolution_stack:
-                cycle = self._resolution_stack[self._resolution_stack.index(dependency_type):] + [dependency_type]
-                raise DependencyError(f"Circular dependency detected: {' -> '.join(t.__name__ for t in cycle)}")
+            if self.config.strict_mode:
+                # Static check, once per type until the registrations change
+                # (finalize() has already validated the whole graph)
+                if self._plan is None and dependency_type not in self._cycle_checked:
+                    cycle = self._find_cycle(dependency_type)
+                    if cycle:
+                        raise DependencyError(f"Circular dependency detected: {' -> '.join(t.__name__ for t in cycle)}")
+                    self._cycle_checked.add(dependency_type)
+                # Re-entrant resolution from inside a constructor
+                if dependency_type in self._resolution_stack:
+                    cycle = self._resolution_stack[self._resolution_stack.index(dependency_type):] + [dependency_type]
+                    raise DependencyError(f"Circular dependency detected: {' -> '.join(t.__name__ for t in cycle)}")
             
             # Track resolution stack
             self._resolution_stack.append(dependency_type)
@@ -394,6 +545,8 @@ class DIContainerV2:
                 if self.config.enable_lifecycle_management and dependency_type in self._lifecycle_managers:
                     self._lifecycle_managers[dependency_type].set_phase(LifecyclePhase.READY)
                 
+                if self._plan is not None:
+                    self._plan = self._plan.publish(dependency_type, provider, instance)
                 return instance
             finally:
                 self._resolution_stack.pop()
@@ -422,13 +575,15 @@ class DIContainerV2:
         
         try:
             # Detect cycles
-            cycles = self._graph.detect_cycles()
-            if cycles and not self.config.allow_circular_dependencies:
+            with self._lock:
+                graph = self._ensure_graph()
+            cycles = graph.detect_cycles()
+            if cycles and self.config.strict_mode and not self.config.allow_circular_dependencies:
                 cycle_str = '; '.join([' -> '.join(t.__name__ for t in cycle) for cycle in cycles])
                 raise DependencyError(f"Circular dependencies detected: {cycle_str}")
             
             # Get dependency order
-            order = self._graph.get_dependency_order()
+            order = graph.get_dependency_order()
             self.logger.info(f"Dependency resolution order: {[t.__name__ for t in order]}")
             
             return True
@@ -447,6 +602,7 @@ class DIContainerV2:
             if not self.validate_graph():
                 raise DependencyError("Dependency graph validation failed")
             
+            self._compile_plan()
             self._finalized = True
             self.logger.info("Container finalized successfully")
     
@@ -468,6 +624,9 @@ class DIContainerV2:
             self._providers.clear()
             self._metadata.clear()
             self._graph = DependencyGraph()
+            self._graph_dirty = False
+            self._cycle_checked.clear()
+            self._plan = None
             self._current_stage = RegistrationStage.BOOTSTRAP
             self._finalized = False
             self._resolution_stack.clear()
@@ -478,12 +637,20 @@ class DIContainerV2:
         """Get metadata for a dependency type."""
         return self._metadata.get(dependency_type)
     
+    def get_plan(self) -> Optional[ResolutionPlan]:
+        """The published resolution plan (None until finalized)."""
+        return self._plan
+    
     def get_graph_info(self) -> Dict[str, Any]:
         """Get information about the dependency graph."""
+        with self._lock:
+            graph = self._ensure_graph()
+        cycles = graph.detect_cycles()
         return {
             "node_count": len(self._providers),
-            "has_cycles": len(self._graph.detect_cycles()) > 0,
-            "resolution_order": [t.__name__ for t in self._graph.get_dependency_order()],
+            "has_cycles": len(cycles) > 0,
+            "cycles": [[t.__name__ for t in cycle] for cycle in cycles],
+            "resolution_order": [t.__name__ for t in graph.get_dependency_order()],
             "current_stage": self._current_stage.value,
             "finalized": self._finalized
         }
@@ -679,6 +846,13 @@ def container_context(container: DIContainerV2):
         container.clear()
 
 
+def _annotation_types(annotation: Any) -> List[Type[Any]]:
+    """Concrete types named by a constructor annotation (``Optional[X]`` -> X)."""
+    if typing.get_origin(annotation) is Union:
+        return [arg for arg in typing.get_args(annotation) if isinstance(arg, type) and arg is not type(None)]
+    return [annotation] if isinstance(annotation, type) else []
+
+
 class DependencyError(Exception):
     """Exception raised for dependency injection errors."""
     pass
@@ -0,0 +1,343 @@
+"""
+Memory-Mapped Flight Data Recorder for DART-Planner
+
+Fixed-schema, crash-safe logging for control and planning loops:
+- Pre-sized ring file: a one-page header followed by ``capacity`` records
+  of float64 fields, mapped into memory; appends are a row copy plus a
+  counter store, with no allocation or system call
+- The header holds two indices: ``started`` is stored before a record
+  is written and ``count`` after it, so readers (and a file left behind
+  by a crashed process) skip the slot being written, including the
+  oldest record while it is overwritten; ``flush()`` additionally forces
+  the pages to disk
+- Once full, the oldest records are overwritten (the file always holds
+  the most recent ``capacity`` records)
+- ``load_flight_record`` maps the file back as a NumPy structured array in
+  chronological order for analysis; ``export_flight_record_csv`` writes
+  it as CSV (with the trajectory-log columns for control records)
+
+File layout (little-endian):
+    [magic: 8s][version: u32][header_size: u32][record_size: u32][fields: u32]
+    [capacity: u64][count: u64][started: u64][created: f64][schema_length: u32]
+    [schema: JSON]
+    ... padding to header_size ...
+    [record 0][record 1] ... [record capacity-1]
+"""
+
+import csv
+import json
+import mmap
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from .errors import ConfigurationError
+
+# (field, length) in record order; every value is a float64
+CONTROL_RECORD_LAYOUT: Tuple[Tuple[str, int], ...] = (
+    ("timestamp", 1),
+    ("position", 3),
+    ("velocity", 3),
+    ("attitude", 3),
+    ("angular_velocity", 3),
+    ("desired_position", 3),
+    ("desired_velocity", 3),
+    ("desired_acceleration", 3),
+    ("thrust", 1),
+    ("torque", 3),
+    ("loop_time_s", 1),
+    ("compute_time_s", 1),
+    ("failsafe_active", 1),
+)
+
+_MAGIC = b"DARTFDR1"
+_VERSION = 1
+_HEADER_SIZE = 4096
+_HEADER = struct.Struct("<8sIIII")
+_INDEX = struct.Struct("<QQQdI")  # capacity, count, started, created, schema length
+_COUNT_OFFSET = _HEADER.size + 8  # after the capacity field; started follows count
+
+# Columns of the CSV trajectory logs read by scripts/visualization
+TRAJECTORY_LOG_COLUMNS: Tuple[str, ...] = (
+    "timestamp",
+    "actual_x", "actual_y", "actual_z",
+    "desired_x", "desired_y", "desired_z",
+    "actual_vx", "actual_vy", "actual_vz",
+    "desired_vx", "desired_vy", "desired_vz",
+    "thrust",
+    "torque_norm",
+    "failsafe_active",
+)
+
+
+def layout_dtype(layout: Tuple[Tuple[str, int], ...]) -> np.dtype:
+    """Structured dtype matching a record layout."""
+    return np.dtype([(name, "<f8", (length,)) if length > 1 else (name, "<f8") for name, length in layout])
+
+
+class FlightRecorder:
+    """
+    Writer for a memory-mapped flight data ring file.
+
+    Only one process/thread may append to a recorder.
+
+    Args:
+        path: File to create (overwritten if it exists)
+        capacity: Number of records kept in the ring
+        layout: Record layout as (field, length) pairs
+        metadata: JSON-serializable information stored in the header
+    """
+
+    def __init__(self, path: Union[str, Path], capacity: int = 600_000,
+                 layout: Tuple[Tuple[str, int], ...] = CONTROL_RECORD_LAYOUT,
+                 metadata: Optional[Dict[str, Any]] = None):
+        if capacity <= 0:
+            raise ConfigurationError(f"Flight recorder capacity must be positive, got {capacity}")
+        self.path = Path(path)
+        self.capacity = capacity
+        self.layout = tuple(layout)
+        self.width = sum(length for _, length in self.layout)
+        schema = json.dumps({"layout": [list(item) for item in self.layout],
+                             "metadata": metadata or {}}).encode()
+        if _HEADER.size + _INDEX.size + len(schema) > _HEADER_SIZE:
+            raise ConfigurationError("Flight recorder schema does not fit in the header")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        size = _HEADER_SIZE + capacity * self.width * 8
+        self._file = open(self.path, "w+b")
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        header = _HEADER.pack(_MAGIC, _VERSION, _HEADER_SIZE, self.width * 8, len(self.layout))
+        header += _INDEX.pack(capacity, 0, 0, time.time(), len(schema)) + schema
+        self._mmap[:len(header)] = header
+
+        # [count, started]
+        self._index = np.ndarray((2,), dtype=np.uint64, buffer=self._mmap, offset=_COUNT_OFFSET)
+        self._rows = np.ndarray((capacity, self.width), dtype=np.float64, buffer=self._mmap, offset=_HEADER_SIZE)
+        self._slices: Dict[str, slice] = {}
+        offset = 0
+        for name, length in self.layout:
+            self._slices[name] = slice(offset, offset + length)
+            offset += length
+        self._control_layout = self.layout == CONTROL_RECORD_LAYOUT
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def _begin(self) -> np.ndarray:
+        # Publish the slot as being written before touching it: once the
+        # ring has wrapped it holds the oldest record readers would return
+        count = self.count
+        self._index[1] = count + 1
+        return self._rows[count % self.capacity]
+
+    def _commit(self) -> None:
+        self.count += 1
+        self._index[0] = self.count
+
+    def append_row(self, values) -> None:
+        """Append one record given as ``width`` floats in layout order."""
+        self._begin()[:] = values
+        self._commit()
+
+    def append(self, **fields) -> None:
+        """Append one record by field name; missing fields are recorded as NaN."""
+        slices = self._slices
+        for name in fields:
+            if name not in slices:
+                raise ConfigurationError(f"Unknown flight record field '{name}'")
+        row = self._begin()
+        row[:] = np.nan
+        for name, value in fields.items():
+            row[slices[name]] = getattr(value, "magnitude", value)
+        self._commit()
+
+    def record_control_step(self, timestamp: float, state, desired_position, desired_velocity,
+                            desired_acceleration, thrust: float, torque, loop_time_s: float = 0.0,
+                            compute_time_s: float = 0.0, failsafe_active: bool = False) -> None:
+        """
+        Append one control-loop record (``CONTROL_RECORD_LAYOUT``).
+
+        ``state`` may be a DroneState (pint quantities in canonical units) or
+        a FastDroneState.
+        """
+        if not self._control_layout:
+            raise ConfigurationError("record_control_step() requires CONTROL_RECORD_LAYOUT")
+        row = self._begin()
+        row[0] = timestamp
+        row[1:4] = getattr(state.position, "magnitude", state.position)
+        row[4:7] = getattr(state.velocity, "magnitude", state.velocity)
+        row[7:10] = getattr(state.attitude, "magnitude", state.attitude)
+        row[10:13] = getattr(state.angular_velocity, "magnitude", state.angular_velocity)
+        row[13:16] = desired_position
+        row[16:19] = desired_velocity
+        row[19:22] = desired_acceleration
+        row[22] = thrust
+        row[23:26] = torque
+        row[26] = loop_time_s
+        row[27] = compute_time_s
+        row[28] = failsafe_active
+        self._commit()
+
+    def read(self) -> np.ndarray:
+        """Copy of the recorded data in chronological order."""
+        records = self._rows.view(layout_dtype(self.layout)).reshape(-1)
+        return _chronological(records, self.count, self.count).copy()
+
+    def flush(self) -> None:
+        """Force written records to disk (not needed to survive a process crash)."""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        if self._mmap.closed:
+            return
+        self._mmap.flush()
+        # The mapping cannot close while numpy views are exported
+        self._rows = self._index = None
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "FlightRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_flight_header(path: Union[str, Path]) -> Dict[str, Any]:
+    """Header fields of a flight record file (layout, capacity, count, started, created, metadata)."""
+    with open(path, "rb") as f:
+        raw = f.read(_HEADER_SIZE)
+    if len(raw) < _HEADER_SIZE:
+        raise ConfigurationError(f"{path} is not a flight record (truncated header)")
+    magic, version, header_size, record_size, n_fields = _HEADER.unpack_from(raw)
+    if magic != _MAGIC:
+        raise ConfigurationError(f"{path} is not a flight record")
+    if version != _VERSION:
+        raise ConfigurationError(f"Unsupported flight record version {version} in {path}")
+    capacity, count, started, created, schema_length = _INDEX.unpack_from(raw, _HEADER.size)
+    schema_start = _HEADER.size + _INDEX.size
+    schema = json.loads(raw[schema_start:schema_start + schema_length])
+    layout = tuple((name, length) for name, length in schema["layout"])
+    return {
+        "version": version,
+        "header_size": header_size,
+        "record_size": record_size,
+        "layout": layout,
+        "capacity": capacity,
+        "count": count,
+        "started": max(started, count),
+        "created": created,
+        "metadata": schema["metadata"],
+    }
+
+
+def load_flight_record(path: Union[str, Path], copy: bool = True) -> np.ndarray:
+    """
+    Load a flight record file as a structured array in chronological order.
+
+    Args:
+        path: File written by a FlightRecorder (possibly still open or
+            left behind by a crashed process)
+        copy: Return an in-memory copy; otherwise the records are a
+            read-only memory map as long as the ring has not wrapped (and
+            may change underneath if a writer still has the file open)
+
+    Returns:
+        Structured array with one field per layout entry
+    """
+    header = read_flight_header(path)
+    capacity = header["capacity"]
+    records = np.memmap(path, dtype=layout_dtype(header["layout"]), mode="r",
+                        offset=header["header_size"], shape=(capacity,))
+    data = _chronological(records, header["count"], header["started"])
+    if not copy:
+        return data
+    data = np.array(data)
+    # Drop the records a live writer started overwriting during the copy
+    overwritten = max(0, read_flight_header(path)["started"] - capacity) - max(0, header["started"] - capacity)
+    return data[overwritten:] if overwritten > 0 else data
+
+
+def _chronological(records: np.ndarray, count: int, started: int) -> np.ndarray:
+    """Complete records in write order: indices [started - capacity, count)."""
+    capacity = len(records)
+    first = max(0, started - capacity)
+    start = first % capacity
+    stop = start + max(0, count - first)
+    if stop <= capacity:
+        return records[start:stop]
+    return np.concatenate((records[start:], records[:stop - capacity]))
+
+
+def _csv_columns(data: np.ndarray) -> Dict[str, np.ndarray]:
+    columns: Dict[str, np.ndarray] = {}
+    names = set(data.dtype.names)
+    if names.issuperset(name for name, _ in CONTROL_RECORD_LAYOUT):
+        columns["timestamp"] = data["timestamp"]
+        for prefix, field, axes in (("actual_", "position", "xyz"), ("desired_", "desired_position", "xyz"),
+                                    ("actual_v", "velocity", "xyz"), ("desired_v", "desired_velocity", "xyz")):
+            for i, axis in enumerate(axes):
+                columns[prefix + axis] = data[field][:, i]
+        columns["thrust"] = data["thrust"]
+        columns["torque_norm"] = np.linalg.norm(data["torque"], axis=1)
+        columns["failsafe_active"] = data["failsafe_active"].astype(bool)
+        names -= {"timestamp", "position", "desired_position", "velocity", "desired_velocity",
+                  "thrust", "failsafe_active"}
+    for name in data.dtype.names:
+        if name not in names:
+            continue
+        values = data[name]
+        if values.ndim == 1:
+            columns[name] = values
+        else:
+            suffixes = "xyz" if values.shape[1] == 3 else range(values.shape[1])
+            for i, suffix in enumerate(suffixes):
+                columns[f"{name}_{suffix}"] = values[:, i]
+    return columns
+
+
+def export_flight_record_csv(path: Union[str, Path], csv_path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Write a flight record file as CSV.
+
+    Control records (``CONTROL_RECORD_LAYOUT``) start with
+    ``TRAJECTORY_LOG_COLUMNS``, the columns of the CSV logs the edge
+    controller used to write, followed by the remaining fields; other
+    layouts get one column per value (``field`` or ``field_x``/``field_0``...).
+
+    Args:
+        path: Flight record file
+        csv_path: Output file (default: ``path`` with a ``.csv`` suffix)
+
+    Returns:
+        Path of the CSV file
+    """
+    path = Path(path)
+    csv_path = Path(csv_path) if csv_path is not None else path.with_suffix(".csv")
+    columns = _csv_columns(load_flight_record(path))
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(zip(*(values.tolist() for values in columns.values())))
+    return csv_path
+
+
+def flight_log_as_csv(path: Union[str, Path]) -> Path:
+    """
+    CSV version of a log file for tools that read CSV.
+
+    ``.fdr`` files are exported next to themselves (again only if the
+    record is newer than the export); other paths are returned unchanged.
+    """
+    path = Path(path)
+    if path.suffix != ".fdr":
+        return path
+    csv_path = path.with_suffix(".csv")
+    if not csv_path.exists() or csv_path.stat().st_mtime < path.stat().st_mtime:
+        export_flight_record_csv(path, csv_path)
+    return csv_path
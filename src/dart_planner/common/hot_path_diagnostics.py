@@ -0,0 +1,221 @@
+"""
+Rate-Limited Diagnostics for Hot Loops
+
+Control and scheduling loops hit the same warning condition thousands of
+times per second; logging each occurrence floods the logs and puts string
+formatting inside the loop. HotPathDiagnostics aggregates instead:
+- record() is O(1): a dict lookup, a counter and min/max/last updates
+  under an uncontended lock, so a concurrent flush never loses counts
+- Messages are static templates; formatting happens only when a summary
+  is emitted
+- The first occurrence of an event is reported immediately, after that
+  one summary line per event per interval
+
+Summaries for the current interval are emitted by the next record() call
+after the interval ends, explicitly with flush(), or by a background
+flusher thread (so a burst followed by quiet ticks is still reported);
+pending summaries are also flushed at interpreter exit, skipping handlers
+whose streams are already closed.
+"""
+
+import atexit
+import logging
+import math
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Poll period of the background flusher
+FLUSH_POLL_S = 0.5
+
+_instances: "weakref.WeakSet[HotPathDiagnostics]" = weakref.WeakSet()
+_flusher: Optional[threading.Thread] = None
+_flusher_lock = threading.Lock()
+
+
+class DiagnosticEvent:
+    """Aggregated occurrences of one event key"""
+
+    __slots__ = ("key", "message", "level", "count", "total", "min", "max", "last", "_has_value")
+
+    def __init__(self, key: str, message: str, level: int):
+        self.key = key
+        self.message = message
+        self.level = level
+        self.total = 0
+        self._reset_interval()
+
+    def _reset_interval(self) -> None:
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.last = math.nan
+        self._has_value = False
+
+    def summary(self, elapsed_s: float) -> str:
+        text = f"{self.message} [{self.key}] x{self.count} in {elapsed_s:.1f}s ({self.total} total)"
+        if self._has_value:
+            text += f" min={self.min:.4g} max={self.max:.4g} last={self.last:.4g}"
+        return text
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "pending": self.count,
+            "min": self.min if self._has_value else None,
+            "max": self.max if self._has_value else None,
+            "last": self.last if self._has_value else None,
+        }
+
+
+class HotPathDiagnostics:
+    """
+    Per-component event aggregator with periodic summary logging.
+
+    Args:
+        name: Logger name summaries are written to
+        interval_s: Minimum time between summaries of the same event
+        clock: Monotonic time source
+    """
+
+    def __init__(self,
+                 name: str,
+                 interval_s: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.logger = logging.getLogger(name)
+        self.interval_s = interval_s
+        self.clock = clock
+        self._events: Dict[str, DiagnosticEvent] = {}
+        self._last_emit = -math.inf
+        self._next_emit = -math.inf
+        self._lock = threading.Lock()
+        _register(self)
+
+    def record(self,
+               key: str,
+               value: Optional[float] = None,
+               message: Optional[str] = None,
+               level: int = logging.WARNING) -> None:
+        """
+        Count one occurrence of an event.
+
+        Args:
+            key: Event identifier
+            value: Optional measurement to aggregate (min/max/last)
+            message: Static description, used when the key is first seen
+            level: Logging level for the summaries
+        """
+        with self._lock:
+            event = self._events.get(key)
+            if event is None:
+                event = self._events[key] = DiagnosticEvent(key, message or key, level)
+            event.count += 1
+            event.total += 1
+            if value is not None:
+                event._has_value = True
+                event.last = value
+                if value < event.min:
+                    event.min = value
+                if value > event.max:
+                    event.max = value
+            due = self.clock() >= self._next_emit
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Emit one summary line per event seen since the previous summary"""
+        for level, text in self._take_summaries():
+            self.logger.log(level, text)
+
+    def _take_summaries(self) -> List[Tuple[int, str]]:
+        # Read and reset under the lock; logging happens outside it so
+        # record() never waits on handler I/O
+        with self._lock:
+            now = self.clock()
+            elapsed = now - self._last_emit if self._last_emit > -math.inf else 0.0
+            self._last_emit = now
+            self._next_emit = now + self.interval_s
+            summaries = []
+            for event in self._events.values():
+                if not event.count:
+                    continue
+                if self.logger.isEnabledFor(event.level):
+                    summaries.append((event.level, event.summary(elapsed)))
+                event._reset_interval()
+            return summaries
+
+    def flush_due(self) -> None:
+        """Flush if events are pending and the interval has elapsed (background flusher)"""
+        with self._lock:
+            due = self.clock() >= self._next_emit and any(event.count for event in self._events.values())
+        if due:
+            self.flush()
+
+    def count(self, key: str) -> int:
+        """Total occurrences of an event since creation (or reset)"""
+        event = self._events.get(key)
+        return event.total if event is not None else 0
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {key: event.snapshot() for key, event in self._events.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._last_emit = -math.inf
+            self._next_emit = -math.inf
+
+
+def flush_all() -> None:
+    """Flush pending summaries of every live HotPathDiagnostics"""
+    for diagnostics in list(_instances):
+        diagnostics.flush()
+
+
+def _register(diagnostics: HotPathDiagnostics) -> None:
+    global _flusher
+    _instances.add(diagnostics)
+    if _flusher is not None:
+        return
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="hot-path-diagnostics", daemon=True)
+            _flusher.start()
+            atexit.register(_flush_at_exit)
+
+
+def _flush_at_exit() -> None:
+    for diagnostics in list(_instances):
+        for level, text in diagnostics._take_summaries():
+            _log_guarded(diagnostics.logger, level, text)
+
+
+def _log_guarded(logger: logging.Logger, level: int, text: str) -> None:
+    """Log via each handler separately, skipping closed streams and failed writes"""
+    # Handlers may already be closed at exit (e.g. captured test streams)
+    record = logger.makeRecord(logger.name, level, "(hot_path_diagnostics)", 0, text, None, None)
+    current: Optional[logging.Logger] = logger
+    while current is not None:
+        for handler in current.handlers:
+            if record.levelno < handler.level:
+                continue
+            stream = getattr(handler, "stream", None)
+            if stream is not None and getattr(stream, "closed", False):
+                continue
+            try:
+                handler.handle(record)
+            except Exception:
+                pass
+        current = current.parent if current.propagate else None
+
+
+def _flush_loop() -> None:
+    while True:
+        time.sleep(FLUSH_POLL_S)
+        for diagnostics in list(_instances):
+            try:
+                diagnostics.flush_due()
+            except Exception:
+                pass
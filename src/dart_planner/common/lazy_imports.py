@@ -0,0 +1,43 @@
+"""
+Lazy Import Helpers for DART-Planner
+
+Keeps process startup cheap by deferring imports until first use:
+- ``lazy_exports`` builds a package ``__getattr__``/``__dir__`` pair
+  (PEP 562) so ``__init__`` re-exports are imported from their submodules
+  only when accessed
+- Resolved names are cached in the package namespace, so only the first
+  access pays for the import
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Module ``__getattr__`` and ``__dir__`` for lazily re-exported names.
+
+    Args:
+        package: ``__name__`` of the package doing the re-exporting
+        exports: Exported name -> ``"submodule"`` (same attribute name) or
+            ``"submodule:attribute"``; submodules are relative to ``package``
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package namespace
+    """
+
+    def __getattr__(name: str) -> object:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        module_name, _, attribute = target.partition(":")
+        module = importlib.import_module(f".{module_name}", package)
+        value = getattr(module, attribute or name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -3,15 +3,31 @@ Centralized logging configuration for DART-Planner.
 
 This module provides a consistent logging setup across all components,
 replacing print statements with proper structured logging.
+
+Records can be written asynchronously (opt-in through
+``logging.enable_async_logging`` or ``setup_logging(enable_async=True)``):
+- ``AsyncLogHandler`` is the only handler on the root logger; it appends
+  records to a bounded queue without taking locks or formatting, and
+  counts what it drops when the queue is full
+- A background writer thread formats (including JSON encoding) and writes
+  them to the real console/file handlers
+- ``StructuredLogger`` calls that would reach only that handler skip
+  ``LogRecord`` creation and caller lookup and enqueue a compact tuple
+- The queue is drained at interpreter exit and when a multiprocessing
+  child exits; other children that leave through ``os._exit`` lose what
+  is still queued
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
 import sys
 import json
 import uuid
 import time
 import threading
+from collections import deque
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
 from contextlib import contextmanager
@@ -72,6 +88,210 @@ class StructuredFormatter(logging.Formatter):
         return json.dumps(log_data, default=str)
 
 
+class LogQueue:
+    """
+    Bounded multi-producer, single-consumer queue of log entries.
+
+    ``put`` never blocks: when the queue is full the entry is dropped and
+    counted. Appends rely on ``deque`` operations being atomic, so no lock
+    is taken on the producer side.
+    """
+
+    def __init__(self, capacity: int = 8192):
+        self.capacity = capacity
+        self.dropped = 0
+        self._items: deque = deque()
+        self._ready = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: Any) -> bool:
+        items = self._items
+        if len(items) >= self.capacity:
+            self.dropped += 1
+            return False
+        items.append(item)
+        if len(items) == 1:
+            # Only the empty -> non-empty transition wakes the writer
+            self._ready.set()
+        return True
+
+    def wait(self, timeout: float) -> None:
+        """Block the consumer until an entry arrives or ``timeout`` passes."""
+        if not self._items:
+            self._ready.wait(timeout)
+        self._ready.clear()
+
+    def wake(self) -> None:
+        self._ready.set()
+
+    def drain(self) -> list:
+        """Remove and return every queued entry."""
+        items = self._items
+        batch = []
+        try:
+            while True:
+                batch.append(items.popleft())
+        except IndexError:
+            return batch
+
+
+class AsyncLogHandler(logging.Handler):
+    """
+    Queue handler whose writer thread forwards records to ``handlers``.
+
+    Records are formatted on the writer thread, so arguments of
+    ``logger.info("%s", obj)`` calls are rendered after the call returns.
+
+    Args:
+        handlers: Handlers that format and write the records
+        capacity: Queue capacity; further records are dropped and counted
+        flush_interval_s: Longest time the writer sleeps without being woken
+    """
+
+    def __init__(self, handlers, capacity: int = 8192, flush_interval_s: float = 0.1):
+        super().__init__()
+        self.handlers = list(handlers)
+        self.queue = LogQueue(capacity)
+        self.flush_interval_s = flush_interval_s
+        self._reported_drops = 0
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._start_writer()
+
+    def _start_writer(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="dart-log-writer", daemon=True)
+        self._thread.start()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Enqueue without the handler lock; filtering is the only work done here."""
+        if self.filters and not self.filter(record):
+            return False
+        self.queue.put(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.queue.put(record)
+
+    def enqueue(self, level: int, name: str, message: str, fields: Dict[str, Any]) -> bool:
+        """Hot-path entry point: queue a compact tuple instead of a LogRecord."""
+        return self.queue.put((time.time(), level, name, message, fields, threading.get_ident()))
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while not self._closed:
+            self.queue.wait(self.flush_interval_s)
+            self._write_pending()
+        self._write_pending()
+
+    def _write_pending(self) -> None:
+        self._busy = True
+        try:
+            for item in self.queue.drain():
+                record = item if isinstance(item, logging.LogRecord) else self._to_record(item)
+                if record is not None:
+                    self._dispatch(record)
+            dropped = self.queue.dropped
+            if dropped != self._reported_drops:
+                self._dispatch(logging.makeLogRecord({
+                    'name': __name__, 'levelno': logging.WARNING, 'levelname': 'WARNING',
+                    'msg': f"Log queue full: dropped {dropped - self._reported_drops} records",
+                }))
+                self._reported_drops = dropped
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    pass  # stream closed underneath the handler (e.g. at interpreter exit)
+        finally:
+            self._busy = False
+
+    def _to_record(self, item: tuple) -> Optional[logging.LogRecord]:
+        created, level, name, message, fields, thread = item
+        try:
+            record = logging.getLogger(name).makeRecord(
+                name, level, "(queued)", 0, message, (), None, extra=fields)
+        except Exception:
+            # e.g. an extra field clashing with a LogRecord attribute
+            record = logging.makeLogRecord({'name': name, 'levelno': level,
+                                            'levelname': logging.getLevelName(level), 'msg': message})
+            self.handleError(record)
+            return None
+        record.relativeCreated -= (record.created - created) * 1000
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        record.thread = thread
+        record.threadName = None
+        return record
+
+    def _dispatch(self, record: logging.LogRecord) -> None:
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def flush(self, timeout: float = 1.0) -> None:
+        """Wait (up to ``timeout``) until everything queued so far is written."""
+        deadline = time.monotonic() + timeout
+        self.queue.wake()
+        while (len(self.queue) or self._busy) and time.monotonic() < deadline \
+                and self._thread is not None and self._thread.is_alive():
+            time.sleep(0.001)
+            self.queue.wake()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self.queue.wake()
+            if self._thread is not None and self._thread is not threading.current_thread():
+                self._thread.join(timeout=1.0)
+            for handler in self.handlers:
+                handler.close()
+        super().close()
+
+    def _after_fork(self) -> None:
+        # Only the forking thread survives in the child: the parent's backlog
+        # is the parent's to write, and the writer has to be restarted
+        if not self._closed:
+            self.queue.drain()
+            self.queue._ready = threading.Event()
+            self._busy = False
+            self._start_writer()
+
+
+# Handler installed on the root logger by setup_logging(), if any
+_async_handler: Optional[AsyncLogHandler] = None
+
+
+def _routes_only_to(logger: logging.Logger, handler: AsyncLogHandler) -> bool:
+    """Whether records from ``logger`` would reach ``handler`` and nothing else."""
+    current: Optional[logging.Logger] = logger
+    while current is not None:
+        if current.filters:
+            return False
+        if current.handlers:
+            return current.handlers == [handler] and (current.parent is None or not current.propagate)
+        if not current.propagate:
+            return False
+        current = current.parent
+    return False
+
+
+def _reinit_async_handler() -> None:
+    if _async_handler is not None:
+        _async_handler._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_async_handler)
+
+
 class PerformanceLogger:
     """Performance logging with timing and metrics."""
     
@@ -83,19 +303,19 @@ class PerformanceLogger:
     
     @contextmanager
     def time_operation(self, operation: str, correlation_id: Optional[str] = None):
-        """Context manager for timing operations."""
-        start_time = time.time()
+        """Context manager for timing operations (durations are logged at DEBUG)."""
+        start_time = time.perf_counter()
         timer_id = f"{operation}_{correlation_id or 'default'}"
         
         try:
             yield
         finally:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             with self._lock:
                 self._timers[timer_id] = duration
                 self._counters[timer_id] = self._counters.get(timer_id, 0) + 1
             
-            self.logger.info(
+            self.logger.debug(
                 f"Operation completed",
                 extra={
                     'operation': operation,
@@ -128,11 +348,19 @@ class StructuredLogger:
     
     def _log_with_context(self, level: int, message: str, **kwargs):
         """Log with correlation ID and context."""
+        logger = self.logger
+        if not logger.isEnabledFor(level):
+            return
+        handler = _async_handler
+        if handler is not None and _routes_only_to(logger, handler):
+            kwargs['correlation_id'] = self.correlation_id
+            handler.enqueue(level, logger.name, message, kwargs)
+            return
         extra = {
             'correlation_id': self.correlation_id,
             **kwargs
         }
-        self.logger.log(level, message, extra=extra)
+        logger.log(level, message, extra=extra)
     
     def debug(self, message: str, **kwargs):
         """Log debug message with context."""
@@ -181,7 +409,8 @@ def setup_logging(
     enable_file: bool = False,
     format_string: Optional[str] = None,
     enable_structured: bool = False,
-    enable_correlation_id: bool = True
+    enable_correlation_id: bool = True,
+    enable_async: Optional[bool] = None
 ) -> None:
     """
     Setup centralized logging configuration.
@@ -194,7 +423,10 @@ def setup_logging(
         format_string: Custom log format string
         enable_structured: Enable structured JSON logging
         enable_correlation_id: Enable correlation IDs in logs
+        enable_async: Format and write records on a background thread
+            (default: ``logging.enable_async_logging`` from the config)
     """
+    global _async_handler
     # Get configuration
     config = get_frozen_config()
     logging_config = config.logging
@@ -207,6 +439,7 @@ def setup_logging(
     format_string = format_string or logging_config.log_format
     enable_structured = enable_structured or logging_config.enable_structured_logging
     enable_correlation_id = enable_correlation_id or logging_config.log_correlation_id
+    enable_async = logging_config.enable_async_logging if enable_async is None else enable_async
     
     # Convert string level to logging constant
     level_map = {
@@ -228,6 +461,9 @@ def setup_logging(
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    if _async_handler is not None:
+        _async_handler.close()
+        _async_handler = None
     
     # Setup handlers
     handlers = []
@@ -256,6 +492,10 @@ def setup_logging(
     
     # Configure root logger
     root_logger.setLevel(log_level)
+    if enable_async and handlers:
+        _async_handler = AsyncLogHandler(handlers, capacity=logging_config.async_queue_size)
+        _install_worker_exit_flush()
+        handlers = [_async_handler]
     for handler in handlers:
         root_logger.addHandler(handler)
     
@@ -274,11 +514,58 @@ def setup_logging(
             'console_enabled': enable_console,
             'file_enabled': enable_file,
             'structured_enabled': enable_structured,
-            'correlation_id_enabled': enable_correlation_id
+            'correlation_id_enabled': enable_correlation_id,
+            'async_enabled': _async_handler is not None
         }
     )
 
 
+def flush_logging(timeout: float = 1.0) -> None:
+    """Wait until records queued for the background writer have been written."""
+    if _async_handler is not None:
+        _async_handler.flush(timeout)
+
+
+def get_log_queue_stats() -> Dict[str, Any]:
+    """Queue depth and drop count of the asynchronous logging pipeline."""
+    if _async_handler is None:
+        return {'enabled': False, 'queued': 0, 'dropped': 0, 'capacity': 0}
+    queue = _async_handler.queue
+    return {'enabled': True, 'queued': len(queue), 'dropped': queue.dropped, 'capacity': queue.capacity}
+
+
+def _shutdown_async_logging() -> None:
+    if _async_handler is not None:
+        _async_handler.close()
+
+
+atexit.register(_shutdown_async_logging)
+
+_worker_exit_flush_installed = False
+
+
+def _register_exit_finalizer(_=None) -> None:
+    import multiprocessing.util
+    multiprocessing.util.Finalize(None, _shutdown_async_logging, exitpriority=-100)
+
+
+def _install_worker_exit_flush() -> None:
+    """
+    Drain the queue when a multiprocessing child exits.
+
+    Children leave through ``os._exit``, which skips ``atexit``, but still
+    run their exit finalizers. Forked children clear the finalizers
+    inherited from the parent, so it is registered again after fork.
+    """
+    global _worker_exit_flush_installed
+    if _worker_exit_flush_installed:
+        return
+    import multiprocessing.util
+    _register_exit_finalizer()
+    multiprocessing.util.register_after_fork(_register_exit_finalizer, _register_exit_finalizer)
+    _worker_exit_flush_installed = True
+
+
 def configure_component_logging(component_name: str, level: Optional[str] = None) -> StructuredLogger:
     """
     Configure logging for a specific component.
@@ -2,23 +2,49 @@
 Multiprocessing-based Real-Time Control Loop for DART-Planner.
 
 Avoids Python GIL by running the control loop in a separate process.
+
+Two ways to exchange data with the control process:
+- Queue mode (default): ``func()`` takes no arguments and its latest
+  result is returned by ``get_result()``
+- Shared-memory mode: ``func(state)`` receives the latest FastDroneState
+  written with ``write_state()`` and returns ``(thrust, torque)``, which
+  ``get_command()`` reads back through a SharedControlChannel (seqlock
+  blocks in shared memory, no pickling)
 """
 
+import os
 import time
 import multiprocessing
 import queue
-from typing import Callable, Optional, Any
+from typing import Callable, Iterable, Optional, Any
+
+import numpy as np
+
+from .errors import ConfigurationError
+from .logging_config import get_logger
+from .shared_state_channel import ControlOutput, SharedControlChannel
+from .types import FastDroneState
 
 
 class ProcessControlLoop:
     """
     Runs a user-provided function at a fixed frequency in a separate process,
     allowing the control loop to bypass the Python GIL.
+
+    Args:
+        func: Control function (see module docstring for its signature)
+        frequency_hz: Loop frequency
+        shared_memory: Exchange state and commands through shared memory
+        cpu_affinity: CPUs to pin the control process to (Linux only)
     """
-    def __init__(self, func: Callable[..., Any], frequency_hz: float):
+    def __init__(self, func: Callable[..., Any], frequency_hz: float,
+                 shared_memory: bool = False,
+                 cpu_affinity: Optional[Iterable[int]] = None):
         self.func = func
         self.frequency_hz = frequency_hz
         self.period_ns = int(1e9 / frequency_hz)
+        self.cpu_affinity = set(cpu_affinity) if cpu_affinity is not None else None
+        self.channel: Optional[SharedControlChannel] = SharedControlChannel() if shared_memory else None
         self.queue: multiprocessing.Queue = multiprocessing.Queue(maxsize=1)
         self.stop_event = multiprocessing.Event()
         self.process: Optional[multiprocessing.Process] = None
@@ -28,15 +54,33 @@ class ProcessControlLoop:
         self.process = multiprocessing.Process(target=self._run_loop, daemon=True)
         self.process.start()
 
+    def _apply_affinity(self) -> None:
+        if not self.cpu_affinity:
+            return
+        logger = get_logger(__name__)
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("CPU affinity is not supported on this platform")
+            return
+        try:
+            os.sched_setaffinity(0, self.cpu_affinity)
+        except OSError as e:
+            logger.warning(f"Could not set CPU affinity {sorted(self.cpu_affinity)}: {e}")
+
     def _run_loop(self) -> None:
+        self._apply_affinity()
+        if self.channel is not None:
+            self._run_shared_loop()
+            return
         next_call = time.perf_counter_ns()
         while not self.stop_event.is_set():
-            start_ns = time.perf_counter_ns()
             try:
                 result = self.func()
                 # Non-blocking put: always keep latest value
-                if not self.queue.full():
-                    self.queue.put(result)
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self.queue.put_nowait(result)
             except Exception:
                 # Ignore errors in loop to preserve timing
                 pass
@@ -45,8 +89,53 @@ class ProcessControlLoop:
             if sleep_ns > 0:
                 time.sleep(sleep_ns / 1e9)
 
+    def _run_shared_loop(self) -> None:
+        channel = self.channel
+        iteration = 0
+        missed = 0
+        next_call = time.perf_counter_ns()
+        while not self.stop_event.is_set():
+            start_ns = time.perf_counter_ns()
+            try:
+                version, state = channel.read_state()
+                if state is not None:
+                    thrust, torque = self.func(state)
+                    iteration += 1
+                    channel.write_command(
+                        float(thrust), np.asarray(torque, dtype=float),
+                        state_timestamp=state.timestamp, state_version=version,
+                        compute_time_s=(time.perf_counter_ns() - start_ns) / 1e9,
+                        iteration=iteration, missed_deadlines=missed,
+                    )
+            except Exception:
+                # Ignore errors in loop to preserve timing
+                pass
+            next_call += self.period_ns
+            sleep_ns = next_call - time.perf_counter_ns()
+            if sleep_ns > 0:
+                time.sleep(sleep_ns / 1e9)
+            else:
+                missed += 1
+                if -sleep_ns > self.period_ns:
+                    # Too far behind: resynchronize instead of bursting
+                    next_call = time.perf_counter_ns()
+
+    def write_state(self, state: FastDroneState) -> int:
+        """Publish the state for the next control step (shared-memory mode)."""
+        if self.channel is None:
+            raise ConfigurationError("write_state() requires shared_memory=True")
+        return self.channel.write_state(state)
+
+    def get_command(self) -> Optional[ControlOutput]:
+        """Latest control output (shared-memory mode), or None before the first one."""
+        if self.channel is None:
+            raise ConfigurationError("get_command() requires shared_memory=True")
+        return self.channel.read_command()
+
     def get_result(self, timeout: Optional[float] = None) -> Any:
         """Retrieve the latest result from the control loop."""
+        if self.channel is not None:
+            return self.channel.read_command()
         try:
             return self.queue.get(timeout=timeout)
         except queue.Empty:
@@ -56,4 +145,6 @@ class ProcessControlLoop:
         """Stop the control loop process."""
         self.stop_event.set()
         if self.process is not None:
-            self.process.join() 
\ No newline at end of file
+            self.process.join()
+        if self.channel is not None:
+            self.channel.close()
@@ -0,0 +1,237 @@
+"""
+Piecewise-Polynomial Trajectory Evaluation for DART-Planner
+
+Compact, precomputed form of a planner ``Trajectory`` for control loops:
+- All sampled fields live in one contiguous float64 ``(N, fields)`` buffer
+  (SI magnitudes, units stripped once on receipt)
+- Per-segment polynomial coefficients are computed once: quintic Hermite
+  for position when velocities and accelerations are available, cubic
+  Hermite with velocities only, linear otherwise; derivative fields
+  (velocity, acceleration, yaw rate) are evaluated from the position/yaw
+  polynomial so they stay consistent with it
+- ``evaluate`` keeps a monotonic segment cursor, so stepping forward in
+  time is O(1); ``evaluate_many`` samples arbitrary times in one pass
+- Times outside the trajectory clamp to the first/last sample
+- Unsorted or repeated sample times are sorted, keeping the last sample
+  given for each time, instead of failing in the control loop
+- Consumers compile once on receipt and key the cache on the trajectory's
+  identity (``compiles`` is O(1)); after editing a trajectory's arrays in
+  place, call ``invalidate`` so the next lookup recompiles
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .errors import ValidationError
+from .units import ensure_units
+
+# Trajectory attribute -> SI unit of its magnitudes
+TRAJECTORY_FIELDS: Dict[str, str] = {
+    "positions": "m",
+    "velocities": "m/s",
+    "accelerations": "m/s^2",
+    "attitudes": "rad",
+    "body_rates": "rad/s",
+    "thrusts": "N",
+    "yaws": "rad",
+    "yaw_rates": "rad/s",
+}
+
+INTERPOLATIONS = ("linear", "hermite")
+
+_ORDER = 6  # coefficients per segment (quintic)
+_POWERS = np.arange(_ORDER)
+# d/dtau of sum(c_k tau^k) in the same power basis
+_DERIVATIVE = np.diag(np.arange(1.0, _ORDER), k=1)
+
+
+class PiecewiseTrajectory:
+    """
+    Precomputed piecewise-polynomial evaluator for a trajectory.
+
+    Args:
+        timestamps: Sample times (s); unsorted or repeated times are sorted,
+            keeping the last sample given for each time
+        samples: Field name -> ``(N,)`` or ``(N, k)`` array in SI units
+        interpolation: ``"hermite"`` to use derivative samples
+            (velocities/accelerations, yaw_rates) as Hermite constraints,
+            or ``"linear"`` to blend every field linearly
+        source: Object the samples were taken from (see ``compiles``)
+
+    Attributes:
+        columns: Field name -> column slice into evaluated rows
+    """
+
+    def __init__(self, timestamps, samples: Dict[str, np.ndarray], interpolation: str = "hermite",
+                 source: object = None):
+        if interpolation not in INTERPOLATIONS:
+            raise ValidationError(f"Unknown trajectory interpolation '{interpolation}'")
+        times = np.ascontiguousarray(timestamps, dtype=np.float64).reshape(-1)
+        if len(times) == 0:
+            raise ValidationError("Cannot compile an empty trajectory")
+        n = len(times)
+        order = None
+        if np.any(np.diff(times) <= 0.0):
+            order = np.argsort(times, kind="stable")
+            ordered = times[order]
+            last = np.append(ordered[1:] != ordered[:-1], True)  # last sample of each time
+            order, times = order[last], ordered[last]
+
+        self.columns: Dict[str, slice] = {}
+        blocks = []
+        width = 0
+        for name, values in samples.items():
+            block = np.asarray(values, dtype=np.float64).reshape(n, -1)
+            if order is not None:
+                block = block[order]
+            self.columns[name] = slice(width, width + block.shape[1])
+            blocks.append(block)
+            width += block.shape[1]
+        self.timestamps = times
+        self.data = np.ascontiguousarray(np.hstack(blocks)) if blocks else np.empty((len(times), 0))
+        self.interpolation = interpolation
+        self.source = source
+        self.coefficients = self._fit()
+        self._segment = 0
+
+    @classmethod
+    def from_trajectory(cls, trajectory, fields: Optional[Sequence[str]] = None,
+                        interpolation: str = "hermite") -> "PiecewiseTrajectory":
+        """
+        Compile a ``Trajectory`` (Quantity or plain SI arrays).
+
+        Args:
+            trajectory: Object with ``timestamps`` and trajectory fields
+            fields: Fields to include (default: every non-None field)
+            interpolation: See class documentation
+        """
+        fields = tuple(fields or TRAJECTORY_FIELDS)
+        samples = {}
+        for name in fields:
+            value = getattr(trajectory, name, None)
+            if value is None:
+                continue
+            if not hasattr(value, "magnitude"):
+                value = np.asarray(value, dtype=np.float64)
+            samples[name] = ensure_units(value, TRAJECTORY_FIELDS[name], f"Trajectory.{name}").magnitude
+        return cls(trajectory.timestamps, samples, interpolation, source=trajectory)
+
+    def compiles(self, trajectory) -> bool:
+        """Whether this evaluator was compiled from ``trajectory`` (identity check)."""
+        return self.source is trajectory
+
+    def invalidate(self) -> None:
+        """Mark stale after the source was edited in place; ``compiles`` is False from now on."""
+        self.source = None
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def start_time(self) -> float:
+        return float(self.timestamps[0])
+
+    @property
+    def end_time(self) -> float:
+        return float(self.timestamps[-1])
+
+    def _fit(self) -> np.ndarray:
+        """Coefficients ``(N-1, 6, fields)`` in local segment time."""
+        data, times = self.data, self.timestamps
+        coefficients = np.zeros((max(len(times) - 1, 0), _ORDER, data.shape[1]))
+        if len(times) < 2:
+            return coefficients
+        h = np.diff(times)[:, None]
+        # Linear blend for every column; Hermite groups overwrite theirs
+        coefficients[:, 0] = data[:-1]
+        coefficients[:, 1] = (data[1:] - data[:-1]) / h
+        if self.interpolation == "hermite":
+            self._fit_hermite(coefficients, h, "positions", "velocities", "accelerations")
+            self._fit_hermite(coefficients, h, "yaws", "yaw_rates", None)
+        return coefficients
+
+    def _fit_hermite(self, coefficients: np.ndarray, h: np.ndarray, value: str,
+                     rate: str, second: Optional[str]) -> None:
+        columns = self.columns
+        if value not in columns or rate not in columns:
+            return
+        data = self.data
+        p = data[:, columns[value]]
+        v = data[:, columns[rate]]
+        if p.shape != v.shape:
+            return
+        p0, p1, v0, v1 = p[:-1], p[1:], v[:-1], v[1:]
+        dp = p1 - p0
+        c = np.zeros((len(h), _ORDER, p.shape[1]))
+        c[:, 0], c[:, 1] = p0, v0
+        if second in columns and data[:, columns[second]].shape == p.shape:
+            a = data[:, columns[second]]
+            a0, a1 = a[:-1], a[1:]
+            c[:, 2] = a0 / 2.0
+            # Residual position, velocity and acceleration left for the cubic-quintic terms
+            rp = dp - v0 * h - a0 * h ** 2 / 2.0
+            rv = (v1 - v0 - a0 * h) * h
+            ra = (a1 - a0) * h ** 2
+            c[:, 3] = (10.0 * rp - 4.0 * rv + ra / 2.0) / h ** 3
+            c[:, 4] = (-15.0 * rp + 7.0 * rv - ra) / h ** 4
+            c[:, 5] = (6.0 * rp - 3.0 * rv + ra / 2.0) / h ** 5
+            derivatives = (rate, second)
+        else:
+            c[:, 2] = (3.0 * dp / h - 2.0 * v0 - v1) / h
+            c[:, 3] = (-2.0 * dp / h + v0 + v1) / h ** 2
+            derivatives = (rate,)
+        coefficients[:, :, columns[value]] = c
+        for name in derivatives:
+            c = np.einsum("jk,skf->sjf", _DERIVATIVE, c)
+            coefficients[:, :, columns[name]] = c
+
+    def _locate(self, t: float) -> int:
+        times = self.timestamps
+        i = self._segment
+        # Steady state: same segment or the next one
+        if times[i] <= t < times[i + 1]:
+            return i
+        if i + 2 < len(times) and times[i + 1] <= t < times[i + 2]:
+            self._segment = i + 1
+            return i + 1
+        i = int(np.searchsorted(times, t, side="right")) - 1
+        self._segment = i
+        return i
+
+    def evaluate(self, t: float) -> np.ndarray:
+        """Row of all fields at time ``t`` (slice it with ``columns``)."""
+        times = self.timestamps
+        if t <= times[0] or len(times) == 1:
+            return self.data[0].copy()
+        if t >= times[-1]:
+            return self.data[-1].copy()
+        i = self._locate(t)
+        return ((t - times[i]) ** _POWERS) @ self.coefficients[i]
+
+    def evaluate_many(self, times) -> np.ndarray:
+        """Rows ``(M, fields)`` at each of ``times``."""
+        query = np.asarray(times, dtype=np.float64).reshape(-1)
+        knots = self.timestamps
+        if len(knots) == 1:
+            return np.repeat(self.data[:1], len(query), axis=0)
+        segments = np.clip(np.searchsorted(knots, query, side="right") - 1, 0, len(knots) - 2)
+        tau = query - knots[segments]
+        rows = np.einsum("mk,mkf->mf", tau[:, None] ** _POWERS, self.coefficients[segments])
+        rows[query <= knots[0]] = self.data[0]
+        rows[query >= knots[-1]] = self.data[-1]
+        return rows
+
+    def field(self, row: np.ndarray, name: str, default: Optional[np.ndarray] = None) -> np.ndarray:
+        """Field ``name`` of an evaluated row, or ``default`` when not compiled."""
+        column = self.columns.get(name)
+        if column is None:
+            return default
+        return row[..., column]
+
+    def sample_motion(self, t: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Position, velocity and acceleration at ``t`` (zeros for missing fields)."""
+        row = self.evaluate(t)
+        return (self.field(row, "positions", np.zeros(3)), self.field(row, "velocities", np.zeros(3)),
+                self.field(row, "accelerations", np.zeros(3)))
+
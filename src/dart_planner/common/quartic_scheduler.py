@@ -6,33 +6,48 @@ for hard real-time tasks with precise timer-driven scheduling.
 
 Features:
 - Precise timer-based scheduling using high-resolution clocks
-- Jitter analysis and histogram generation
+- Jitter analysis and histogram generation from constant-memory quantile
+  sketches (p50/p99/p99.9 over a sliding window); dispatch only appends to
+  the raw sample deques, which are folded into the sketches in batches and
+  evaluated only when statistics are requested
 - Cooperative multitasking with deadline monitoring
 - Support for multiple task priorities and frequencies
+- Heap-based dispatch: a release heap keyed by next execution time feeds a
+  ready heap keyed by (priority, deadline), i.e. earliest-deadline-first
+  within a priority class, so dispatch is O(log n) in the number of tasks
+- Optional thread/process executors for long-running synchronous tasks,
+  with deadline accounting on completion
 - Real-time performance monitoring and statistics
 - Integration with existing DART-Planner real-time infrastructure
+- Pluggable clock: under a VirtualClock the same tasks run in simulated
+  time, deterministically and faster than real time
 
 Based on cutting-plane algorithms for real-time scheduling and modern
 cooperative multitasking principles.
 """
 
 import asyncio
-import time
+import heapq
+import itertools
+import pickle
 import threading
 import platform
 import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, List, Optional, Callable, Any, Union, Tuple
 from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
 from collections import deque, defaultdict
-import numpy as np
-import matplotlib.pyplot as plt
 from pathlib import Path
 
-from .timing_utils import high_res_sleep
+import numpy as np
+
+from .clock import Clock, get_clock
 from .errors import RealTimeError, SchedulingError
 from .real_time_config import TaskPriority, TaskType, RealTimeTask, TimingStats
 from .logging_config import get_logger
+from .hot_path_diagnostics import HotPathDiagnostics
+from .streaming_stats import QuantileSketch, WindowedQuantileSketch
 
 
 @dataclass
@@ -44,25 +59,58 @@ class QuarticTask:
     priority: TaskPriority = TaskPriority.MEDIUM
     enabled: bool = True
     deadline_ms: Optional[float] = None
+    # None runs synchronous functions inline on the event loop; "thread" or
+    # "process" runs them on a dedicated single-worker executor
+    executor: Optional[str] = None
     
     # Timing tracking
     period_s: float = 0.0
     next_execution: float = 0.0
     last_execution: float = 0.0
     execution_count: int = 0
+    release_count: int = 0
     missed_deadlines: int = 0
+    skipped_releases: int = 0  # releases skipped while an offloaded run was still in flight
     
-    # Performance monitoring
+    # Performance monitoring: recent raw samples (for plots) and windowed sketches (ms).
+    # The sketches are fed from the deques by QuarticScheduler._feed_sketches;
+    # the *_sample_times deques hold the clock time each sample was taken.
     execution_times: deque = field(default_factory=lambda: deque(maxlen=1000))
     jitter_samples: deque = field(default_factory=lambda: deque(maxlen=1000))
+    execution_sample_times: deque = field(default_factory=lambda: deque(maxlen=1000), repr=False)
+    jitter_sample_times: deque = field(default_factory=lambda: deque(maxlen=1000), repr=False)
+    execution_stats: WindowedQuantileSketch = field(default_factory=WindowedQuantileSketch,
+                                                    repr=False, compare=False)
+    jitter_stats: WindowedQuantileSketch = field(default_factory=WindowedQuantileSketch,
+                                                 repr=False, compare=False)
+    
+    # Diagnostic event keys/messages, built once so the hot path does no formatting
+    deadline_key: str = field(init=False, repr=False, default="")
+    deadline_message: str = field(init=False, repr=False, default="")
+    overrun_key: str = field(init=False, repr=False, default="")
+    overrun_message: str = field(init=False, repr=False, default="")
+    
+    # Scheduler bookkeeping: heap entries carrying an older token are stale
+    _sched_token: int = field(init=False, repr=False, compare=False, default=0)
+    # execution_count / release_count already folded into the sketches
+    _executions_sketched: int = field(init=False, repr=False, compare=False, default=0)
+    _releases_sketched: int = field(init=False, repr=False, compare=False, default=0)
+    _inflight: Optional[asyncio.Future] = field(init=False, repr=False, compare=False, default=None)
     
     def __post_init__(self):
         """Initialize computed fields."""
+        if self.executor not in (None, "thread", "process"):
+            raise SchedulingError(f"Unknown executor '{self.executor}' for task '{self.name}'")
         self.period_s = 1.0 / self.frequency_hz
-        self.next_execution = time.perf_counter()
+        self.next_execution = get_clock().now()
         self.last_execution = self.next_execution
         if self.deadline_ms is None:
             self.deadline_ms = self.period_s * 1000.0 * 0.8  # 80% of period as default deadline
+        self.deadline_key = f"deadline:{self.name}"
+        self.deadline_message = f"Deadline violation in task '{self.name}' (execution ms, deadline {self.deadline_ms:.2f}ms)"
+        self.overrun_key = f"overrun:{self.name}"
+        self.overrun_message = f"Task overrun in '{self.name}' (execution ms, period {self.period_s * 1000:.2f}ms)"
+
 
 
 @dataclass
@@ -74,6 +122,9 @@ class JitterAnalysis:
     min_jitter_ms: float
     jitter_histogram: Dict[str, int] = field(default_factory=dict)
     samples_count: int = 0
+    p50_jitter_ms: float = 0.0
+    p99_jitter_ms: float = 0.0
+    p999_jitter_ms: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -83,10 +134,18 @@ class JitterAnalysis:
             'max_jitter_ms': self.max_jitter_ms,
             'min_jitter_ms': self.min_jitter_ms,
             'jitter_histogram': dict(self.jitter_histogram),
-            'samples_count': self.samples_count
+            'samples_count': self.samples_count,
+            'p50_jitter_ms': self.p50_jitter_ms,
+            'p99_jitter_ms': self.p99_jitter_ms,
+            'p999_jitter_ms': self.p999_jitter_ms
         }
 
 
+def _newest(samples: deque, count: int) -> np.ndarray:
+    """The ``count`` most recent entries of a sample deque, oldest first."""
+    return np.fromiter(itertools.islice(samples, len(samples) - count, None), dtype=np.float64, count=count)
+
+
 class QuarticScheduler:
     """
     Cooperative real-time scheduler with precise timer-driven execution.
@@ -95,14 +154,22 @@ class QuarticScheduler:
     to provide precise timing for hard real-time tasks like 400 Hz control loops.
     """
     
-    def __init__(self, enable_monitoring: bool = True, max_jitter_ms: float = 1.0):
+    # Raw samples are folded into the sketches at most this often, and often
+    # enough that the fastest task fills at most half of its sample deque
+    SKETCH_FEED_INTERVAL_S = 1.0
+    
+    def __init__(self, enable_monitoring: bool = True, max_jitter_ms: float = 1.0,
+                 clock: Optional[Clock] = None):
         """
         Initialize the quartic scheduler.
         
         Args:
             enable_monitoring: Enable performance monitoring and jitter analysis
             max_jitter_ms: Maximum acceptable jitter in milliseconds
+            clock: Time source (default: the process clock from get_clock());
+                tasks should be created under the same clock
         """
+        self.clock = clock or get_clock()
         self.tasks: Dict[str, QuarticTask] = {}
         self.running = False
         self.scheduler_task: Optional[asyncio.Task] = None
@@ -111,7 +178,7 @@ class QuarticScheduler:
         self.max_jitter_ms = max_jitter_ms
         
         # Timing and performance
-        self.start_time = time.perf_counter()
+        self.start_time = self.clock.now()
         self.cycle_count = 0
         self.total_missed_deadlines = 0
         self.total_overruns = 0
@@ -124,11 +191,23 @@ class QuarticScheduler:
         self._lock = threading.RLock()
         self._shutdown_event = threading.Event()
         
+        # Dispatch heaps: (next_execution, seq, token, task) for waiting tasks and
+        # (priority, next_execution, seq, token, task) for released ones
+        self._release_heap: List[Tuple[float, int, int, QuarticTask]] = []
+        self._ready_heap: List[Tuple[int, float, int, int, QuarticTask]] = []
+        self._heap_seq = itertools.count()
+        self._executors: Dict[str, Executor] = {}
+        self._next_sketch_feed = 0.0
+        self._sketch_feed_interval = self.SKETCH_FEED_INTERVAL_S
+        
         # Logger
         self.logger = get_logger(__name__)
+        # Per-execution warnings are aggregated into periodic summaries
+        self.diagnostics = HotPathDiagnostics(__name__, clock=self.clock.now)
         
-        # Platform-specific optimizations
-        self._setup_platform_optimizations()
+        # Platform-specific optimizations (pointless, and needs root, in simulated time)
+        if not self.clock.is_virtual:
+            self._setup_platform_optimizations()
         
         # Overrun protection
         self.max_consecutive_overruns = 10
@@ -162,22 +241,42 @@ class QuarticScheduler:
         with self._lock:
             if task.name in self.tasks:
                 raise SchedulingError(f"Task '{task.name}' already exists")
+            if task.executor == "process":
+                try:
+                    pickle.dumps(task.func)
+                except Exception as e:
+                    raise SchedulingError(
+                        f"Task '{task.name}' uses the process executor but its function "
+                        f"cannot be pickled ({e}); use a module-level function or executor='thread'"
+                    ) from e
             
+            # Phase the task on this scheduler's clock, whichever clock it was created under
+            task.next_execution = self.clock.now()
+            task.last_execution = task.next_execution
             self.tasks[task.name] = task
+            self._reschedule(task)
+            self._update_feed_interval()
             self.logger.info(f"Added task '{task.name}' at {task.frequency_hz}Hz")
     
     def remove_task(self, task_name: str) -> None:
         """Remove a task from the scheduler."""
         with self._lock:
             if task_name in self.tasks:
-                del self.tasks[task_name]
+                task = self.tasks.pop(task_name)
+                task._sched_token += 1  # drop its heap entries
+                executor = self._executors.pop(task_name, None)
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                self._update_feed_interval()
                 self.logger.info(f"Removed task '{task_name}'")
     
     def enable_task(self, task_name: str) -> None:
         """Enable a task."""
         with self._lock:
             if task_name in self.tasks:
-                self.tasks[task_name].enabled = True
+                task = self.tasks[task_name]
+                task.enabled = True
+                self._reschedule(task)
                 self.logger.info(f"Enabled task '{task_name}'")
     
     def disable_task(self, task_name: str) -> None:
@@ -187,13 +286,89 @@ class QuarticScheduler:
                 self.tasks[task_name].enabled = False
                 self.logger.info(f"Disabled task '{task_name}'")
     
+    def reschedule_task(self, task_name: str) -> None:
+        """
+        Re-queue a task after its ``next_execution``, ``priority`` or
+        ``enabled`` was changed directly rather than through the scheduler.
+        
+        Later releases and lower priorities are picked up lazily at dispatch;
+        moving a release earlier or re-enabling a task needs this call.
+        """
+        with self._lock:
+            task = self.tasks.get(task_name)
+            if task is not None:
+                self._reschedule(task)
+    
+    def _reschedule(self, task: QuarticTask) -> None:
+        """(Re)insert a task into the release heap at its next_execution."""
+        with self._lock:
+            token = task._sched_token + 1
+            task._sched_token = token
+            if task.enabled and self.tasks.get(task.name) is task:
+                heapq.heappush(self._release_heap, (task.next_execution, next(self._heap_seq), token, task))
+                if len(self._release_heap) + len(self._ready_heap) > 4 * len(self.tasks) + 64:
+                    self._rebuild_heaps()
+    
+    def _rebuild_heaps(self) -> None:
+        """Drop stale entries (left behind by rescheduling) in one pass."""
+        self._ready_heap = []
+        self._release_heap = [(t.next_execution, next(self._heap_seq), t._sched_token, t)
+                              for t in self.tasks.values() if t.enabled]
+        heapq.heapify(self._release_heap)
+    
+    def _release_due(self, current_time: float) -> None:
+        """Move tasks whose next_execution has arrived to the ready heap."""
+        release = self._release_heap
+        ready = self._ready_heap
+        while release and release[0][0] <= current_time:
+            deadline, seq, token, task = heapq.heappop(release)
+            if token != task._sched_token or not task.enabled:
+                continue
+            if deadline != task.next_execution:
+                # Timing was changed outside the scheduler: requeue at the new time
+                heapq.heappush(release, (task.next_execution, seq, token, task))
+                continue
+            heapq.heappush(ready, (task.priority.value, deadline, seq, token, task))
+    
+    def _peek_ready(self) -> Optional[QuarticTask]:
+        """Highest-priority released task, discarding stale entries."""
+        ready = self._ready_heap
+        while ready:
+            priority, deadline, seq, token, task = ready[0]
+            if token == task._sched_token and task.enabled:
+                if deadline == task.next_execution:
+                    if priority == task.priority.value:
+                        return task
+                    # Priority was changed directly: requeue in its new class
+                    heapq.heapreplace(ready, (task.priority.value, deadline, seq, token, task))
+                    continue
+                heapq.heappush(self._release_heap, (task.next_execution, seq, token, task))
+            heapq.heappop(ready)
+        return None
+    
+    def _next_release_time(self) -> Optional[float]:
+        """Earliest next_execution among enabled tasks, discarding stale entries."""
+        task = self._peek_ready()
+        if task is not None:
+            return task.next_execution
+        release = self._release_heap
+        while release:
+            deadline, seq, token, task = release[0]
+            if token == task._sched_token and task.enabled:
+                if deadline == task.next_execution:
+                    return deadline
+                heapq.heapreplace(release, (task.next_execution, seq, token, task))
+            else:
+                heapq.heappop(release)
+        return None
+    
     async def start(self) -> None:
         """Start the quartic scheduler."""
         if self.running:
             return
         
         self.running = True
-        self.start_time = time.perf_counter()
+        self.start_time = self.clock.now()
         self._shutdown_event.clear()
         
         # Start the main scheduler loop
@@ -228,13 +403,21 @@ class QuarticScheduler:
             except asyncio.CancelledError:
                 pass
         
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
         self.logger.info("Quartic scheduler stopped")
     
     async def _scheduler_loop(self) -> None:
         """Main scheduler loop with precise timing."""
         while self.running and not self._shutdown_event.is_set():
             try:
-                current_time = time.perf_counter()
+                current_time = self.clock.now()
+                if current_time >= self._next_sketch_feed:
+                    self._feed_sketches(current_time)
                 
                 # Find the next task to execute
                 next_task = self._find_next_task(current_time)
@@ -246,7 +429,7 @@ class QuarticScheduler:
                     # No tasks ready, sleep until next task
                     sleep_time = self._calculate_sleep_time(current_time)
                     if sleep_time > 0:
-                        await high_res_sleep(sleep_time)
+                        await self.clock.sleep_until(current_time + sleep_time)
                 
                 self.cycle_count += 1
                 
@@ -254,34 +437,22 @@ class QuarticScheduler:
                 break
             except Exception as e:
                 self.logger.error(f"Error in scheduler loop: {e}")
-                await asyncio.sleep(0.001)  # Brief pause on error
+                await self.clock.sleep(0.001)  # Brief pause on error
     
     def _find_next_task(self, current_time: float) -> Optional[QuarticTask]:
-        """Find the next task to execute based on priority and timing."""
+        """Find the next task to execute: highest priority, then earliest deadline, among ready tasks."""
         with self._lock:
-            ready_tasks = []
-            
-            for task in self.tasks.values():
-                if not task.enabled:
-                    continue
-                
-                if current_time >= task.next_execution:
-                    ready_tasks.append(task)
-            
-            if not ready_tasks:
-                return None
-            
-            # Sort by priority (lower value = higher priority) and then by deadline
-            ready_tasks.sort(
-                key=lambda t: (t.priority.value, t.next_execution),
-                reverse=False
-            )
-            
-            return ready_tasks[0]
+            self._release_due(current_time)
+            return self._peek_ready()
     
     async def _execute_task(self, task: QuarticTask, current_time: float) -> None:
         """Execute a task with precise timing measurement."""
-        execution_start = time.perf_counter()
+        execution_start = self.clock.now()
+        
+        if task.executor is not None and not self.clock.is_virtual \
+                and not asyncio.iscoroutinefunction(task.func):
+            self._dispatch_to_executor(task, current_time, execution_start)
+            return
         
         try:
             # Execute the task
@@ -290,102 +461,163 @@ class QuarticScheduler:
             else:
                 # Execute synchronous function directly to minimize overhead.
                 # Users must ensure that such functions complete quickly to avoid
-                # blocking the event loop. For long-running work, provide an async
-                # wrapper or make the function itself awaitable.
+                # blocking the event loop. For long-running work, set
+                # ``executor`` on the task or make the function itself awaitable.
                 task.func()
             
             # Calculate execution time and jitter
-            execution_time = (time.perf_counter() - execution_start) * 1000.0
-            task.execution_times.append(execution_time)
-            
-            # Check for deadline violation
-            if task.deadline_ms and execution_time > task.deadline_ms:
-                task.missed_deadlines += 1
-                self.total_missed_deadlines += 1
-                self.logger.warning(
-                    f"Deadline violation in task '{task.name}': "
-                    f"{execution_time:.2f}ms > {task.deadline_ms:.2f}ms"
-                )
-            
-            # Calculate jitter (deviation from expected execution time)
-            expected_time = task.last_execution + task.period_s
-            actual_time = execution_start  # Use actual execution start time
-            jitter_ms = (actual_time - expected_time) * 1000.0
-            
-            task.jitter_samples.append(jitter_ms)
-            self.global_jitter_samples.append(jitter_ms)
-            
-            # Update timing: preserve the original cadence to avoid drift.
-            task.last_execution = current_time  # aligns with test expectations
-            # Keep cadence without accumulating backlog.
-            if task.next_execution + task.period_s <= current_time:
-                # If we are already past the next slot (overrun), schedule from now.
-                task.next_execution = current_time + task.period_s
-            else:
-                # Normal case: advance by exactly one period.
-                task.next_execution = task.next_execution + task.period_s
-            task.execution_count += 1
-            
-            # Check for overruns
-            if execution_time > task.period_s * 1000.0:
-                self.total_overruns += 1
-                self.consecutive_overrun_counts[task.name] = self.consecutive_overrun_counts.get(task.name, 0) + 1
-                
-                # Log warning for first few overruns
-                if self.consecutive_overrun_counts[task.name] <= 3:
-                    self.logger.warning(
-                        f"Task overrun in '{task.name}': "
-                        f"{execution_time:.2f}ms > {task.period_s*1000:.2f}ms"
-                    )
-                
-                # Temporarily disable task if it consistently overruns
-                if self.consecutive_overrun_counts[task.name] >= self.max_consecutive_overruns:
-                    self.logger.error(
-                        f"Task '{task.name}' disabled due to {self.consecutive_overrun_counts[task.name]} "
-                        f"consecutive overruns. Execution time: {execution_time:.2f}ms"
-                    )
-                    task.enabled = False
-                    # Reset counter when task is disabled
-                    self.consecutive_overrun_counts[task.name] = 0
-            else:
-                # Reset consecutive overrun counter on successful execution
-                self.consecutive_overrun_counts[task.name] = 0
+            execution_time = (self.clock.now() - execution_start) * 1000.0
+            self._record_execution(task, execution_time, execution_start)
+            self._advance_task(task, current_time, execution_start)
             
         except Exception as e:
             self.logger.error(f"Error executing task '{task.name}': {e}")
             # Don't update timing on error to prevent cascading failures
     
+    def _dispatch_to_executor(self, task: QuarticTask, current_time: float,
+                              execution_start: float) -> None:
+        """Start a synchronous task on its executor without blocking the loop."""
+        if task._inflight is not None and not task._inflight.done():
+            # The previous run is still going: skip this release, keep cadence
+            task.skipped_releases += 1
+        else:
+            try:
+                future = asyncio.get_running_loop().run_in_executor(self._get_executor(task), task.func)
+            except Exception as e:
+                self.logger.error(f"Error executing task '{task.name}': {e}")
+                return
+            task._inflight = future
+            future.add_done_callback(
+                lambda f, task=task, start=execution_start: self._on_executor_done(task, f, start))
+        self._advance_task(task, current_time, execution_start)
+    
+    def _on_executor_done(self, task: QuarticTask, future: asyncio.Future, execution_start: float) -> None:
+        """Deadline accounting for an offloaded run (runs on the event loop)."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Error executing task '{task.name}': {error}")
+            return
+        self._record_execution(task, (self.clock.now() - execution_start) * 1000.0, execution_start)
+    
+    def _get_executor(self, task: QuarticTask) -> Executor:
+        with self._lock:
+            executor = self._executors.get(task.name)
+            if executor is None:
+                if task.executor == "process":
+                    executor = ProcessPoolExecutor(max_workers=1)
+                else:
+                    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"quartic-{task.name}")
+                self._executors[task.name] = executor
+            return executor
+    
+    def _record_execution(self, task: QuarticTask, execution_time: float, execution_start: float) -> None:
+        """Execution time, deadline and overrun bookkeeping for one completed run."""
+        task.execution_times.append(execution_time)
+        task.execution_sample_times.append(execution_start)
+        task.execution_count += 1
+        
+        # Check for deadline violation
+        if task.deadline_ms and execution_time > task.deadline_ms:
+            task.missed_deadlines += 1
+            self.total_missed_deadlines += 1
+            self.diagnostics.record(task.deadline_key, execution_time, task.deadline_message)
+        
+        # Check for overruns
+        if execution_time > task.period_s * 1000.0:
+            self.total_overruns += 1
+            self.consecutive_overrun_counts[task.name] = self.consecutive_overrun_counts.get(task.name, 0) + 1
+            
+            self.diagnostics.record(task.overrun_key, execution_time, task.overrun_message)
+            
+            # Temporarily disable task if it consistently overruns
+            if self.consecutive_overrun_counts[task.name] >= self.max_consecutive_overruns:
+                self.logger.error(
+                    f"Task '{task.name}' disabled due to {self.consecutive_overrun_counts[task.name]} "
+                    f"consecutive overruns. Execution time: {execution_time:.2f}ms"
+                )
+                task.enabled = False
+                # Reset counter when task is disabled
+                self.consecutive_overrun_counts[task.name] = 0
+        else:
+            # Reset consecutive overrun counter on successful execution
+            self.consecutive_overrun_counts[task.name] = 0
+    
+    def _advance_task(self, task: QuarticTask, current_time: float, execution_start: float) -> None:
+        """Jitter sample and next release time after a dispatch."""
+        # Calculate jitter (deviation from expected execution time)
+        expected_time = task.last_execution + task.period_s
+        jitter_ms = (execution_start - expected_time) * 1000.0
+        
+        task.jitter_samples.append(jitter_ms)
+        task.jitter_sample_times.append(execution_start)
+        self.global_jitter_samples.append(jitter_ms)
+        task.release_count += 1
+        
+        # Update timing: preserve the original cadence to avoid drift.
+        task.last_execution = current_time  # aligns with test expectations
+        # Keep cadence without accumulating backlog.
+        if task.next_execution + task.period_s <= current_time:
+            # If we are already past the next slot (overrun), schedule from now.
+            task.next_execution = current_time + task.period_s
+        else:
+            # Normal case: advance by exactly one period.
+            task.next_execution = task.next_execution + task.period_s
+    
     def _calculate_sleep_time(self, current_time: float) -> float:
         """Calculate sleep time until next task execution."""
         with self._lock:
             if not self.tasks:
                 return 0.001  # Default 1ms sleep
             
-            # Find the earliest next execution time
-            next_times = [
-                task.next_execution - current_time
-                for task in self.tasks.values()
-                if task.enabled
-            ]
-            
-            if not next_times:
+            # Earliest next execution time, from the top of the dispatch heaps
+            next_time = self._next_release_time()
+            if next_time is None:
                 return 0.001
             
-            min_sleep = min(next_times)
+            min_sleep = next_time - current_time
             # If any task is overdue (negative or zero sleep time), clamp to minimum sleep
             if min_sleep <= 0:
                 return 0.0001  # Minimum 0.1ms sleep to yield control
+            if self.clock.is_virtual:
+                # Simulated time has no timer granularity: wake exactly on time
+                return min_sleep
             
             return max(0.0001, min_sleep)  # Minimum 0.1ms, maximum sleep time
     
+    def _update_feed_interval(self) -> None:
+        interval = self.SKETCH_FEED_INTERVAL_S
+        for task in self.tasks.values():
+            capacity = min(task.execution_times.maxlen or 0, task.jitter_samples.maxlen or 0)
+            if capacity:
+                interval = min(interval, 0.5 * capacity * task.period_s)
+        self._sketch_feed_interval = interval
+    
+    def _feed_sketches(self, now: float) -> None:
+        """Fold raw samples recorded since the last feed into the windowed sketches."""
+        with self._lock:
+            for task in self.tasks.values():
+                new = min(task.execution_count - task._executions_sketched, len(task.execution_times))
+                if new > 0:
+                    task.execution_stats.record_many(
+                        _newest(task.execution_times, new), _newest(task.execution_sample_times, new))
+                task._executions_sketched = task.execution_count
+                new = min(task.release_count - task._releases_sketched, len(task.jitter_samples))
+                if new > 0:
+                    task.jitter_stats.record_many(
+                        _newest(task.jitter_samples, new), _newest(task.jitter_sample_times, new))
+                task._releases_sketched = task.release_count
+            self._next_sketch_feed = now + self._sketch_feed_interval
+    
     async def _monitoring_loop(self) -> None:
         """Monitoring loop for performance analysis."""
         while self.running and not self._shutdown_event.is_set():
             try:
-                await asyncio.sleep(1.0)  # Update every second
+                await self.clock.sleep(1.0)  # Update every second
                 
-                # Update jitter analysis
-                self._update_jitter_analysis()
+                # Jitter analysis is evaluated from the sketches on request
+                self.diagnostics.flush()
                 
                 # Log performance statistics
                 if self.cycle_count % 100 == 0:  # Log every 100 cycles
@@ -399,31 +631,42 @@ class QuarticScheduler:
     def _update_jitter_analysis(self) -> None:
         """Update jitter analysis for all tasks."""
         with self._lock:
-            for task_name, task in self.tasks.items():
-                if len(task.jitter_samples) < 10:
-                    continue  # Need at least 10 samples
-                
-                jitter_array = np.array(list(task.jitter_samples))
-                
-                analysis = JitterAnalysis(
-                    mean_jitter_ms=float(np.mean(jitter_array)),
-                    std_jitter_ms=float(np.std(jitter_array)),
-                    max_jitter_ms=float(np.max(jitter_array)),
-                    min_jitter_ms=float(np.min(jitter_array)),
-                    samples_count=len(jitter_array)
-                )
-                
-                # Create histogram
-                hist, bins = np.histogram(jitter_array, bins=20)
-                for i, count in enumerate(hist):
-                    bin_label = f"{bins[i]:.2f}-{bins[i+1]:.2f}"
-                    analysis.jitter_histogram[bin_label] = int(count)
-                
-                self.jitter_analysis[task_name] = analysis
+            for task in self.tasks.values():
+                self._analyze_task_jitter(task)
+    
+    def _analyze_task_jitter(self, task: QuarticTask) -> Optional[JitterAnalysis]:
+        """Refresh ``jitter_analysis`` for one task from its jitter sketch."""
+        now = self.clock.now()
+        self._feed_sketches(now)
+        analysis = self._jitter_analysis_from(task.jitter_stats.snapshot(now))
+        if analysis is not None:
+            self.jitter_analysis[task.name] = analysis
+        return analysis
+    
+    def _jitter_analysis_from(self, sketch: QuantileSketch,
+                              min_samples: int = 10) -> Optional[JitterAnalysis]:
+        if sketch.count < min_samples:
+            return None
+        summary = sketch.summary()
+        analysis = JitterAnalysis(
+            mean_jitter_ms=summary['mean'],
+            std_jitter_ms=summary['std'],
+            max_jitter_ms=summary['max'],
+            min_jitter_ms=summary['min'],
+            samples_count=summary['count'],
+            p50_jitter_ms=summary['p50'],
+            p99_jitter_ms=summary['p99'],
+            p999_jitter_ms=summary['p999']
+        )
+        hist, bins = sketch.histogram(bins=20)
+        for i, count in enumerate(hist):
+            bin_label = f"{bins[i]:.2f}-{bins[i+1]:.2f}"
+            analysis.jitter_histogram[bin_label] = int(count)
+        return analysis
     
     def _log_performance(self) -> None:
         """Log performance statistics."""
-        runtime = time.perf_counter() - self.start_time
+        runtime = self.clock.now() - self.start_time
         avg_frequency = self.cycle_count / runtime if runtime > 0 else 0
         
         self.logger.info(
@@ -441,7 +684,7 @@ class QuarticScheduler:
                 return None
             
             task = self.tasks[task_name]
-            runtime = time.perf_counter() - self.start_time
+            runtime = self.clock.now() - self.start_time
             
             stats = {
                 'name': task.name,
@@ -452,22 +695,29 @@ class QuarticScheduler:
                 'missed_deadlines': task.missed_deadlines,
                 'actual_frequency_hz': task.execution_count / runtime if runtime > 0 else 0,
                 'deadline_ms': task.deadline_ms,
-                'period_ms': task.period_s * 1000.0
+                'period_ms': task.period_s * 1000.0,
+                'executor': task.executor or 'inline',
+                'skipped_releases': task.skipped_releases
             }
             
-            # Add execution time statistics
-            if task.execution_times:
-                exec_times = list(task.execution_times)
+            # Add execution time statistics (sliding window)
+            now = self.clock.now()
+            self._feed_sketches(now)
+            execution = task.execution_stats.snapshot(now)
+            if execution.count:
+                summary = execution.summary()
                 stats.update({
-                    'mean_execution_time_ms': float(np.mean(exec_times)),
-                    'max_execution_time_ms': float(np.max(exec_times)),
-                    'min_execution_time_ms': float(np.min(exec_times)),
-                    'std_execution_time_ms': float(np.std(exec_times))
+                    'mean_execution_time_ms': summary['mean'],
+                    'max_execution_time_ms': summary['max'],
+                    'min_execution_time_ms': summary['min'],
+                    'std_execution_time_ms': summary['std'],
+                    'p99_execution_time_ms': summary['p99']
                 })
             
             # Add jitter analysis
-            if task_name in self.jitter_analysis:
-                stats['jitter_analysis'] = self.jitter_analysis[task_name].to_dict()
+            analysis = self._analyze_task_jitter(task)
+            if analysis is not None:
+                stats['jitter_analysis'] = analysis.to_dict()
             
             return stats
     
@@ -483,7 +733,7 @@ class QuarticScheduler:
     
     def get_global_stats(self) -> Dict[str, Any]:
         """Get global scheduler statistics."""
-        runtime = time.perf_counter() - self.start_time
+        runtime = self.clock.now() - self.start_time
         
         return {
             'runtime_s': runtime,
@@ -504,30 +754,32 @@ class QuarticScheduler:
             task_name: Specific task to analyze (None for global)
             save_path: Path to save the histogram image
         """
-        if task_name and task_name not in self.jitter_analysis:
-            self.logger.warning(f"No jitter data available for task '{task_name}'")
-            return
-        
         if task_name:
-            analysis = self.jitter_analysis[task_name]
-            samples = list(self.tasks[task_name].jitter_samples)
+            task = self.tasks.get(task_name)
+            analysis = self._analyze_task_jitter(task) if task is not None else None
+            if analysis is None:
+                self.logger.warning(f"No jitter data available for task '{task_name}'")
+                return
+            samples = list(task.jitter_samples)
             title = f"Jitter Histogram - {task_name}"
         else:
-            # Global jitter analysis
-            samples = list(self.global_jitter_samples)
-            if not samples:
+            # Global jitter analysis: merge of the per-task sketches
+            now = self.clock.now()
+            with self._lock:
+                self._feed_sketches(now)
+                windows = [task.jitter_stats.snapshot(now) for task in self.tasks.values()]
+            merged = windows[0] if windows else None
+            for window in windows[1:]:
+                merged.merge(window)
+            analysis = self._jitter_analysis_from(merged, min_samples=1) if merged is not None else None
+            if analysis is None:
                 self.logger.warning("No global jitter data available")
                 return
-            
-            analysis = JitterAnalysis(
-                mean_jitter_ms=float(np.mean(samples)),
-                std_jitter_ms=float(np.std(samples)),
-                max_jitter_ms=float(np.max(samples)),
-                min_jitter_ms=float(np.min(samples)),
-                samples_count=len(samples)
-            )
+            samples = list(self.global_jitter_samples)
             title = "Global Jitter Histogram"
         
+        import matplotlib.pyplot as plt  # plotting only; keep it off the import path
+
         # Create histogram
         plt.figure(figsize=(12, 8))
         
@@ -559,6 +811,7 @@ class QuarticScheduler:
         - Std Dev: {analysis.std_jitter_ms:.3f} ms
         - Max: {analysis.max_jitter_ms:.3f} ms
         - Min: {analysis.min_jitter_ms:.3f} ms
+        - p99 / p99.9: {analysis.p99_jitter_ms:.3f} / {analysis.p999_jitter_ms:.3f} ms
         - Samples: {analysis.samples_count}
         - Max Acceptable: {self.max_jitter_ms:.3f} ms
         """
@@ -615,9 +868,10 @@ def create_safety_task(func: Callable, frequency_hz: float = 100.0,
 # Context manager for easy scheduler usage
 @asynccontextmanager
 async def quartic_scheduler_context(enable_monitoring: bool = True, 
-                                   max_jitter_ms: float = 1.0):
+                                   max_jitter_ms: float = 1.0,
+                                   clock: Optional[Clock] = None):
     """Context manager for quartic scheduler."""
-    scheduler = QuarticScheduler(enable_monitoring, max_jitter_ms)
+    scheduler = QuarticScheduler(enable_monitoring, max_jitter_ms, clock)
     try:
         await scheduler.start()
         yield scheduler
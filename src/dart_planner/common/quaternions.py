@@ -0,0 +1,314 @@
+"""
+Quaternion Attitude Utilities for DART-Planner
+
+Shared attitude math for the planner and the controllers:
+- Unit quaternions in ``[w, x, y, z]`` (Hamilton) order, body-to-world,
+  consistent with ZYX (roll, pitch, yaw) Euler angles used elsewhere
+- Batch-capable: every array function operates on the last axis, so a
+  single ``(4,)`` quaternion and a ``(K, 4)`` or ``(N, 4)`` stack use the
+  same code (rotation matrices are ``(..., 3, 3)``)
+- Geometric attitude error computed directly from quaternions:
+  for ``q_e = q_des* ⊗ q``, ``½ vee(R_desᵀR − RᵀR_des) = 2 w_e v_e``,
+  with no rotation-matrix products
+- Scalar ``*_into`` kernels for the single-vehicle control step, which
+  write into caller-provided buffers and use ``math`` instead of NumPy
+  ufuncs on 3-element arrays
+"""
+
+import math
+from typing import Optional, Union
+
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
+IDENTITY_QUATERNION = np.array([1.0, 0.0, 0.0, 0.0])
+_E1 = np.array([1.0, 0.0, 0.0])
+
+
+# ---------------------------------------------------------------------------
+# Batch helpers (operate on the last axis)
+# ---------------------------------------------------------------------------
+
+def quaternion_normalize(q: np.ndarray) -> np.ndarray:
+    """Normalize quaternions; near-zero quaternions map to the identity."""
+    q = np.asarray(q, dtype=float)
+    norm = np.linalg.norm(q, axis=-1, keepdims=True)
+    valid = norm > 1e-6
+    return np.where(valid, q / np.where(valid, norm, 1.0), IDENTITY_QUATERNION)
+
+
+def quaternion_conjugate(q: np.ndarray) -> np.ndarray:
+    """Conjugate (inverse of a unit quaternion)."""
+    q = np.asarray(q, dtype=float)
+    result = -q
+    result[..., 0] = q[..., 0]
+    return result
+
+
+def quaternion_multiply(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Hamilton product ``p ⊗ q`` (broadcasts over leading axes)."""
+    p = np.asarray(p, dtype=float)
+    q = np.asarray(q, dtype=float)
+    pw, px, py, pz = p[..., 0], p[..., 1], p[..., 2], p[..., 3]
+    qw, qx, qy, qz = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return np.stack((
+        pw * qw - px * qx - py * qy - pz * qz,
+        pw * qx + px * qw + py * qz - pz * qy,
+        pw * qy - px * qz + py * qw + pz * qx,
+        pw * qz + px * qy - py * qx + pz * qw,
+    ), axis=-1)
+
+
+def euler_to_quaternion(euler: np.ndarray) -> np.ndarray:
+    """ZYX Euler angles ``(..., 3)`` (roll, pitch, yaw) to unit quaternions ``(..., 4)``."""
+    half = 0.5 * np.asarray(euler, dtype=float)
+    cr, cp, cy = np.moveaxis(np.cos(half), -1, 0)
+    sr, sp, sy = np.moveaxis(np.sin(half), -1, 0)
+    return np.stack((
+        cr * cp * cy + sr * sp * sy,
+        sr * cp * cy - cr * sp * sy,
+        cr * sp * cy + sr * cp * sy,
+        cr * cp * sy - sr * sp * cy,
+    ), axis=-1)
+
+
+def quaternion_to_euler(q: np.ndarray) -> np.ndarray:
+    """Unit quaternions ``(..., 4)`` to ZYX Euler angles ``(..., 3)``."""
+    q = np.asarray(q, dtype=float)
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    roll = np.arctan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    pitch = np.arcsin(np.clip(2.0 * (w * y - z * x), -1.0, 1.0))
+    yaw = np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    return np.stack((roll, pitch, yaw), axis=-1)
+
+
+def quaternion_to_rotation_matrix(q: np.ndarray) -> np.ndarray:
+    """Quaternions ``(..., 4)`` to rotation matrices ``(..., 3, 3)`` (normalizes first)."""
+    q = quaternion_normalize(q)
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    R = np.empty(q.shape[:-1] + (3, 3))
+    R[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    R[..., 0, 1] = 2 * (x * y - w * z)
+    R[..., 0, 2] = 2 * (x * z + w * y)
+    R[..., 1, 0] = 2 * (x * y + w * z)
+    R[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    R[..., 1, 2] = 2 * (y * z - w * x)
+    R[..., 2, 0] = 2 * (x * z - w * y)
+    R[..., 2, 1] = 2 * (y * z + w * x)
+    R[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    return R
+
+
+def rotation_matrix_to_quaternion(R: np.ndarray) -> np.ndarray:
+    """
+    Rotation matrices ``(..., 3, 3)`` to unit quaternions ``(..., 4)`` with ``w >= 0``.
+
+    Uses Shepperd's method: of the four algebraically equivalent
+    formulas, the one with the largest pivot (trace or diagonal entry)
+    is selected per matrix, which keeps the conversion well conditioned
+    for every rotation angle.
+    """
+    R = np.asarray(R, dtype=float)
+    r00, r01, r02 = R[..., 0, 0], R[..., 0, 1], R[..., 0, 2]
+    r10, r11, r12 = R[..., 1, 0], R[..., 1, 1], R[..., 1, 2]
+    r20, r21, r22 = R[..., 2, 0], R[..., 2, 1], R[..., 2, 2]
+    trace = r00 + r11 + r22
+
+    candidates = np.stack((
+        np.stack((1.0 + trace, r21 - r12, r02 - r20, r10 - r01), axis=-1),
+        np.stack((r21 - r12, 1.0 + r00 - r11 - r22, r01 + r10, r02 + r20), axis=-1),
+        np.stack((r02 - r20, r01 + r10, 1.0 - r00 + r11 - r22, r12 + r21), axis=-1),
+        np.stack((r10 - r01, r02 + r20, r12 + r21, 1.0 - r00 - r11 + r22), axis=-1),
+    ), axis=-2)
+    pivot = np.argmax(np.stack((trace, r00, r11, r22), axis=-1), axis=-1)
+    q = np.take_along_axis(candidates, pivot[..., None, None], axis=-2)[..., 0, :]
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    return np.where(q[..., :1] < 0.0, -q, q)
+
+
+def thrust_yaw_to_quaternion(b3: np.ndarray, yaw: ArrayLike = 0.0) -> np.ndarray:
+    """
+    Desired attitude from unit thrust directions and yaw angles.
+
+    Uses the controller's frame construction ``b1 = (ψ × b3)/|ψ × b3|``,
+    ``b2 = b3 × b1`` with ``ψ = [cos yaw, sin yaw, 0]``, falling back to
+    ``b1 = e1`` when the yaw vector is parallel to the thrust.
+
+    Args:
+        b3: Unit thrust directions ``(..., 3)``
+        yaw: Desired yaw angles broadcastable to ``b3.shape[:-1]``
+
+    Returns:
+        Unit quaternions ``(..., 4)``
+    """
+    b3 = np.asarray(b3, dtype=float)
+    yaw = np.broadcast_to(np.asarray(yaw, dtype=float), b3.shape[:-1])
+    yaw_vector = np.zeros(b3.shape)
+    yaw_vector[..., 0] = np.cos(yaw)
+    yaw_vector[..., 1] = np.sin(yaw)
+
+    b1 = np.cross(yaw_vector, b3)
+    b1_norm = np.linalg.norm(b1, axis=-1, keepdims=True)
+    regular = b1_norm > 1e-6
+    b1 = np.where(regular, b1 / np.where(regular, b1_norm, 1.0), _E1)
+    b2 = np.cross(b3, b1)
+    return rotation_matrix_to_quaternion(np.stack((b1, b2, b3), axis=-1))
+
+
+def attitude_error(q_des: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    Geometric attitude error ``eR = ½ vee(R_desᵀR − RᵀR_des)`` from quaternions.
+
+    Equal to ``2 w_e v_e`` for ``q_e = q_des* ⊗ q``; invariant to the sign
+    of either quaternion.
+    """
+    q_e = quaternion_multiply(quaternion_conjugate(q_des), q)
+    return 2.0 * q_e[..., :1] * q_e[..., 1:]
+
+
+def body_rates_from_quaternions(q_prev: np.ndarray, q: np.ndarray, dt: ArrayLike) -> np.ndarray:
+    """
+    Constant body angular velocity that rotates ``q_prev`` into ``q`` over ``dt``.
+
+    Uses the quaternion logarithm of ``q_prev* ⊗ q`` along the shorter arc.
+    """
+    q_rel = quaternion_multiply(quaternion_conjugate(q_prev), q)
+    q_rel = np.where(q_rel[..., :1] < 0.0, -q_rel, q_rel)
+    v = q_rel[..., 1:]
+    v_norm = np.linalg.norm(v, axis=-1, keepdims=True)
+    angle = 2.0 * np.arctan2(v_norm, q_rel[..., :1])
+    # angle / |v| -> 2 as |v| -> 0
+    scale = np.where(v_norm > 1e-12, angle / np.where(v_norm > 1e-12, v_norm, 1.0), 2.0)
+    return scale * v / np.asarray(dt, dtype=float)[..., None]
+
+
+def euler_rates_from_body_rates(euler: np.ndarray, body_rates: np.ndarray) -> np.ndarray:
+    """
+    ZYX Euler angle rates ``(..., 3)`` from body angular velocities ``(..., 3)``.
+
+    Singular at pitch = ±90°, where the cosine is clamped to keep the
+    result finite.
+    """
+    euler = np.asarray(euler, dtype=float)
+    p, q, r = np.moveaxis(np.asarray(body_rates, dtype=float), -1, 0)
+    roll, pitch = euler[..., 0], euler[..., 1]
+    sr, cr = np.sin(roll), np.cos(roll)
+    cp = np.cos(pitch)
+    cp = np.where(np.abs(cp) < 1e-6, np.copysign(1e-6, cp), cp)
+    yaw_term = (q * sr + r * cr) / cp
+    return np.stack((p + yaw_term * np.sin(pitch), q * cr - r * sr, yaw_term), axis=-1)
+
+
+def quaternion_slerp(q0: np.ndarray, q1: np.ndarray, alpha: ArrayLike) -> np.ndarray:
+    """
+    Spherical linear interpolation from ``q0`` (alpha=0) to ``q1`` (alpha=1).
+
+    Takes the shorter arc; nearly parallel inputs fall back to normalized
+    linear interpolation.
+    """
+    q0 = np.asarray(q0, dtype=float)
+    q1 = np.asarray(q1, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)[..., None]
+    dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+    q1 = np.where(dot < 0.0, -q1, q1)
+    dot = np.minimum(np.abs(dot), 1.0)
+    theta = np.arccos(dot)
+    sin_theta = np.sin(theta)
+    near = sin_theta < 1e-6
+    safe_sin = np.where(near, 1.0, sin_theta)
+    w0 = np.where(near, 1.0 - alpha, np.sin((1.0 - alpha) * theta) / safe_sin)
+    w1 = np.where(near, alpha, np.sin(alpha * theta) / safe_sin)
+    return quaternion_normalize(w0 * q0 + w1 * q1)
+
+
+# ---------------------------------------------------------------------------
+# Scalar kernels for the single-vehicle control step
+# ---------------------------------------------------------------------------
+
+def euler_to_quaternion_into(euler: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Single ZYX Euler triple to a unit quaternion written into ``out``."""
+    half_roll = 0.5 * euler[0]
+    half_pitch = 0.5 * euler[1]
+    half_yaw = 0.5 * euler[2]
+    cr, sr = math.cos(half_roll), math.sin(half_roll)
+    cp, sp = math.cos(half_pitch), math.sin(half_pitch)
+    cy, sy = math.cos(half_yaw), math.sin(half_yaw)
+    out[0] = cr * cp * cy + sr * sp * sy
+    out[1] = sr * cp * cy - cr * sp * sy
+    out[2] = cr * sp * cy + sr * cp * sy
+    out[3] = cr * cp * sy - sr * sp * cy
+    return out
+
+
+def normalize_quaternion_into(q: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Copy ``q`` into ``out`` as a unit quaternion (identity if degenerate)."""
+    w, x, y, z = q[0], q[1], q[2], q[3]
+    norm = math.sqrt(w * w + x * x + y * y + z * z)
+    if norm > 1e-6:
+        out[0] = w / norm
+        out[1] = x / norm
+        out[2] = y / norm
+        out[3] = z / norm
+    else:
+        out[0] = 1.0
+        out[1] = out[2] = out[3] = 0.0
+    return out
+
+
+def quaternion_yaw(q: np.ndarray) -> float:
+    """ZYX yaw angle of a single unit quaternion."""
+    w, x, y, z = q[0], q[1], q[2], q[3]
+    return math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+
+
+def frame_attitude_error_into(b1: np.ndarray,
+                              b2: np.ndarray,
+                              b3: np.ndarray,
+                              q: np.ndarray,
+                              out: np.ndarray,
+                              q_des_out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Attitude error between the desired frame ``[b1 b2 b3]`` and unit quaternion ``q``.
+
+    Scalar equivalent of ``attitude_error(rotation_matrix_to_quaternion(R_des), q)``
+    with the same Shepperd pivot selection. The desired quaternion can be
+    written to ``q_des_out`` for logging.
+    """
+    r00, r01, r02 = b1[0], b2[0], b3[0]
+    r10, r11, r12 = b1[1], b2[1], b3[1]
+    r20, r21, r22 = b1[2], b2[2], b3[2]
+    trace = r00 + r11 + r22
+
+    if trace >= r00 and trace >= r11 and trace >= r22:
+        dw, dx, dy, dz = 1.0 + trace, r21 - r12, r02 - r20, r10 - r01
+    elif r00 >= r11 and r00 >= r22:
+        dw, dx, dy, dz = r21 - r12, 1.0 + r00 - r11 - r22, r01 + r10, r02 + r20
+    elif r11 >= r22:
+        dw, dx, dy, dz = r02 - r20, r01 + r10, 1.0 - r00 + r11 - r22, r12 + r21
+    else:
+        dw, dx, dy, dz = r10 - r01, r02 + r20, r12 + r21, 1.0 - r00 - r11 + r22
+    norm = math.sqrt(dw * dw + dx * dx + dy * dy + dz * dz)
+    if dw < 0.0:
+        norm = -norm
+    dw /= norm
+    dx /= norm
+    dy /= norm
+    dz /= norm
+    if q_des_out is not None:
+        q_des_out[0] = dw
+        q_des_out[1] = dx
+        q_des_out[2] = dy
+        q_des_out[3] = dz
+
+    # q_e = q_des* ⊗ q
+    w, x, y, z = q[0], q[1], q[2], q[3]
+    ew = dw * w + dx * x + dy * y + dz * z
+    ex = dw * x - dx * w - dy * z + dz * y
+    ey = dw * y + dx * z - dy * w - dz * x
+    ez = dw * z - dx * y + dy * x - dz * w
+    two_w = 2.0 * ew
+    out[0] = two_w * ex
+    out[1] = two_w * ey
+    out[2] = two_w * ez
+    return out
@@ -10,6 +10,8 @@ from typing import Callable, Optional
 from collections import deque
 import time
 
+from .streaming_stats import RunningStats, WindowedQuantileSketch
+
 
 class TaskPriority(Enum):
     """Task priority levels for real-time scheduling."""
@@ -45,6 +47,13 @@ class RealTimeTask:
     missed_deadlines: int = 0
     total_executions: int = 0
     execution_times: deque = field(default_factory=lambda: deque(maxlen=100))
+    # Streaming statistics in ms: O(1) summaries since start, windowed quantile sketches
+    execution_summary: RunningStats = field(default_factory=RunningStats, repr=False, compare=False)
+    jitter_summary: RunningStats = field(default_factory=RunningStats, repr=False, compare=False)
+    execution_stats: WindowedQuantileSketch = field(default_factory=WindowedQuantileSketch,
+                                                    repr=False, compare=False)
+    jitter_stats: WindowedQuantileSketch = field(default_factory=WindowedQuantileSketch,
+                                                 repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize task timing."""
@@ -61,6 +70,8 @@ class TimingStats:
     min_execution_time_ms: float = float('inf')
     mean_jitter_ms: float = 0.0
     max_jitter_ms: float = 0.0
+    p99_execution_time_ms: float = 0.0  # sliding window, filled on request
+    p99_jitter_ms: float = 0.0
     missed_deadlines: int = 0
     total_executions: int = 0
     success_rate: float = 1.0
@@ -27,6 +27,10 @@ except ImportError:
     WINDOWS_AVAILABLE = False
 
 from .real_time_config import RealTimeTask, TimingStats, TaskType, TaskPriority, SchedulerConfig
+from .hot_path_diagnostics import HotPathDiagnostics
+
+# Deadline violations are aggregated per task instead of logged per occurrence
+_deadline_diagnostics = HotPathDiagnostics(__name__)
 
 
 def set_thread_priority(priority: int = 90) -> bool:
@@ -237,21 +241,25 @@ def update_task_stats(task: RealTimeTask, execution_time: float, current_time: f
     # Update execution time history
     task.execution_times.append(execution_time)
     task.total_executions += 1
+    execution_ms = execution_time * 1000.0
+    task.execution_summary.add(execution_ms)
+    task.execution_stats.record(execution_ms, current_time)
     
-    # Calculate statistics
-    if task.execution_times:
-        execution_times = list(task.execution_times)
-        stats.mean_execution_time_ms = sum(execution_times) / len(execution_times) * 1000.0
-        stats.max_execution_time_ms = max(execution_times) * 1000.0
-        stats.min_execution_time_ms = min(execution_times) * 1000.0
+    # Calculate statistics (O(1): no copy of the history)
+    stats.mean_execution_time_ms = task.execution_summary.mean
+    stats.max_execution_time_ms = task.execution_summary.max
+    stats.min_execution_time_ms = task.execution_summary.min
     
     # Calculate jitter
     if task.task_type == TaskType.PERIODIC and task.period_ms > 0:
         expected_time = task.last_execution + (task.period_ms / 1000.0)
         actual_time = current_time
-        jitter = abs(actual_time - expected_time)
-        stats.mean_jitter_ms = jitter * 1000.0
-        stats.max_jitter_ms = max(stats.max_jitter_ms, jitter * 1000.0)
+        jitter_ms = abs(actual_time - expected_time) * 1000.0
+        task.jitter_summary.add(jitter_ms)
+        task.jitter_stats.record(jitter_ms, current_time)
+    if task.jitter_summary.count:
+        stats.mean_jitter_ms = task.jitter_summary.mean
+        stats.max_jitter_ms = task.jitter_summary.max
     
     # Update missed deadlines
     stats.missed_deadlines = task.missed_deadlines
@@ -261,15 +269,28 @@ def update_task_stats(task: RealTimeTask, execution_time: float, current_time: f
     return stats
 
 
+def fill_percentiles(stats: TimingStats, task: RealTimeTask, current_time: float) -> TimingStats:
+    """Add windowed p99 execution time and jitter from the task's sketches."""
+    execution = task.execution_stats.snapshot(current_time)
+    if execution.count:
+        stats.p99_execution_time_ms = execution.quantile(0.99)
+    jitter = task.jitter_stats.snapshot(current_time)
+    if jitter.count:
+        stats.p99_jitter_ms = jitter.quantile(0.99)
+    return stats
+
+
 def handle_deadline_violation(task: RealTimeTask, current_time: float) -> None:
     """Handle deadline violation for a task."""
     task.missed_deadlines += 1
-    logging.warning(f"Deadline violation for task '{task.name}' at {current_time:.6f}")
+    lateness_ms = (current_time - task.next_deadline) * 1000
     
-    # For critical tasks, log more details
+    # Critical tasks are reported at ERROR level; value is lateness in ms
     if task.priority.value <= 1:  # CRITICAL or HIGH
-        logging.error(f"Critical deadline violation: {task.name} missed deadline by "
-                     f"{(current_time - task.next_deadline) * 1000:.2f}ms")
+        _deadline_diagnostics.record(task.name, lateness_ms,
+                                     "Critical deadline violation (ms late)", logging.ERROR)
+    else:
+        _deadline_diagnostics.record(task.name, lateness_ms, "Deadline violation (ms late)")
 
 
 def apply_timing_compensation(task: RealTimeTask, current_time: float, 
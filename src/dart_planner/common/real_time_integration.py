@@ -38,6 +38,9 @@ from typing import Callable, Optional, Any
 from contextlib import asynccontextmanager
 
 from .timing_alignment import get_timing_manager, TimingConfig, TimingMode
+from .hot_path_diagnostics import HotPathDiagnostics
+from .timer_service import PeriodicTimer, TimerService, get_timer_service
+from .timing_utils import high_res_sleep, high_res_sleep_until
 
 
 class RealTimeLoop:
@@ -58,6 +61,9 @@ class RealTimeLoop:
         self.missed_deadlines = 0
         self.execution_times = []
         self.logger = logging.getLogger(f"{__name__}.{name}")
+        # Deadline misses are aggregated into periodic summaries
+        self.diagnostics = HotPathDiagnostics(f"{__name__}.{name}")
+        self._deadline_message = f"Deadline violation (execution ms, period {self.period_s * 1000:.2f}ms)"
         
         # Timing compensation
         self.clock_drift = 0.0
@@ -98,23 +104,10 @@ class RealTimeLoop:
                 loop = asyncio.get_event_loop()
                 result = await loop.run_in_executor(None, func, *args, **kwargs)
             
-            # Calculate execution time
-            execution_time = (time.perf_counter() - iteration_start) * 1000.0
-            self.execution_times.append(execution_time)
+            self._record_execution(iteration_start)
             
-            # Check for deadline violation
-            if execution_time > self.period_s * 1000.0:
-                self.missed_deadlines += 1
-                self.logger.warning(
-                    f"Deadline violation: {execution_time:.2f}ms > {self.period_s*1000:.2f}ms"
-                )
-            
-            # Calculate sleep time with compensation
-            elapsed = time.perf_counter() - iteration_start
-            sleep_time = max(0.0, self.period_s - elapsed)
-            
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+            # Sleep to the end of the period (returns at once after an overrun)
+            await high_res_sleep_until(iteration_start + self.period_s)
             
             self.loop_count += 1
             return result
@@ -122,9 +115,65 @@ class RealTimeLoop:
         except Exception as e:
             self.logger.error(f"Error in real-time loop iteration: {e}")
             # Brief pause on error to prevent tight error loops
-            await asyncio.sleep(0.001)
+            await high_res_sleep(0.001)
             raise
     
+    def register(self, func: Callable, *args, priority: TaskPriority = TaskPriority.MEDIUM,
+                 offload: bool = False, service: Optional[TimerService] = None) -> PeriodicTimer:
+        """
+        Run ``func(*args)`` every period from the timer service instead of a sleeping coroutine.
+        
+        Args:
+            func: Function or coroutine function to run
+            priority: Order among timers due at the same wakeup
+            offload: Run a synchronous ``func`` in the default executor
+            service: Timer service (default: the process-wide one)
+        
+        Returns:
+            Timer handle; cancel it to stop the loop
+        """
+        service = service or get_timer_service()
+        self.running = True
+        self.start_time = time.perf_counter()
+        self.last_iteration_time = self.start_time
+        
+        if asyncio.iscoroutinefunction(func) or offload:
+            async def tick():
+                iteration_start = time.perf_counter()
+                try:
+                    if asyncio.iscoroutinefunction(func):
+                        await func(*args)
+                    else:
+                        await asyncio.get_running_loop().run_in_executor(None, func, *args)
+                except Exception as e:
+                    self.logger.error(f"Error in real-time loop iteration: {e}")
+                self._complete_iteration(iteration_start)
+        else:
+            def tick():
+                iteration_start = time.perf_counter()
+                try:
+                    func(*args)
+                except Exception as e:
+                    self.logger.error(f"Error in real-time loop iteration: {e}")
+                self._complete_iteration(iteration_start)
+        
+        return service.call_every(self.period_s, tick, name=self.name, priority=priority,
+                                  start=service.clock.now())
+    
+    def _record_execution(self, iteration_start: float) -> None:
+        execution_time = (time.perf_counter() - iteration_start) * 1000.0
+        self.execution_times.append(execution_time)
+        
+        # Check for deadline violation
+        if execution_time > self.period_s * 1000.0:
+            self.missed_deadlines += 1
+            self.diagnostics.record("deadline", execution_time, self._deadline_message)
+    
+    def _complete_iteration(self, iteration_start: float) -> None:
+        self._record_execution(iteration_start)
+        self.loop_count += 1
+        self.last_iteration_time = time.perf_counter()
+    
     def get_stats(self) -> dict:
         """Get performance statistics."""
         if not self.execution_times:
@@ -174,14 +223,14 @@ async def run_realtime_loop(
     loop = RealTimeLoop(frequency_hz, name)
     
     async with loop.run_loop():
-        start_time = time.perf_counter()
-        
-        while True:
-            # Check duration limit
-            if duration and (time.perf_counter() - start_time) > duration:
-                break
-            
-            await loop.iterate(func)
+        timer = loop.register(func, offload=True)
+        try:
+            if duration:
+                await asyncio.sleep(duration)
+            else:
+                await asyncio.get_running_loop().create_future()
+        finally:
+            timer.cancel()
     
     return loop
 
@@ -262,6 +311,28 @@ class TimingAwareLoop:
             results["control_duration"] = control_duration
             
         return results
+    
+    def register(
+        self,
+        control_func: Callable,
+        planning_func: Optional[Callable] = None,
+        priority: TaskPriority = TaskPriority.HIGH,
+        service: Optional[TimerService] = None
+    ) -> PeriodicTimer:
+        """
+        Run ``iterate_with_timing`` at the control frequency from the timer service.
+        
+        Returns:
+            Timer handle; cancel it to stop the loop
+        """
+        service = service or get_timer_service()
+        self.running = True
+        
+        async def tick():
+            await self.iterate_with_timing(control_func, planning_func)
+        
+        return service.call_every(1.0 / self.timing_config.control_frequency, tick,
+                                  name=self.name, priority=priority)
 
 
 def create_control_loop(
@@ -26,12 +26,13 @@ warnings.warn(
 # Re-export core functions for compatibility
 from .real_time_core import (
     check_rt_os_support, get_rt_priority, setup_rt_os,
-    should_execute_task, update_task_stats, handle_deadline_violation,
+    should_execute_task, update_task_stats, fill_percentiles, handle_deadline_violation,
     apply_timing_compensation, schedule_next_execution, calculate_sleep_time,
     create_task_factory
 )
 
 import asyncio
+import functools
 import time
 import threading
 import platform
@@ -46,6 +47,10 @@ from .real_time_config import (
     TaskPriority, TaskType, RealTimeTask, TimingStats, SchedulerConfig
 )
 from .logging_config import get_logger
+from .hot_path_diagnostics import HotPathDiagnostics
+from .clock import Clock, get_clock
+from .streaming_stats import WindowedQuantileSketch
+from .timer_service import PeriodicTimer, TimerService, get_timer_service
 
 
 class RealTimeScheduler:
@@ -58,15 +63,23 @@ class RealTimeScheduler:
     - Deadline monitoring and missed deadline recovery
     - Real-time operating system integration
     - Performance monitoring and statistics
+    
+    Periodic tasks and the performance monitor are timers on the loop's
+    timer service, so they share its single wakeup source; sporadic and
+    aperiodic tasks keep their own polling coroutines.
     """
     
-    def __init__(self, config: Optional[SchedulerConfig] = None):
+    def __init__(self, config: Optional[SchedulerConfig] = None, clock: Optional[Clock] = None):
         """Initialize the real-time scheduler."""
         self.config = config or SchedulerConfig()
+        self.clock = clock or get_clock()
         self.tasks: Dict[str, RealTimeTask] = {}
         self.running = False
         self.scheduler_thread: Optional[threading.Thread] = None
         self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer_service: Optional[TimerService] = None
+        self._owns_timer_service = False
+        self._timers: Dict[str, PeriodicTimer] = {}
         
         # Timing compensation
         self.clock_drift_compensation = 0.0
@@ -76,8 +89,8 @@ class RealTimeScheduler:
         # Track previous stats to calculate increments correctly
         self.previous_stats: Dict[str, TimingStats] = {}
         
-        # Real-time OS features
-        self.enable_rt_os = self.config.enable_rt_os and check_rt_os_support()
+        # Real-time OS features (not used in simulated time)
+        self.enable_rt_os = self.config.enable_rt_os and not self.clock.is_virtual and check_rt_os_support()
         self.rt_priority = get_rt_priority()
         
         # Performance monitoring
@@ -109,7 +122,7 @@ class RealTimeScheduler:
         
         # Initialize timing for periodic tasks
         if task.task_type == TaskType.PERIODIC and task.period_ms > 0:
-            task.next_deadline = time.perf_counter() + (task.period_ms / 1000.0)
+            task.next_deadline = self.clock.now() + (task.period_ms / 1000.0)
     
     def remove_task(self, task_name: str) -> None:
         """Remove a task from the scheduler."""
@@ -136,14 +149,27 @@ class RealTimeScheduler:
             return
         
         self.running = True
-        self.loop = asyncio.get_event_loop()
+        self.loop = asyncio.get_running_loop()
+        service = get_timer_service()
+        self._owns_timer_service = service.clock is not self.clock
+        if self._owns_timer_service:
+            service = TimerService(self.loop, self.clock)
+        self._timer_service = service
         
-        # Start monitoring task
-        asyncio.create_task(self._monitor_performance())
+        # Start monitoring (100 Hz)
+        self._timers["__monitor__"] = service.call_every(
+            0.01, self._monitor_tick, name="rt_scheduler_monitor", priority=TaskPriority.LOW)
         
         # Start all enabled tasks
         for task in self.tasks.values():
-            if task.enabled:
+            if not task.enabled:
+                continue
+            if task.task_type == TaskType.PERIODIC and task.period_ms > 0:
+                self._timers[task.name] = service.call_every(
+                    task.period_ms / 1000.0, functools.partial(self._run_release, task),
+                    name=task.name, priority=task.priority,
+                    start=max(task.next_deadline, self.clock.now()))
+            else:
                 asyncio.create_task(self._run_task(task))
         
         self.logger.info("Real-time scheduler started")
@@ -151,29 +177,62 @@ class RealTimeScheduler:
     async def stop(self) -> None:
         """Stop the real-time scheduler."""
         self.running = False
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        if self._owns_timer_service and self._timer_service is not None:
+            self._timer_service.close()
+        self._timer_service = None
         self.logger.info("Real-time scheduler stopped")
     
+    async def _run_release(self, task: RealTimeTask) -> None:
+        """Run one release of a periodic task (timer service callback)."""
+        if not (self.running and task.enabled):
+            timer = self._timers.pop(task.name, None)
+            if timer is not None:
+                timer.cancel()
+            return
+        try:
+            current_time = self.clock.now()
+            execution_start = current_time
+            
+            if asyncio.iscoroutinefunction(task.func):
+                await task.func()
+            elif not self.clock.is_virtual:
+                await self.loop.run_in_executor(None, task.func)
+            else:
+                task.func()
+            
+            execution_time = (self.clock.now() - execution_start) * 1000.0
+            self._update_task_stats(task, execution_time, current_time)
+            if current_time > task.next_deadline:
+                self._handle_deadline_violation(task, current_time)
+            self._schedule_next_execution(task, current_time)
+        except Exception as e:
+            self.logger.error(f"Error in task '{task.name}'", error=str(e))
+    
     async def _run_task(self, task: RealTimeTask) -> None:
-        """Run a single real-time task."""
+        """Run a sporadic or aperiodic task in its own polling coroutine."""
         while self.running and task.enabled:
             try:
-                current_time = time.perf_counter()
+                current_time = self.clock.now()
                 
                 # Check if it's time to execute
                 if self._should_execute_task(task, current_time):
                     # Execute task with timing measurement
-                    execution_start = time.perf_counter()
+                    execution_start = self.clock.now()
                     
                     if asyncio.iscoroutinefunction(task.func):
                         await task.func()
                     else:
-                        # Run synchronous function in thread pool
-                        if self.loop:
+                        # Run synchronous function in thread pool; inline under
+                        # virtual time, where thread completion is not simulated
+                        if self.loop and not self.clock.is_virtual:
                             await self.loop.run_in_executor(None, task.func)
                         else:
                             task.func()
                     
-                    execution_time = (time.perf_counter() - execution_start) * 1000.0
+                    execution_time = (self.clock.now() - execution_start) * 1000.0
                     
                     # Update task statistics
                     self._update_task_stats(task, execution_time, current_time)
@@ -188,11 +247,11 @@ class RealTimeScheduler:
                 # Sleep until next execution or deadline
                 sleep_time = self._calculate_sleep_time(task, current_time)
                 if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
+                    await self.clock.sleep(sleep_time)
                 
             except Exception as e:
                 self.logger.error(f"Error in task '{task.name}'", error=str(e))
-                await asyncio.sleep(0.001)  # Brief pause on error
+                await self.clock.sleep(0.001)  # Brief pause on error
     
     def _should_execute_task(self, task: RealTimeTask, current_time: float) -> bool:
         """Determine if a task should execute now."""
@@ -243,28 +302,23 @@ class RealTimeScheduler:
         sleep_time = calculate_sleep_time(task, current_time)
         return max(0.001, sleep_time)  # Ensure minimum sleep time
     
-    async def _monitor_performance(self):
-        """Monitor overall scheduler performance."""
-        while self.running:
-            try:
-                # Update global statistics
-                self.global_stats['total_cycles'] += 1
-                
-                # Calculate average cycle time
-                if self.timing_stats:
-                    avg_cycle_times = [stats.mean_execution_time_ms for stats in self.timing_stats.values()]
-                    self.global_stats['average_cycle_time_ms'] = np.mean(avg_cycle_times)
-                    self.global_stats['max_cycle_time_ms'] = max(avg_cycle_times)
-                
-                # Log performance every 10 seconds
-                if self.global_stats['total_cycles'] % 1000 == 0:
-                    self._log_performance()
-                
-                await asyncio.sleep(0.01)  # 100Hz monitoring
-                
-            except Exception as e:
-                self.logger.error("Error in performance monitoring", error=str(e))
-                await asyncio.sleep(0.1)
+    def _monitor_tick(self) -> None:
+        """Update overall scheduler performance (timer service callback, 100 Hz)."""
+        try:
+            # Update global statistics
+            self.global_stats['total_cycles'] += 1
+            
+            # Calculate average cycle time
+            if self.timing_stats:
+                avg_cycle_times = [stats.mean_execution_time_ms for stats in self.timing_stats.values()]
+                self.global_stats['average_cycle_time_ms'] = np.mean(avg_cycle_times)
+                self.global_stats['max_cycle_time_ms'] = max(avg_cycle_times)
+            
+            # Log performance every 10 seconds
+            if self.global_stats['total_cycles'] % 1000 == 0:
+                self._log_performance()
+        except Exception as e:
+            self.logger.error("Error in performance monitoring", error=str(e))
     
     def _log_performance(self):
         """Log current performance statistics."""
@@ -288,10 +342,18 @@ class RealTimeScheduler:
     
     def get_task_stats(self, task_name: str) -> Optional[TimingStats]:
         """Get statistics for a specific task."""
-        return self.timing_stats.get(task_name)
+        stats = self.timing_stats.get(task_name)
+        task = self.tasks.get(task_name)
+        if stats is not None and task is not None:
+            fill_percentiles(stats, task, self.clock.now())
+        return stats
     
     def get_all_stats(self) -> Dict[str, TimingStats]:
         """Get statistics for all tasks."""
+        now = self.clock.now()
+        for task_name, stats in self.timing_stats.items():
+            if task_name in self.tasks:
+                fill_percentiles(stats, self.tasks[task_name], now)
         return self.timing_stats.copy()
     
     def get_global_stats(self) -> Dict[str, Any]:
@@ -307,8 +369,9 @@ class RealTimeLoop:
     that automatically handle timing compensation and deadline monitoring.
     """
     
-    def __init__(self, frequency_hz: float, name: str = "realtime_loop"):
+    def __init__(self, frequency_hz: float, name: str = "realtime_loop", clock: Optional[Clock] = None):
         """Initialize a real-time loop."""
+        self.clock = clock or get_clock()
         self.frequency_hz = frequency_hz
         self.period_ms = 1000.0 / frequency_hz
         self.name = name
@@ -316,23 +379,29 @@ class RealTimeLoop:
         self.loop_count = 0
         self.missed_deadlines = 0
         self.execution_times = deque(maxlen=1000)
+        self.execution_stats = WindowedQuantileSketch()
+        # Timer service on this loop's clock, when it differs from the shared one's
+        self._private_service: Optional[TimerService] = None
         
         # Timing compensation
         self.clock_drift = 0.0
         self.jitter_compensation = 0.0
         
         # Performance monitoring
-        self.start_time = time.perf_counter()
+        self.start_time = self.clock.now()
         self.last_iteration_time = self.start_time
         
         # Initialize logger
         self.logger = get_logger(f"{__name__}.{name}")
+        # Deadline misses are aggregated into periodic summaries
+        self.diagnostics = HotPathDiagnostics(f"{__name__}.{name}", clock=self.clock.now)
+        self._deadline_message = f"Deadline violation in {name} (execution ms, period {self.period_ms:.2f}ms)"
     
     @asynccontextmanager
     async def real_time_loop(self):
         """Context manager for real-time loops."""
         self.running = True
-        self.start_time = time.perf_counter()
+        self.start_time = self.clock.now()
         self.last_iteration_time = self.start_time
         
         try:
@@ -345,52 +414,115 @@ class RealTimeLoop:
         if not self.running:
             raise RealTimeError("Real-time loop is not running")
         
-        iteration_start = time.perf_counter()
+        iteration_start = self.clock.now()
         
         try:
             # Execute the function
             if asyncio.iscoroutinefunction(func):
                 await func()
+            elif self.clock.is_virtual:
+                func()
             else:
                 # Run synchronous function in thread pool
                 loop = asyncio.get_event_loop()
                 await loop.run_in_executor(None, func)
             
-            # Calculate execution time
-            execution_time = (time.perf_counter() - iteration_start) * 1000.0
-            self.execution_times.append(execution_time)
-            
-            # Check for deadline violation
-            if execution_time > self.period_ms:
-                self.missed_deadlines += 1
-                self.logger.warning(
-                    f"Deadline violation in {self.name}",
-                    execution_time_ms=execution_time,
-                    period_ms=self.period_ms
-                )
+            self._record_execution(iteration_start)
             
             # Calculate sleep time with compensation
-            elapsed = time.perf_counter() - iteration_start
+            elapsed = self.clock.now() - iteration_start
             sleep_time = max(0.0, (self.period_ms / 1000.0) - elapsed)
             
             # Apply timing compensation
             sleep_time = self._apply_compensation(sleep_time)
             
             if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+                await self.clock.sleep(sleep_time)
             
             self.loop_count += 1
-            self.last_iteration_time = time.perf_counter()
+            self.last_iteration_time = self.clock.now()
             
         except Exception as e:
             self.logger.error(f"Error in real-time loop '{self.name}'", error=str(e))
-            await asyncio.sleep(0.001)  # Brief pause on error
+            await self.clock.sleep(0.001)  # Brief pause on error
     
+    def register(self, func: Callable, priority: TaskPriority = TaskPriority.MEDIUM,
+                 offload: bool = False, service: Optional[TimerService] = None) -> PeriodicTimer:
+        """
+        Run ``func`` every period from the timer service instead of a sleeping coroutine.
+
+        Args:
+            func: Function or coroutine function to run
+            priority: Order among timers due at the same wakeup
+            offload: Run a synchronous ``func`` in the default executor
+            service: Timer service (default: the running loop's shared one,
+                or a private one if this loop uses a different clock; call
+                ``close`` to release it)
+
+        Returns:
+            Timer handle; cancel it to stop the loop
+        """
+        service = service or get_timer_service()
+        if service.clock is not self.clock:
+            private = self._private_service
+            if private is None or private.loop is not service.loop:
+                if private is not None:
+                    private.close()
+                private = self._private_service = TimerService(service.loop, self.clock)
+            service = private
+        self.running = True
+        self.start_time = self.clock.now()
+        self.last_iteration_time = self.start_time
+
+        if asyncio.iscoroutinefunction(func) or offload:
+            async def tick() -> None:
+                iteration_start = self.clock.now()
+                try:
+                    if offload and not asyncio.iscoroutinefunction(func):
+                        await asyncio.get_running_loop().run_in_executor(None, func)
+                    else:
+                        await func()
+                except Exception as e:
+                    self.logger.error(f"Error in real-time loop '{self.name}'", error=str(e))
+                self._complete_iteration(iteration_start)
+        else:
+            def tick() -> None:
+                iteration_start = self.clock.now()
+                try:
+                    func()
+                except Exception as e:
+                    self.logger.error(f"Error in real-time loop '{self.name}'", error=str(e))
+                self._complete_iteration(iteration_start)
+
+        return service.call_every(1.0 / self.frequency_hz, tick, name=self.name,
+                                  priority=priority, start=self.start_time)
+
+    def close(self) -> None:
+        """Cancel this loop's timers on its private timer service and release the service."""
+        if self._private_service is not None:
+            self._private_service.close()
+            self._private_service = None
+
+    def _record_execution(self, iteration_start: float) -> None:
+        execution_time = (self.clock.now() - iteration_start) * 1000.0
+        self.execution_times.append(execution_time)
+        self.execution_stats.record(execution_time, iteration_start)
+        
+        # Check for deadline violation
+        if execution_time > self.period_ms:
+            self.missed_deadlines += 1
+            self.diagnostics.record("deadline", execution_time, self._deadline_message)
+
+    def _complete_iteration(self, iteration_start: float) -> None:
+        self._record_execution(iteration_start)
+        self.loop_count += 1
+        self.last_iteration_time = self.clock.now()
+
     def _apply_compensation(self, sleep_time: float) -> float:
         """Apply timing compensation for jitter and drift."""
         # Calculate drift compensation
         expected_time = self.start_time + (self.loop_count * self.period_ms / 1000.0)
-        actual_time = time.perf_counter()
+        actual_time = self.clock.now()
         drift = actual_time - expected_time
         
         # Apply compensation (10% of drift) with proper clamping
@@ -405,6 +537,7 @@ class RealTimeLoop:
         if not self.execution_times:
             return {}
         
+        elapsed = self.clock.now() - self.start_time
         return {
             'name': self.name,
             'frequency_hz': self.frequency_hz,
@@ -415,7 +548,8 @@ class RealTimeLoop:
             'mean_execution_time_ms': np.mean(self.execution_times),
             'max_execution_time_ms': max(self.execution_times),
             'min_execution_time_ms': min(self.execution_times),
-            'actual_frequency_hz': self.loop_count / ((time.perf_counter() - self.start_time) if self.start_time else 1.0),
+            'p99_execution_time_ms': self.execution_stats.snapshot(self.clock.now()).quantile(0.99),
+            'actual_frequency_hz': self.loop_count / elapsed if elapsed > 0 else 0.0,
         }
 
 
@@ -424,14 +558,19 @@ async def run_periodic_task(
     func: Callable,
     frequency_hz: float,
     name: str = "periodic_task",
-    priority: TaskPriority = TaskPriority.MEDIUM
+    priority: TaskPriority = TaskPriority.MEDIUM,
+    clock: Optional[Clock] = None
 ) -> None:
-    """Run a function at a fixed frequency."""
-    loop = RealTimeLoop(frequency_hz, name)
+    """Run a function at a fixed frequency (until cancelled) on the loop's timer service."""
+    loop = RealTimeLoop(frequency_hz, name, clock)
     
     async with loop.real_time_loop():
-        while loop.running:
-            await loop.iterate(func)
+        timer = loop.register(func, priority, offload=not loop.clock.is_virtual)
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            timer.cancel()
+            loop.close()
 
 
 async def run_with_deadline(
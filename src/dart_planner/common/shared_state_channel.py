@@ -0,0 +1,290 @@
+"""
+Shared-Memory State/Command Channel for DART-Planner
+
+Lock-free handoff between the main process and a control process
+(see ProcessControlLoop) without pickling or queues:
+- Fixed binary layout: one block for the latest FastDroneState and one
+  for the latest control output, each on its own cache lines
+- Single-writer seqlock per block: the sequence counter is odd while a
+  write is in progress, so readers never wait on the writer
+- Torn-read detection: besides the sequence check, every block carries a
+  checksum of its payload bits, so a read that raced a write (including
+  stores becoming visible out of order on weakly ordered CPUs) is retried
+- Readers copy into preallocated arrays; a handoff costs a few
+  microseconds
+
+Block layout (little-endian, 8-byte words):
+    [sequence: uint64][payload: float64 * n][checksum: uint64]
+"""
+
+import os
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .errors import CommunicationError
+from .types import FastDroneState
+
+# (field, length) in payload order
+STATE_LAYOUT: Tuple[Tuple[str, int], ...] = (
+    ("timestamp", 1),
+    ("position", 3),
+    ("velocity", 3),
+    ("attitude", 3),
+    ("angular_velocity", 3),
+    ("quaternion", 4),
+)
+COMMAND_LAYOUT: Tuple[Tuple[str, int], ...] = (
+    ("timestamp", 1),
+    ("thrust", 1),
+    ("torque", 3),
+    ("state_timestamp", 1),
+    ("state_version", 1),
+    ("compute_time_s", 1),
+    ("iteration", 1),
+    ("missed_deadlines", 1),
+)
+
+_CACHE_LINE = 64
+# Spin this many times on an in-progress write before yielding the CPU
+_SPINS_BEFORE_YIELD = 16
+
+
+def _layout_size(layout: Tuple[Tuple[str, int], ...]) -> int:
+    return sum(length for _, length in layout)
+
+
+def _block_bytes(n_values: int) -> int:
+    raw = 8 * (n_values + 2)
+    return (raw + _CACHE_LINE - 1) // _CACHE_LINE * _CACHE_LINE
+
+
+class SeqlockBlock:
+    """
+    Single-writer, multi-reader seqlock over a region of a shared buffer.
+
+    Args:
+        buffer: Shared buffer (e.g. ``SharedMemory.buf``)
+        offset: Byte offset of the block (8-byte aligned)
+        n_values: Number of float64 payload values
+    """
+
+    def __init__(self, buffer, offset: int, n_values: int):
+        self.n_values = n_values
+        self._seq = np.ndarray((1,), dtype=np.uint64, buffer=buffer, offset=offset)
+        self._data = np.ndarray((n_values,), dtype=np.float64, buffer=buffer, offset=offset + 8)
+        self._check = np.ndarray((1,), dtype=np.uint64, buffer=buffer, offset=offset + 8 * (n_values + 1))
+        self._scratch = np.empty(n_values)
+        self._scratch_bits = self._scratch.view(np.uint64)
+        self.torn_reads = 0
+
+    @property
+    def version(self) -> int:
+        """Number of completed writes (0 if never written)."""
+        return int(self._seq[0]) // 2
+
+    def write(self, values: np.ndarray) -> int:
+        """
+        Publish ``values``; only one process may write a given block.
+
+        Returns:
+            Version of the published values
+        """
+        seq = int(self._seq[0]) | 1
+        self._seq[0] = seq  # odd: write in progress
+        self._data[:] = values
+        self._check[0] = np.bitwise_xor.reduce(self._data.view(np.uint64)) ^ np.uint64(seq + 1)
+        self._seq[0] = seq + 1
+        return (seq + 1) // 2
+
+    def read(self, out: Optional[np.ndarray] = None, max_retries: int = 10000) -> Tuple[int, np.ndarray]:
+        """
+        Copy the latest consistent payload.
+
+        Args:
+            out: Destination array of ``n_values`` floats (default: internal scratch,
+                overwritten by the next read)
+            max_retries: Attempts before giving up on a writer stuck mid-write
+
+        Returns:
+            (version, values); version 0 means nothing was written yet
+
+        Raises:
+            CommunicationError: If no consistent read succeeded within max_retries
+        """
+        scratch = self._scratch
+        for attempt in range(max_retries):
+            seq = int(self._seq[0])
+            if seq & 1:
+                if attempt % _SPINS_BEFORE_YIELD == _SPINS_BEFORE_YIELD - 1:
+                    time.sleep(0)
+                continue
+            scratch[:] = self._data
+            check = self._check[0]
+            if int(self._seq[0]) == seq and (
+                    seq == 0 or check == np.bitwise_xor.reduce(self._scratch_bits) ^ np.uint64(seq)):
+                if out is None:
+                    return seq // 2, scratch
+                out[:] = scratch
+                return seq // 2, out
+            self.torn_reads += 1
+        raise CommunicationError(f"Seqlock read did not complete after {max_retries} attempts")
+
+
+@dataclass
+class ControlOutput:
+    """Control output published by the control process."""
+    timestamp: float
+    thrust: float
+    torque: np.ndarray
+    state_timestamp: float     # timestamp of the state the output was computed from
+    state_version: int         # channel version of that state
+    compute_time_s: float
+    iteration: int
+    missed_deadlines: int
+    version: int               # channel version of this output
+
+
+class SharedControlChannel:
+    """
+    State and command blocks in one shared-memory segment.
+
+    The main process writes states and reads commands; the control process
+    does the opposite. The channel pickles by name, so it can be handed to
+    a ``multiprocessing.Process`` under any start method.
+
+    Args:
+        name: Segment name to attach to; a new segment is created when omitted
+    """
+
+    STATE_SIZE = _layout_size(STATE_LAYOUT)
+    COMMAND_SIZE = _layout_size(COMMAND_LAYOUT)
+
+    def __init__(self, name: Optional[str] = None):
+        state_bytes = _block_bytes(self.STATE_SIZE)
+        size = state_bytes + _block_bytes(self.COMMAND_SIZE)
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._shm.buf[:size] = bytes(size)
+        else:
+            self._shm = _attach(name)
+        self.name = self._shm.name
+        self._state = SeqlockBlock(self._shm.buf, 0, self.STATE_SIZE)
+        self._command = SeqlockBlock(self._shm.buf, state_bytes, self.COMMAND_SIZE)
+        self._state_values = np.empty(self.STATE_SIZE)
+        self._command_values = np.empty(self.COMMAND_SIZE)
+
+    def __reduce__(self):
+        return (SharedControlChannel, (self.name,))
+
+    @property
+    def torn_reads(self) -> int:
+        """Reads retried in this process because they raced a write."""
+        return self._state.torn_reads + self._command.torn_reads
+
+    @property
+    def state_version(self) -> int:
+        return self._state.version
+
+    @property
+    def command_version(self) -> int:
+        return self._command.version
+
+    def write_state(self, state: FastDroneState) -> int:
+        """Publish a state (main process); returns its version."""
+        values = self._state_values
+        values[0] = state.timestamp
+        values[1:4] = state.position
+        values[4:7] = state.velocity
+        values[7:10] = state.attitude
+        values[10:13] = state.angular_velocity
+        state.get_quaternion(values[13:17])
+        return self._state.write(values)
+
+    def read_state(self) -> Tuple[int, Optional[FastDroneState]]:
+        """Latest state (control process) as (version, state); state is None before the first write."""
+        version, values = self._state.read()
+        if version == 0:
+            return 0, None
+        return version, FastDroneState(
+            timestamp=float(values[0]),
+            position=values[1:4].copy(),
+            velocity=values[4:7].copy(),
+            attitude=values[7:10].copy(),
+            angular_velocity=values[10:13].copy(),
+            quaternion=values[13:17].copy(),
+        )
+
+    def write_command(self, thrust: float, torque: np.ndarray, state_timestamp: float = 0.0,
+                      state_version: int = 0, compute_time_s: float = 0.0, iteration: int = 0,
+                      missed_deadlines: int = 0, timestamp: Optional[float] = None) -> int:
+        """Publish a control output (control process); returns its version."""
+        values = self._command_values
+        values[0] = time.time() if timestamp is None else timestamp
+        values[1] = thrust
+        values[2:5] = torque
+        values[5] = state_timestamp
+        values[6] = state_version
+        values[7] = compute_time_s
+        values[8] = iteration
+        values[9] = missed_deadlines
+        return self._command.write(values)
+
+    def read_command(self) -> Optional[ControlOutput]:
+        """Latest control output (main process), or None before the first write."""
+        version, values = self._command.read()
+        if version == 0:
+            return None
+        return ControlOutput(
+            timestamp=float(values[0]),
+            thrust=float(values[1]),
+            torque=values[2:5].copy(),
+            state_timestamp=float(values[5]),
+            state_version=int(values[6]),
+            compute_time_s=float(values[7]),
+            iteration=int(values[8]),
+            missed_deadlines=int(values[9]),
+            version=version,
+        )
+
+    def close(self) -> None:
+        """Detach from the segment; the creator also removes it."""
+        # Drop the numpy views first, the mapping cannot close while exported
+        self._state = self._command = None
+        try:
+            self._shm.close()
+        except BufferError:
+            pass
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._owner = False
+
+    def __enter__(self) -> "SharedControlChannel":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without taking ownership of its lifetime."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        # Before 3.13 attaching also registers the segment with the resource
+        # tracker, which would unlink it when this process exits
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        except Exception:
+            pass
+    return shm
@@ -7,21 +7,24 @@ of lock-free operations and proper synchronization to ensure data consistency.
 
 Key features:
 - Atomic state updates with versioning
-- Lock-free reads for high-frequency control loops
-- Configurable buffer size for different use cases
+- Lock-free reads for high-frequency control loops (seqlock: readers retry
+  instead of blocking, and read statistics are kept per thread)
+- Preallocated history ring of ``buffer_size`` timestamped states with
+  O(log n) lookup and linear/SLERP interpolation between samples
 - Support for both DroneState and FastDroneState
 - Integration with asyncio for communication layers
 """
 
 import asyncio
+import bisect
 import threading
 import time
-from typing import Optional, Generic, TypeVar, Dict, Any
+from typing import Optional, Generic, TypeVar, Dict, Any, List
 from dataclasses import dataclass, field
-from collections import deque
-import numpy as np
 
+from dart_planner.common.quaternions import quaternion_slerp, quaternion_to_euler
 from dart_planner.common.types import DroneState, FastDroneState
+from dart_planner.common.units import Q_
 
 T = TypeVar('T', DroneState, FastDroneState)
 
@@ -36,36 +39,52 @@ class StateSnapshot(Generic[T]):
 
 class ThreadSafeStateBuffer(Generic[T]):
     """
-    Thread-safe state buffer with atomic updates and versioning.
+    Thread-safe state history with atomic updates and versioning.
     
-    Provides lock-free reads for high-frequency control loops while ensuring
-    atomic state updates from estimators. Uses double-buffering technique
-    to prevent race conditions.
+    States are kept in a preallocated ring of ``buffer_size`` slots in write
+    order, so the newest write is always the latest state and the oldest
+    write is evicted first. Writers are serialized by a lock; readers never take
+    it. Instead every write bumps a sequence counter to an odd value before
+    touching the ring and back to even afterwards, and readers retry until
+    they observe the same even value before and after reading (a seqlock).
+    
+    Snapshot timestamps are the states' own timestamps, so
+    ``get_state_at_time`` can be used for latency compensation and sensor
+    fusion: it binary-searches a timestamp-sorted view of the history (built
+    once per write) and interpolates between the bracketing samples.
     """
     
     def __init__(self, buffer_size: int = 10, state_type: type = DroneState):
         self.buffer_size = buffer_size
         self.state_type = state_type
         
-        # Double-buffered state storage
-        self._current_buffer = 0
-        self._buffers = [
-            StateSnapshot[T](state=None, timestamp=0.0, version=0),
-            StateSnapshot[T](state=None, timestamp=0.0, version=0)
-        ]
+        # Preallocated history ring, oldest sample at _head
+        self._capacity = max(int(buffer_size), 2)
+        self._times = [0.0] * self._capacity
+        self._states: list = [None] * self._capacity
+        self._versions = [0] * self._capacity
+        self._sources = ["unknown"] * self._capacity
+        self._metadata: list = [None] * self._capacity
+        self._head = 0
+        self._count = 0
         
-        # Threading primitives
+        # Threading primitives: writers lock, readers check the sequence
         self._update_lock = threading.RLock()
+        self._seq = 0
         self._version_counter = 0
+        self._latest_snapshot: Optional[tuple] = None  # (seq, snapshot)
+        self._time_index: Optional[tuple] = None  # (seq, (times, indices))
         
-        # Statistics
+        # Writer statistics (guarded by the update lock)
         self._stats = {
             'updates': 0,
-            'reads': 0,
-            'stale_reads': 0,
-            'last_update_time': 0.0,
-            'last_read_time': 0.0
+            'last_update_time': 0.0
         }
+        # Reader statistics: one [reads, stale_reads, last_read_time]
+        # counter per thread, so reads never write shared state
+        self._reader_local = threading.local()
+        self._reader_counters: List[list] = []
+        self._reader_lock = threading.Lock()
         
         # Async support
         self._update_event = asyncio.Event()
@@ -74,7 +93,12 @@ class ThreadSafeStateBuffer(Generic[T]):
     def update_state(self, state: T, source: str = "unknown", 
                     metadata: Optional[Dict[str, Any]] = None) -> int:
         """
-        Atomically update the state buffer.
+        Atomically append a state to the history.
+        
+        The ring is kept in write order: every sample is accepted and a full
+        ring evicts the oldest write, whatever the samples' timestamps (a
+        backwards clock jump must not lock out new data). Timestamp order is
+        established by the queries that need it.
         
         Args:
             state: New state data
@@ -87,69 +111,230 @@ class ThreadSafeStateBuffer(Generic[T]):
         if not isinstance(state, self.state_type):
             raise TypeError(f"Expected {self.state_type}, got {type(state)}")
         
+        timestamp = float(state.timestamp)
+        capacity = self._capacity
+        
         with self._update_lock:
-            # Increment version and switch buffers
             self._version_counter += 1
-            self._current_buffer = 1 - self._current_buffer
+            version = self._version_counter
             
-            # Update the inactive buffer
-            self._buffers[self._current_buffer] = StateSnapshot(
-                state=state,
-                timestamp=time.time(),
-                version=self._version_counter,
-                source=source,
-                metadata=metadata or {}
-            )
+            self._seq += 1  # odd: write in progress
+            try:
+                head = self._head
+                count = self._count
+                if count == capacity:
+                    # Evict the oldest write
+                    head = (head + 1) % capacity
+                    count -= 1
+                slot = (head + count) % capacity
+                self._times[slot] = timestamp
+                self._states[slot] = state
+                self._versions[slot] = version
+                self._sources[slot] = source
+                self._metadata[slot] = metadata
+                self._head = head
+                self._count = count + 1
+            finally:
+                self._seq += 1  # even: consistent again
             
             # Update statistics
             self._stats['updates'] += 1
             self._stats['last_update_time'] = time.time()
             
             # Notify async subscribers
-            self._notify_subscribers(state, self._version_counter)
+            self._notify_subscribers(state, version)
             
-            return self._version_counter
+            return version
     
     def get_latest_state(self) -> Optional[StateSnapshot[T]]:
         """
-        Get the latest state snapshot (lock-free read).
+        Get the most recently written snapshot (lock-free read).
         
         Returns:
             Latest state snapshot or None if no state available
         """
-        # Lock-free read from current buffer
-        snapshot = self._buffers[self._current_buffer]
+        while True:
+            seq = self._seq
+            if seq & 1:
+                time.sleep(0)  # writer active: yield and retry
+                continue
+            cached = self._latest_snapshot
+            if cached is not None and cached[0] == seq:
+                snapshot = cached[1]
+                break
+            try:
+                snapshot = self._snapshot_at(self._count - 1) if self._count else None
+            except (IndexError, TypeError):
+                snapshot = None
+            if self._seq == seq:
+                if snapshot is not None:
+                    # Built at most once per write, shared by all readers
+                    self._latest_snapshot = (seq, snapshot)
+                break
         
-        if snapshot.state is None:
+        if snapshot is None:
             return None
-        
-        self._stats['reads'] += 1
-        self._stats['last_read_time'] = time.time()
-        
+        self._count_read(stale=False)
         return snapshot
     
     def get_state_at_time(self, target_time: float, 
-                         max_age: float = 0.1) -> Optional[StateSnapshot[T]]:
+                         max_age: float = 0.1,
+                         interpolate: bool = True) -> Optional[StateSnapshot[T]]:
         """
-        Get state closest to target time within max_age.
+        Get the state at ``target_time`` from the history (lock-free read).
+        
+        Between two samples, position, velocity and angular velocity are
+        interpolated linearly and attitude by quaternion SLERP. Outside the
+        history the nearest sample is returned without extrapolation.
         
         Args:
-            target_time: Target timestamp
-            max_age: Maximum age of acceptable state (seconds)
+            target_time: Target timestamp (same time base as the states)
+            max_age: Maximum distance from target_time to the nearest
+                sample (seconds)
+            interpolate: If False, return the nearest sample instead
             
         Returns:
-            State snapshot or None if no suitable state found
+            State snapshot or None if no sample is within max_age
         """
-        snapshot = self.get_latest_state()
-        if snapshot is None:
+        while True:
+            seq = self._seq
+            if seq & 1:
+                time.sleep(0)
+                continue
+            try:
+                bracket = self._bracket(target_time, self._time_order(seq))
+            except (IndexError, TypeError):
+                bracket = None
+            if self._seq == seq:
+                break
+        
+        if bracket is None:
             return None
+        before, after = bracket
         
-        age = abs(snapshot.timestamp - target_time)
-        if age > max_age:
-            self._stats['stale_reads'] += 1
+        nearest = before
+        if after is not None and (before is None or after.timestamp - target_time < target_time - before.timestamp):
+            nearest = after
+        if abs(nearest.timestamp - target_time) > max_age:
+            self._count_read(stale=True)
             return None
         
-        return snapshot
+        self._count_read(stale=False)
+        if before is None or after is None or not interpolate or nearest.timestamp == target_time:
+            return nearest
+        return self._interpolate(before, after, target_time)
+    
+    def get_history(self) -> List[StateSnapshot[T]]:
+        """Get all stored snapshots in timestamp order (lock-free read)."""
+        while True:
+            seq = self._seq
+            if seq & 1:
+                time.sleep(0)
+                continue
+            try:
+                history = [self._snapshot_at(i) for i in self._time_order(seq)[1]]
+            except (IndexError, TypeError):
+                history = []
+            if self._seq == seq:
+                return history
+    
+    def _time_order(self, seq: int) -> tuple:
+        """
+        ``(times, indices)``: logical ring indices sorted by state timestamp.
+        
+        Built at most once per write and shared by all readers. Called inside
+        a seqlock read, so the result is only cached if no write intervened.
+        """
+        cached = self._time_index
+        if cached is not None and cached[0] == seq:
+            return cached[1]
+        head, count, capacity = self._head, self._count, self._capacity
+        times = [self._times[(head + i) % capacity] for i in range(count)]
+        # Stable sort: equal timestamps stay in write order
+        indices = sorted(range(count), key=times.__getitem__)
+        order = ([times[i] for i in indices], indices)
+        if self._seq == seq:
+            self._time_index = (seq, order)
+        return order
+    
+    def _snapshot_at(self, index: int) -> StateSnapshot[T]:
+        slot = (self._head + index) % self._capacity
+        metadata = self._metadata[slot]
+        return StateSnapshot(
+            state=self._states[slot],
+            timestamp=self._times[slot],
+            version=self._versions[slot],
+            source=self._sources[slot],
+            metadata=dict(metadata) if metadata else {}
+        )
+    
+    def _bracket(self, target_time: float, order: tuple) -> Optional[tuple]:
+        """Samples at or before and after ``target_time`` (either may be None)."""
+        times, indices = order
+        if not indices:
+            return None
+        index = bisect.bisect_right(times, target_time)
+        before = self._snapshot_at(indices[index - 1]) if index > 0 else None
+        if before is not None and before.timestamp == target_time:
+            return before, None
+        after = self._snapshot_at(indices[index]) if index < len(indices) else None
+        return before, after
+    
+    def _interpolate(self, before: StateSnapshot[T], after: StateSnapshot[T],
+                     target_time: float) -> StateSnapshot[T]:
+        alpha = (target_time - before.timestamp) / (after.timestamp - before.timestamp)
+        s0, s1 = before.state, after.state
+        f0 = s0 if isinstance(s0, FastDroneState) else s0.to_fast_state()
+        f1 = s1 if isinstance(s1, FastDroneState) else s1.to_fast_state()
+        
+        position = f0.position + alpha * (f1.position - f0.position)
+        velocity = f0.velocity + alpha * (f1.velocity - f0.velocity)
+        angular_velocity = f0.angular_velocity + alpha * (f1.angular_velocity - f0.angular_velocity)
+        quaternion = quaternion_slerp(f0.get_quaternion(), f1.get_quaternion(), alpha)
+        attitude = quaternion_to_euler(quaternion)
+        
+        if isinstance(s0, FastDroneState):
+            state = FastDroneState(
+                timestamp=target_time, position=position, velocity=velocity,
+                attitude=attitude, angular_velocity=angular_velocity,
+                quaternion=quaternion
+            )
+        else:
+            motor_rpms = s1.motor_rpms
+            if s0.motor_rpms is not None and s1.motor_rpms is not None:
+                motor_rpms = s0.motor_rpms + alpha * (s1.motor_rpms - s0.motor_rpms)
+            state = DroneState(
+                timestamp=target_time,
+                position=Q_(position, 'm'),
+                velocity=Q_(velocity, 'm/s'),
+                attitude=Q_(attitude, 'rad'),
+                angular_velocity=Q_(angular_velocity, 'rad/s'),
+                motor_rpms=motor_rpms
+            )
+        
+        return StateSnapshot(
+            state=state,
+            timestamp=target_time,
+            version=after.version,
+            source=after.source,
+            metadata={
+                'interpolated': True,
+                'alpha': alpha,
+                'bracket_versions': (before.version, after.version)
+            }
+        )
+    
+    def _count_read(self, stale: bool) -> None:
+        counter = getattr(self._reader_local, 'counter', None)
+        if counter is None:
+            counter = [0, 0, 0.0]
+            with self._reader_lock:
+                self._reader_counters.append(counter)
+            self._reader_local.counter = counter
+        counter[0] += 1
+        if stale:
+            counter[1] += 1
+        counter[2] = time.time()
     
     def wait_for_update(self, timeout: float = 1.0) -> Optional[StateSnapshot[T]]:
         """
@@ -233,35 +418,44 @@ class ThreadSafeStateBuffer(Generic[T]):
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get buffer statistics for monitoring."""
+        with self._reader_lock:
+            counters = list(self._reader_counters)
         return {
             'updates': self._stats['updates'],
-            'reads': self._stats['reads'],
-            'stale_reads': self._stats['stale_reads'],
+            'reads': sum(c[0] for c in counters),
+            'stale_reads': sum(c[1] for c in counters),
             'current_version': self._version_counter,
             'last_update_time': self._stats['last_update_time'],
-            'last_read_time': self._stats['last_read_time'],
+            'last_read_time': max((c[2] for c in counters), default=0.0),
             'subscriber_count': len(self._subscribers),
-            'buffer_size': self.buffer_size
+            'buffer_size': self.buffer_size,
+            'history_length': self._count
         }
     
     def reset(self):
         """Reset the buffer and statistics."""
         with self._update_lock:
-            self._buffers = [
-                StateSnapshot[T](state=None, timestamp=0.0, version=0),
-                StateSnapshot[T](state=None, timestamp=0.0, version=0)
-            ]
+            self._seq += 1
+            try:
+                for i in range(self._capacity):
+                    self._states[i] = None
+                    self._metadata[i] = None
+                self._head = 0
+                self._count = 0
+            finally:
+                self._seq += 1
+            self._latest_snapshot = None
+            self._time_index = None
             self._version_counter = 0
-            self._current_buffer = 0
             
             # Reset statistics
             self._stats = {
                 'updates': 0,
-                'reads': 0,
-                'stale_reads': 0,
-                'last_update_time': 0.0,
-                'last_read_time': 0.0
+                'last_update_time': 0.0
             }
+            with self._reader_lock:
+                self._reader_local = threading.local()
+                self._reader_counters = []
             
             # Clear subscribers
             self._subscribers.clear()
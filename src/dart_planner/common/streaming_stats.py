@@ -0,0 +1,445 @@
+"""
+Bounded-Memory Statistics for DART-Planner Hot Loops
+
+Metrics primitives that can be fed from a control loop indefinitely:
+- RingBuffer: preallocated NumPy ring of the most recent samples
+  (scalars or fixed-width rows); appends write in place
+- RunningStats: O(1) streaming count/mean/variance/min/max (Welford)
+- QuantileSketch: log-bucketed histogram (HDR-histogram layout) with O(1)
+  record and p50/p99/p99.9 queries; sketches with the same layout merge by
+  adding counts, and pickle, so they can be combined across tasks and
+  processes
+- WindowedQuantileSketch: ring of QuantileSketch slices answering the same
+  queries over a sliding time window
+
+None of them grows with the number of samples recorded.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity ring of the most recent samples"""
+
+    __slots__ = ("capacity", "_data", "_index", "_count")
+
+    def __init__(self, capacity: int, width: Optional[int] = None, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        shape: Tuple[int, ...] = (capacity,) if width is None else (capacity, width)
+        self._data = np.zeros(shape, dtype=dtype)
+        self._index = 0
+        self._count = 0
+
+    def append(self, value: Union[float, Sequence[float], np.ndarray]) -> None:
+        self._data[self._index] = value
+        self._index += 1
+        if self._index == self.capacity:
+            self._index = 0
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self) -> None:
+        self._index = 0
+        self._count = 0
+
+    def last(self):
+        if self._count == 0:
+            raise IndexError("last() on empty RingBuffer")
+        return self._data[self._index - 1]
+
+    def to_array(self) -> np.ndarray:
+        """Copy of the stored samples, oldest first"""
+        if self._count < self.capacity:
+            return self._data[:self._count].copy()
+        return np.concatenate((self._data[self._index:], self._data[:self._index]))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+
+class RunningStats:
+    """Streaming count, mean, variance, min and max"""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def __len__(self) -> int:
+        return self.count
+
+
+# Samples a QuantileSketch buffers before bucketing them in one vectorized pass
+_SKETCH_BATCH = 1024
+
+
+class QuantileSketch:
+    """
+    Log-linear histogram of signed values.
+
+    Magnitudes below ``resolution * 2**sub_bucket_bits`` fall in linear
+    buckets of width ``resolution``; above that each power of two is split
+    into ``2**(sub_bucket_bits - 1)`` buckets, so a quantile is off by less
+    than ``2**-(sub_bucket_bits - 1)`` of its value. Magnitudes beyond
+    ``max_value`` share the last bucket. Count, mean, min and max are exact.
+
+    ``record`` only appends to a short pending list; samples are bucketed
+    with NumPy every ``_SKETCH_BATCH`` records and before any query. Counts
+    are stored only for the span of buckets actually hit, so a sketch of a
+    narrow distribution costs a few hundred bytes rather than the full
+    layout.
+
+    Args:
+        resolution: Smallest distinguishable magnitude (in the recorded unit)
+        max_value: Largest magnitude resolved
+        sub_bucket_bits: Precision (buckets per power of two of dynamic range)
+    """
+
+    __slots__ = ("resolution", "max_value", "sub_bucket_bits", "_sub_count", "_half", "_n",
+                 "_pending", "_offset", "_counts", "_count", "_total", "_total_sq", "_min", "_max")
+
+    # Bucket midpoints per layout, shared by all sketches of that layout
+    _midpoints: Dict[Tuple[float, float, int], np.ndarray] = {}
+
+    def __init__(self, resolution: float = 1e-3, max_value: float = 1e4, sub_bucket_bits: int = 5):
+        if resolution <= 0 or max_value <= resolution:
+            raise ValueError(f"need 0 < resolution < max_value, got {resolution}, {max_value}")
+        if not 1 <= sub_bucket_bits <= 16:
+            raise ValueError(f"sub_bucket_bits must be in [1, 16], got {sub_bucket_bits}")
+        self.resolution = float(resolution)
+        self.max_value = float(max_value)
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self._half = self._sub_count >> 1
+        magnitude = int(self.max_value / self.resolution)
+        if magnitude < self._sub_count:
+            self._n = magnitude + 1
+        else:
+            shift = magnitude.bit_length() - sub_bucket_bits
+            self._n = self._sub_count + (shift - 1) * self._half + (magnitude >> shift) - self._half + 1
+        self.reset()
+
+    @property
+    def layout(self) -> Tuple[float, float, int]:
+        return (self.resolution, self.max_value, self.sub_bucket_bits)
+
+    def _buckets(self, values: np.ndarray) -> np.ndarray:
+        """Bucket keys of ``values``: the magnitude's bucket, ``-index - 1`` for negatives."""
+        magnitude = (np.minimum(np.abs(values), self.max_value) / self.resolution).astype(np.int64)
+        # frexp exponent == bit_length for positive integers below 2**53
+        shift = np.maximum(np.frexp(magnitude)[1] - self.sub_bucket_bits, 1)
+        index = np.where(magnitude < self._sub_count, magnitude,
+                         self._sub_count + (shift - 1) * self._half + (magnitude >> shift) - self._half)
+        return np.where(values < 0, -index - 1, index)
+
+    def _signed_midpoints(self) -> np.ndarray:
+        """Centres of the ``_counts`` slots, from the most negative to the most positive."""
+        mids = QuantileSketch._midpoints.get(self.layout)
+        if mids is None:
+            index = np.arange(self._n)
+            linear = index < self._sub_count
+            shift = np.where(linear, 0, (index - self._sub_count) // self._half + 1)
+            sub = np.where(linear, index, (index - self._sub_count) % self._half + self._half)
+            positive = ((sub << shift) + (1 << shift) / 2.0) * self.resolution
+            mids = np.concatenate((-positive[::-1], positive))
+            QuantileSketch._midpoints[self.layout] = mids
+        return mids
+
+    def reset(self) -> None:
+        self._pending: List[float] = []  # samples not bucketed yet
+        # Slot key + n holds bucket key, so slots are ordered by value.
+        # Only slots _offset .. _offset + len(_counts) are stored, allocated
+        # on first use and widened as new buckets are hit.
+        self._offset = 0
+        self._counts: Optional[np.ndarray] = None
+        self._count = 0
+        self._total = 0.0
+        self._total_sq = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def record(self, value: float) -> None:
+        """Add one sample (NaN is ignored)."""
+        pending = self._pending
+        pending.append(value)
+        if len(pending) >= _SKETCH_BATCH:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        values = np.asarray(self._pending, dtype=np.float64)
+        self._pending.clear()  # in place: WindowedQuantileSketch appends to it directly
+        self.record_array(values)
+
+    def record_array(self, values: np.ndarray) -> None:
+        """Add an array of samples in one vectorized pass (NaN is ignored)."""
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return
+        slots = self._buckets(values) + self._n
+        offset = int(slots.min())
+        self._add_counts(offset, np.bincount(slots - offset))
+        self._count += values.size
+        self._total += float(values.sum())
+        self._total_sq += float(np.dot(values, values))
+        self._min = min(self._min, float(values.min()))
+        self._max = max(self._max, float(values.max()))
+
+    def _add_counts(self, offset: int, counts: np.ndarray) -> None:
+        """Add ``counts`` for slots ``offset ..``, widening the stored span if needed."""
+        if self._counts is None:
+            self._offset = offset
+            self._counts = counts.copy()
+            return
+        lo = min(self._offset, offset)
+        hi = max(self._offset + self._counts.size, offset + counts.size)
+        if lo != self._offset or hi != self._offset + self._counts.size:
+            widened = np.zeros(hi - lo, dtype=np.int64)
+            widened[self._offset - lo:self._offset - lo + self._counts.size] = self._counts
+            self._offset = lo
+            self._counts = widened
+        self._counts[offset - lo:offset - lo + counts.size] += counts
+
+    def _stored_midpoints(self) -> np.ndarray:
+        """Bucket midpoints of the stored slots."""
+        return self._signed_midpoints()[self._offset:self._offset + self._counts.size]
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Add the samples of ``other`` (same layout) into this sketch."""
+        if other.layout != self.layout:
+            raise ValueError(f"cannot merge sketch layout {other.layout} into {self.layout}")
+        other._flush()
+        if other._count:
+            self._add_counts(other._offset, other._counts)
+            self._count += other._count
+            self._total += other._total
+            self._total_sq += other._total_sq
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+        return self
+
+    def copy(self) -> "QuantileSketch":
+        return QuantileSketch(*self.layout).merge(self)
+
+    @property
+    def count(self) -> int:
+        self._flush()
+        return self._count
+
+    @property
+    def min(self) -> float:
+        self._flush()
+        return self._min if self._count else math.nan
+
+    @property
+    def max(self) -> float:
+        self._flush()
+        return self._max if self._count else math.nan
+
+    @property
+    def mean(self) -> float:
+        self._flush()
+        return self._total / self._count if self._count else 0.0
+
+    @property
+    def std(self) -> float:
+        self._flush()
+        if self._count < 2:
+            return 0.0
+        mean = self._total / self._count
+        return math.sqrt(max(self._total_sq / self._count - mean * mean, 0.0))
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """Values at the given quantiles (0..1); NaN when empty."""
+        qs = list(qs)
+        self._flush()
+        if not self._count:
+            return [math.nan] * len(qs)
+        fractions = np.asarray(qs, dtype=float)
+        cumulative = np.cumsum(self._counts)
+        targets = np.maximum(np.ceil(fractions * self._count), 1)
+        values = self._stored_midpoints()[np.searchsorted(cumulative, targets)]
+        # Exact extremes beat bucket midpoints
+        values = np.where(fractions <= 0.0, self._min, np.where(fractions >= 1.0, self._max, values))
+        return np.clip(values, self._min, self._max).tolist()
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles((q,))[0]
+
+    def histogram(self, bins: int = 20) -> Tuple[np.ndarray, np.ndarray]:
+        """Equal-width histogram between min and max, like ``np.histogram``."""
+        self._flush()
+        if not self._count:
+            return np.zeros(bins, dtype=np.int64), np.zeros(bins + 1)
+        occupied = self._counts > 0
+        mids = np.clip(self._stored_midpoints()[occupied], self._min, self._max)
+        hist, edges = np.histogram(mids, bins=bins, range=(self._min, self._max),
+                                   weights=self._counts[occupied])
+        return hist.astype(np.int64), edges
+
+    def summary(self) -> Dict[str, float]:
+        """count, mean, std, min, max, p50, p90, p99 and p999 (99.9th percentile)."""
+        p50, p90, p99, p999 = self.quantiles((0.5, 0.9, 0.99, 0.999))
+        return {
+            "count": self._count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "p999": p999,
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getstate__(self):
+        self._flush()  # pending samples travel bucketed
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+class WindowedQuantileSketch:
+    """
+    QuantileSketch over the last ``window_s`` seconds.
+
+    The window is a ring of ``slices`` sketches, each covering
+    ``window_s / slices`` seconds; a query merges the slices, so the window
+    edge moves in steps of one slice. Timestamps come from the caller (any
+    monotonic time base), keeping ``record`` clock-free.
+
+    Args:
+        window_s: Window length in seconds
+        slices: Number of sub-windows
+        resolution, max_value, sub_bucket_bits: Layout of every slice (see QuantileSketch)
+    """
+
+    __slots__ = ("window_s", "_slice_s", "_slices", "_epoch", "_slice_end", "_current", "_pending")
+
+    def __init__(self, window_s: float = 10.0, slices: int = 10, resolution: float = 1e-3,
+                 max_value: float = 1e4, sub_bucket_bits: int = 5):
+        if window_s <= 0 or slices < 1:
+            raise ValueError(f"need window_s > 0 and slices >= 1, got {window_s}, {slices}")
+        self.window_s = float(window_s)
+        self._slice_s = self.window_s / slices
+        self._slices = [QuantileSketch(resolution, max_value, sub_bucket_bits) for _ in range(slices)]
+        self.reset()
+
+    def reset(self) -> None:
+        for sketch in self._slices:
+            sketch.reset()
+        self._epoch: Optional[int] = None
+        self._slice_end = -math.inf
+        self._current = self._slices[0]
+        self._pending = self._current._pending
+
+    def _advance(self, now: float) -> None:
+        epoch = int(now // self._slice_s)
+        if self._epoch is not None and epoch <= self._epoch:
+            return
+        slices = self._slices
+        self._current._flush()  # only the current slice holds unbucketed samples
+        if self._epoch is None or epoch - self._epoch >= len(slices):
+            for sketch in slices:
+                sketch.reset()
+        else:
+            for e in range(self._epoch + 1, epoch + 1):
+                slices[e % len(slices)].reset()
+        self._epoch = epoch
+        self._slice_end = (epoch + 1) * self._slice_s
+        self._current = slices[epoch % len(slices)]
+        self._pending = self._current._pending
+
+    def record(self, value: float, now: float) -> None:
+        """Add one sample taken at time ``now`` (seconds)."""
+        # Time going backwards keeps writing to the current slice
+        if now >= self._slice_end:
+            self._advance(now)
+        # Inlined QuantileSketch.record: this runs once per dispatch per task
+        pending = self._pending
+        pending.append(value)
+        if len(pending) >= _SKETCH_BATCH:
+            self._current._flush()
+
+    def record_many(self, values: Union[np.ndarray, Iterable[float]],
+                    now: Union[float, np.ndarray]) -> None:
+        """
+        Add a batch of samples taken at ``now`` (seconds).
+
+        ``now`` is either one time for the whole batch or an array with the
+        time each sample was taken, oldest first; each run of samples is
+        recorded into the slice its times fall in.
+        """
+        if not isinstance(values, np.ndarray):
+            values = np.fromiter(values, dtype=np.float64)
+        if np.ndim(now) == 0:
+            if now >= self._slice_end:
+                self._advance(now)
+            self._current.record_array(values)
+            return
+        times = np.asarray(now, dtype=np.float64)
+        if len(times) != len(values):
+            raise ValueError(f"record_many got {len(values)} values but {len(times)} times")
+        if not len(times):
+            return
+        epochs = np.floor_divide(times, self._slice_s)
+        starts = np.flatnonzero(epochs[1:] != epochs[:-1]) + 1
+        for begin, end in zip(np.concatenate(([0], starts)), np.concatenate((starts, [len(times)]))):
+            # Time going backwards keeps writing to the current slice
+            if times[begin] >= self._slice_end:
+                self._advance(float(times[begin]))
+            self._current.record_array(values[begin:end])
+
+    def snapshot(self, now: Optional[float] = None) -> QuantileSketch:
+        """Merged copy of the window, expiring slices older than ``now`` first."""
+        if now is not None:
+            self._advance(now)
+        merged = QuantileSketch(*self._current.layout)
+        for sketch in self._slices:
+            merged.merge(sketch)
+        return merged
+
+    def summary(self, now: Optional[float] = None) -> Dict[str, float]:
+        return self.snapshot(now).summary()
+
+    def __len__(self) -> int:
+        return sum(sketch.count for sketch in self._slices)
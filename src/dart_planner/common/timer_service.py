@@ -0,0 +1,562 @@
+"""
+Per-Loop Timer Service for DART-Planner
+
+Drives the periodic callbacks registered with it from one wakeup source per
+event loop (``RealTimeScheduler`` periodic tasks, ``RealTimeLoop.register``
+and the timing-aware loops):
+- Hierarchical timing wheel (64 slots per level, occupancy bitmasks):
+  scheduling and cancelling are O(1), and finding the next deadline costs
+  a few bit operations instead of a scan over all timers
+- A single re-armable wakeup per loop (timerfd on Linux, the loop's timer
+  queue elsewhere and on virtual time); it is armed at the exact deadline
+  of the earliest timer, so the wheel tick only bounds bookkeeping, not
+  precision
+- Timers due at the same wakeup run in ``TaskPriority`` order
+- Phase-aligned periods: releases are computed as ``start + n * period``
+  (no accumulated drift), timers without an explicit start are aligned to
+  multiples of their period so commensurate rates share wakeups, and
+  missed periods are skipped and counted instead of being run back to back
+- Per-timer lateness/execution sketches and service-wide wakeup and
+  dispatch overhead statistics in one place
+
+Synchronous callbacks run inline on the loop and should be short;
+coroutine functions are started as tasks, and a release is counted as an
+overrun (and skipped) while the previous run is still in progress.
+"""
+
+import asyncio
+import heapq
+import math
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .clock import Clock, SystemClock, get_clock
+from .errors import SchedulingError
+from .logging_config import get_logger
+from .real_time_config import TaskPriority
+from .streaming_stats import WindowedQuantileSketch
+from .timing_utils import LoopTimer
+
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+
+
+@dataclass(eq=False)
+class PeriodicTimer:
+    """A callback registered with a TimerService (``period_s == 0`` for one-shot timers)."""
+    name: str
+    callback: Callable[[], Any]
+    period_s: float
+    priority: TaskPriority = TaskPriority.MEDIUM
+    deadline: float = 0.0
+    active: bool = True
+    runs: int = 0
+    missed_periods: int = 0
+    overruns: int = 0
+    errors: int = 0
+    lateness_stats: WindowedQuantileSketch = field(default_factory=WindowedQuantileSketch, repr=False)
+    execution_stats: WindowedQuantileSketch = field(default_factory=WindowedQuantileSketch, repr=False)
+    _service: Optional["TimerService"] = field(default=None, repr=False)
+    _is_coroutine: bool = field(default=False, repr=False)
+    _task: Optional[asyncio.Task] = field(default=None, repr=False)
+    _start: float = field(default=0.0, repr=False)
+    _release: int = field(default=0, repr=False)
+    # Wheel bookkeeping: tick, (level, slot) while in the wheel, token while in the near heap
+    _tick: int = field(default=0, repr=False)
+    _where: Optional[tuple] = field(default=None, repr=False)
+    _token: int = field(default=0, repr=False)
+
+    def cancel(self) -> None:
+        """Stop the timer; a coroutine run already in progress is not interrupted."""
+        if self._service is not None:
+            self._service.cancel(self)
+        self.active = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        lateness = self.lateness_stats.summary()
+        execution = self.execution_stats.summary()
+        return {
+            'name': self.name,
+            'period_ms': self.period_s * 1000.0,
+            'priority': self.priority.name,
+            'active': self.active,
+            'runs': self.runs,
+            'missed_periods': self.missed_periods,
+            'overruns': self.overruns,
+            'errors': self.errors,
+            'p50_lateness_ms': lateness['p50'],
+            'p99_lateness_ms': lateness['p99'],
+            'max_lateness_ms': lateness['max'],
+            'p50_execution_time_ms': execution['p50'],
+            'p99_execution_time_ms': execution['p99'],
+        }
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel over integer ticks.
+
+    An entry lives on the lowest level whose enclosing block it shares with
+    the current tick, in slot ``(tick >> 6 * level) & 63``; entries beyond
+    the top level wait in an overflow list. Entries cascade to lower levels
+    as the wheel advances into their slot.
+
+    Args:
+        levels: Number of 64-slot levels (span of ``64 ** levels`` ticks)
+        current: Last processed tick
+    """
+
+    def __init__(self, levels: int = 4, current: int = 0):
+        self.levels = levels
+        self.current = current
+        self._slots: List[List[List[PeriodicTimer]]] = [[[] for _ in range(_SLOTS)] for _ in range(levels)]
+        self._occupied = [0] * levels
+        self._overflow: List[PeriodicTimer] = []
+        self._top_shift = _SLOT_BITS * levels
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, entry: PeriodicTimer, tick: int) -> None:
+        """Insert an entry due at ``tick`` (must be later than ``current``)."""
+        entry._tick = tick
+        self._size += 1
+        self._place(entry)
+
+    def remove(self, entry: PeriodicTimer) -> None:
+        if entry._where is None:
+            return
+        level, index = entry._where
+        entry._where = None
+        self._size -= 1
+        if level == self.levels:
+            self._overflow.remove(entry)
+            return
+        slot = self._slots[level][index]
+        slot.remove(entry)
+        if not slot:
+            self._occupied[level] &= ~(1 << index)
+
+    def _locate(self, tick: int):
+        diff = tick ^ self.current
+        level = 0
+        while level < self.levels and diff >> (_SLOT_BITS * (level + 1)):
+            level += 1
+        return level, (tick >> (_SLOT_BITS * level)) & _SLOT_MASK
+
+    def _place(self, entry: PeriodicTimer) -> None:
+        level, index = self._locate(entry._tick)
+        if level == self.levels:
+            slot = self._overflow
+        else:
+            slot = self._slots[level][index]
+            self._occupied[level] |= 1 << index
+        slot.append(entry)
+        entry._where = (level, index)
+
+    def next_slot(self) -> Optional[List[PeriodicTimer]]:
+        """Slot (or overflow list) holding the earliest entry, or None if empty."""
+        start = self._next_event()
+        if start is None:
+            return None
+        return start[1]
+
+    def _next_event(self):
+        """(start tick, slot, level, index) of the earliest occupied slot, or None."""
+        current = self.current
+        for level in range(self.levels):
+            shift = _SLOT_BITS * level
+            digit = (current >> shift) & _SLOT_MASK
+            later = self._occupied[level] >> (digit + 1)
+            if later:
+                index = digit + 1 + ((later & -later).bit_length() - 1)
+                block = (current >> (shift + _SLOT_BITS)) << (shift + _SLOT_BITS)
+                return block | (index << shift), self._slots[level][index], level, index
+        if self._overflow:
+            tick = min(entry._tick for entry in self._overflow)
+            return (tick >> self._top_shift) << self._top_shift, self._overflow, self.levels, 0
+        return None
+
+    def advance(self, target: int) -> List[PeriodicTimer]:
+        """Move to ``target`` and return the entries whose tick is now <= ``target``."""
+        expired: List[PeriodicTimer] = []
+        while True:
+            event = self._next_event()
+            if event is None or event[0] > target:
+                break
+            start, slot, level, index = event
+            self.current = max(self.current, start)
+            entries = slot[:]
+            slot.clear()
+            if level < self.levels:
+                self._occupied[level] &= ~(1 << index)
+            for entry in entries:
+                if entry._tick <= target:
+                    entry._where = None
+                    self._size -= 1
+                    expired.append(entry)
+                else:
+                    self._place(entry)
+        self.current = max(self.current, target)
+        return expired
+
+
+class _ClockTimer:
+    """Wakeup source for non-system clocks, on the loop's own timer queue."""
+
+    precise = False
+
+    def __init__(self, callback, loop: asyncio.AbstractEventLoop, clock: Clock):
+        self._callback = callback
+        self._loop = loop
+        self._clock = clock
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def arm(self, deadline_s: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        # On a VirtualTimeEventLoop loop.time() is the virtual clock itself
+        delay = max(deadline_s - self._clock.now(), 0.0)
+        self._handle = self._loop.call_at(self._loop.time() + delay, self._fire)
+
+    def cancel(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    close = cancel
+
+    def _fire(self) -> None:
+        self._handle = None
+        self._callback()
+
+
+class TimerService:
+    """
+    Timing wheel driving periodic and one-shot callbacks on one event loop.
+
+    Use ``get_timer_service()`` for the running loop's shared instance.
+    Methods must be called from the loop's thread. The service refers to its
+    loop weakly, so an abandoned loop and its service can be collected.
+
+    Args:
+        loop: Event loop to run on (default: the running loop)
+        clock: Time source (default: the process clock)
+        tick_s: Wheel resolution
+        levels: Wheel levels
+        slack_s: Timers due within this long after a wakeup run with it
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None, clock: Optional[Clock] = None,
+                 tick_s: float = 1e-4, levels: int = 4, slack_s: float = 1e-6):
+        if tick_s <= 0:
+            raise SchedulingError("Timer wheel tick must be positive")
+        self._loop_ref = weakref.ref(loop or _running_loop())
+        self.clock = clock or get_clock()
+        self.tick_s = tick_s
+        self.slack_s = slack_s
+        self._inv_tick = 1.0 / tick_s
+        self.logger = get_logger(__name__)
+        self._wheel = TimerWheel(levels, self._tick_of(self.clock.now()))
+        # Timers popped from the wheel (or added for the current tick) but not yet due
+        self._near: List = []
+        self._tokens = 0
+        self._timers: Dict[int, PeriodicTimer] = {}
+        self._waker = None
+        self._armed = math.inf
+        self._in_dispatch = False
+        self.wakeups = 0
+        self.dispatched = 0
+        self.wakeup_lateness = WindowedQuantileSketch()
+        self.dispatch_overhead = WindowedQuantileSketch(resolution=1e-6)
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """The event loop this service runs on (None once it has been collected)."""
+        return self._loop_ref()
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def call_every(self, period_s: float, callback: Callable[[], Any], name: Optional[str] = None,
+                   priority: TaskPriority = TaskPriority.MEDIUM, start: Optional[float] = None) -> PeriodicTimer:
+        """
+        Run ``callback`` every ``period_s`` seconds.
+
+        Args:
+            period_s: Period in seconds
+            callback: Function or coroutine function taking no arguments
+            name: Name used in statistics
+            priority: Order among timers due at the same wakeup
+            start: First release in clock seconds (default: the next
+                multiple of the period)
+
+        Returns:
+            Handle for cancelling the timer and reading its statistics
+        """
+        if period_s <= 0:
+            raise SchedulingError(f"Timer period must be positive, got {period_s}")
+        if start is None:
+            start = (math.floor(self.clock.now() / period_s) + 1) * period_s
+        return self._register(callback, period_s, start, name, priority)
+
+    def call_at(self, deadline: float, callback: Callable[[], Any], name: Optional[str] = None,
+                priority: TaskPriority = TaskPriority.MEDIUM) -> PeriodicTimer:
+        """Run ``callback`` once at ``deadline`` (clock seconds)."""
+        return self._register(callback, 0.0, deadline, name, priority)
+
+    def call_later(self, delay: float, callback: Callable[[], Any], name: Optional[str] = None,
+                   priority: TaskPriority = TaskPriority.MEDIUM) -> PeriodicTimer:
+        """Run ``callback`` once after ``delay`` seconds."""
+        return self.call_at(self.clock.now() + delay, callback, name, priority)
+
+    def cancel(self, timer: PeriodicTimer) -> None:
+        if self._timers.pop(id(timer), None) is None:
+            return
+        timer.active = False
+        timer._token = 0  # invalidates any entry in the near heap
+        self._wheel.remove(timer)
+        if not self._timers and not self._in_dispatch:
+            self._release_waker()
+
+    def _register(self, callback, period_s, deadline, name, priority) -> PeriodicTimer:
+        timer = PeriodicTimer(
+            name=name or getattr(callback, "__name__", "timer"),
+            callback=callback,
+            period_s=period_s,
+            priority=priority,
+            deadline=deadline,
+            _start=deadline,
+            _service=self,
+            _is_coroutine=asyncio.iscoroutinefunction(callback),
+        )
+        self._timers[id(timer)] = timer
+        self._schedule(timer)
+        if not self._in_dispatch:
+            self._rearm()
+        return timer
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+    @property
+    def timers(self) -> List[PeriodicTimer]:
+        return list(self._timers.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        lateness = self.wakeup_lateness.summary()
+        overhead = self.dispatch_overhead.summary()
+        return {
+            'timers': len(self._timers),
+            'wakeups': self.wakeups,
+            'dispatched': self.dispatched,
+            'precise_wakeups': bool(self._waker is not None and self._waker.precise),
+            'p50_wakeup_lateness_ms': lateness['p50'],
+            'p99_wakeup_lateness_ms': lateness['p99'],
+            'p50_dispatch_overhead_ms': overhead['p50'],
+            'p99_dispatch_overhead_ms': overhead['p99'],
+            'timer_stats': {timer.name: timer.get_stats() for timer in self._timers.values()},
+        }
+
+    def close(self) -> None:
+        """Cancel every timer and release the wakeup source."""
+        for timer in list(self._timers.values()):
+            self.cancel(timer)
+        self._release_waker()
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+    def _tick_of(self, t: float) -> int:
+        return math.floor(t * self._inv_tick)
+
+    def _schedule(self, timer: PeriodicTimer) -> None:
+        tick = self._tick_of(timer.deadline)
+        if tick > self._wheel.current:
+            self._wheel.add(timer, tick)
+        else:
+            self._push_near(timer)
+
+    def _push_near(self, timer: PeriodicTimer) -> None:
+        self._tokens += 1
+        timer._token = self._tokens
+        heapq.heappush(self._near, (timer.deadline, self._tokens, timer))
+
+    def _next_deadline(self) -> float:
+        near = self._near
+        while near and near[0][2]._token != near[0][1]:
+            heapq.heappop(near)
+        deadline = near[0][0] if near else math.inf
+        slot = self._wheel.next_slot()
+        if slot:
+            deadline = min(deadline, min(timer.deadline for timer in slot))
+        return deadline
+
+    def _rearm(self) -> None:
+        deadline = self._next_deadline()
+        if deadline == self._armed:
+            return
+        self._armed = deadline
+        if deadline == math.inf:
+            if self._waker is not None:
+                self._waker.cancel()
+            return
+        if self._waker is None:
+            if isinstance(self.clock, SystemClock):
+                self._waker = LoopTimer(self._on_wakeup, self.loop)
+            else:
+                self._waker = _ClockTimer(self._on_wakeup, self.loop, self.clock)
+        self._waker.arm(deadline)
+
+    def _release_waker(self) -> None:
+        if self._waker is not None:
+            self._waker.close()
+            self._waker = None
+        self._armed = math.inf
+
+    def _on_wakeup(self) -> None:
+        now = self.clock.now()
+        wall_start = time.perf_counter()
+        self.wakeups += 1
+        if self._armed != math.inf:
+            self.wakeup_lateness.record((now - self._armed) * 1000.0, now)
+        self._armed = math.inf
+
+        for timer in self._wheel.advance(self._tick_of(now + self.slack_s)):
+            self._push_near(timer)
+        near = self._near
+        due: List[PeriodicTimer] = []
+        horizon = now + self.slack_s
+        while near and near[0][0] <= horizon:
+            _, token, timer = heapq.heappop(near)
+            if timer._token == token:
+                due.append(timer)
+        if len(due) > 1:
+            due.sort(key=lambda t: (t.priority.value, t.deadline))
+
+        callback_time = 0.0
+        self._in_dispatch = True
+        try:
+            for timer in due:
+                callback_time += self._run(timer, now)
+        finally:
+            self._in_dispatch = False
+
+        if self._timers:
+            self._rearm()
+        else:
+            self._release_waker()
+        self.dispatch_overhead.record((time.perf_counter() - wall_start - callback_time) * 1000.0, now)
+
+    def _run(self, timer: PeriodicTimer, now: float) -> float:
+        """Run one due timer and reschedule it; returns wall time spent in the callback."""
+        if not timer.active or self._timers.get(id(timer)) is not timer:
+            return 0.0  # cancelled by an earlier callback of this wakeup
+        self.dispatched += 1
+        timer.lateness_stats.record((now - timer.deadline) * 1000.0, now)
+        wall_start = time.perf_counter()
+        try:
+            if timer._is_coroutine:
+                if timer._task is not None and not timer._task.done():
+                    timer.overruns += 1
+                else:
+                    timer.runs += 1
+                    timer._task = self.loop.create_task(self._run_coroutine(timer))
+            else:
+                timer.runs += 1
+                timer.callback()
+        except Exception as e:
+            timer.errors += 1
+            self.logger.error(f"Timer '{timer.name}' failed: {e}")
+        elapsed = time.perf_counter() - wall_start
+        if not timer._is_coroutine:
+            timer.execution_stats.record(elapsed * 1000.0, now)
+
+        if not timer.active:
+            return elapsed
+        if timer.period_s <= 0:
+            self.cancel(timer)
+            return elapsed
+        timer._release += 1
+        timer.deadline = timer._start + timer._release * timer.period_s
+        current = self.clock.now()
+        if timer.deadline <= current:
+            skipped = math.ceil((current - timer.deadline) / timer.period_s)
+            timer.missed_periods += skipped
+            timer._release += skipped
+            timer.deadline = timer._start + timer._release * timer.period_s
+        self._schedule(timer)
+        return elapsed
+
+    async def _run_coroutine(self, timer: PeriodicTimer) -> None:
+        start = self.clock.now()
+        try:
+            await timer.callback()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            timer.errors += 1
+            self.logger.error(f"Timer '{timer.name}' failed: {e}")
+        timer.execution_stats.record((self.clock.now() - start) * 1000.0, start)
+
+
+def _running_loop() -> asyncio.AbstractEventLoop:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        raise SchedulingError("The timer service needs a running event loop") from None
+
+
+# One shared service per event loop; entries go away with their loop
+_services: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TimerService]" = weakref.WeakKeyDictionary()
+_service_lock = threading.Lock()
+
+
+def get_timer_service() -> TimerService:
+    """
+    Get the shared timer service of the running event loop.
+
+    The service is created on first use with the process clock
+    (``get_clock()``). Each loop has its own; services of other loops (and
+    threads) are never touched.
+    """
+    loop = _running_loop()
+    service = _services.get(loop)
+    if service is not None:
+        return service
+    with _service_lock:
+        service = _services.get(loop)
+        if service is None:
+            service = _services[loop] = TimerService(loop)
+        return service
+
+
+def set_timer_service(service: Optional[TimerService],
+                      loop: Optional[asyncio.AbstractEventLoop] = None) -> Optional[TimerService]:
+    """
+    Install the shared timer service of a loop; returns the previous one.
+
+    Args:
+        service: Service to install, or None to forget the current one
+        loop: Loop to install it for (default: ``service.loop``, or the
+            running loop when ``service`` is None)
+    """
+    if loop is None:
+        loop = service.loop if service is not None else _running_loop()
+    with _service_lock:
+        previous = _services.pop(loop, None)
+        if service is not None:
+            _services[loop] = service
+    return previous
+
+
+def close_timer_service() -> None:
+    """Close and forget the running loop's shared service (call from that loop)."""
+    service = set_timer_service(None)
+    if service is not None:
+        service.close()
@@ -10,6 +10,7 @@ import time
 import logging
 from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass
+from collections import deque
 from enum import Enum
 
 import numpy as np
@@ -17,6 +18,9 @@ import threading
 import contextvars
 
 from .types import Trajectory
+from .piecewise_trajectory import PiecewiseTrajectory
+from .clock import Clock, get_clock
+from .streaming_stats import WindowedQuantileSketch
 
 
 class TimingMode(Enum):
@@ -36,6 +40,8 @@ class TimingConfig:
     min_planning_interval: float = 0.01  # seconds
     enable_throttling: bool = True
     enable_interpolation: bool = True
+    # "linear" blends each field; "hermite" uses velocities as position derivatives
+    interpolation: str = "linear"
 
 
 class TimingManager:
@@ -46,10 +52,14 @@ class TimingManager:
     1. Planner dt is set to 1/control_frequency by default
     2. Controller is throttled when planner outputs slower
     3. Smooth interpolation between planner outputs
+    
+    Times passed to should_plan/should_control default to the manager's
+    clock, so the same manager runs in real or simulated time.
     """
     
-    def __init__(self, config: TimingConfig):
+    def __init__(self, config: TimingConfig, clock: Optional[Clock] = None):
         self.config = config
+        self.clock = clock or get_clock()
         self.logger = logging.getLogger(__name__)
         
         # Calculate derived timing parameters
@@ -62,10 +72,12 @@ class TimingManager:
         self.planning_latency = 0.0
         self.control_skips = 0
         self.interpolation_factor = 1.0
+        self._compiled_trajectory: Optional[PiecewiseTrajectory] = None
         
-        # Performance tracking
-        self.planning_times = []
-        self.control_times = []
+        # Performance tracking: recent samples plus a windowed latency sketch (seconds)
+        self.planning_times = deque(maxlen=100)
+        self.control_times = deque(maxlen=1000)
+        self.planning_stats = WindowedQuantileSketch(window_s=60.0, resolution=1e-6, max_value=100.0)
         self.throttling_events = 0
         
         self.logger.info(f"Timing manager initialized:")
@@ -77,11 +89,13 @@ class TimingManager:
         """Get the recommended planner time step based on control frequency."""
         return self.control_dt
     
-    def should_plan(self, current_time: float) -> bool:
+    def should_plan(self, current_time: Optional[float] = None) -> bool:
         """Determine if a new plan should be generated."""
         if not self.config.enable_throttling:
             return True
         
+        if current_time is None:
+            current_time = self.clock.now()
         time_since_last_plan = current_time - self.last_plan_time
         
         # Check if enough time has passed for planning
@@ -98,11 +112,13 @@ class TimingManager:
         self.last_plan_time = current_time
         return True
     
-    def should_control(self, current_time: float) -> bool:
+    def should_control(self, current_time: Optional[float] = None) -> bool:
         """Determine if control should be executed."""
         if not self.config.enable_throttling:
             return True
         
+        if current_time is None:
+            current_time = self.clock.now()
         time_since_last_control = current_time - self.last_control_time
         
         # Always allow control at the specified frequency
@@ -118,10 +134,7 @@ class TimingManager:
         self.last_plan_time = planning_time
         self.planning_latency = planning_duration
         self.planning_times.append(planning_duration)
-        
-        # Keep only recent planning times for statistics
-        if len(self.planning_times) > 100:
-            self.planning_times = self.planning_times[-100:]
+        self.planning_stats.record(planning_duration, self.clock.now())
     
     def update_control_timing(self, control_time: float):
         """Update timing information after control execution using elapsed time deltas."""
@@ -132,11 +145,8 @@ class TimingManager:
             delta = self.control_dt
         # Update last control timestamp
         self.last_control_time = control_time
-        # Record duration delta
+        # Record duration delta (bounded deque keeps only recent ones)
         self.control_times.append(delta)
-        # Keep only recent control deltas for statistics
-        if len(self.control_times) > 1000:
-            self.control_times = self.control_times[-1000:]
     
     def interpolate_trajectory(self, trajectory: Optional['Trajectory'], target_time: float) -> Optional[np.ndarray]:
         """
@@ -155,63 +165,39 @@ class TimingManager:
         if len(trajectory.timestamps) == 0:
             return None
         
-        # Find the two trajectory points to interpolate between
-        timestamps = trajectory.timestamps
-        
-        # Handle edge cases
-        if target_time <= timestamps[0]:
-            return np.concatenate([
-                trajectory.positions[0],
-                trajectory.velocities[0] if trajectory.velocities is not None else np.zeros(3),
-                trajectory.attitudes[0] if trajectory.attitudes is not None else np.zeros(3)
-            ])
-        
-        if target_time >= timestamps[-1]:
-            return np.concatenate([
-                trajectory.positions[-1],
-                trajectory.velocities[-1] if trajectory.velocities is not None else np.zeros(3),
-                trajectory.attitudes[-1] if trajectory.attitudes is not None else np.zeros(3)
-            ])
-        
-        # Find interpolation interval
-        for i in range(len(timestamps) - 1):
-            if timestamps[i] <= target_time <= timestamps[i + 1]:
-                # Linear interpolation
-                alpha = (target_time - timestamps[i]) / (timestamps[i + 1] - timestamps[i])
-                
-                # Interpolate position
-                pos = (1 - alpha) * trajectory.positions[i] + alpha * trajectory.positions[i + 1]
-                
-                # Interpolate velocity if available
-                if trajectory.velocities is not None:
-                    vel = (1 - alpha) * trajectory.velocities[i] + alpha * trajectory.velocities[i + 1]
-                else:
-                    vel = np.zeros(3)
-                
-                # Interpolate attitude if available
-                if trajectory.attitudes is not None:
-                    # For attitudes, use SLERP (Spherical Linear Interpolation) for quaternions
-                    # or simple linear interpolation for Euler angles
-                    if len(trajectory.attitudes[i]) == 4:  # Quaternion
-                        # Simple linear interpolation for quaternions (not ideal but fast)
-                        att = (1 - alpha) * trajectory.attitudes[i] + alpha * trajectory.attitudes[i + 1]
-                        # Normalize
-                        att = att / np.linalg.norm(att)
-                    else:  # Euler angles
-                        att = (1 - alpha) * trajectory.attitudes[i] + alpha * trajectory.attitudes[i + 1]
-                else:
-                    att = np.zeros(3)
-                
-                return np.concatenate([pos, vel, att])
-        
-        return None
+        # Compiled once per trajectory; successive calls advance a segment cursor
+        compiled = self.compile_trajectory(trajectory)
+        row = compiled.evaluate(target_time)
+        att = compiled.field(row, "attitudes", np.zeros(3))
+        if len(att) == 4:  # Quaternion: blended linearly, so renormalize
+            att = att / np.linalg.norm(att)
+        return np.concatenate([
+            compiled.field(row, "positions"),
+            compiled.field(row, "velocities", np.zeros(3)),
+            att,
+        ])
+    
+    def compile_trajectory(self, trajectory: 'Trajectory') -> PiecewiseTrajectory:
+        """Piecewise-polynomial form of a trajectory, cached by identity."""
+        compiled = self._compiled_trajectory
+        if compiled is None or not compiled.compiles(trajectory):
+            compiled = PiecewiseTrajectory.from_trajectory(
+                trajectory, fields=("positions", "velocities", "attitudes"),
+                interpolation=self.config.interpolation)
+            self._compiled_trajectory = compiled
+        return compiled
+    
+    def invalidate_trajectory(self) -> None:
+        """Drop the compiled trajectory after its source was edited in place."""
+        if self._compiled_trajectory is not None:
+            self._compiled_trajectory.invalidate()
     
     def get_timing_stats(self) -> Dict[str, Any]:
         """Get timing performance statistics."""
         if not self.planning_times:
             return {}
         
-        return {
+        stats = {
             "avg_planning_time": np.mean(self.planning_times),
             "max_planning_time": np.max(self.planning_times),
             "planning_frequency": 1.0 / np.mean(self.planning_times) if self.planning_times else 0.0,
@@ -221,11 +207,16 @@ class TimingManager:
             "last_planning_latency": self.planning_latency,
             "timing_mode": self.config.mode.value,
         }
+        latency = self.planning_stats.snapshot(self.clock.now())
+        if latency.count:
+            stats["p50_planning_time"], stats["p99_planning_time"] = latency.quantiles((0.5, 0.99))
+        return stats
     
     def reset_stats(self):
         """Reset timing statistics."""
         self.planning_times.clear()
         self.control_times.clear()
+        self.planning_stats.reset()
         self.throttling_events = 0
         self.planning_latency = 0.0
 
@@ -244,7 +235,7 @@ class ControllerThrottler:
         self.current_trajectory = None
         self.last_control_state = None
         
-    def should_execute_control(self, current_time: float) -> bool:
+    def should_execute_control(self, current_time: Optional[float] = None) -> bool:
         """Determine if control should be executed."""
         return self.timing_manager.should_control(current_time)
     
@@ -264,8 +255,10 @@ class ControllerThrottler:
         return self.timing_manager.interpolate_trajectory(self.current_trajectory, current_time)
     
     def update_trajectory(self, trajectory: 'Trajectory'):
-        """Update the current trajectory for interpolation."""
+        """Update the current trajectory for interpolation (compiled here, on receipt)."""
         self.current_trajectory = trajectory
+        if trajectory is not None and len(trajectory.timestamps) > 0:
+            self.timing_manager.compile_trajectory(trajectory)
     
     def get_throttling_info(self) -> Dict[str, Any]:
         """Get information about throttling status."""
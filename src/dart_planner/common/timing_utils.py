@@ -1,9 +1,29 @@
 """Timing utilities for high-precision sleeps.
 
-Provides an awaitable ``high_res_sleep`` that attempts nanosecond-level sleep on
-Linux via ``clock_nanosleep`` and falls back to ``asyncio.sleep`` elsewhere.
-The helper emits a warning if requested resolution <1 ms but the underlying
-platform cannot guarantee it.
+Provides awaitable ``high_res_sleep`` / ``high_res_sleep_until`` with
+sub-millisecond wakeups. Plain ``asyncio.sleep`` is limited by the
+millisecond timeout granularity of ``epoll``; on Linux two backends avoid
+that (``set_sleep_backend``):
+
+- ``"executor"`` (default): ``clock_nanosleep`` in the loop's default
+  executor. Best tail latency at 1 ms periods in our measurements.
+- ``"timerfd"``: a one-shot ``timerfd`` armed with an absolute
+  ``CLOCK_MONOTONIC`` deadline is registered with the loop
+  (``add_reader``), so the wakeup is an ordinary I/O event and no executor
+  threads are involved. Lower median lateness; timer descriptors are
+  pooled per event loop.
+- ``calibrate_backend`` measures both on this machine and keeps the one
+  with the lower tail lateness.
+- Optional busy-spin for the last few microseconds before the deadline
+  (``set_spin_threshold`` / ``calibrate_spin``) to absorb wakeup latency.
+- Elsewhere (or on loops without ``add_reader``) the sleep falls back to
+  ``asyncio.sleep``; a warning is emitted if sub-millisecond resolution is
+  requested there.
+- ``LoopTimer``: the same timerfd wakeup as a re-armable callback, for
+  dispatchers that drive many timers from one wakeup source.
+
+Deadlines are in ``time.perf_counter()`` seconds, the time base of
+``SystemClock.now()``.
 """
 from __future__ import annotations
 
@@ -12,13 +32,21 @@ import os
 import time
 import warnings
 import platform
-from typing import Optional
+import weakref
+from typing import List, Optional
 
-__all__ = ["high_res_sleep"]
+__all__ = [
+    "high_res_sleep", "high_res_sleep_until", "set_spin_threshold", "calibrate_spin",
+    "set_sleep_backend", "get_sleep_backend", "calibrate_backend", "LoopTimer",
+]
 
 # Detect platform specifics
 _IS_LINUX = platform.system().lower() == "linux"
 
+_clock_nanosleep = None
+_timerfd_create = None
+_timerfd_settime = None
+
 if _IS_LINUX:
     try:
         import ctypes
@@ -30,47 +58,332 @@ if _IS_LINUX:
         class timespec(ctypes.Structure):
             _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
 
+        class itimerspec(ctypes.Structure):
+            _fields_ = [("it_interval", timespec), ("it_value", timespec)]
+
         _clock_nanosleep = librt.clock_nanosleep
         _clock_nanosleep.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(timespec), ctypes.POINTER(timespec)]
         _clock_nanosleep.restype = ctypes.c_int
+
+        libc = ctypes.CDLL(find_library("c"), use_errno=True)
+        _timerfd_create = libc.timerfd_create
+        _timerfd_create.argtypes = [ctypes.c_int, ctypes.c_int]
+        _timerfd_create.restype = ctypes.c_int
+        _timerfd_settime = libc.timerfd_settime
+        _timerfd_settime.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(itimerspec),
+                                     ctypes.POINTER(itimerspec)]
+        _timerfd_settime.restype = ctypes.c_int
     except Exception:  # pragma: no cover – fallback path
-        _clock_nanosleep = None
-else:
-    _clock_nanosleep = None
+        _timerfd_create = None
+        _timerfd_settime = None
+
+_TFD_NONBLOCK = os.O_NONBLOCK
+_TFD_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+_TFD_TIMER_ABSTIME = 1
+
+# timerfd deadlines are CLOCK_MONOTONIC; convert if perf_counter uses another clock
+_PERF_COUNTER_IS_MONOTONIC = (
+    time.get_clock_info("perf_counter").implementation == "clock_gettime(CLOCK_MONOTONIC)"
+)
+
+# Busy-wait this long before each deadline (seconds)
+_spin_s = 0.0
+
+SLEEP_BACKENDS = ("executor", "timerfd")
+
+# Wakeup source for high_res_sleep_until (see set_sleep_backend)
+_backend = "executor"
+
+
+def set_spin_threshold(seconds: float) -> None:
+    """Busy-wait the last ``seconds`` before every high-res deadline (0 disables)."""
+    global _spin_s
+    _spin_s = max(0.0, float(seconds))
+
+
+def set_sleep_backend(name: str) -> None:
+    """Select the wakeup source for ``high_res_sleep``: "executor" or "timerfd"."""
+    global _backend
+    if name not in SLEEP_BACKENDS:
+        raise ValueError(f"Unknown sleep backend '{name}', expected one of {SLEEP_BACKENDS}")
+    _backend = name
+
+
+def get_sleep_backend() -> str:
+    """The wakeup source currently used by ``high_res_sleep``."""
+    return _backend
+
+
+class _TimerfdPool:
+    """One-shot timerfds registered with a single event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        # No reference to the loop itself: the pool is the value of a weak-keyed map
+        self._free: List[int] = []
+        self._all: List[int] = []
+        weakref.finalize(loop, _close_all, self._all)
+
+    def _acquire(self) -> int:
+        if self._free:
+            return self._free.pop()
+        fd = _timerfd_create(CLOCK_MONOTONIC, _TFD_NONBLOCK | _TFD_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "timerfd_create failed")
+        self._all.append(fd)
+        return fd
+
+    @staticmethod
+    def _arm(fd: int, deadline_s: float) -> None:
+        if not _PERF_COUNTER_IS_MONOTONIC:  # pragma: no cover
+            deadline_s = time.monotonic() + (deadline_s - time.perf_counter())
+        ns = max(int(deadline_s * 1e9), 1)  # an all-zero value would disarm the timer
+        spec = itimerspec(timespec(0, 0), timespec(ns // 1_000_000_000, ns % 1_000_000_000))
+        if _timerfd_settime(fd, _TFD_TIMER_ABSTIME, ctypes.byref(spec), None) != 0:
+            raise OSError(ctypes.get_errno(), "timerfd_settime failed")
+
+    @staticmethod
+    def _drain(fd: int) -> bool:
+        try:
+            os.read(fd, 8)
+            return True
+        except BlockingIOError:
+            return False
+
+    def _on_readable(self, fd: int, waiter: asyncio.Future) -> None:
+        if self._drain(fd) and not waiter.done():
+            waiter.set_result(None)
+
+    async def wait_until(self, deadline_s: float) -> None:
+        loop = asyncio.get_running_loop()
+        fd = self._acquire()
+        waiter = loop.create_future()
+        try:
+            self._arm(fd, deadline_s)
+            loop.add_reader(fd, self._on_readable, fd, waiter)
+        except BaseException:
+            self._free.append(fd)
+            raise
+        try:
+            await waiter
+        finally:
+            loop.remove_reader(fd)
+            if not waiter.done() or waiter.cancelled():
+                # Cancelled before firing: disarm so the pooled fd starts clean
+                _timerfd_settime(fd, 0, ctypes.byref(itimerspec()), None)
+                self._drain(fd)
+            self._free.append(fd)
+
+
+def _close_all(fds: List[int]) -> None:
+    for fd in fds:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    fds.clear()
+
+
+# Per-loop pools; None marks loops that cannot watch file descriptors
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Optional[_TimerfdPool]]" = weakref.WeakKeyDictionary()
+
+
+def _get_pool(loop: asyncio.AbstractEventLoop) -> Optional[_TimerfdPool]:
+    try:
+        return _pools[loop]
+    except KeyError:
+        pass
+    pool: Optional[_TimerfdPool] = None
+    if _timerfd_create is not None:
+        try:
+            # Probe add_reader support (e.g. not on proactor loops)
+            probe_r, probe_w = os.pipe()
+            try:
+                loop.add_reader(probe_r, lambda: None)
+                loop.remove_reader(probe_r)
+                pool = _TimerfdPool(loop)
+            finally:
+                os.close(probe_r)
+                os.close(probe_w)
+        except (NotImplementedError, OSError, RuntimeError):
+            pool = None
+    _pools[loop] = pool
+    return pool
+
+
+async def high_res_sleep_until(deadline_s: float, spin_s: Optional[float] = None) -> None:
+    """Sleep until ``time.perf_counter() >= deadline_s``.
+
+    Args:
+        deadline_s: Absolute deadline in ``time.perf_counter()`` seconds
+        spin_s: Busy-wait this long before the deadline (default: the value
+            from ``set_spin_threshold``/``calibrate_spin``)
+    """
+    spin = _spin_s if spin_s is None else spin_s
+    now = time.perf_counter()
+    if deadline_s <= now:
+        return
+
+    wake = deadline_s - spin
+    if wake > now:
+        loop = asyncio.get_running_loop()
+        pool = _get_pool(loop) if _backend == "timerfd" else None
+        if pool is not None:
+            await pool.wait_until(wake)
+        elif _clock_nanosleep is not None:
+            # Relative sleep: re-read the clock right before handing it off
+            await loop.run_in_executor(None, _clock_nanosleep_sleep, max(wake - time.perf_counter(), 0.0))
+        else:
+            if deadline_s - now < 0.001 and spin <= 0:
+                warnings.warn(
+                    "Requested sleep {:.3f} ms but high-resolution timer not available; timing jitter may exceed 1 ms".format(
+                        (deadline_s - now) * 1000
+                    ),
+                    RuntimeWarning,
+                )
+            await asyncio.sleep(wake - now)
+
+    while time.perf_counter() < deadline_s:
+        pass
 
 
 async def high_res_sleep(duration_s: float, _loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
     """High-resolution async sleep.
 
-    If on Linux and ``clock_nanosleep`` is available, we perform the sleep in a
-    thread to avoid blocking the event loop. Otherwise we fall back to
-    ``asyncio.sleep``.
-
-    A warning is emitted if ``duration_s < 0.001`` and we cannot guarantee
-    sub-millisecond resolution.
+    Equivalent to ``high_res_sleep_until(time.perf_counter() + duration_s)``.
     """
     if duration_s <= 0:
         return
+    await high_res_sleep_until(time.perf_counter() + duration_s)
+
 
-    if _clock_nanosleep is not None:
-        # Offload to thread so we don't block.
-        if _loop is None:
-            _loop = asyncio.get_event_loop()
+async def calibrate_spin(samples: int = 200, period_s: float = 0.001, percentile: float = 99.0,
+                         max_spin_s: float = 0.0002) -> float:
+    """Measure timer wakeup latency on this machine and use it as the spin threshold.
 
-        await _loop.run_in_executor(None, _clock_nanosleep_sleep, duration_s)
-    else:
-        if duration_s < 0.001:
-            warnings.warn(
-                "Requested sleep {:.3f} ms but high-resolution timer not available; timing jitter may exceed 1 ms".format(
-                    duration_s * 1000
-                ),
-                RuntimeWarning,
-            )
-        await asyncio.sleep(duration_s)
+    Args:
+        samples: Number of timed sleeps
+        period_s: Length of each sleep
+        percentile: Wakeup-latency percentile to cover by spinning
+        max_spin_s: Upper bound on the spin (CPU burnt per sleep)
+
+    Returns:
+        The spin threshold now in effect (seconds)
+    """
+    lateness = []
+    for _ in range(samples):
+        deadline = time.perf_counter() + period_s
+        await high_res_sleep_until(deadline, spin_s=0.0)
+        lateness.append(time.perf_counter() - deadline)
+    lateness.sort()
+    index = min(len(lateness) - 1, int(len(lateness) * percentile / 100.0))
+    set_spin_threshold(min(lateness[index], max_spin_s))
+    return _spin_s
+
+
+async def calibrate_backend(samples: int = 200, period_s: float = 0.001,
+                            percentile: float = 99.0) -> str:
+    """Measure each sleep backend on this machine and keep the best one.
+
+    Runs ``samples`` fixed-rate sleeps per backend and selects the backend
+    with the lower wakeup lateness at ``percentile``. The spin threshold is
+    not applied while measuring.
+
+    Args:
+        samples: Number of timed sleeps per backend
+        period_s: Length of each sleep
+        percentile: Lateness percentile to compare
+
+    Returns:
+        The backend now in effect
+    """
+    candidates = ["executor"]
+    if _get_pool(asyncio.get_running_loop()) is not None:
+        candidates.append("timerfd")
+    previous = _backend
+    scores = {}
+    try:
+        for name in candidates:
+            set_sleep_backend(name)
+            lateness = []
+            for _ in range(samples):
+                deadline = time.perf_counter() + period_s
+                await high_res_sleep_until(deadline, spin_s=0.0)
+                lateness.append(time.perf_counter() - deadline)
+            lateness.sort()
+            scores[name] = lateness[min(len(lateness) - 1, int(len(lateness) * percentile / 100.0))]
+    finally:
+        set_sleep_backend(previous)
+    set_sleep_backend(min(scores, key=scores.get))
+    return _backend
+
+
+class LoopTimer:
+    """
+    Re-armable one-shot timer that calls ``callback()`` on an event loop.
+
+    Uses a dedicated timerfd watched by the loop when available, otherwise
+    ``loop.call_at``. Must be armed and closed from the loop's thread.
+
+    Args:
+        callback: Called without arguments when the deadline passes
+        loop: Event loop to run on (default: the running loop)
+    """
+
+    def __init__(self, callback, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._loop = loop or asyncio.get_running_loop()
+        self._callback = callback
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._fd: Optional[int] = None
+        if _get_pool(self._loop) is not None:
+            fd = _timerfd_create(CLOCK_MONOTONIC, _TFD_NONBLOCK | _TFD_CLOEXEC)
+            if fd >= 0:
+                self._fd = fd
+                self._loop.add_reader(fd, self._on_readable)
+
+    @property
+    def precise(self) -> bool:
+        """Whether wakeups come from a timerfd rather than the loop's timer queue."""
+        return self._fd is not None
+
+    def arm(self, deadline_s: float) -> None:
+        """(Re)arm for ``deadline_s`` in ``time.perf_counter()`` seconds."""
+        if self._fd is not None:
+            _TimerfdPool._arm(self._fd, deadline_s)
+            return
+        if self._handle is not None:
+            self._handle.cancel()
+        delay = max(deadline_s - time.perf_counter(), 0.0)
+        self._handle = self._loop.call_at(self._loop.time() + delay, self._fire)
+
+    def cancel(self) -> None:
+        if self._fd is not None:
+            _timerfd_settime(self._fd, 0, ctypes.byref(itimerspec()), None)
+            _TimerfdPool._drain(self._fd)
+        elif self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def close(self) -> None:
+        if self._fd is not None:
+            try:
+                self._loop.remove_reader(self._fd)
+            except Exception:
+                pass  # loop already closed
+            os.close(self._fd)
+            self._fd = None
+        self.cancel()
+
+    def _on_readable(self) -> None:
+        if _TimerfdPool._drain(self._fd):
+            self._callback()
+
+    def _fire(self) -> None:
+        self._handle = None
+        self._callback()
 
 
 def _clock_nanosleep_sleep(duration_s: float) -> None:
-    """Blocking helper executed in a thread to perform high-res sleep."""
+    """Blocking high-res sleep (the executor backend, and threaded callers)."""
     if _clock_nanosleep is None:
         time.sleep(duration_s)
         return
@@ -80,4 +393,4 @@ def _clock_nanosleep_sleep(duration_s: float) -> None:
     err = _clock_nanosleep(CLOCK_MONOTONIC, 0, ctypes.byref(ts), None)
     if err != 0:  # pragma: no cover
         # Fallback to time.sleep if call failed
-        time.sleep(duration_s) 
\ No newline at end of file
+        time.sleep(duration_s)
@@ -4,7 +4,8 @@ from typing import List, Optional, Union, TypeAlias
 import os
 import numpy as np
 from pint import Quantity
-from dart_planner.common.units import Q_, ensure_units
+from dart_planner.common.units import Q_, ensure_units, tag_units
+from dart_planner.common.quaternions import euler_to_quaternion_into
 
 @dataclass
 class Pose:
@@ -35,22 +36,40 @@ class FastDroneState:
     - attitude: radians (rad)
     - angular_velocity: rad/s
     - timestamp: seconds (s)
+    - quaternion: optional unit attitude quaternion [w, x, y, z] supplied by
+      estimators that already work in quaternions; when set it is the
+      authoritative attitude, so keep it in step with ``attitude`` or clear it
     """
     timestamp: float
     position: np.ndarray = field(default_factory=lambda: np.zeros(3))      # meters
     velocity: np.ndarray = field(default_factory=lambda: np.zeros(3))      # m/s
     attitude: np.ndarray = field(default_factory=lambda: np.zeros(3))      # rad
     angular_velocity: np.ndarray = field(default_factory=lambda: np.zeros(3))  # rad/s
+    quaternion: Optional[np.ndarray] = None                                 # [w, x, y, z]
+
+    def get_quaternion(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Attitude as a unit quaternion [w, x, y, z]
+        
+        Returns the supplied quaternion, or derives it from ``attitude`` with
+        the scalar kernel. Pass ``out`` (length 4) to avoid allocating.
+        """
+        if self.quaternion is not None:
+            if out is None:
+                return self.quaternion
+            out[:] = self.quaternion
+            return out
+        return euler_to_quaternion_into(self.attitude, np.empty(4) if out is None else out)
     
     @classmethod
     def from_drone_state(cls, state: 'DroneState') -> 'FastDroneState':
         """Convert DroneState to FastDroneState, stripping units."""
         return cls(
             timestamp=state.timestamp,
-            position=state.position.to('m').magnitude,
-            velocity=state.velocity.to('m/s').magnitude,
-            attitude=state.attitude.to('rad').magnitude,
-            angular_velocity=state.angular_velocity.to('rad/s').magnitude,
+            position=ensure_units(state.position, 'm').magnitude,
+            velocity=ensure_units(state.velocity, 'm/s').magnitude,
+            attitude=ensure_units(state.attitude, 'rad').magnitude,
+            angular_velocity=ensure_units(state.angular_velocity, 'rad/s').magnitude,
         )
 
 # ---------------------------------------------------------------------------
@@ -98,6 +117,27 @@ class DroneState:
         """Convert to FastDroneState for high-frequency control loops."""
         return FastDroneState.from_drone_state(self)
 
+    @classmethod
+    def from_si_arrays(cls, timestamp: float, position: np.ndarray, velocity: Optional[np.ndarray] = None,
+                       attitude: Optional[np.ndarray] = None, angular_velocity: Optional[np.ndarray] = None,
+                       motor_rpms: Optional[np.ndarray] = None) -> 'DroneState':
+        """
+        Build a DroneState from arrays already in SI units (m, m/s, rad, rad/s).
+
+        Units are attached without pint conversion or validation, so this is
+        the constructor for adapters and simulators on the hot path. The
+        arrays are not copied.
+        """
+        state = cls.__new__(cls)
+        state.timestamp = timestamp
+        state.position = tag_units(np.asarray(position, dtype=float), 'm')
+        state.velocity = tag_units(np.zeros(3) if velocity is None else np.asarray(velocity, dtype=float), 'm/s')
+        state.attitude = tag_units(np.zeros(3) if attitude is None else np.asarray(attitude, dtype=float), 'rad')
+        state.angular_velocity = tag_units(
+            np.zeros(3) if angular_velocity is None else np.asarray(angular_velocity, dtype=float), 'rad/s')
+        state.motor_rpms = np.zeros(4) if motor_rpms is None else motor_rpms
+        return state
+
 @dataclass
 class ControlCommand:
     """Represents the output of the low-level controller, sent to the motors.
@@ -5,17 +5,26 @@ This module provides a unified units system using Pint for dimensional analysis.
 All physical quantities should use this module to prevent unit conversion errors.
 
 Key features:
-- Singleton UnitRegistry for consistent units across the codebase
+- Singleton UnitRegistry for consistent units across the codebase, built
+  from pint's on-disk definition cache (``DART_PINT_CACHE`` selects the
+  folder; empty disables it); matplotlib support is opt-in via
+  ``enable_matplotlib_units()`` so importing units stays cheap
 - Integration with Pydantic for type validation
 - Common drone-specific units (N, m/s, rad/s, etc.)
-- Performance-optimized for hot loops
+- Performance-optimized for hot loops: unit strings are parsed once,
+  conversion factors are cached per (source, target) unit pair, values
+  already in the expected units pass through untouched, and
+  ``tag_units`` attaches units to SI magnitudes without pint's
+  constructor
 """
 
+import os
 from functools import lru_cache
 from typing import Union, Optional, Any
 import numpy as np
 from pint import UnitRegistry, Quantity
 from pint.errors import DimensionalityError
+from pint.util import UnitsContainer
 
 # Global unit registry singleton
 _UREG: Optional[UnitRegistry] = None
@@ -25,9 +34,12 @@ def get_ureg() -> UnitRegistry:
     """Get the global unit registry singleton."""
     global _UREG
     if _UREG is None:
-        _UREG = UnitRegistry()
-        # Enable matplotlib integration for plotting
-        _UREG.setup_matplotlib(True)
+        cache_folder = os.environ.get("DART_PINT_CACHE", ":auto:") or None
+        try:
+            _UREG = UnitRegistry(cache_folder=cache_folder)
+        except OSError:
+            # Unwritable cache location: parse the definitions every time
+            _UREG = UnitRegistry()
         
         # Add drone-specific units if not already defined
         if 'N' not in _UREG:
@@ -42,6 +54,11 @@ def get_ureg() -> UnitRegistry:
     return _UREG
 
 
+def enable_matplotlib_units() -> None:
+    """Let matplotlib plot Quantities directly (imports matplotlib)."""
+    get_ureg().setup_matplotlib(True)
+
+
 def Q_(value: Union[float, int, str, np.ndarray], unit: Optional[str] = None) -> Quantity:
     """
     Create a Quantity with proper units.
@@ -60,13 +77,65 @@ def Q_(value: Union[float, int, str, np.ndarray], unit: Optional[str] = None) ->
     """
     ureg = get_ureg()
     if unit is not None:
-        return ureg.Quantity(value, unit)
+        return ureg.Quantity(value, _unit(unit))
     elif isinstance(value, str):
         return ureg.Quantity(value)
     else:
         raise ValueError("Must provide unit when value is not a string")
 
 
+@lru_cache(maxsize=None)
+def _unit(unit: str):
+    """Parsed registry Unit for a unit string."""
+    return get_ureg().Unit(unit)
+
+
+@lru_cache(maxsize=None)
+def _units_container(unit: str) -> UnitsContainer:
+    return _unit(unit)._units
+
+
+@lru_cache(maxsize=None)
+def conversion_factor(source: UnitsContainer, target: UnitsContainer) -> Optional[float]:
+    """
+    Multiplicative factor from ``source`` to ``target`` units.
+
+    Returns:
+        The factor, or None for non-multiplicative (offset) conversions
+        such as temperatures, which must go through pint
+
+    Raises:
+        DimensionalityError: If the units are not compatible
+    """
+    ureg = get_ureg()
+    source_unit, target_unit = ureg.Unit(source), ureg.Unit(target)
+    if ureg.Quantity(0.0, source_unit).to(target_unit).magnitude != 0.0:
+        return None
+    return float(ureg.Quantity(1.0, source_unit).to(target_unit).magnitude)
+
+
+@lru_cache(maxsize=1)
+def _can_tag_directly() -> bool:
+    # tag_units fills in the two attributes pint's constructor sets; check
+    # that this pint version still has exactly those
+    return set(vars(get_ureg().Quantity(1.0, "m"))) == {"_magnitude", "_units"}
+
+
+def tag_units(magnitude: Union[float, int, np.ndarray], unit: str) -> Quantity:
+    """
+    Attach units to a magnitude that is already expressed in them.
+
+    Equivalent to ``Q_(magnitude, unit)`` for numbers and arrays, but skips
+    unit parsing and pint's constructor. The magnitude is not copied.
+    """
+    if not _can_tag_directly():
+        return get_ureg().Quantity(magnitude, _unit(unit))
+    quantity = object.__new__(get_ureg().Quantity)
+    quantity._magnitude = magnitude
+    quantity._units = _units_container(unit)
+    return quantity
+
+
 def to_float(q: Any) -> Union[float, np.ndarray]:
     """
     Convert a Quantity (or subclass) to float/array, stripping units.
@@ -94,15 +163,23 @@ def ensure_units(value: Any, expected_unit: str, context: str = "") -> Quantity:
         ValueError: If value is not a Quantity or convertible
     """
     if isinstance(value, Quantity):
+        target = _units_container(expected_unit)
+        units = value._units
+        if units == target:
+            return value
         try:
-            return value.to(expected_unit)
+            factor = conversion_factor(units, target)
+            if factor is None:
+                return value.to(expected_unit)
         except DimensionalityError as e:
             raise DimensionalityError(
-                f"Unit mismatch in {context}: cannot convert {value} to {expected_unit}"
+                e.units1, e.units2, e.dim1, e.dim2,
+                extra_msg=f" (unit mismatch in {context}: cannot convert {value} to {expected_unit})"
             ) from e
+        return tag_units(value.magnitude * factor, expected_unit)
     elif isinstance(value, (int, float, np.ndarray)):
         # Assume dimensionless or same units as expected
-        return Q_(value, expected_unit)
+        return tag_units(value, expected_unit)
     else:
         raise ValueError(f"Expected Quantity or number, got {type(value)} in {context}")
 
@@ -1,9 +1,10 @@
-import asyncio
 import logging
 import time
 from typing import Callable, Optional
 from dataclasses import dataclass
 
+from .heartbeat_service import HeartbeatLink, HeartbeatService, get_heartbeat_service
+
 @dataclass
 class HeartbeatConfig:
     """Configuration for heartbeat monitoring"""
@@ -14,83 +15,112 @@ class HeartbeatConfig:
     @classmethod
     def from_central_config(cls):
         """Create HeartbeatConfig from centralized configuration."""
-        from dart_planner.config.frozen_config import get_frozen_config as get_config
-        config = get_config()
-        heartbeat_config = config.get_heartbeat_config()
+        from dart_planner.config.frozen_config import get_config_snapshot
+        snapshot = get_config_snapshot()
         return cls(
-            heartbeat_interval_ms=heartbeat_config.interval_ms,
-            timeout_ms=heartbeat_config.timeout_ms
+            heartbeat_interval_ms=snapshot["communication.heartbeat_interval_ms"],
+            timeout_ms=snapshot["communication.heartbeat_timeout_ms"]
         )
 
 class HeartbeatMonitor:
     """
-    Asyncio-compatible heartbeat monitor for communication links.
+    Heartbeat monitor for a single communication link.
     Monitors heartbeat loss and triggers emergency procedures.
+    
+    Monitoring is a registration on the process-wide HeartbeatService, which
+    tracks every link with one deadline heap instead of a polling task per
+    monitor. Authenticated data traffic reported via message_received()
+    counts as an implicit heartbeat.
     """
     
-    def __init__(self, config: HeartbeatConfig):
+    def __init__(self,
+                 config: HeartbeatConfig,
+                 service: Optional[HeartbeatService] = None,
+                 link_id: Optional[str] = None,
+                 send_callback: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            config: Heartbeat timing configuration
+            service: Heartbeat service to register with (default: process-wide)
+            link_id: Link name used in logs and status (default: unique id)
+            send_callback: Sends a dedicated heartbeat; only invoked when the
+                link has been idle for heartbeat_interval_ms
+        """
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self._last_heartbeat_received = time.time()
-        self._last_heartbeat_sent = time.time()
+        self.service = service or get_heartbeat_service()
+        self._send_callback = send_callback
+        self._link = HeartbeatLink(
+            link_id=link_id or f"link-{id(self):x}",
+            timeout_s=config.timeout_ms / 1000.0,
+            on_timeout=self._on_link_timeout,
+            send_interval_s=config.heartbeat_interval_ms / 1000.0,
+            send_heartbeat=self._send_heartbeat if send_callback else None,
+        )
         self._monitoring = False
-        self._monitor_task: Optional[asyncio.Task] = None
-        self._lock = asyncio.Lock()
+        
+    @property
+    def link_id(self) -> str:
+        return self._link.link_id
         
     def start_monitoring(self):
-        """Start the heartbeat monitoring task"""
+        """Register the link with the heartbeat service"""
         if self._monitoring:
             return
             
         self._monitoring = True
-        # Create task in the current event loop
-        try:
-            loop = asyncio.get_running_loop()
-            self._monitor_task = loop.create_task(self._monitor_loop())
-        except RuntimeError:
-            # No event loop running, create a new one
-            self._monitor_task = asyncio.create_task(self._monitor_loop())
+        self.service.add_link(self._link)
         self.logger.info(f"🔔 Heartbeat monitoring started (timeout: {self.config.timeout_ms}ms)")
         
     def stop_monitoring(self):
-        """Stop the heartbeat monitoring task"""
+        """Unregister the link from the heartbeat service"""
         self._monitoring = False
-        if self._monitor_task and not self._monitor_task.done():
-            self._monitor_task.cancel()
+        self.service.remove_link(self._link.link_id)
         self.logger.info("🔔 Heartbeat monitoring stopped")
         
     async def heartbeat_received(self):
         """Mark that a heartbeat was received"""
-        async with self._lock:
-            self._last_heartbeat_received = time.time()
+        self.heartbeat_received_sync()
             
     async def heartbeat_sent(self):
         """Mark that a heartbeat was sent"""
-        async with self._lock:
-            self._last_heartbeat_sent = time.time()
+        self.heartbeat_sent_sync()
             
     def heartbeat_received_sync(self):
-        """Synchronous version for compatibility"""
-        self._last_heartbeat_received = time.time()
+        """Mark that a heartbeat was received (callable from any thread)"""
+        self._link.explicit_heartbeats += 1
+        self.service.link_received(self._link)
             
     def heartbeat_sent_sync(self):
-        """Synchronous version for compatibility"""
-        self._last_heartbeat_sent = time.time()
+        """Mark that a heartbeat was sent (callable from any thread)"""
+        self._link.last_sent = self.service.clock()
+        
+    def message_received(self, authenticated: bool = False):
+        """
+        Data message received; authenticated traffic is an implicit heartbeat
+        
+        Pass ``authenticated=True`` only after the message's signature was verified.
+        """
+        if authenticated:
+            self._link.implicit_heartbeats += 1
+            self.service.link_received(self._link)
             
-    async def _monitor_loop(self):
-        """Main monitoring loop - runs as asyncio task"""
-        while self._monitoring:
-            current_time = time.time()
+    def message_sent(self):
+        """Data message sent; suppresses the next dedicated heartbeat"""
+        self.heartbeat_sent_sync()
+        
+    def set_send_callback(self, send_callback: Optional[Callable[[], None]]):
+        """Set the function that sends a dedicated heartbeat on an idle link"""
+        self._send_callback = send_callback
+        self._link.send_heartbeat = self._send_heartbeat if send_callback else None
+        self.service.refresh_link(self._link)
+        
+    def _send_heartbeat(self, link: HeartbeatLink) -> None:
+        if self._send_callback is not None:
+            self._send_callback()
             
-            async with self._lock:
-                time_since_last_heartbeat = (current_time - self._last_heartbeat_received) * 1000
-                
-            if time_since_last_heartbeat > self.config.timeout_ms:
-                self.logger.error(f"🚨 HEARTBEAT LOST! {time_since_last_heartbeat:.1f}ms since last heartbeat")
-                self._trigger_emergency()
-                break
-                
-            await asyncio.sleep(0.01)  # Check every 10ms
+    def _on_link_timeout(self, link: HeartbeatLink) -> None:
+        self._trigger_emergency()
             
     def _trigger_emergency(self):
         """Trigger emergency procedure"""
@@ -105,13 +135,9 @@ class HeartbeatMonitor:
             
     def get_status(self) -> dict:
         """Get current heartbeat status"""
-        current_time = time.time()
-        return {
-            "monitoring": self._monitoring,
-            "time_since_last_received_ms": (current_time - self._last_heartbeat_received) * 1000,
-            "time_since_last_sent_ms": (current_time - self._last_heartbeat_sent) * 1000,
-            "timeout_ms": self.config.timeout_ms,
-        }
+        status = self.service.get_link_status(self._link)
+        status["monitoring"] = self._monitoring
+        return status
 
 class HeartbeatMessage:
     """Standard heartbeat message format"""
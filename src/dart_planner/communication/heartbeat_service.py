@@ -0,0 +1,328 @@
+"""
+Multiplexed Heartbeat Service for DART-Planner
+
+One liveness tracker for any number of communication links:
+- A single deadline min-heap drives every link; there are no per-link
+  polling loops and the service only wakes when the earliest deadline
+  is due
+- Recording traffic is O(1) and lock free (a timestamp store); deadlines
+  are re-validated lazily when they expire
+- Any authenticated data message counts as an implicit heartbeat, and
+  dedicated heartbeats are only sent on links that have been idle for a
+  full send interval
+"""
+
+import asyncio
+import heapq
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Heap entry kinds
+_RX_DEADLINE = 0
+_TX_DEADLINE = 1
+
+
+@dataclass(eq=False)
+class HeartbeatLink:
+    """Liveness state of one monitored link"""
+    link_id: str
+    timeout_s: float
+    on_timeout: Optional[Callable[["HeartbeatLink"], None]] = None
+    send_interval_s: Optional[float] = None
+    send_heartbeat: Optional[Callable[["HeartbeatLink"], None]] = None
+    last_received: float = field(default_factory=time.monotonic)
+    last_sent: float = field(default_factory=time.monotonic)
+    lost: bool = False
+    explicit_heartbeats: int = 0
+    implicit_heartbeats: int = 0
+    heartbeats_sent: int = 0
+    timeouts: int = 0
+    # Whether an RX/TX deadline for this link is currently in the heap
+    _rx_scheduled: bool = False
+    _tx_scheduled: bool = False
+
+
+class HeartbeatService:
+    """
+    Process-wide heartbeat multiplexer
+
+    The service runs on the asyncio loop that is running when the first
+    link is added; if there is none it starts a private daemon loop thread.
+    Traffic notifications may be made from any thread.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+        self._links: Dict[str, HeartbeatLink] = {}
+        self._heap: List[Tuple[float, int, int, HeartbeatLink]] = []
+        self._counter = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_deadline = float('inf')
+        self.wakeups = 0
+
+    # ------------------------------------------------------------------
+    # Link registration
+    # ------------------------------------------------------------------
+    def add_link(self, link: HeartbeatLink) -> HeartbeatLink:
+        """Start monitoring a link (its receive deadline starts now)"""
+        now = self.clock()
+        link.last_received = now
+        link.last_sent = now
+        link.lost = False
+        self._links[link.link_id] = link
+        self._call(self._arm_link, link)
+        return link
+
+    def register_link(self,
+                      link_id: str,
+                      timeout_s: float,
+                      on_timeout: Optional[Callable[[HeartbeatLink], None]] = None,
+                      send_interval_s: Optional[float] = None,
+                      send_heartbeat: Optional[Callable[[HeartbeatLink], None]] = None) -> HeartbeatLink:
+        """Create and start monitoring a link"""
+        return self.add_link(HeartbeatLink(
+            link_id=link_id,
+            timeout_s=timeout_s,
+            on_timeout=on_timeout,
+            send_interval_s=send_interval_s,
+            send_heartbeat=send_heartbeat,
+        ))
+
+    def refresh_link(self, link: HeartbeatLink) -> None:
+        """Re-read a registered link's intervals/callbacks after they changed"""
+        if self._links.get(link.link_id) is link:
+            self._call(self._arm_link, link)
+
+    def remove_link(self, link_id: str) -> None:
+        """Stop monitoring a link; its heap entries are discarded lazily"""
+        self._links.pop(link_id, None)
+
+    def get_link(self, link_id: str) -> Optional[HeartbeatLink]:
+        return self._links.get(link_id)
+
+    # ------------------------------------------------------------------
+    # Traffic notifications (any thread, O(1))
+    # ------------------------------------------------------------------
+    def heartbeat_received(self, link_id: str) -> None:
+        """Explicit heartbeat packet received on a link"""
+        link = self._links.get(link_id)
+        if link is not None:
+            link.explicit_heartbeats += 1
+            self.link_received(link)
+
+    def message_received(self, link_id: str, authenticated: bool = False) -> None:
+        """
+        Data message received on a link
+
+        Authenticated messages prove the peer is alive and count as an
+        implicit heartbeat; unauthenticated traffic is ignored. Pass
+        ``authenticated=True`` only after the message's signature was verified.
+        """
+        if not authenticated:
+            return
+        link = self._links.get(link_id)
+        if link is not None:
+            link.implicit_heartbeats += 1
+            self.link_received(link)
+
+    def message_sent(self, link_id: str) -> None:
+        """Outbound data (or heartbeat) sent; postpones the next dedicated heartbeat"""
+        link = self._links.get(link_id)
+        if link is not None:
+            link.last_sent = self.clock()
+
+    def link_received(self, link: HeartbeatLink) -> None:
+        """Record liveness on a link object, re-arming it if it was lost"""
+        link.last_received = self.clock()
+        if link.lost and self._links.get(link.link_id) is link:
+            link.lost = False
+            self.logger.info(f"Heartbeat link '{link.link_id}' recovered")
+            self._call(self._arm_link, link)
+
+    # ------------------------------------------------------------------
+    # Status
+    # ------------------------------------------------------------------
+    def get_link_status(self, link: HeartbeatLink) -> Dict[str, Any]:
+        now = self.clock()
+        return {
+            "link_id": link.link_id,
+            "monitoring": self._links.get(link.link_id) is link,
+            "lost": link.lost,
+            "time_since_last_received_ms": (now - link.last_received) * 1000,
+            "time_since_last_sent_ms": (now - link.last_sent) * 1000,
+            "timeout_ms": link.timeout_s * 1000,
+            "explicit_heartbeats": link.explicit_heartbeats,
+            "implicit_heartbeats": link.implicit_heartbeats,
+            "heartbeats_sent": link.heartbeats_sent,
+            "timeouts": link.timeouts,
+        }
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "links": len(self._links),
+            "pending_deadlines": len(self._heap),
+            "wakeups": self.wakeups,
+            "lost_links": [link_id for link_id, link in self._links.items() if link.lost],
+        }
+
+    def shutdown(self) -> None:
+        """Drop all links and stop the private loop thread if one was started"""
+        self._links.clear()
+        self._heap.clear()
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._cancel_timer)
+        if self._thread is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=1.0)
+            self._thread = None
+            self._loop.close()
+            self._loop = None
+
+    # ------------------------------------------------------------------
+    # Loop plumbing
+    # ------------------------------------------------------------------
+    def _loop_usable(self, loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+        return (loop is not None and not loop.is_closed()
+                and (self._thread is not None or loop.is_running()))
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if self._loop_usable(loop):
+            return loop  # type: ignore[return-value]
+
+        with self._loop_lock:
+            if self._loop_usable(self._loop):
+                return self._loop  # type: ignore[return-value]
+
+            # First use, or the loop we were attached to has finished
+            try:
+                loop = asyncio.get_running_loop()
+                self._thread = None
+            except RuntimeError:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="heartbeat-service", daemon=True
+                )
+                self._thread.start()
+            self._loop = loop
+            self._timer = None
+            self._timer_deadline = float('inf')
+            if self._heap:
+                loop.call_soon_threadsafe(self._rearm_timer)
+            return loop
+
+    def _call(self, fn: Callable[..., None], *args: Any) -> None:
+        loop = self._ensure_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            fn(*args)
+        else:
+            loop.call_soon_threadsafe(fn, *args)
+
+    def _push(self, deadline: float, kind: int, link: HeartbeatLink) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (deadline, self._counter, kind, link))
+        if deadline < self._timer_deadline:
+            self._rearm_timer()
+
+    def _arm_link(self, link: HeartbeatLink) -> None:
+        if not link._rx_scheduled:
+            link._rx_scheduled = True
+            self._push(link.last_received + link.timeout_s, _RX_DEADLINE, link)
+        if link.send_interval_s and link.send_heartbeat and not link._tx_scheduled:
+            link._tx_scheduled = True
+            self._push(link.last_sent + link.send_interval_s, _TX_DEADLINE, link)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._timer_deadline = float('inf')
+
+    def _rearm_timer(self) -> None:
+        self._cancel_timer()
+        if not self._heap or self._loop is None:
+            return
+        deadline = self._heap[0][0]
+        self._timer_deadline = deadline
+        self._timer = self._loop.call_later(max(0.0, deadline - self.clock()), self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._timer_deadline = float('inf')
+        self.wakeups += 1
+        now = self.clock()
+
+        while self._heap and self._heap[0][0] <= now:
+            _, _, kind, link = heapq.heappop(self._heap)
+            active = self._links.get(link.link_id) is link
+            if kind == _RX_DEADLINE:
+                link._rx_scheduled = False
+                if not active or link.lost:
+                    continue
+                deadline = link.last_received + link.timeout_s
+                if deadline > now:
+                    # Traffic arrived since this deadline was set
+                    link._rx_scheduled = True
+                    self._counter += 1
+                    heapq.heappush(self._heap, (deadline, self._counter, kind, link))
+                else:
+                    self._expire(link, now)
+            else:
+                link._tx_scheduled = False
+                if not active or not link.send_interval_s or not link.send_heartbeat:
+                    continue
+                due = link.last_sent + link.send_interval_s
+                if due <= now:
+                    self._send(link, now)
+                    due = now + link.send_interval_s
+                link._tx_scheduled = True
+                self._counter += 1
+                heapq.heappush(self._heap, (due, self._counter, kind, link))
+
+        self._rearm_timer()
+
+    def _expire(self, link: HeartbeatLink, now: float) -> None:
+        link.lost = True
+        link.timeouts += 1
+        self.logger.error(
+            f"🚨 HEARTBEAT LOST on '{link.link_id}'! "
+            f"{(now - link.last_received) * 1000:.1f}ms since last heartbeat"
+        )
+        if link.on_timeout is not None:
+            try:
+                link.on_timeout(link)
+            except Exception as e:
+                self.logger.error(f"❌ Heartbeat timeout callback failed for '{link.link_id}': {e}")
+
+    def _send(self, link: HeartbeatLink, now: float) -> None:
+        try:
+            link.send_heartbeat(link)  # type: ignore[misc]
+            link.heartbeats_sent += 1
+        except Exception as e:
+            self.logger.error(f"❌ Failed to send heartbeat on '{link.link_id}': {e}")
+        link.last_sent = now
+
+
+_heartbeat_service: Optional[HeartbeatService] = None
+_heartbeat_service_lock = threading.Lock()
+
+
+def get_heartbeat_service() -> HeartbeatService:
+    """Get the process-wide heartbeat service."""
+    global _heartbeat_service
+    if _heartbeat_service is None:
+        with _heartbeat_service_lock:
+            if _heartbeat_service is None:
+                _heartbeat_service = HeartbeatService()
+    return _heartbeat_service
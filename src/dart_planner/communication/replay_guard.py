@@ -0,0 +1,128 @@
+"""
+Anti-Replay Protection for DART-Planner Messaging
+
+Sliding-window duplicate detection in the style of IPsec/DTLS anti-replay
+(RFC 4303 / RFC 6479):
+- Each sender stamps messages with a monotonically increasing counter
+- Receivers keep, per sender, the highest counter seen and a fixed-size
+  bitmap of which of the last N counters were accepted
+- Checks are O(1) with constant memory per peer; the bitmap is updated
+  in place
+
+Checking and committing are separate so callers can run the cheap
+duplicate check before authenticating a message and only record the
+counter once the message is known to be genuine.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class ReplayWindow:
+    """Sliding anti-replay window for one sender"""
+
+    __slots__ = ("size", "highest", "_bits")
+
+    def __init__(self, size: int = 1024):
+        # Round up to whole bytes
+        self.size = max(8, (size + 7) // 8 * 8)
+        self.highest = -1
+        self._bits = bytearray(self.size // 8)
+
+    def _test(self, counter: int) -> bool:
+        slot = counter % self.size
+        return bool(self._bits[slot >> 3] & (1 << (slot & 7)))
+
+    def _set(self, counter: int) -> None:
+        slot = counter % self.size
+        self._bits[slot >> 3] |= 1 << (slot & 7)
+
+    def _clear(self, counter: int) -> None:
+        slot = counter % self.size
+        self._bits[slot >> 3] &= ~(1 << (slot & 7)) & 0xFF
+
+    def check(self, counter: int) -> bool:
+        """True if the counter is new and inside (or ahead of) the window"""
+        if counter < 0:
+            return False
+        if counter > self.highest:
+            return True
+        if self.highest - counter >= self.size:
+            return False  # Too old to tell, reject
+        return not self._test(counter)
+
+    def commit(self, counter: int) -> None:
+        """Record an accepted counter (call only after check() and authentication)"""
+        if counter > self.highest:
+            advance = counter - self.highest
+            if advance >= self.size:
+                for i in range(len(self._bits)):
+                    self._bits[i] = 0
+            else:
+                # Slots being reused for new counters must be cleared
+                for stale in range(self.highest + 1, counter + 1):
+                    self._clear(stale)
+            self.highest = counter
+        self._set(counter)
+
+    def check_and_commit(self, counter: int) -> bool:
+        if not self.check(counter):
+            return False
+        self.commit(counter)
+        return True
+
+
+class ReplayGuard:
+    """
+    Anti-replay state for many senders
+
+    Memory is bounded by ``max_peers`` windows; the least recently active
+    sender is evicted first. Only authenticated messages reach commit(),
+    so unauthenticated traffic cannot evict legitimate peers.
+    """
+
+    def __init__(self, window_size: int = 1024, max_peers: int = 1024):
+        self.window_size = window_size
+        self.max_peers = max(1, max_peers)
+        self._windows: "OrderedDict[str, ReplayWindow]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def check(self, sender: str, counter: int) -> bool:
+        """Cheap pre-authentication duplicate check"""
+        window = self._windows.get(sender)
+        ok = window.check(counter) if window is not None else counter >= 0
+        if not ok:
+            self.rejected += 1
+        return ok
+
+    def commit(self, sender: str, counter: int) -> bool:
+        """
+        Record an authenticated message
+
+        Returns:
+            False if the counter was a replay (e.g. a concurrent duplicate
+            that passed check() in another thread)
+        """
+        with self._lock:
+            window = self._windows.get(sender)
+            if window is None:
+                window = ReplayWindow(self.window_size)
+                self._windows[sender] = window
+                if len(self._windows) > self.max_peers:
+                    self._windows.popitem(last=False)
+            else:
+                self._windows.move_to_end(sender)
+            if not window.check(counter):
+                self.rejected += 1
+                return False
+            window.commit(counter)
+            return True
+
+    def highest_counter(self, sender: str) -> Optional[int]:
+        window = self._windows.get(sender)
+        return window.highest if window is not None else None
+
+    def __len__(self) -> int:
+        return len(self._windows)
@@ -9,12 +9,15 @@ import json
 import base64
 import hashlib
 import hmac
+import itertools
 import os
+import secrets
 from typing import Any, Dict, Optional, Union
 from dataclasses import dataclass, asdict
 import numpy as np
 
 from ..common.errors import SecurityError
+from .replay_guard import ReplayGuard
 
 
 @dataclass
@@ -34,7 +37,11 @@ class SecureSerializer:
     - JSON-based serialization (no code execution)
     - HMAC signature verification
     - Timestamp validation
-    - Message ID tracking
+    - Replay rejection via per-sender sliding counter windows
+    
+    Message IDs have the form ``msg_<counter>_<sender>``; the counter is
+    monotonically increasing per serializer instance and covered by the
+    HMAC, so receivers can reject duplicates without remembering IDs.
     """
     
     def __init__(
@@ -42,8 +49,19 @@ class SecureSerializer:
         secret_key: Optional[str] = None,
         test_mode: bool = False,
         message_ttl: Optional[int] = None,
+        sender_id: Optional[str] = None,
+        replay_window: int = 1024,
     ):
-        """Initialize serializer with optional secret key and test mode."""
+        """
+        Initialize serializer with optional secret key and test mode.
+        
+        Args:
+            secret_key: HMAC key (default: DART_ZMQ_SECRET)
+            test_mode: Allow a random key when none is configured
+            message_ttl: Maximum accepted message age in seconds
+            sender_id: Identity stamped into message IDs (default: pid + random nonce)
+            replay_window: Per-sender anti-replay window in messages (0 disables)
+        """
         env_secret = os.getenv("DART_ZMQ_SECRET")
         env_mode = os.getenv("DART_ENVIRONMENT", "development")
         self._test_mode = test_mode or env_mode in ("test", "testing")
@@ -55,9 +73,11 @@ class SecureSerializer:
             raise SecurityError("DART_ZMQ_SECRET must be set in non-test environments for secure ZMQ communication.")
         else:
             # In test mode, generate a random secret instead of using hardcoded value
-            import secrets
             self.secret_key = secrets.token_urlsafe(32)
-        self._message_counter = 0
+        self._message_counter = itertools.count(1)
+        # Random nonce keeps instances in the same process distinct
+        self._sender_id = sender_id or f"{os.getpid()}-{secrets.token_hex(4)}"
+        self._replay_guard = ReplayGuard(replay_window) if replay_window > 0 else None
 
         # TTL configuration (seconds)
         if message_ttl is not None:
@@ -71,8 +91,15 @@ class SecureSerializer:
     
     def _generate_message_id(self) -> str:
         """Generate unique message ID."""
-        self._message_counter += 1
-        return f"msg_{self._message_counter}_{os.getpid()}"
+        return f"msg_{next(self._message_counter)}_{self._sender_id}"
+    
+    @staticmethod
+    def _parse_message_id(message_id: str) -> Optional[tuple]:
+        """Split a message ID into (sender, counter), or None if malformed."""
+        parts = str(message_id).split("_", 2)
+        if len(parts) != 3 or parts[0] != "msg" or not parts[1].isdigit():
+            return None
+        return parts[2], int(parts[1])
     
     def _sign_data(self, data: str, timestamp: float, message_id: str) -> str:
         """Create HMAC signature for data integrity."""
@@ -139,8 +166,8 @@ class SecureSerializer:
             Deserialized object
             
         Raises:
-            ValueError: If signature verification fails
-            ValueError: If message is too old
+            CommunicationError: If signature verification fails
+            CommunicationError: If message is too old or a replay
         """
         import time
         
@@ -152,18 +179,34 @@ class SecureSerializer:
             from dart_planner.common.errors import CommunicationError
             raise CommunicationError(f"Invalid message format: {e}")
         
+        # Cheap checks first so junk is rejected before the HMAC
         # Check message age against configured TTL
         current_time = time.time()
         if current_time - secure_msg.timestamp > self._msg_ttl:
             from dart_planner.common.errors import CommunicationError
             raise CommunicationError("Message too old")
         
+        replay_key = None
+        if self._replay_guard is not None:
+            replay_key = self._parse_message_id(secure_msg.message_id)
+            if replay_key is None:
+                from dart_planner.common.errors import CommunicationError
+                raise CommunicationError("Malformed message id")
+            if not self._replay_guard.check(*replay_key):
+                from dart_planner.common.errors import CommunicationError
+                raise CommunicationError("Replayed message rejected")
+        
         # Verify signature
         data_json = json.dumps(secure_msg.data, default=self._json_serializer)
         if not self._verify_signature(data_json, secure_msg.timestamp, secure_msg.message_id, secure_msg.signature):
             from dart_planner.common.errors import CommunicationError
             raise CommunicationError("Message signature verification failed")
         
+        # Only authenticated messages advance the replay window
+        if replay_key is not None and not self._replay_guard.commit(*replay_key):
+            from dart_planner.common.errors import CommunicationError
+            raise CommunicationError("Replayed message rejected")
+        
         # Convert back numpy arrays if needed
         result = self._restore_numpy_arrays(secure_msg.data)
         return result
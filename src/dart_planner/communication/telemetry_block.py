@@ -0,0 +1,271 @@
+"""
+Columnar Telemetry Blocks for DART-Planner
+
+Bulk transfer format for historical telemetry (dashboard scrubbing/replay):
+- N samples stored as contiguous per-field column arrays plus a time index
+- Each column quantized with the telemetry codec field specs, delta encoded
+  along time and zlib compressed independently
+- Range queries by timestamp on a server-side bounded history
+- One-call decoding to NumPy arrays
+
+Block layout (little endian)::
+
+    4s   magic b'DTB1'
+    u32  sample count
+    f64  first timestamp, f64 last timestamp
+    u8   column count
+    per column:
+        u8 name length, name
+        u8 flags (bit 0 = has presence mask), u8 width,
+        f64 resolution, u32 payload length, zlib(payload)
+
+    payload = [packbits(presence)] + int64 deltas of quantized values
+"""
+
+import struct
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from dart_planner.common.errors import CommunicationError
+
+from .telemetry_codec import DEFAULT_FIELD_SPECS, STATUS_CODES, STATUS_NAMES, FieldSpec
+
+BLOCK_MAGIC = b'DTB1'
+_HEADER = struct.Struct('<4sIddB')
+_COLUMN_HEADER = struct.Struct('<BBdI')
+_FLAG_PRESENCE = 0x01
+
+
+def _sample_to_row(spec: FieldSpec, value: Any, out: np.ndarray) -> None:
+    """Write one telemetry field value into a column row (float64)."""
+    if spec.name == 'system_status':
+        out[0] = STATUS_CODES.get(str(value).lower(), 0) if isinstance(value, str) else float(value)
+    elif not spec.keys:
+        out[0] = float(value)
+    elif isinstance(value, dict):
+        out[:] = [value.get(key, 0.0) for key in spec.keys]
+    else:
+        values = np.asarray(value, dtype=np.float64).ravel()[:spec.width]
+        out[:len(values)] = values
+
+
+class TelemetryBlock:
+    """
+    Columnar batch of telemetry samples
+
+    Attributes:
+        timestamps: (N,) float64 time index, non-decreasing
+        columns: field name -> (N, width) float64 array, NaN where absent
+    """
+
+    def __init__(self,
+                 timestamps: np.ndarray,
+                 columns: Dict[str, np.ndarray],
+                 field_specs: Sequence[FieldSpec] = DEFAULT_FIELD_SPECS):
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        self.columns = columns
+        self.field_specs = tuple(field_specs)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_samples(cls,
+                     samples: Sequence[Dict[str, Any]],
+                     field_specs: Sequence[FieldSpec] = DEFAULT_FIELD_SPECS) -> "TelemetryBlock":
+        """Build a block from telemetry dictionaries (TelemetryCompressor layout)"""
+        n = len(samples)
+        timestamps = np.array([s.get('timestamp', np.nan) for s in samples], dtype=np.float64)
+        columns: Dict[str, np.ndarray] = {}
+        for spec in field_specs:
+            if spec.name == 'timestamp' or not any(spec.name in s for s in samples):
+                continue
+            column = np.full((n, spec.width), np.nan)
+            for i, sample in enumerate(samples):
+                if spec.name in sample:
+                    _sample_to_row(spec, sample[spec.name], column[i])
+            columns[spec.name] = column
+        return cls(timestamps, columns, field_specs)
+
+    def to_numpy(self) -> Dict[str, np.ndarray]:
+        """Column arrays keyed by field name, including 'timestamp'"""
+        arrays = {'timestamp': self.timestamps}
+        arrays.update(self.columns)
+        return arrays
+
+    def to_samples(self) -> List[Dict[str, Any]]:
+        """Expand back to per-sample dictionaries (NaN fields omitted)"""
+        specs = {spec.name: spec for spec in self.field_specs}
+        samples: List[Dict[str, Any]] = []
+        for i, timestamp in enumerate(self.timestamps):
+            sample: Dict[str, Any] = {'timestamp': float(timestamp)}
+            for name, column in self.columns.items():
+                row = column[i]
+                if np.isnan(row[0]):
+                    continue
+                spec = specs[name]
+                if name == 'system_status':
+                    sample[name] = STATUS_NAMES.get(int(row[0]), 'unknown')
+                elif not spec.keys:
+                    sample[name] = float(row[0])
+                else:
+                    sample[name] = dict(zip(spec.keys, row.tolist()))
+            samples.append(sample)
+        return samples
+
+    def slice_time(self, start: float, end: float) -> "TelemetryBlock":
+        """Samples with start <= timestamp <= end"""
+        lo = int(np.searchsorted(self.timestamps, start, side='left'))
+        hi = int(np.searchsorted(self.timestamps, end, side='right'))
+        return TelemetryBlock(
+            self.timestamps[lo:hi],
+            {name: column[lo:hi] for name, column in self.columns.items()},
+            self.field_specs,
+        )
+
+    def encode(self, compression_level: int = 6) -> bytes:
+        """Serialize to the compressed columnar wire format"""
+        n = len(self)
+        specs = {spec.name: spec for spec in self.field_specs}
+        t_first = float(self.timestamps[0]) if n else 0.0
+        t_last = float(self.timestamps[-1]) if n else 0.0
+
+        column_items: List[Tuple[str, np.ndarray, float]] = [
+            ('timestamp', self.timestamps.reshape(n, 1), specs['timestamp'].resolution)
+        ]
+        column_items += [
+            (name, column, specs[name].resolution) for name, column in self.columns.items()
+        ]
+
+        parts = [_HEADER.pack(BLOCK_MAGIC, n, t_first, t_last, len(column_items))]
+        for name, column, resolution in column_items:
+            present = ~np.isnan(column[:, 0])
+            has_mask = not bool(present.all())
+            quantized = np.rint(np.where(np.isnan(column), 0.0, column) / resolution).astype(np.int64)
+            # Delta along time so slowly varying columns compress to near nothing
+            deltas = np.diff(quantized, axis=0, prepend=np.zeros((1, column.shape[1]), np.int64))
+            payload = np.packbits(present).tobytes() if has_mask else b''
+            payload += np.ascontiguousarray(deltas.T).tobytes()
+            compressed = zlib.compress(payload, compression_level)
+
+            name_bytes = name.encode('utf-8')
+            parts.append(struct.pack('<B', len(name_bytes)) + name_bytes)
+            parts.append(_COLUMN_HEADER.pack(
+                _FLAG_PRESENCE if has_mask else 0, column.shape[1], resolution, len(compressed)
+            ))
+            parts.append(compressed)
+        return b''.join(parts)
+
+    @classmethod
+    def decode(cls,
+               data: bytes,
+               field_specs: Sequence[FieldSpec] = DEFAULT_FIELD_SPECS) -> "TelemetryBlock":
+        """Parse a block produced by encode()"""
+        if len(data) < _HEADER.size:
+            raise CommunicationError("Truncated telemetry block")
+        magic, n, _, _, column_count = _HEADER.unpack_from(data, 0)
+        if magic != BLOCK_MAGIC:
+            raise CommunicationError("Not a telemetry block")
+        offset = _HEADER.size
+
+        timestamps = np.zeros(0)
+        columns: Dict[str, np.ndarray] = {}
+        try:
+            for _ in range(column_count):
+                name_len = data[offset]
+                name = data[offset + 1:offset + 1 + name_len].decode('utf-8')
+                offset += 1 + name_len
+                flags, width, resolution, length = _COLUMN_HEADER.unpack_from(data, offset)
+                offset += _COLUMN_HEADER.size
+                payload = zlib.decompress(data[offset:offset + length])
+                offset += length
+
+                mask_bytes = (n + 7) // 8 if flags & _FLAG_PRESENCE else 0
+                deltas = np.frombuffer(payload, dtype=np.int64, offset=mask_bytes).reshape(width, n).T
+                column = np.cumsum(deltas, axis=0) * resolution
+                if mask_bytes:
+                    present = np.unpackbits(np.frombuffer(payload[:mask_bytes], np.uint8))[:n].astype(bool)
+                    column[~present] = np.nan
+
+                if name == 'timestamp':
+                    timestamps = column[:, 0]
+                else:
+                    columns[name] = column
+        except (IndexError, ValueError, struct.error, zlib.error) as e:
+            raise CommunicationError(f"Malformed telemetry block: {e}")
+
+        return cls(timestamps, columns, field_specs)
+
+
+def decode_telemetry_block(data: bytes) -> Dict[str, np.ndarray]:
+    """Decode a telemetry block straight to NumPy column arrays"""
+    return TelemetryBlock.decode(data).to_numpy()
+
+
+class TelemetryHistory:
+    """
+    Bounded server-side telemetry history with time range queries
+
+    Samples are written into preallocated column ring buffers, so appending
+    at telemetry rate does not allocate per sample. Timestamps must be
+    appended in non-decreasing order.
+    """
+
+    def __init__(self,
+                 capacity: int = 30000,
+                 field_specs: Sequence[FieldSpec] = DEFAULT_FIELD_SPECS):
+        self.capacity = max(1, capacity)
+        self.field_specs = tuple(spec for spec in field_specs if spec.name != 'timestamp')
+        self._all_specs = tuple(field_specs)
+        self._timestamps = np.full(self.capacity, np.nan)
+        self._columns = {
+            spec.name: np.full((self.capacity, spec.width), np.nan) for spec in self.field_specs
+        }
+        self._used = {spec.name: False for spec in self.field_specs}
+        self._head = 0  # next write position
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, sample: Dict[str, Any]) -> None:
+        """Record one telemetry sample"""
+        i = self._head
+        self._timestamps[i] = float(sample['timestamp'])
+        for spec in self.field_specs:
+            row = self._columns[spec.name][i]
+            if spec.name in sample:
+                _sample_to_row(spec, sample[spec.name], row)
+                self._used[spec.name] = True
+            else:
+                row[:] = np.nan
+        self._head = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def time_range(self) -> Optional[Tuple[float, float]]:
+        """Oldest and newest stored timestamps"""
+        if not self._count:
+            return None
+        oldest = (self._head - self._count) % self.capacity
+        newest = (self._head - 1) % self.capacity
+        return float(self._timestamps[oldest]), float(self._timestamps[newest])
+
+    def query(self, start: float, end: float) -> TelemetryBlock:
+        """Samples with start <= timestamp <= end as a TelemetryBlock"""
+        oldest = (self._head - self._count) % self.capacity
+        # The ring holds at most two sorted runs: [oldest:] and [:head]
+        first_run = self._timestamps[oldest:oldest + self._count]
+        second_run = self._timestamps[:self._count - len(first_run)]
+        indices = []
+        for run, base in ((first_run, oldest), (second_run, 0)):
+            lo = int(np.searchsorted(run, start, side='left'))
+            hi = int(np.searchsorted(run, end, side='right'))
+            indices.append(np.arange(base + lo, base + hi))
+        index = np.concatenate(indices)
+
+        columns = {
+            name: self._columns[name][index] for name, used in self._used.items() if used
+        }
+        return TelemetryBlock(self._timestamps[index], columns, self._all_specs)
@@ -0,0 +1,249 @@
+"""
+Encode-once WebSocket Telemetry Broadcast for DART-Planner
+
+Fan-out of telemetry to many dashboard clients without coupling the
+telemetry loop to the slowest client:
+- Each tick is encoded once per negotiated format, not once per client
+- Every client has its own sender task and a bounded outbound queue
+- Under backpressure the oldest queued frames are dropped (stale telemetry
+  is worthless), so memory per client stays constant
+- Delta-coded streams resynchronize after a drop: the client's remaining
+  deltas of that stream are discarded and its next frame is a keyframe;
+  DELTA and DELTA_BATCH clients follow separate sequences and resync alone
+- Per-client send-lag and drop metrics
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple, Union
+
+from dart_planner.common.logging_config import get_logger
+
+from .telemetry_compression import CompressionType, WebSocketTelemetryManager
+
+Payload = Union[str, bytes]
+
+DELTA_FORMATS = (CompressionType.DELTA, CompressionType.DELTA_BATCH)
+
+
+@dataclass
+class ClientSendStats:
+    """Outbound statistics of one broadcast client"""
+    frames_queued: int = 0
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    send_errors: int = 0
+    last_send_lag_ms: float = 0.0
+    avg_send_lag_ms: float = 0.0
+    max_send_lag_ms: float = 0.0
+
+
+class _BroadcastClient:
+    """Per-client outbound queue drained by a dedicated sender task"""
+
+    def __init__(self, client_id: str, websocket: Any, compression: CompressionType, queue_size: int):
+        self.client_id = client_id
+        self.websocket = websocket
+        self.compression = compression
+        self.queue_size = queue_size
+        self.queue: Deque[Tuple[float, Payload, Optional[str]]] = deque()
+        self.ready = asyncio.Event()
+        self.stats = ClientSendStats()
+        self.task: Optional["asyncio.Task[None]"] = None
+        # Delta streams whose chain is intact up to the newest queued frame
+        self.synced_streams: Set[str] = set()
+
+    def needs_keyframe(self, stream: str) -> bool:
+        return self.compression in DELTA_FORMATS and stream not in self.synced_streams
+
+    def enqueue(self,
+                enqueued_at: float,
+                payload: Payload,
+                stream: Optional[str] = None,
+                keyframe: bool = False) -> None:
+        """Queue a frame; ``stream`` names the delta chain of delta-coded payloads"""
+        if len(self.queue) >= self.queue_size:
+            _, _, dropped_stream = self.queue.popleft()
+            self.stats.frames_dropped += 1
+            if dropped_stream is not None:
+                # Later deltas of that stream chain off the dropped frame
+                self.synced_streams.discard(dropped_stream)
+                kept = [entry for entry in self.queue if entry[2] != dropped_stream]
+                self.stats.frames_dropped += len(self.queue) - len(kept)
+                self.queue = deque(kept)
+
+        if stream is not None:
+            if keyframe:
+                self.synced_streams.add(stream)
+            elif stream not in self.synced_streams:
+                self.stats.frames_dropped += 1  # undecodable until the next keyframe
+                return
+        self.queue.append((enqueued_at, payload, stream))
+        self.stats.frames_queued += 1
+        self.ready.set()
+
+
+class TelemetryBroadcaster:
+    """
+    Concurrent, backpressure-aware telemetry fan-out to WebSocket clients
+
+    ``websocket`` objects only need ``send_text``/``send_bytes`` coroutines
+    (FastAPI/Starlette WebSocket compatible).
+    """
+
+    def __init__(self,
+                 telemetry_manager: Optional[WebSocketTelemetryManager] = None,
+                 queue_size: int = 4,
+                 send_timeout: Optional[float] = 5.0,
+                 lag_smoothing: float = 0.1,
+                 on_client_removed: Optional[Callable[[str], None]] = None):
+        """
+        Initialize broadcaster
+
+        Args:
+            telemetry_manager: Manager used to encode telemetry per format
+            queue_size: Outbound frames buffered per client before dropping
+            send_timeout: Disconnect clients whose single send exceeds this (s)
+            lag_smoothing: EWMA factor for the average send lag metric
+            on_client_removed: Called with the client id when a failing client
+                is dropped by the broadcaster (not on remove_client)
+        """
+        self.telemetry_manager = telemetry_manager or WebSocketTelemetryManager()
+        self.queue_size = max(1, queue_size)
+        self.send_timeout = send_timeout
+        self.lag_smoothing = lag_smoothing
+        self.on_client_removed = on_client_removed
+        self._clients: Dict[str, _BroadcastClient] = {}
+        self.logger = get_logger(__name__)
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def add_client(self,
+                   client_id: str,
+                   websocket: Any,
+                   compression: CompressionType = CompressionType.NONE) -> None:
+        """Register a client and start its sender task (call from the event loop)"""
+        client = _BroadcastClient(client_id, websocket, compression, self.queue_size)
+        client.task = asyncio.get_running_loop().create_task(self._sender(client))
+        self._clients[client_id] = client
+        self.telemetry_manager.set_client_preference(client_id, compression)
+        # DELTA clients start unsynchronized; broadcast() forces a keyframe
+
+    async def remove_client(self, client_id: str) -> None:
+        """Unregister a client and stop its sender task"""
+        client = self._clients.pop(client_id, None)
+        self.telemetry_manager.client_preferences.pop(client_id, None)
+        if client is None or client.task is None:
+            return
+        client.task.cancel()
+        try:
+            await client.task
+        except asyncio.CancelledError:
+            pass
+
+    def broadcast(self, telemetry_data: Dict[str, Any], packet_type: str = "telemetry") -> int:
+        """
+        Encode a telemetry sample once per client format and queue it
+
+        Never awaits client I/O, so it is safe to call from the telemetry loop.
+
+        Returns:
+            Number of clients the sample was queued for
+        """
+        formats = {client.compression for client in self._clients.values()}
+        if not formats:
+            return 0
+        compressor = self.telemetry_manager.compressor
+        for compression in formats.intersection(DELTA_FORMATS):
+            if any(client.compression == compression and client.needs_keyframe(packet_type)
+                   for client in self._clients.values()):
+                # Late joiners and clients that dropped frames resynchronize here;
+                # the keyframe is shared with the other clients of that format only
+                compressor.request_keyframe(packet_type, compression)
+        payloads = self.telemetry_manager.prepare_broadcast_telemetry(
+            telemetry_data, formats, packet_type
+        )
+        keyframes = {
+            compression: compressor.last_frame_was_keyframe(packet_type, compression)
+            for compression in formats.intersection(DELTA_FORMATS)
+        }
+        now = time.perf_counter()
+        for client in self._clients.values():
+            if client.compression in keyframes:
+                client.enqueue(now, payloads[client.compression], packet_type,
+                               keyframes[client.compression])
+            else:
+                client.enqueue(now, payloads[client.compression])
+        return len(self._clients)
+
+    def broadcast_raw(self, payload: Union[Payload, Dict[str, Any]]) -> int:
+        """Queue an already encoded payload (dicts are JSON encoded once) for every client"""
+        if isinstance(payload, dict):
+            payload = json.dumps(payload)
+        now = time.perf_counter()
+        for client in self._clients.values():
+            client.enqueue(now, payload)
+        return len(self._clients)
+
+    def get_client_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-client send lag, throughput and drop counters"""
+        return {
+            client_id: {
+                "compression": client.compression.value,
+                "queue_depth": len(client.queue),
+                "frames_queued": client.stats.frames_queued,
+                "frames_sent": client.stats.frames_sent,
+                "frames_dropped": client.stats.frames_dropped,
+                "send_errors": client.stats.send_errors,
+                "last_send_lag_ms": client.stats.last_send_lag_ms,
+                "avg_send_lag_ms": client.stats.avg_send_lag_ms,
+                "max_send_lag_ms": client.stats.max_send_lag_ms,
+            }
+            for client_id, client in self._clients.items()
+        }
+
+    async def close(self) -> None:
+        """Stop all sender tasks"""
+        for client_id in list(self._clients):
+            await self.remove_client(client_id)
+
+    async def _sender(self, client: _BroadcastClient) -> None:
+        stats = client.stats
+        while True:
+            await client.ready.wait()
+            client.ready.clear()
+            while client.queue:
+                enqueued_at, payload, _ = client.queue.popleft()
+                try:
+                    if isinstance(payload, bytes):
+                        send = client.websocket.send_bytes(payload)
+                    else:
+                        send = client.websocket.send_text(payload)
+                    if self.send_timeout is not None:
+                        await asyncio.wait_for(send, self.send_timeout)
+                    else:
+                        await send
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    stats.send_errors += 1
+                    self.logger.warning(f"Dropping broadcast client {client.client_id}: {e}")
+                    self._clients.pop(client.client_id, None)
+                    self.telemetry_manager.client_preferences.pop(client.client_id, None)
+                    if self.on_client_removed is not None:
+                        self.on_client_removed(client.client_id)
+                    return
+
+                lag_ms = (time.perf_counter() - enqueued_at) * 1000.0
+                stats.frames_sent += 1
+                stats.last_send_lag_ms = lag_ms
+                stats.max_send_lag_ms = max(stats.max_send_lag_ms, lag_ms)
+                if stats.frames_sent == 1:
+                    stats.avg_send_lag_ms = lag_ms
+                else:
+                    stats.avg_send_lag_ms += self.lag_smoothing * (lag_ms - stats.avg_send_lag_ms)
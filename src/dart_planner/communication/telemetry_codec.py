@@ -0,0 +1,431 @@
+"""
+Streaming Delta Telemetry Codec for DART-Planner
+
+Bandwidth-oriented encoding of high-rate telemetry streams:
+- Self-describing frames with a field presence bitmap
+- Per-field fixed-point quantization at configurable resolution
+- Delta encoding against the previous sample of the same stream; delta
+  frames only carry the fields that changed
+- Periodic keyframes so receivers can (re)join a stream
+- Optional batch packing of many frames into one zlib/zstd frame
+  sharing a preset dictionary
+
+Frame layout (little endian)::
+
+    u8      header   (version << 4 | flags, bit 0 = keyframe)
+    varint  sequence (mod 2**16)
+    u16     field bitmap (bit i = FIELD_SPECS[i]; keyframes: field present,
+            delta frames: field changed since the previous frame)
+    varint* zigzag encoded quantized values (absolute or delta)
+
+Delta frames always describe the same set of fields as the keyframe they
+follow; the encoder emits a keyframe whenever that set changes.
+"""
+
+import math
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from dart_planner.common.errors import CommunicationError
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+CODEC_VERSION = 1
+_FLAG_KEYFRAME = 0x01
+_SEQUENCE_MODULUS = 1 << 16
+
+# Batch frame algorithm identifiers
+_BATCH_ZLIB = 0x01
+_BATCH_ZSTD = 0x02
+_DECOMPRESS_ERRORS: Tuple[type, ...] = (zlib.error, ValueError) + (
+    (zstandard.ZstdError,) if ZSTD_AVAILABLE else ()
+)
+
+STATUS_CODES: Dict[str, int] = {
+    'idle': 0,
+    'arming': 1,
+    'armed': 2,
+    'takeoff': 3,
+    'mission': 4,
+    'landing': 5,
+    'emergency': 6,
+    'error': 7,
+}
+STATUS_NAMES: Dict[int, str] = {code: name for name, code in STATUS_CODES.items()}
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Quantization spec for one telemetry field.
+
+    Attributes:
+        name: Key of the field in the telemetry dictionary
+        keys: Component keys of dict-valued fields, empty for scalars
+        resolution: Quantization step (value units per integer count)
+    """
+    name: str
+    keys: Tuple[str, ...]
+    resolution: float
+
+    @property
+    def width(self) -> int:
+        return max(1, len(self.keys))
+
+
+# Field order defines bit positions in the presence bitmap; append only.
+DEFAULT_FIELD_SPECS: Tuple[FieldSpec, ...] = (
+    FieldSpec('timestamp', (), 1e-4),
+    FieldSpec('position', ('x', 'y', 'z'), 1e-3),
+    FieldSpec('velocity', ('x', 'y', 'z'), 1e-3),
+    FieldSpec('attitude', ('roll', 'pitch', 'yaw'), 1e-4),
+    FieldSpec('battery_voltage', (), 1e-2),
+    FieldSpec('battery_remaining', (), 1e-1),
+    FieldSpec('gps', ('latitude', 'longitude', 'altitude'), 1e-7),
+    FieldSpec('system_status', (), 1.0),
+    FieldSpec('performance', ('avg_planning_time_ms', 'autonomous_operation_time_s'), 1e-3),
+)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) if value >= 0 else ((-value << 1) - 1)
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise CommunicationError("Truncated telemetry frame")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+def is_keyframe(frame: bytes) -> bool:
+    """True if an encoded frame is a keyframe (decodable without prior frames)."""
+    return bool(frame) and bool(frame[0] & _FLAG_KEYFRAME)
+
+
+def _quantize(spec: FieldSpec, value: Any) -> int:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise CommunicationError(f"Non-numeric value for telemetry field '{spec.name}': {value!r}")
+    if not math.isfinite(number):
+        raise CommunicationError(f"Non-finite value for telemetry field '{spec.name}': {number}")
+    return int(round(number / spec.resolution))
+
+
+def _quantize_field(spec: FieldSpec, value: Any) -> Tuple[int, ...]:
+    """
+    Convert a telemetry field value to quantized integer components.
+
+    Raises:
+        CommunicationError: If a component is non-numeric, NaN or infinite
+    """
+    if spec.name == 'system_status':
+        code = STATUS_CODES.get(str(value).lower(), 0) if isinstance(value, str) else _quantize(spec, value)
+        return (code,)
+
+    if not spec.keys:
+        return (_quantize(spec, value),)
+
+    if isinstance(value, dict):
+        components = [value.get(key, 0.0) for key in spec.keys]
+    elif isinstance(value, (list, tuple, np.ndarray)):
+        components = list(value[:len(spec.keys)])
+        components += [0.0] * (len(spec.keys) - len(components))
+    else:
+        raise CommunicationError(f"Unsupported value for telemetry field '{spec.name}': {type(value)}")
+
+    return tuple(_quantize(spec, c) for c in components)
+
+
+def _dequantize_field(spec: FieldSpec, counts: Sequence[int]) -> Any:
+    """Convert quantized integer components back to a telemetry field value."""
+    if spec.name == 'system_status':
+        return STATUS_NAMES.get(counts[0], 'unknown')
+    if not spec.keys:
+        return counts[0] * spec.resolution
+    return {key: count * spec.resolution for key, count in zip(spec.keys, counts)}
+
+
+class TelemetryStreamEncoder:
+    """
+    Stateful encoder for a single telemetry stream.
+
+    Each encoded frame carries the fields present in the sample, quantized
+    to their spec resolution. Non-keyframes store the difference to the last
+    transmitted value of each changed field; unchanged fields cost nothing
+    and slowly varying ones one byte per component.
+    """
+
+    def __init__(self,
+                 field_specs: Sequence[FieldSpec] = DEFAULT_FIELD_SPECS,
+                 keyframe_interval: int = 50):
+        """
+        Initialize stream encoder
+
+        Args:
+            field_specs: Field quantization specs (at most 16)
+            keyframe_interval: Emit a keyframe every N frames (1 = always)
+        """
+        if len(field_specs) > 16:
+            raise CommunicationError("Telemetry codec supports at most 16 fields")
+        self.field_specs = tuple(field_specs)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._sequence = 0
+        self._frames_since_keyframe = 0
+        self._reference: Dict[int, Tuple[int, ...]] = {}
+        self._force_keyframe = True
+        # Whether the last encode (first frame of the last encode_batch) was a keyframe
+        self.last_frame_was_keyframe = False
+
+    def request_keyframe(self) -> None:
+        """Force the next frame to be a keyframe (e.g. after a receiver joins)."""
+        self._force_keyframe = True
+
+    def encode(self, sample: Dict[str, Any]) -> bytes:
+        """
+        Encode one telemetry sample into a frame
+
+        Args:
+            sample: Telemetry dictionary (same layout as TelemetryCompressor input)
+
+        Returns:
+            Encoded frame bytes
+        """
+        quantized: Dict[int, Tuple[int, ...]] = {}
+        for index, spec in enumerate(self.field_specs):
+            if spec.name in sample:
+                value = sample[spec.name]
+            elif spec.name == 'timestamp':
+                value = time.time()
+            else:
+                continue
+            quantized[index] = _quantize_field(spec, value)
+
+        keyframe = (self._force_keyframe
+                    or self._frames_since_keyframe >= self.keyframe_interval
+                    or quantized.keys() != self._reference.keys())
+        if keyframe:
+            self._reference.clear()
+            self._frames_since_keyframe = 0
+            self._force_keyframe = False
+
+        presence = 0
+        payload = bytearray()
+        for index, counts in quantized.items():
+            previous = self._reference.get(index)
+            if previous == counts:
+                continue
+            for i, count in enumerate(counts):
+                delta = count - previous[i] if previous is not None else count
+                _write_varint(payload, _zigzag(delta))
+            presence |= 1 << index
+        self._reference = quantized
+
+        frame = bytearray()
+        frame.append((CODEC_VERSION << 4) | (_FLAG_KEYFRAME if keyframe else 0))
+        _write_varint(frame, self._sequence)
+        frame += struct.pack('<H', presence)
+        frame += payload
+
+        self._sequence = (self._sequence + 1) % _SEQUENCE_MODULUS
+        self._frames_since_keyframe += 1
+        self.last_frame_was_keyframe = keyframe
+        return bytes(frame)
+
+    def encode_batch(self, samples: Sequence[Dict[str, Any]]) -> List[bytes]:
+        """Encode consecutive samples of this stream into frames."""
+        frames = [self.encode(sample) for sample in samples]
+        self.last_frame_was_keyframe = bool(frames) and is_keyframe(frames[0])
+        return frames
+
+
+class TelemetryStreamDecoder:
+    """
+    Stateful decoder mirroring TelemetryStreamEncoder.
+
+    Delta frames are only accepted in sequence after a keyframe; after a
+    gap the decoder rejects frames until the next keyframe arrives.
+    """
+
+    def __init__(self, field_specs: Sequence[FieldSpec] = DEFAULT_FIELD_SPECS):
+        self.field_specs = tuple(field_specs)
+        self._reference: Dict[int, Tuple[int, ...]] = {}
+        self._expected_sequence: Optional[int] = None
+        self.frames_dropped = 0
+
+    @property
+    def synchronized(self) -> bool:
+        """True once a keyframe has been received and no gap has been seen."""
+        return self._expected_sequence is not None
+
+    def decode(self, frame: bytes) -> Dict[str, Any]:
+        """
+        Decode one frame back to a telemetry dictionary
+
+        Raises:
+            CommunicationError: On malformed frames or delta frames received
+                out of sequence (the stream then waits for a keyframe)
+        """
+        if len(frame) < 4:
+            raise CommunicationError("Truncated telemetry frame")
+        header = frame[0]
+        if header >> 4 != CODEC_VERSION:
+            raise CommunicationError(f"Unsupported telemetry codec version: {header >> 4}")
+        keyframe = bool(header & _FLAG_KEYFRAME)
+
+        sequence, offset = _read_varint(frame, 1)
+        if keyframe:
+            self._reference.clear()
+        elif sequence != self._expected_sequence:
+            self._expected_sequence = None
+            self.frames_dropped += 1
+            raise CommunicationError(
+                f"Telemetry delta frame {sequence} out of sequence; waiting for keyframe"
+            )
+
+        if offset + 2 > len(frame):
+            raise CommunicationError("Truncated telemetry frame")
+        presence = struct.unpack_from('<H', frame, offset)[0]
+        offset += 2
+
+        data: Dict[str, Any] = {}
+        for index, spec in enumerate(self.field_specs):
+            previous = self._reference.get(index)
+            if not presence & (1 << index):
+                if previous is not None:
+                    data[spec.name] = _dequantize_field(spec, previous)  # unchanged
+                continue
+            counts = []
+            for i in range(spec.width):
+                raw, offset = _read_varint(frame, offset)
+                delta = _unzigzag(raw)
+                counts.append(delta + previous[i] if previous is not None else delta)
+            counts_tuple = tuple(counts)
+            self._reference[index] = counts_tuple
+            data[spec.name] = _dequantize_field(spec, counts_tuple)
+
+        self._expected_sequence = (sequence + 1) % _SEQUENCE_MODULUS
+        return data
+
+    def decode_batch(self, frames: Sequence[bytes]) -> List[Dict[str, Any]]:
+        """Decode consecutive frames of this stream."""
+        return [self.decode(frame) for frame in frames]
+
+
+class TelemetryBatchPacker:
+    """
+    Packs many codec frames into one compressed frame.
+
+    Frames are length-prefixed and compressed together, so the compressor
+    sees the redundancy between consecutive samples. A shared preset
+    dictionary (built from representative frames) primes the compressor
+    so even small batches compress well. zstd is used when the optional
+    ``zstandard`` package is installed and requested, zlib otherwise.
+    """
+
+    def __init__(self,
+                 dictionary: Optional[bytes] = None,
+                 compression_level: int = 6,
+                 use_zstd: bool = False):
+        self.dictionary = dictionary
+        self.compression_level = compression_level
+        self.use_zstd = use_zstd and ZSTD_AVAILABLE
+        self._zstd_dict = (
+            zstandard.ZstdCompressionDict(dictionary)
+            if self.use_zstd and dictionary else None
+        )
+
+    @staticmethod
+    def build_dictionary(frames: Sequence[bytes], max_size: int = 4096) -> bytes:
+        """
+        Build a preset dictionary from representative frames
+
+        Both sides of the link must use the same dictionary bytes.
+        """
+        blob = bytearray()
+        for frame in frames:
+            _write_varint(blob, len(frame))
+            blob += frame
+        # zlib weights the end of the dictionary most, keep the newest frames
+        return bytes(blob[-max_size:])
+
+    def pack(self, frames: Sequence[bytes]) -> bytes:
+        """Length-prefix and compress frames into a single batch frame."""
+        raw = bytearray()
+        _write_varint(raw, len(frames))
+        for frame in frames:
+            _write_varint(raw, len(frame))
+            raw += frame
+
+        if self.use_zstd:
+            compressor = zstandard.ZstdCompressor(
+                level=self.compression_level, dict_data=self._zstd_dict
+            )
+            return bytes([_BATCH_ZSTD]) + compressor.compress(bytes(raw))
+
+        if self.dictionary:
+            compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15,
+                                          zdict=self.dictionary)
+        else:
+            compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15)
+        return bytes([_BATCH_ZLIB]) + compressor.compress(bytes(raw)) + compressor.flush()
+
+    def unpack(self, batch: bytes) -> List[bytes]:
+        """Decompress a batch frame back to individual codec frames."""
+        if not batch:
+            raise CommunicationError("Empty telemetry batch")
+
+        algorithm = batch[0]
+        try:
+            if algorithm == _BATCH_ZSTD:
+                if not ZSTD_AVAILABLE:
+                    raise CommunicationError("zstd telemetry batch received but zstandard is not installed")
+                decompressor = zstandard.ZstdDecompressor(dict_data=self._zstd_dict)
+                raw = decompressor.decompress(batch[1:])
+            elif algorithm == _BATCH_ZLIB:
+                if self.dictionary:
+                    decompressor = zlib.decompressobj(-15, zdict=self.dictionary)
+                else:
+                    decompressor = zlib.decompressobj(-15)
+                raw = decompressor.decompress(batch[1:]) + decompressor.flush()
+            else:
+                raise CommunicationError(f"Unknown telemetry batch algorithm: {algorithm}")
+        except _DECOMPRESS_ERRORS as e:
+            raise CommunicationError(f"Failed to decompress telemetry batch: {e}")
+
+        count, offset = _read_varint(raw, 0)
+        frames = []
+        for _ in range(count):
+            length, offset = _read_varint(raw, offset)
+            frames.append(bytes(raw[offset:offset + length]))
+            offset += length
+        return frames
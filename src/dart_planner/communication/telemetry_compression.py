@@ -6,6 +6,8 @@ Provides efficient compression and serialization of telemetry data for:
 - HTTP gzip compression
 - Bandwidth optimization
 - Real-time performance
+- Per-stream delta/quantized encoding (see telemetry_codec)
+- Columnar history blocks for bulk replay (see telemetry_block)
 """
 
 import gzip
@@ -14,9 +16,18 @@ import struct
 import time
 from dataclasses import dataclass, asdict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Dict, List, Optional, Set, Union, Tuple
 import numpy as np
 
+from .telemetry_block import TelemetryBlock
+from .telemetry_codec import (
+    STATUS_CODES,
+    STATUS_NAMES,
+    TelemetryBatchPacker,
+    TelemetryStreamDecoder,
+    TelemetryStreamEncoder,
+)
+
 
 class CompressionType(Enum):
     """Supported compression types"""
@@ -24,6 +35,9 @@ class CompressionType(Enum):
     GZIP = "gzip"
     BINARY = "binary"
     BINARY_GZIP = "binary_gzip"
+    DELTA = "delta"
+    DELTA_BATCH = "delta_batch"
+    COLUMNAR = "columnar"
 
 
 @dataclass
@@ -55,19 +69,35 @@ class TelemetryCompressor:
     - Binary serialization for WebSocket efficiency
     - Configurable compression levels
     - Automatic format detection
+    - Delta/quantized streams with per-stream context (packet_type = stream)
     """
     
-    def __init__(self, compression_level: int = 6, enable_binary: bool = True):
+    def __init__(self,
+                 compression_level: int = 6,
+                 enable_binary: bool = True,
+                 keyframe_interval: int = 50,
+                 batch_dictionary: Optional[bytes] = None):
         """
         Initialize telemetry compressor
         
         Args:
             compression_level: Gzip compression level (1-9, higher = smaller but slower)
             enable_binary: Enable binary serialization for WebSocket
+            keyframe_interval: Keyframe period of DELTA streams in frames
+            batch_dictionary: Preset dictionary shared by DELTA_BATCH peers
         """
         self.compression_level = max(1, min(9, compression_level))
         self.enable_binary = enable_binary
         self.sequence_counter = 0
+        self.keyframe_interval = keyframe_interval
+        
+        # Delta codec context, one encoder/decoder per stream and delta format;
+        # DELTA and DELTA_BATCH receivers each follow their own frame sequence
+        self._stream_encoders: Dict[Tuple[str, CompressionType], TelemetryStreamEncoder] = {}
+        self._stream_decoders: Dict[Tuple[str, CompressionType], TelemetryStreamDecoder] = {}
+        self._batch_packer = TelemetryBatchPacker(
+            dictionary=batch_dictionary, compression_level=self.compression_level
+        )
         
         # Pre-allocated buffers for performance
         self._gzip_buffer = bytearray(4096)
@@ -144,6 +174,22 @@ class TelemetryCompressor:
                 sequence_id=self.sequence_counter
             )
         
+        elif compression_type == CompressionType.DELTA:
+            frame = self._get_stream_encoder(packet_type, CompressionType.DELTA).encode(telemetry_data)
+            return TelemetryPacket(
+                timestamp=timestamp,
+                packet_type=packet_type,
+                data=frame,
+                compression=compression_type,
+                sequence_id=self.sequence_counter
+            )
+        
+        elif compression_type == CompressionType.DELTA_BATCH:
+            return self.compress_telemetry_batch([telemetry_data], packet_type)
+        
+        elif compression_type == CompressionType.COLUMNAR:
+            return self.compress_telemetry_block([telemetry_data], packet_type)
+        
         else:
             from dart_planner.common.errors import CommunicationError
             raise CommunicationError(f"Unsupported compression type: {compression_type}")
@@ -157,6 +203,10 @@ class TelemetryCompressor:
             
         Returns:
             Decompressed telemetry data
+            
+        Raises:
+            CommunicationError: For DELTA_BATCH packets with more than one
+                sample (decode those with decompress_telemetry_batch)
         """
         if packet.compression == CompressionType.NONE:
             return packet.data if isinstance(packet.data, dict) else {}
@@ -171,10 +221,117 @@ class TelemetryCompressor:
             decompressed_binary = self._decompress_gzip_bytes(packet.data)
             return self._deserialize_binary(decompressed_binary)
         
+        elif packet.compression == CompressionType.DELTA:
+            return self._get_stream_decoder(packet.packet_type).decode(packet.data)
+        
+        elif packet.compression == CompressionType.DELTA_BATCH:
+            frames = self._batch_packer.unpack(packet.data)
+            if len(frames) != 1:
+                from dart_planner.common.errors import CommunicationError
+                raise CommunicationError(
+                    f"DELTA_BATCH packet holds {len(frames)} samples; use decompress_telemetry_batch"
+                )
+            return self._get_stream_decoder(packet.packet_type, CompressionType.DELTA_BATCH).decode(frames[0])
+        
+        elif packet.compression == CompressionType.COLUMNAR:
+            return self.decompress_telemetry_block(packet).to_numpy()
+        
         else:
             from dart_planner.common.errors import CommunicationError
             raise CommunicationError(f"Unsupported compression type: {packet.compression}")
     
+    def compress_telemetry_batch(self,
+                                 samples: List[Dict[str, Any]],
+                                 packet_type: str = "telemetry") -> TelemetryPacket:
+        """
+        Delta-encode consecutive samples of one stream into a single packet
+        
+        The frames are compressed together using the shared batch dictionary,
+        which amortizes headers and exploits inter-sample redundancy.
+        
+        Args:
+            samples: Consecutive telemetry samples of the stream
+            packet_type: Stream identifier
+            
+        Returns:
+            DELTA_BATCH telemetry packet
+        """
+        self.sequence_counter += 1
+        encoder = self._get_stream_encoder(packet_type, CompressionType.DELTA_BATCH)
+        frames = encoder.encode_batch(samples)
+        return TelemetryPacket(
+            timestamp=time.time(),
+            packet_type=packet_type,
+            data=self._batch_packer.pack(frames),
+            compression=CompressionType.DELTA_BATCH,
+            sequence_id=self.sequence_counter
+        )
+    
+    def decompress_telemetry_batch(self, packet: TelemetryPacket) -> List[Dict[str, Any]]:
+        """Decode every sample of a DELTA_BATCH packet in order"""
+        frames = self._batch_packer.unpack(packet.data)
+        return self._get_stream_decoder(packet.packet_type, CompressionType.DELTA_BATCH).decode_batch(frames)
+    
+    def compress_telemetry_block(self,
+                                 block: Union[TelemetryBlock, List[Dict[str, Any]]],
+                                 packet_type: str = "telemetry_block") -> TelemetryPacket:
+        """
+        Serialize many samples as one columnar, per-column compressed packet
+        
+        Args:
+            block: TelemetryBlock (e.g. a TelemetryHistory query) or raw samples
+            packet_type: Type of telemetry packet
+            
+        Returns:
+            COLUMNAR telemetry packet
+        """
+        if not isinstance(block, TelemetryBlock):
+            block = TelemetryBlock.from_samples(block)
+        self.sequence_counter += 1
+        return TelemetryPacket(
+            timestamp=time.time(),
+            packet_type=packet_type,
+            data=block.encode(self.compression_level),
+            compression=CompressionType.COLUMNAR,
+            sequence_id=self.sequence_counter
+        )
+    
+    def decompress_telemetry_block(self, packet: TelemetryPacket) -> TelemetryBlock:
+        """Decode a COLUMNAR packet; use .to_numpy() for column arrays"""
+        return TelemetryBlock.decode(packet.data)
+    
+    def request_keyframe(self,
+                         packet_type: str = "telemetry",
+                         compression_type: CompressionType = CompressionType.DELTA) -> None:
+        """Force a keyframe on the next delta packet of a stream (e.g. new receiver)"""
+        self._get_stream_encoder(packet_type, compression_type).request_keyframe()
+    
+    def last_frame_was_keyframe(self,
+                                packet_type: str = "telemetry",
+                                compression_type: CompressionType = CompressionType.DELTA) -> bool:
+        """True if the newest delta packet of a stream starts with a keyframe"""
+        return self._get_stream_encoder(packet_type, compression_type).last_frame_was_keyframe
+    
+    def _get_stream_encoder(self,
+                            packet_type: str,
+                            compression_type: CompressionType = CompressionType.DELTA) -> TelemetryStreamEncoder:
+        key = (packet_type, compression_type)
+        encoder = self._stream_encoders.get(key)
+        if encoder is None:
+            encoder = TelemetryStreamEncoder(keyframe_interval=self.keyframe_interval)
+            self._stream_encoders[key] = encoder
+        return encoder
+    
+    def _get_stream_decoder(self,
+                            packet_type: str,
+                            compression_type: CompressionType = CompressionType.DELTA) -> TelemetryStreamDecoder:
+        key = (packet_type, compression_type)
+        decoder = self._stream_decoders.get(key)
+        if decoder is None:
+            decoder = TelemetryStreamDecoder()
+            self._stream_decoders[key] = decoder
+        return decoder
+    
     def _compress_gzip(self, data: Dict[str, Any]) -> bytes:
         """Compress dictionary data using gzip"""
         json_str = json.dumps(data, separators=(',', ':'))  # Compact JSON
@@ -329,31 +486,11 @@ class TelemetryCompressor:
     
     def _encode_status(self, status: str) -> int:
         """Encode system status string to byte code"""
-        status_codes = {
-            'idle': 0,
-            'arming': 1,
-            'armed': 2,
-            'takeoff': 3,
-            'mission': 4,
-            'landing': 5,
-            'emergency': 6,
-            'error': 7
-        }
-        return status_codes.get(status.lower(), 0)
+        return STATUS_CODES.get(status.lower(), 0)
     
     def _decode_status(self, status_code: int) -> str:
         """Decode byte code back to system status string"""
-        status_strings = {
-            0: 'idle',
-            1: 'arming',
-            2: 'armed',
-            3: 'takeoff',
-            4: 'mission',
-            5: 'landing',
-            6: 'emergency',
-            7: 'error'
-        }
-        return status_strings.get(status_code, 'unknown')
+        return STATUS_NAMES.get(status_code, 'unknown')
     
     def get_compression_stats(self, original_data: Dict[str, Any], compressed_packet: TelemetryPacket) -> Dict[str, Any]:
         """Get compression statistics"""
@@ -423,6 +560,33 @@ class WebSocketTelemetryManager:
             )
             return packet.to_dict()
     
+    def prepare_broadcast_telemetry(self,
+                                    telemetry_data: Dict[str, Any],
+                                    formats: Set[CompressionType],
+                                    packet_type: str = "telemetry") -> Dict[CompressionType, Union[str, bytes]]:
+        """
+        Encode one telemetry sample once per requested format
+        
+        Used for fan-out: every client sharing a format receives the same
+        wire payload instead of a per-client re-encoding.
+        
+        Args:
+            telemetry_data: Raw telemetry data
+            formats: Compression formats negotiated by connected clients
+            packet_type: Telemetry packet/stream type
+            
+        Returns:
+            Mapping of format to wire payload (JSON text or binary frame)
+        """
+        payloads: Dict[CompressionType, Union[str, bytes]] = {}
+        for compression_type in formats:
+            packet = self.compressor.compress_telemetry(telemetry_data, compression_type, packet_type)
+            if compression_type == CompressionType.NONE:
+                payloads[compression_type] = json.dumps(packet.to_dict(), separators=(',', ':'))
+            else:
+                payloads[compression_type] = packet.data
+        return payloads
+    
     def handle_websocket_message(self, message: Union[str, bytes], client_id: str) -> Dict[str, Any]:
         """
         Handle incoming WebSocket message and detect compression format
@@ -26,14 +26,18 @@ class ZmqClient:
     - Thread-safe operations
     """
     
-    def __init__(self, server_address: str = "tcp://localhost:5555"):
+    def __init__(self, server_address: str = "tcp://localhost:5555",
+                 on_verified_message: Optional[Callable[[], None]] = None):
         """
         Initialize ZMQ client.
         
         Args:
             server_address: ZMQ server address (default: tcp://localhost:5555)
+            on_verified_message: Called after each response passes signature
+                verification (e.g. SafetyWatchdog.verified_message_received)
         """
         self.server_address = server_address
+        self.on_verified_message = on_verified_message
         self.context = zmq.Context()
         self.socket: Optional[zmq.Socket] = None
         self.connected = False
@@ -90,6 +94,8 @@ class ZmqClient:
                 if self.socket.poll(int(timeout * 1000)) > 0:
                     response_message = self.socket.recv()
                     response_data = deserialize(response_message)
+                    if self.on_verified_message is not None:
+                        self.on_verified_message()
                     return response_data
                 else:
                     self.logger.warning(f"⚠️ ZMQ request timeout after {timeout}s")
@@ -25,7 +25,8 @@ class ZmqServer:
     - Thread-safe operations
     """
     
-    def __init__(self, port: int = 5555, bind_address: str = "127.0.0.1", enable_curve: bool = False):
+    def __init__(self, port: int = 5555, bind_address: str = "127.0.0.1", enable_curve: bool = False,
+                 on_verified_message: Optional[Callable[[], None]] = None):
         """
         Initialize ZMQ server.
         
@@ -33,8 +34,11 @@ class ZmqServer:
             port: Port to bind to (default: 5555)
             bind_address: Address to bind to (default: "127.0.0.1" for security)
             enable_curve: Enable ZMQ Curve encryption (default: False)
+            on_verified_message: Called after each request passes signature
+                verification (e.g. SafetyWatchdog.verified_message_received)
         """
         self.port = port
+        self.on_verified_message = on_verified_message
         self.bind_address = bind_address
         self.enable_curve = enable_curve
         self.context = zmq.Context()
@@ -88,6 +92,8 @@ class ZmqServer:
                 # Wait for request
                 message = self.socket.recv()
                 data = deserialize(message)
+                if self.on_verified_message is not None:
+                    self.on_verified_message()
                 
                 # Handle request
                 response = self._handle_request(data)
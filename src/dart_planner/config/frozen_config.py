@@ -3,23 +3,39 @@ Frozen Configuration System for DART-Planner
 
 Provides immutable configuration objects with Pydantic validation
 and startup validation to prevent runtime modification.
+
+Validated configurations can be cached as snapshots keyed by their
+sources and shared with worker processes without re-validation. Secrets
+are never written to snapshots; they are re-read when a snapshot loads.
 """
 
 import os
 import json
+import hashlib
+import logging
+import pickle
+import stat
+import sys
+import tempfile
+import typing
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union, FrozenSet
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Tuple, Union, FrozenSet
 from dataclasses import dataclass, field
 from datetime import datetime
 from contextlib import contextmanager
+from functools import lru_cache
 
 from pydantic import BaseModel, Field, validator, root_validator, ValidationError, model_validator
+from pydantic import VERSION as PYDANTIC_VERSION
 from pydantic.generics import GenericModel
 
 from dart_planner.common.errors import ConfigurationError
 from dart_planner.common.coordinate_frames import WorldFrame
 
+logger = logging.getLogger(__name__)
+
 
 class FrozenBaseModel(BaseModel):
     """Base model for frozen configuration objects."""
@@ -245,6 +261,8 @@ class LoggingConfig(FrozenBaseModel):
     enable_file_logging: bool = Field(default=True, description="Enable file logging")
     enable_structured_logging: bool = Field(default=False, description="Enable structured logging")
     log_correlation_id: bool = Field(default=True, description="Include correlation IDs in logs")
+    enable_async_logging: bool = Field(default=False, description="Format and write logs on a background thread")
+    async_queue_size: int = Field(default=8192, ge=64, le=1048576, description="Async log queue capacity")
     enable_performance_logging: bool = Field(default=True, description="Enable performance logging")
     performance_log_interval_s: int = Field(default=60, ge=10, le=3600, description="Performance log interval")
     
@@ -371,19 +389,296 @@ class DARTPlannerFrozenConfig(FrozenBaseModel):
         return values
 
 
+# Environment variables that override configuration fields
+ENV_MAPPINGS: Dict[str, Union[str, Tuple[str, str]]] = {
+    'DART_ENVIRONMENT': 'environment',
+    'DART_DEBUG': 'debug',
+    'DART_VERSION': 'version',
+    'DART_JWT_SECRET_KEY': ('security', 'jwt_secret_key'),
+    'DART_JWT_ALGORITHM': ('security', 'jwt_algorithm'),
+    'DART_JWT_EXPIRATION_MINUTES': ('security', 'jwt_expiration_minutes'),
+    'DART_CONTROL_FREQUENCY_HZ': ('real_time', 'control_loop_frequency_hz'),
+    'DART_PLANNING_FREQUENCY_HZ': ('real_time', 'planning_loop_frequency_hz'),
+    'DART_SAFETY_FREQUENCY_HZ': ('real_time', 'safety_loop_frequency_hz'),
+    'DART_MAX_CONTROL_LATENCY_MS': ('real_time', 'max_control_latency_ms'),
+    'DART_MAX_PLANNING_LATENCY_MS': ('real_time', 'max_planning_latency_ms'),
+    'DART_MAX_SAFETY_LATENCY_MS': ('real_time', 'max_safety_latency_ms'),
+    'DART_ENABLE_DEADLINE_MONITORING': ('real_time', 'enable_deadline_monitoring'),
+    'DART_ENABLE_JITTER_COMPENSATION': ('real_time', 'enable_jitter_compensation'),
+    'DART_MAX_JITTER_MS': ('real_time', 'max_jitter_ms'),
+    'DART_ENABLE_PRIORITY_SCHEDULING': ('real_time', 'enable_priority_scheduling'),
+    'DART_CONTROL_PRIORITY': ('real_time', 'control_priority'),
+    'DART_PLANNING_PRIORITY': ('real_time', 'planning_priority'),
+    'DART_SAFETY_PRIORITY': ('real_time', 'safety_priority'),
+    'DART_RT_ENABLE_OS': ('real_time', 'enable_rt_os'),
+    'DART_RT_ENABLE_PRIORITY_INHERITANCE': ('real_time', 'enable_priority_inheritance'),
+    'DART_RT_ENABLE_TIMING_COMPENSATION': ('real_time', 'enable_timing_compensation'),
+    'DART_RT_MAX_SCHEDULING_LATENCY_MS': ('real_time', 'max_scheduling_latency_ms'),
+    'DART_RT_MAX_CONTEXT_SWITCH_MS': ('real_time', 'max_context_switch_ms'),
+    'DART_RT_MAX_INTERRUPT_LATENCY_MS': ('real_time', 'max_interrupt_latency_ms'),
+    'DART_RT_CLOCK_DRIFT_COMPENSATION_FACTOR': ('real_time', 'clock_drift_compensation_factor'),
+    'DART_RT_JITTER_COMPENSATION_WINDOW': ('real_time', 'jitter_compensation_window'),
+    'DART_RT_TIMING_COMPENSATION_THRESHOLD_MS': ('real_time', 'timing_compensation_threshold_ms'),
+    'DART_RT_CONTROL_DEADLINE_MS': ('real_time', 'control_loop_deadline_ms'),
+    'DART_RT_CONTROL_JITTER_MS': ('real_time', 'control_loop_jitter_ms'),
+    'DART_RT_PLANNING_DEADLINE_MS': ('real_time', 'planning_loop_deadline_ms'),
+    'DART_RT_PLANNING_JITTER_MS': ('real_time', 'planning_loop_jitter_ms'),
+    'DART_RT_SAFETY_DEADLINE_MS': ('real_time', 'safety_loop_deadline_ms'),
+    'DART_RT_SAFETY_JITTER_MS': ('real_time', 'safety_loop_jitter_ms'),
+    'DART_RT_COMMUNICATION_FREQUENCY_HZ': ('real_time', 'communication_frequency_hz'),
+    'DART_RT_COMMUNICATION_DEADLINE_MS': ('real_time', 'communication_deadline_ms'),
+    'DART_RT_COMMUNICATION_JITTER_MS': ('real_time', 'communication_jitter_ms'),
+    'DART_RT_TELEMETRY_FREQUENCY_HZ': ('real_time', 'telemetry_frequency_hz'),
+    'DART_RT_TELEMETRY_DEADLINE_MS': ('real_time', 'telemetry_deadline_ms'),
+    'DART_RT_TELEMETRY_JITTER_MS': ('real_time', 'telemetry_jitter_ms'),
+    'DART_RT_ENABLE_MONITORING': ('real_time', 'enable_performance_monitoring'),
+    'DART_RT_MONITORING_FREQUENCY_HZ': ('real_time', 'monitoring_frequency_hz'),
+    'DART_RT_STATS_WINDOW_SIZE': ('real_time', 'stats_window_size'),
+    'DART_RT_DEADLINE_VIOLATION_THRESHOLD': ('real_time', 'deadline_violation_threshold'),
+    'DART_RT_JITTER_THRESHOLD_MS': ('real_time', 'jitter_threshold_ms'),
+    'DART_RT_EXECUTION_TIME_THRESHOLD_MS': ('real_time', 'execution_time_threshold_ms'),
+    'DART_RT_ENABLE_TIMING_LOGS': ('real_time', 'enable_timing_logs'),
+    'DART_RT_ENABLE_PERFORMANCE_REPORTS': ('real_time', 'enable_performance_reports'),
+    'DART_RT_LOG_PERFORMANCE_INTERVAL_S': ('real_time', 'log_performance_interval_s'),
+    'DART_MAX_VELOCITY_MPS': ('hardware', 'max_velocity_mps'),
+    'DART_MAX_ALTITUDE_M': ('hardware', 'max_altitude_m'),
+    'DART_ZMQ_BIND_ADDRESS': ('communication', 'zmq_bind_address'),
+    'DART_LOG_LEVEL': ('logging', 'log_level'),
+    'DART_WORLD_FRAME': ('coordinate_frame', 'world_frame'),
+    'DART_ENFORCE_FRAME_CONSISTENCY': ('coordinate_frame', 'enforce_consistency'),
+    'DART_VALIDATE_TRANSFORMS': ('coordinate_frame', 'validate_transforms'),
+    'DART_AUTO_DETECT_FRAME': ('coordinate_frame', 'auto_detect_frame'),
+}
+
+# Every environment variable that can change the validated configuration:
+# the overrides above plus those read directly by field validators
+SNAPSHOT_ENV_VARS: Tuple[str, ...] = tuple(sorted(set(ENV_MAPPINGS) | {"DART_ENCRYPTION_KEY"}))
+
+# Secret fields -> environment variable they can come from. Snapshots store
+# them as None and restore them from the environment or config file on load
+SNAPSHOT_SECRET_FIELDS: Dict[Tuple[str, str], str] = {
+    ('security', 'jwt_secret_key'): 'DART_JWT_SECRET_KEY',
+    ('communication', 'encryption_key'): 'DART_ENCRYPTION_KEY',
+}
+
+SNAPSHOT_FORMAT_VERSION = 2
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Validated configuration flattened for hot readers.
+
+    ``values`` maps dotted field paths (``"real_time.control_loop_frequency_hz"``)
+    to their values in a read-only mapping. Sections are also reachable as
+    attributes (``snapshot.real_time``) and return the frozen section models.
+    """
+    config: DARTPlannerFrozenConfig
+    values: Mapping[str, Any]
+
+    @classmethod
+    def from_config(cls, config: DARTPlannerFrozenConfig) -> "ConfigSnapshot":
+        values: Dict[str, Any] = {}
+        _flatten_model(config, "", values)
+        return cls(config, MappingProxyType(values))
+
+    def __getitem__(self, path: str) -> Any:
+        return self.values[path]
+
+    def get(self, path: str, default: Any = None) -> Any:
+        return self.values.get(path, default)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.config, name)
+
+
+def _flatten_model(model: BaseModel, prefix: str, out: Dict[str, Any]) -> None:
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        if isinstance(value, BaseModel):
+            _flatten_model(value, f"{prefix}{name}.", out)
+        else:
+            out[f"{prefix}{name}"] = value
+
+
+def _schema_modules() -> List[str]:
+    """Source files of every module defining a model or type used by the configuration."""
+    modules = set()
+    seen = set()
+    pending: List[Any] = [DARTPlannerFrozenConfig]
+    while pending:
+        tp = pending.pop()
+        if tp in seen:
+            continue
+        seen.add(tp)
+        pending.extend(typing.get_args(tp))
+        if not isinstance(tp, type) or tp.__module__ in ("builtins", "typing"):
+            continue
+        modules.add(tp.__module__)
+        if issubclass(tp, BaseModel):
+            pending.extend(base for base in tp.__mro__[1:] if issubclass(base, BaseModel) and base is not BaseModel)
+            pending.extend(field_info.annotation for field_info in tp.model_fields.values())
+    files = (getattr(sys.modules.get(name), "__file__", None) for name in modules)
+    return sorted(path for path in files if path)
+
+
+@lru_cache(maxsize=1)
+def _schema_fingerprint() -> str:
+    # Snapshots pickled against a different model definition are stale
+    digest = hashlib.sha256(f"{SNAPSHOT_FORMAT_VERSION}:{PYDANTIC_VERSION}".encode())
+    for path in _schema_modules():
+        digest.update(f"\0{path}\0".encode())
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+def _replace_fields(config: DARTPlannerFrozenConfig,
+                    values: Dict[Tuple[str, str], Any]) -> DARTPlannerFrozenConfig:
+    sections: Dict[str, Dict[str, Any]] = {}
+    for (section, name), value in values.items():
+        sections.setdefault(section, {})[name] = value
+    return config.model_copy(update={
+        section: getattr(config, section).model_copy(update=fields)
+        for section, fields in sections.items()
+    })
+
+
+def _restore_secrets(config: DARTPlannerFrozenConfig, secrets: List[str],
+                     config_path: Optional[str], path: Path) -> DARTPlannerFrozenConfig:
+    """Re-read the secrets a snapshot was written without, with load_config's precedence"""
+    restored: Dict[Tuple[str, str], Any] = {}
+    file_data: Optional[Dict[str, Any]] = None
+    for (section, name), env_var in SNAPSHOT_SECRET_FIELDS.items():
+        if f"{section}.{name}" not in secrets:
+            continue
+        value = os.environ.get(env_var) if env_var in ENV_MAPPINGS else None
+        if value is None and config_path:
+            if file_data is None:
+                source = Path(config_path)
+                file_data = (ConfigurationManager(config_path)._load_from_file(source) or {}) if source.exists() else {}
+            value = (file_data.get(section) or {}).get(name)
+        if value is None:
+            value = os.environ.get(env_var)
+        if value is None:
+            raise ConfigurationError(f"Configuration snapshot {path} needs {env_var}, which is not set")
+        restored[(section, name)] = value
+    return _replace_fields(config, restored) if restored else config
+
+
+def read_snapshot_file(path: Union[str, Path]) -> DARTPlannerFrozenConfig:
+    """
+    Load a configuration written by ``write_snapshot_file`` without re-validating it.
+
+    Snapshots are pickles, so only files owned by the current user and not
+    writable by others are accepted.
+
+    Raises:
+        ConfigurationError: If the file is missing, untrusted, or not a snapshot
+    """
+    path = Path(path)
+    try:
+        with open(path, "rb") as f:
+            if hasattr(os, "getuid"):
+                file_stat = os.fstat(f.fileno())
+                if file_stat.st_uid != os.getuid() or file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                    raise ConfigurationError(f"Refusing to load configuration snapshot {path}: untrusted permissions")
+            payload = pickle.load(f)
+    except ConfigurationError:
+        raise
+    except Exception as e:
+        raise ConfigurationError(f"Failed to load configuration snapshot from {path}: {e}")
+
+    if (not isinstance(payload, dict) or payload.get("format") != SNAPSHOT_FORMAT_VERSION
+            or not isinstance(payload.get("config"), DARTPlannerFrozenConfig)):
+        raise ConfigurationError(f"{path} is not a configuration snapshot")
+    return _restore_secrets(payload["config"], payload.get("secrets", []), payload.get("config_path"), path)
+
+
+def write_snapshot_file(path: Union[str, Path], config: DARTPlannerFrozenConfig,
+                        config_path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Atomically write a validated configuration to ``path`` (mode 0600).
+
+    Secret fields (``SNAPSHOT_SECRET_FIELDS``) are written as None and
+    re-read by ``read_snapshot_file`` from their environment variable or
+    ``config_path``. The directory is still created private to the user.
+    """
+    path = Path(path)
+    secrets = [
+        f"{section}.{name}" for section, name in SNAPSHOT_SECRET_FIELDS
+        if getattr(getattr(config, section), name) is not None
+    ]
+    payload = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "config": _replace_fields(config, {field: None for field in SNAPSHOT_SECRET_FIELDS}),
+        "secrets": secrets,
+        "config_path": str(config_path) if config_path else None,
+    }
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return path
+
+
 class ConfigurationManager:
-    """Manages frozen configuration objects."""
+    """
+    Manages frozen configuration objects.
+    
+    When a snapshot cache directory is configured (``cache_dir`` or the
+    ``DART_CONFIG_CACHE_DIR`` environment variable), the validated
+    configuration is stored there keyed by a hash of the config file and
+    the relevant environment variables, and later loads with the same
+    sources skip parsing and validation.
+    """
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, cache_dir: Optional[str] = None):
         self.config_path = Path(config_path) if config_path else None
+        cache_dir = cache_dir if cache_dir is not None else os.environ.get("DART_CONFIG_CACHE_DIR")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self._config: Optional[DARTPlannerFrozenConfig] = None
+        self._snapshot: Optional[ConfigSnapshot] = None
         self._frozen = False
     
+    def snapshot_key(self) -> str:
+        """Hash of everything the validated configuration is derived from."""
+        digest = hashlib.sha256(_schema_fingerprint().encode())
+        if self.config_path:
+            try:
+                digest.update(self.config_path.read_bytes())
+            except FileNotFoundError:
+                pass
+        for name in SNAPSHOT_ENV_VARS:
+            value = os.environ.get(name)
+            if value is not None:
+                digest.update(f"\0{name}={value}".encode())
+        return digest.hexdigest()
+    
     def load_config(self) -> DARTPlannerFrozenConfig:
-        """Load and validate configuration."""
+        """Load and validate configuration, reusing a cached snapshot if one matches."""
         if self._config is not None:
             return self._config
         
+        snapshot_path = None
+        if self.cache_dir is not None:
+            snapshot_path = self.cache_dir / f"config-{self.snapshot_key()[:32]}.pickle"
+            if snapshot_path.exists():
+                try:
+                    self._config = read_snapshot_file(snapshot_path)
+                    return self._config
+                except ConfigurationError as e:
+                    logger.warning("Ignoring configuration snapshot: %s", e)
+        
         # Load from file if provided
         config_data = {}
         if self.config_path and self.config_path.exists():
@@ -398,8 +693,32 @@ class ConfigurationManager:
         except ValidationError as e:
             raise ConfigurationError(f"Configuration validation failed: {e}")
         
+        if snapshot_path is not None:
+            try:
+                write_snapshot_file(snapshot_path, self._config, self.config_path)
+            except OSError as e:
+                logger.warning("Could not write configuration snapshot %s: %s", snapshot_path, e)
+        
         return self._config
     
+    def get_snapshot(self) -> ConfigSnapshot:
+        """Flat read-only view of the current configuration."""
+        config = self.get_config()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.config is not config:
+            snapshot = self._snapshot = ConfigSnapshot.from_config(config)
+        return snapshot
+    
+    def export_snapshot(self, path: Union[str, Path]) -> Path:
+        """
+        Write the validated configuration for worker processes.
+        
+        Workers started with ``fork`` inherit the loaded configuration; for
+        ``spawn``/``forkserver`` pools pass ``load_config_snapshot`` and this
+        path as the pool initializer so workers skip validation.
+        """
+        return write_snapshot_file(path, self.get_config(), self.config_path)
+    
     def _load_from_file(self, config_path: Path) -> Dict[str, Any]:
         """Load configuration from file."""
         try:
@@ -416,67 +735,7 @@ class ConfigurationManager:
     
     def _load_from_env(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Load configuration from environment variables."""
-        env_mappings = {
-            'DART_ENVIRONMENT': 'environment',
-            'DART_DEBUG': 'debug',
-            'DART_VERSION': 'version',
-            'DART_JWT_SECRET_KEY': ('security', 'jwt_secret_key'),
-            'DART_JWT_ALGORITHM': ('security', 'jwt_algorithm'),
-            'DART_JWT_EXPIRATION_MINUTES': ('security', 'jwt_expiration_minutes'),
-            'DART_CONTROL_FREQUENCY_HZ': ('real_time', 'control_loop_frequency_hz'),
-            'DART_PLANNING_FREQUENCY_HZ': ('real_time', 'planning_loop_frequency_hz'),
-            'DART_SAFETY_FREQUENCY_HZ': ('real_time', 'safety_loop_frequency_hz'),
-            'DART_MAX_CONTROL_LATENCY_MS': ('real_time', 'max_control_latency_ms'),
-            'DART_MAX_PLANNING_LATENCY_MS': ('real_time', 'max_planning_latency_ms'),
-            'DART_MAX_SAFETY_LATENCY_MS': ('real_time', 'max_safety_latency_ms'),
-            'DART_ENABLE_DEADLINE_MONITORING': ('real_time', 'enable_deadline_monitoring'),
-            'DART_ENABLE_JITTER_COMPENSATION': ('real_time', 'enable_jitter_compensation'),
-            'DART_MAX_JITTER_MS': ('real_time', 'max_jitter_ms'),
-            'DART_ENABLE_PRIORITY_SCHEDULING': ('real_time', 'enable_priority_scheduling'),
-            'DART_CONTROL_PRIORITY': ('real_time', 'control_priority'),
-            'DART_PLANNING_PRIORITY': ('real_time', 'planning_priority'),
-            'DART_SAFETY_PRIORITY': ('real_time', 'safety_priority'),
-            'DART_RT_ENABLE_OS': ('real_time', 'enable_rt_os'),
-            'DART_RT_ENABLE_PRIORITY_INHERITANCE': ('real_time', 'enable_priority_inheritance'),
-            'DART_RT_ENABLE_TIMING_COMPENSATION': ('real_time', 'enable_timing_compensation'),
-            'DART_RT_MAX_SCHEDULING_LATENCY_MS': ('real_time', 'max_scheduling_latency_ms'),
-            'DART_RT_MAX_CONTEXT_SWITCH_MS': ('real_time', 'max_context_switch_ms'),
-            'DART_RT_MAX_INTERRUPT_LATENCY_MS': ('real_time', 'max_interrupt_latency_ms'),
-            'DART_RT_CLOCK_DRIFT_COMPENSATION_FACTOR': ('real_time', 'clock_drift_compensation_factor'),
-            'DART_RT_JITTER_COMPENSATION_WINDOW': ('real_time', 'jitter_compensation_window'),
-            'DART_RT_TIMING_COMPENSATION_THRESHOLD_MS': ('real_time', 'timing_compensation_threshold_ms'),
-            'DART_RT_CONTROL_DEADLINE_MS': ('real_time', 'control_loop_deadline_ms'),
-            'DART_RT_CONTROL_JITTER_MS': ('real_time', 'control_loop_jitter_ms'),
-            'DART_RT_PLANNING_DEADLINE_MS': ('real_time', 'planning_loop_deadline_ms'),
-            'DART_RT_PLANNING_JITTER_MS': ('real_time', 'planning_loop_jitter_ms'),
-            'DART_RT_SAFETY_DEADLINE_MS': ('real_time', 'safety_loop_deadline_ms'),
-            'DART_RT_SAFETY_JITTER_MS': ('real_time', 'safety_loop_jitter_ms'),
-            'DART_RT_COMMUNICATION_FREQUENCY_HZ': ('real_time', 'communication_frequency_hz'),
-            'DART_RT_COMMUNICATION_DEADLINE_MS': ('real_time', 'communication_deadline_ms'),
-            'DART_RT_COMMUNICATION_JITTER_MS': ('real_time', 'communication_jitter_ms'),
-            'DART_RT_TELEMETRY_FREQUENCY_HZ': ('real_time', 'telemetry_frequency_hz'),
-            'DART_RT_TELEMETRY_DEADLINE_MS': ('real_time', 'telemetry_deadline_ms'),
-            'DART_RT_TELEMETRY_JITTER_MS': ('real_time', 'telemetry_jitter_ms'),
-            'DART_RT_ENABLE_MONITORING': ('real_time', 'enable_performance_monitoring'),
-            'DART_RT_MONITORING_FREQUENCY_HZ': ('real_time', 'monitoring_frequency_hz'),
-            'DART_RT_STATS_WINDOW_SIZE': ('real_time', 'stats_window_size'),
-            'DART_RT_DEADLINE_VIOLATION_THRESHOLD': ('real_time', 'deadline_violation_threshold'),
-            'DART_RT_JITTER_THRESHOLD_MS': ('real_time', 'jitter_threshold_ms'),
-            'DART_RT_EXECUTION_TIME_THRESHOLD_MS': ('real_time', 'execution_time_threshold_ms'),
-            'DART_RT_ENABLE_TIMING_LOGS': ('real_time', 'enable_timing_logs'),
-            'DART_RT_ENABLE_PERFORMANCE_REPORTS': ('real_time', 'enable_performance_reports'),
-            'DART_RT_LOG_PERFORMANCE_INTERVAL_S': ('real_time', 'log_performance_interval_s'),
-            'DART_MAX_VELOCITY_MPS': ('hardware', 'max_velocity_mps'),
-            'DART_MAX_ALTITUDE_M': ('hardware', 'max_altitude_m'),
-            'DART_ZMQ_BIND_ADDRESS': ('communication', 'zmq_bind_address'),
-            'DART_LOG_LEVEL': ('logging', 'log_level'),
-            'DART_WORLD_FRAME': ('coordinate_frame', 'world_frame'),
-            'DART_ENFORCE_FRAME_CONSISTENCY': ('coordinate_frame', 'enforce_consistency'),
-            'DART_VALIDATE_TRANSFORMS': ('coordinate_frame', 'validate_transforms'),
-            'DART_AUTO_DETECT_FRAME': ('coordinate_frame', 'auto_detect_frame'),
-        }
-        
-        for env_var, config_path in env_mappings.items():
+        for env_var, config_path in ENV_MAPPINGS.items():
             value = os.getenv(env_var)
             if value is not None:
                 if isinstance(config_path, str):
@@ -598,6 +857,22 @@ def get_frozen_config() -> DARTPlannerFrozenConfig:
     """Get the frozen configuration."""
     return get_config_manager().get_config()
 
+def get_config_snapshot() -> ConfigSnapshot:
+    """Get the flat read-only view of the frozen configuration."""
+    return get_config_manager().get_snapshot()
+
+def load_config_snapshot(path: Union[str, Path]) -> ConfigSnapshot:
+    """
+    Install a snapshot written by ``export_snapshot`` as the global configuration.
+    
+    Usable as a ``multiprocessing.Pool`` initializer.
+    """
+    global _config_manager
+    manager = ConfigurationManager()
+    manager._config = read_snapshot_file(path)
+    _config_manager = manager
+    return manager.get_snapshot()
+
 def freeze_configuration() -> None:
     """Freeze the global configuration."""
     get_config_manager().freeze_config()
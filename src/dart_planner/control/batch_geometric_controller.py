@@ -0,0 +1,335 @@
+"""
+Vectorized Geometric Controller for DART-Planner
+
+Batch counterpart of ``GeometricController.compute_control_fast`` for swarm
+simulation and Monte Carlo studies:
+- Steps K vehicles at once on ``(K, 3)`` state/reference arrays and returns
+  ``(K,)`` thrusts and ``(K, 3)`` torques
+- Same PID + feedforward law, anti-windup (clamping or back-calculation),
+  tilt limit and yaw-singularity fallbacks as the single-vehicle controller,
+  expressed as masked NumPy operations instead of per-vehicle branches
+- Per-vehicle integrator and saturation state is kept in arrays, so a row
+  of this controller behaves exactly like an independent GeometricController
+"""
+
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from dart_planner.common.coordinate_frames import get_coordinate_frame_manager
+from dart_planner.common.errors import ControlError
+from dart_planner.common.hot_path_diagnostics import HotPathDiagnostics
+from dart_planner.common.logging_config import get_logger
+from dart_planner.common.quaternions import (
+    attitude_error,
+    euler_to_quaternion,
+    quaternion_normalize,
+    quaternion_to_euler,
+    rotation_matrix_to_quaternion,
+)
+from dart_planner.common.vehicle_params import get_control_constants
+from .geometric_controller import GeometricControllerConfig, apply_tuning_profile
+
+ArrayLike = Union[float, np.ndarray]
+
+_E1 = np.array([1.0, 0.0, 0.0])
+_BACK_CALC_THRUST_SPLIT = np.array([0.33, 0.33, 0.34])
+
+
+def _normalize_rows(v: np.ndarray) -> np.ndarray:
+    return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+
+def _project_e1(b3: np.ndarray) -> np.ndarray:
+    """Unit x-axis projected onto the plane perpendicular to each row of ``b3``."""
+    return _normalize_rows(_E1 - b3[:, :1] * b3)
+
+
+class BatchGeometricController:
+    """
+    Geometric controller for K vehicles sharing one configuration.
+
+    All inputs are base SI units without pint, as in ``compute_control_fast``.
+    """
+
+    def __init__(self,
+                 num_vehicles: int,
+                 config: Optional[GeometricControllerConfig] = None,
+                 tuning_profile: str = "sitl_optimized"):
+        if num_vehicles < 1:
+            raise ControlError(f"num_vehicles must be positive, got {num_vehicles}")
+        self.logger = get_logger(__name__)
+        if config is None:
+            config = GeometricControllerConfig()
+        if tuning_profile:
+            apply_tuning_profile(config, tuning_profile, self.logger)
+        self.config = config
+        self.tuning_profile_name = tuning_profile
+        self.num_vehicles = num_vehicles
+        self.diagnostics = HotPathDiagnostics(__name__, interval_s=self.config.diagnostics_interval_s)
+
+        constants = get_control_constants()
+        self._mass = constants['mass']
+        self._gravity_magnitude = constants['gravity']
+        self._gravity_vector = get_coordinate_frame_manager().get_gravity_vector(self._gravity_magnitude)
+        self._inertia = np.asarray(self.config.inertia, dtype=float)
+        self._max_torque = np.asarray(self.config.max_torque_xyz, dtype=float)
+        self._min_thrust = self.config.min_thrust * self._mass * self._gravity_magnitude
+        self._hover_thrust = float(self._mass * self._gravity_magnitude)
+
+        self._init_state()
+        self.logger.info(
+            f"🎯 Batch geometric controller initialized for {num_vehicles} vehicles "
+            f"with '{tuning_profile}' profile"
+        )
+
+    def _init_state(self) -> None:
+        K = self.num_vehicles
+        # Integrates velocity error over time (∫vel_error dt) ⇒ metres, per vehicle
+        self.integral_vel_error = np.zeros((K, 3))
+        self.last_thrust_saturated = np.zeros(K, dtype=bool)
+        self.last_torque_saturated = np.zeros((K, 3), dtype=bool)
+        self.unsaturated_thrust = np.zeros(K)
+        self.unsaturated_torque = np.zeros((K, 3))
+        self.thrust_saturation_count = np.zeros(K, dtype=np.int64)
+        self.torque_saturation_count = np.zeros(K, dtype=np.int64)
+        self.yaw_singularity_count = np.zeros(K, dtype=np.int64)
+
+    def reset(self, vehicles: Optional[np.ndarray] = None) -> None:
+        """Reset controller state for all vehicles, or only the selected ones.
+
+        Args:
+            vehicles: Boolean mask or index array of vehicles to reset
+        """
+        if vehicles is None:
+            self._init_state()
+            self.diagnostics.flush()
+            self.diagnostics.reset()
+            return
+        self.integral_vel_error[vehicles] = 0.0
+        self.last_thrust_saturated[vehicles] = False
+        self.last_torque_saturated[vehicles] = False
+        self.unsaturated_thrust[vehicles] = 0.0
+        self.unsaturated_torque[vehicles] = 0.0
+        self.thrust_saturation_count[vehicles] = 0
+        self.torque_saturation_count[vehicles] = 0
+        self.yaw_singularity_count[vehicles] = 0
+
+    def compute_control_batch(
+        self,
+        pos: np.ndarray,
+        vel: np.ndarray,
+        att: np.ndarray,
+        ang_vel: np.ndarray,
+        desired_pos: np.ndarray,
+        desired_vel: np.ndarray,
+        desired_acc: np.ndarray,
+        desired_yaw: ArrayLike = 0.0,
+        desired_yaw_rate: ArrayLike = 0.0,
+        dt: float = 0.001,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute thrust and torque for every vehicle in one pass.
+
+        Args:
+            pos, vel: Vehicle positions (m) and velocities (m/s), shape (K, 3)
+            att: Euler angles (rad), shape (K, 3), or quaternions [w, x, y, z], shape (K, 4)
+            ang_vel: Body angular velocities (rad/s), shape (K, 3)
+            desired_pos, desired_vel, desired_acc: References, shape (K, 3) or (3,)
+            desired_yaw, desired_yaw_rate: Scalars or shape (K,) (rad, rad/s)
+            dt: Shared time step (s)
+
+        Returns:
+            thrust: Thrust magnitudes (N), shape (K,)
+            torque: Body torques (N·m), shape (K, 3)
+        """
+        K = self.num_vehicles
+        if pos.shape != (K, 3):
+            raise ControlError(f"Expected state arrays of shape ({K}, 3), got {pos.shape}")
+        if dt <= 0 or dt > 0.1:
+            return np.full(K, self._hover_thrust), np.zeros((K, 3))
+
+        cfg = self.config
+        pos_error = desired_pos - pos
+        vel_error = desired_vel - vel
+
+        # Desired acceleration (PID + feedforward), integral from previous step
+        acc_des = desired_acc + (
+            cfg.kp_pos * pos_error
+            + cfg.kd_pos * vel_error
+            + cfg.ki_pos * self.integral_vel_error
+        )
+        thrust_vector = acc_des - self._gravity_vector
+        thrust_magnitude = np.linalg.norm(thrust_vector, axis=1)
+        self.unsaturated_thrust = thrust_magnitude.copy()
+
+        # Thrust limits
+        over = thrust_magnitude > cfg.max_thrust
+        under = ~over & (thrust_magnitude < self._min_thrust)
+        thrust_magnitude[over] = cfg.max_thrust
+        thrust_magnitude[under] = self._min_thrust
+        thrust_saturated = over | under
+        self.thrust_saturation_count += thrust_saturated
+        self.last_thrust_saturated = thrust_saturated
+
+        # Anti-windup uses this step's thrust saturation and last step's torque saturation
+        self._update_integral_error(vel_error, dt, thrust_saturated, self.last_torque_saturated)
+
+        # Desired body z-axis (scaled by the saturated magnitude, as in the scalar controller)
+        nonzero = thrust_magnitude > 1e-6
+        b3_des = np.where(
+            nonzero[:, None],
+            thrust_vector / np.where(nonzero, thrust_magnitude, 1.0)[:, None],
+            [0.0, 0.0, 1.0],
+        )
+
+        # Tilt limit
+        cos_max_tilt = np.cos(cfg.max_tilt_angle)
+        tilted = np.arccos(np.clip(b3_des[:, 2], -1.0, 1.0)) > cfg.max_tilt_angle
+        if tilted.any():
+            limited = b3_des[tilted]
+            limited[:, :2] *= (cos_max_tilt / limited[:, 2])[:, None]
+            limited[:, 2] = cos_max_tilt
+            b3_des[tilted] = _normalize_rows(limited)
+
+        torque = self._attitude_control(att, ang_vel, b3_des, desired_yaw, desired_yaw_rate)
+        return thrust_magnitude, torque
+
+    def _attitude_control(
+        self,
+        att: np.ndarray,
+        ang_vel: np.ndarray,
+        b3_des: np.ndarray,
+        yaw_des: ArrayLike,
+        yaw_rate_des: ArrayLike,
+    ) -> np.ndarray:
+        cfg = self.config
+        K = self.num_vehicles
+        if att.shape[1] == 4:
+            q = quaternion_normalize(att)
+            current_yaw = quaternion_to_euler(q)[:, 2]
+        else:
+            q = euler_to_quaternion(att)
+            current_yaw = att[:, 2]
+
+        yaw_des = np.broadcast_to(np.asarray(yaw_des, dtype=float), (K,))
+        yaw_vector = np.zeros((K, 3))
+        yaw_vector[:, 0] = np.cos(yaw_des)
+        yaw_vector[:, 1] = np.sin(yaw_des)
+        b3 = _normalize_rows(b3_des)
+
+        # Yaw-alignment singularity detection
+        cos_angle = np.abs(np.einsum('ij,ij->i', yaw_vector, b3))
+        singular = cos_angle >= cfg.yaw_singularity_threshold
+        near_singular = cos_angle > cfg.yaw_singularity_warning_threshold
+
+        # Regular case: b1 = yaw × b3, with a fixed fallback when degenerate
+        b1 = np.cross(yaw_vector, b3)
+        b1_norm = np.linalg.norm(b1, axis=1)
+        regular_ok = b1_norm > 1e-6
+        b1 = np.where(regular_ok[:, None], b1 / np.where(regular_ok, b1_norm, 1.0)[:, None], _E1)
+
+        if singular.any():
+            b1[singular] = self._singular_b1(b3[singular], current_yaw[singular])
+            self.yaw_singularity_count += singular
+        if near_singular.any():
+            # Aggregated warnings: one record per tick, value = worst |cos| yaw/thrust
+            self.diagnostics.record("yaw_singularity_approach", float(cos_angle.max()),
+                                    "⚠️ Approaching yaw singularity (max |cos| yaw/thrust over vehicles)")
+            if singular.any():
+                self.diagnostics.record("yaw_singularity", float(singular.sum()),
+                                        "🚨 YAW SINGULARITY DETECTED, using fallback frame (vehicles affected)")
+        b2 = np.cross(b3, b1)
+
+        # eR = ½ vee(R_desᵀ R − Rᵀ R_des), evaluated on quaternions
+        q_des = rotation_matrix_to_quaternion(np.stack((b1, b2, b3), axis=2))
+        eR = attitude_error(q_des, q)
+
+        eOmega = ang_vel.copy()
+        eOmega[:, 2] -= yaw_rate_des
+        coriolis = np.cross(ang_vel, self._inertia * ang_vel)
+        torque = -cfg.kp_att * eR - cfg.kd_att * eOmega + coriolis
+        self.unsaturated_torque = torque.copy()
+
+        torque_saturated = np.abs(torque) > self._max_torque
+        np.clip(torque, -self._max_torque, self._max_torque, out=torque)
+        self.torque_saturation_count += torque_saturated.sum(axis=1)
+        self.last_torque_saturated = torque_saturated
+        return torque
+
+    def _singular_b1(self, b3: np.ndarray, current_yaw: np.ndarray) -> np.ndarray:
+        """Safe desired x-axis for rows in yaw singularity (see ``_handle_yaw_singularity``)."""
+        method = self.config.yaw_singularity_fallback_method
+        if method == "skip_yaw":
+            vertical = np.abs(b3[:, 2]) >= 0.99
+            b1 = _project_e1(b3)
+            b1[vertical] = _E1
+            return b1
+
+        if method == "default_heading":
+            yaw = np.full(len(b3), self.config.default_heading_yaw)
+        elif method == "maintain_current":
+            yaw = current_yaw
+        else:
+            self.diagnostics.record("unknown_yaw_fallback",
+                                    message="⚠️ Unknown yaw singularity fallback method, using skip_yaw")
+            return _project_e1(b3)
+
+        heading = np.zeros((len(b3), 3))
+        heading[:, 0] = np.cos(yaw)
+        heading[:, 1] = np.sin(yaw)
+        b1 = np.cross(heading, b3)
+        b1_norm = np.linalg.norm(b1, axis=1)
+        ok = b1_norm > 1e-6
+        b1[ok] /= b1_norm[ok, None]
+        if not ok.all():
+            b1[~ok] = _project_e1(b3[~ok])
+        return b1
+
+    def _update_integral_error(self,
+                               vel_error: np.ndarray,
+                               dt: float,
+                               thrust_saturated: np.ndarray,
+                               torque_saturated: np.ndarray) -> None:
+        """Integrate velocity error with anti-windup and per-axis/norm clamping."""
+        cfg = self.config
+        update = vel_error * dt
+
+        if cfg.anti_windup_method == "clamping":
+            update[thrust_saturated] *= 0.1
+            update[torque_saturated] *= 0.1
+        elif cfg.anti_windup_method == "back_calculation":
+            Kb = cfg.back_calculation_gain
+            thrust_feedback = np.where(thrust_saturated, (self.unsaturated_thrust - cfg.max_thrust) * Kb, 0.0)
+            update -= thrust_feedback[:, None] * _BACK_CALC_THRUST_SPLIT
+            torque_feedback = (self.unsaturated_torque - self._max_torque) * Kb
+            update -= np.where(torque_saturated, torque_feedback * 0.5, 0.0)
+        else:
+            self.diagnostics.record("unknown_anti_windup", message="Unknown anti-windup method, integral not limited")
+
+        integral = self.integral_vel_error
+        integral += update
+
+        limits = np.asarray(cfg.max_integral_per_axis, dtype=float)
+        np.clip(integral, -limits, limits, out=integral)
+
+        magnitude = np.linalg.norm(integral, axis=1)
+        over = magnitude > cfg.max_integral_pos
+        if over.any():
+            integral[over] *= (cfg.max_integral_pos / magnitude[over])[:, None]
+
+        # Decay axes that are approaching their limit
+        near_limit = np.abs(integral) > limits * cfg.saturation_threshold
+        integral[near_limit] *= cfg.integral_decay_factor
+
+    def get_performance_metrics(self) -> Dict[str, Any]:
+        integral_magnitude = np.linalg.norm(self.integral_vel_error, axis=1)
+        return {
+            "num_vehicles": self.num_vehicles,
+            "anti_windup_method": self.config.anti_windup_method,
+            "max_integral_magnitude": float(integral_magnitude.max()),
+            "mean_integral_magnitude": float(integral_magnitude.mean()),
+            "thrust_saturation_count": int(self.thrust_saturation_count.sum()),
+            "torque_saturation_count": int(self.torque_saturation_count.sum()),
+            "yaw_singularity_count": int(self.yaw_singularity_count.sum()),
+        }
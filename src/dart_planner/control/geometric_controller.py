@@ -1,5 +1,7 @@
 import logging
+import math
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional, Tuple, Union
 
 import numpy as np
@@ -7,20 +9,46 @@ from pint import Quantity
 
 from dart_planner.common.types import ControlCommand, DroneState, BodyRateCommand, FastDroneState
 from dart_planner.common.logging_config import get_logger
+from dart_planner.common.hot_path_diagnostics import HotPathDiagnostics
+from dart_planner.common.quaternions import (
+    euler_to_quaternion_into,
+    frame_attitude_error_into,
+    normalize_quaternion_into,
+    quaternion_yaw,
+)
+from dart_planner.common.streaming_stats import RingBuffer, RunningStats
 from dart_planner.common.units import Q_, to_float
 from .control_config import get_controller_config, ControllerTuningProfile
 from dart_planner.common.vehicle_params import get_params, get_control_constants, load_hardware_params, compute_max_torque_xyz
 from dart_planner.common.coordinate_frames import get_coordinate_frame_manager
 
-# Load hardware parameters and compute max torque limits
-try:
-    _hardware_params = load_hardware_params()
-except Exception as e:
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.warning(f"Failed to load hardware params at import time: {e}")
-    _hardware_params = {}
-_max_torque_xyz = compute_max_torque_xyz(_hardware_params)
+
+@lru_cache(maxsize=1)
+def _default_max_torque_xyz() -> np.ndarray:
+    """Per-axis torque limits from hardware.yaml, loaded on first use."""
+    try:
+        hardware_params = load_hardware_params()
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Failed to load hardware params: {e}")
+        hardware_params = {}
+    return compute_max_torque_xyz(hardware_params)
+
+
+_BACK_CALC_THRUST_SPLIT = np.array([0.33, 0.33, 0.34])
+
+
+def _cross3(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """3-vector cross product written into ``out`` (np.cross allocates)."""
+    a0, a1, a2 = a[0], a[1], a[2]
+    b0, b1, b2 = b[0], b[1], b[2]
+    out[0] = a1 * b2 - a2 * b1
+    out[1] = a2 * b0 - a0 * b2
+    out[2] = a0 * b1 - a1 * b0
+    return out
+
+
+def _norm3(v: np.ndarray) -> float:
+    return math.sqrt(np.dot(v, v))
 
 @dataclass
 class GeometricControllerConfig:
@@ -48,7 +76,7 @@ class GeometricControllerConfig:
     # Physical inertia diagonal (kg·m²)
     inertia: np.ndarray = field(default_factory=lambda: np.array(get_params().inertia))
     # Per-axis torque limits (N·m), now auto-computed from hardware config
-    max_torque_xyz: np.ndarray = field(default_factory=lambda: _max_torque_xyz)
+    max_torque_xyz: np.ndarray = field(default_factory=lambda: _default_max_torque_xyz().copy())
     # Feedforward gains
     ff_pos: float = 1.2
     ff_vel: float = 0.8
@@ -74,6 +102,33 @@ class GeometricControllerConfig:
     yaw_singularity_fallback_method: str = "skip_yaw"  # "skip_yaw", "default_heading", or "maintain_current"
     default_heading_yaw: float = 0.0  # Default yaw angle when singularity detected (rad)
     yaw_singularity_warning_threshold: float = 0.3  # cos(angle) threshold for warning (0.3 ≈ 72°)
+    # Performance metrics: recent samples kept for percentiles (lifetime aggregates are streaming)
+    metrics_window: int = 2048
+    # Minimum interval between summary lines for per-tick warnings (s)
+    diagnostics_interval_s: float = 1.0
+
+def apply_tuning_profile(config: GeometricControllerConfig, profile_name: str, logger=None) -> None:
+    """Copy the gains and limits of a named tuning profile into ``config`` in place."""
+    logger = logger or get_logger(__name__)
+    try:
+        profile = get_controller_config(profile_name)
+        config.kp_pos = profile.kp_pos.copy()
+        config.ki_pos = profile.ki_pos.copy()
+        config.kd_pos = profile.kd_pos.copy()
+        config.kp_att = profile.kp_att.copy()
+        config.kd_att = profile.kd_att.copy()
+        config.ff_pos = profile.ff_pos
+        config.ff_vel = profile.ff_vel
+        config.max_tilt_angle = profile.max_tilt_angle
+        config.max_thrust = profile.max_thrust
+        config.min_thrust = profile.min_thrust
+        config.max_integral_pos = profile.max_integral_pos
+        config.tracking_error_threshold = profile.tracking_error_threshold
+        config.velocity_error_threshold = profile.velocity_error_threshold
+        logger.info(f"✅ Applied '{profile_name}' tuning profile: {profile.description}")
+    except ValueError as e:
+        logger.warning(f"⚠️ Failed to apply tuning profile: {e}")
+        logger.info("   Using default configuration")
 
 class GeometricController:
     """
@@ -91,9 +146,14 @@ class GeometricController:
         self.last_time = None
         # Integrates velocity error over time (∫vel_error dt) ⇒ units of metres.
         self.integral_vel_error = np.zeros(3)
-        self.position_errors = []
-        self.velocity_errors = []
-        self.control_outputs = []
+        # Bounded performance history: recent samples in rings, lifetime aggregates streaming
+        self.position_errors = RingBuffer(self.config.metrics_window)
+        self.velocity_errors = RingBuffer(self.config.metrics_window)
+        self.control_outputs = RingBuffer(self.config.metrics_window, width=4)
+        self.position_error_stats = RunningStats()
+        self.velocity_error_stats = RunningStats()
+        # Per-tick warning conditions are aggregated rather than logged individually
+        self.diagnostics = HotPathDiagnostics(__name__, interval_s=self.config.diagnostics_interval_s)
         self.failsafe_active = False
         self.failsafe_count = 0
         
@@ -124,6 +184,7 @@ class GeometricController:
         # This ensures the controller uses the provided config, not global vehicle params
         self._fast_inertia = np.diag(self.config.inertia)
         self._fast_min_thrust = self.config.min_thrust * self._fast_mass * self._fast_gravity_magnitude
+        self._init_work_buffers()
         
         self.logger.info(f"🎯 Geometric Controller initialized with '{tuning_profile}' profile")
         self.logger.info(f"   Position gains: Kp={self.config.kp_pos}, Ki={self.config.ki_pos}, Kd={self.config.kd_pos}")
@@ -137,25 +198,35 @@ class GeometricController:
         self.logger.info(f"   Yaw warning threshold: {self.config.yaw_singularity_warning_threshold:.3f}, default heading: {self.config.default_heading_yaw:.2f}rad")
 
     def _apply_tuning_profile(self, config: GeometricControllerConfig, profile_name: str):
-        try:
-            profile = get_controller_config(profile_name)
-            config.kp_pos = profile.kp_pos.copy()
-            config.ki_pos = profile.ki_pos.copy()
-            config.kd_pos = profile.kd_pos.copy()
-            config.kp_att = profile.kp_att.copy()
-            config.kd_att = profile.kd_att.copy()
-            config.ff_pos = profile.ff_pos
-            config.ff_vel = profile.ff_vel
-            config.max_tilt_angle = profile.max_tilt_angle
-            config.max_thrust = profile.max_thrust
-            config.min_thrust = profile.min_thrust
-            config.max_integral_pos = profile.max_integral_pos
-            config.tracking_error_threshold = profile.tracking_error_threshold
-            config.velocity_error_threshold = profile.velocity_error_threshold
-            self.logger.info(f"✅ Applied '{profile_name}' tuning profile: {profile.description}")
-        except ValueError as e:
-            self.logger.warning(f"⚠️ Failed to apply tuning profile: {e}")
-            self.logger.info("   Using default configuration")
+        apply_tuning_profile(config, profile_name, self.logger)
+
+    def _init_work_buffers(self) -> None:
+        """Preallocate scratch arrays so the fast control step runs without allocating."""
+        self._pos_error = np.zeros(3)
+        self._vel_error = np.zeros(3)
+        self._acc_des = np.zeros(3)
+        self._thrust_vector = np.zeros(3)
+        self._b3_des = np.zeros(3)
+        self._integral_update = np.zeros(3)
+        self._yaw_vector = np.zeros(3)
+        self._b1_des = np.zeros(3)
+        self._b2_des = np.zeros(3)
+        self._b3_unit = np.zeros(3)
+        self._q = np.zeros(4)
+        self._q_des = np.zeros(4)
+        self._eR = np.zeros(3)
+        self._eOmega = np.zeros(3)
+        self._inertia_omega = np.zeros(3)
+        self._coriolis = np.zeros(3)
+        self._vec_tmp = np.zeros(3)
+        self._torque = np.zeros(3)
+        self._torque_saturated = np.zeros(3, dtype=bool)
+
+    def _record_tracking_errors(self, pos_error_magnitude: float, vel_error_magnitude: float) -> None:
+        self.position_errors.append(pos_error_magnitude)
+        self.velocity_errors.append(vel_error_magnitude)
+        self.position_error_stats.add(pos_error_magnitude)
+        self.velocity_error_stats.add(vel_error_magnitude)
 
     def _detect_yaw_singularity(self, yaw_vector: np.ndarray, b3_des: np.ndarray) -> Tuple[bool, float, str]:
         """
@@ -176,14 +247,13 @@ class GeometricController:
         # Check for singularity (vectors nearly parallel)
         is_singular = cos_angle >= self.config.yaw_singularity_threshold
         
-        # Log warning when approaching singularity
+        # Aggregated warnings; values are |cos| between yaw and thrust axes
         if cos_angle > self.config.yaw_singularity_warning_threshold:
-            angle_deg = np.arccos(np.clip(cos_angle, 0, 1)) * 180 / np.pi
-            self.logger.warning(f"⚠️ Approaching yaw singularity: angle={angle_deg:.1f}° (cos={cos_angle:.3f})")
-            
+            self.diagnostics.record("yaw_singularity_approach", cos_angle,
+                                    "⚠️ Approaching yaw singularity (|cos| yaw/thrust)")
         if is_singular:
-            angle_deg = np.arccos(np.clip(cos_angle, 0, 1)) * 180 / np.pi
-            self.logger.warning(f"🚨 YAW SINGULARITY DETECTED: angle={angle_deg:.1f}° (cos={cos_angle:.3f})")
+            self.diagnostics.record("yaw_singularity", cos_angle,
+                                    "🚨 YAW SINGULARITY DETECTED, using fallback frame (|cos| yaw/thrust)")
             
         return is_singular, cos_angle, self.config.yaw_singularity_fallback_method
 
@@ -240,14 +310,14 @@ class GeometricController:
                 b1_des = b1_des / np.linalg.norm(b1_des)
         else:
             # Unknown method, use skip_yaw as default
-            self.logger.warning(f"⚠️ Unknown yaw singularity fallback method: {fallback_method}, using skip_yaw")
+            self.diagnostics.record("unknown_yaw_fallback",
+                                    message="⚠️ Unknown yaw singularity fallback method, using skip_yaw")
             b1_des = np.array([1.0, 0.0, 0.0]) - np.dot(np.array([1.0, 0.0, 0.0]), b3_des) * b3_des
             b1_des = b1_des / np.linalg.norm(b1_des)
             
         # Compute b2_des to complete orthonormal frame
         b2_des = np.cross(b3_des, b1_des)
         
-        self.logger.info(f"🔄 Yaw singularity handled using '{fallback_method}' method")
         return b1_des, b2_des, b3_des
 
     def compute_control_fast(
@@ -262,56 +332,56 @@ class GeometricController:
         desired_yaw: float = 0.0,
         desired_yaw_rate: float = 0.0,
         dt: float = 0.001,
+        out: Optional[np.ndarray] = None,
     ) -> Tuple[float, np.ndarray]:
         """
         Optimized control computation without pint unit conversions.
         
         All inputs are assumed to be in base SI units:
         - pos, vel, desired_pos, desired_vel: meters, m/s
-        - att, ang_vel: radians, rad/s
+        - att: ZYX Euler angles (rad) or a unit quaternion [w, x, y, z]
+        - ang_vel: rad/s
         - desired_acc: m/s²
         - desired_yaw, desired_yaw_rate: radians, rad/s
         - dt: seconds
         
+        Intermediate results are written into preallocated buffers. Pass a
+        3-element ``out`` array to receive the torque without allocating;
+        otherwise a fresh array is returned.
+        
         Returns:
             thrust: float (Newtons)
             torque: np.ndarray (N·m, 3 elements)
         """
         if dt <= 0 or dt > 0.1:
-            return float(self._fast_mass * self._fast_gravity_magnitude), np.zeros(3)
+            self._torque.fill(0.0)
+            return float(self._fast_mass * self._fast_gravity_magnitude), self._export_torque(out)
             
+        cfg = self.config
         # Position and velocity errors
-        pos_error = desired_pos - pos
-        vel_error = desired_vel - vel
+        pos_error = np.subtract(desired_pos, pos, out=self._pos_error)
+        vel_error = np.subtract(desired_vel, vel, out=self._vel_error)
         
         # Track errors for performance metrics
-        pos_error_magnitude = float(np.linalg.norm(pos_error))
-        vel_error_magnitude = float(np.linalg.norm(vel_error))
-        self.position_errors.append(pos_error_magnitude)
-        self.velocity_errors.append(vel_error_magnitude)
+        self._record_tracking_errors(_norm3(pos_error), _norm3(vel_error))
         
         # Compute desired acceleration (PID + feedforward)
-        acc_pid = (
-            self.config.kp_pos * pos_error +
-            self.config.kd_pos * vel_error +
-            self.config.ki_pos * self.integral_vel_error
-        )
-        acc_des = desired_acc + acc_pid
+        acc_des = np.multiply(cfg.kp_pos, pos_error, out=self._acc_des)
+        acc_des += np.multiply(cfg.kd_pos, vel_error, out=self._vec_tmp)
+        acc_des += np.multiply(cfg.ki_pos, self.integral_vel_error, out=self._vec_tmp)
+        acc_des += desired_acc
         
         # Compute thrust vector in world frame
-        thrust_vector_world = acc_des - self._fast_gravity_vector
-        thrust_magnitude = np.linalg.norm(thrust_vector_world)
+        thrust_vector_world = np.subtract(acc_des, self._fast_gravity_vector, out=self._thrust_vector)
+        thrust_magnitude = _norm3(thrust_vector_world)
         
         # Store unsaturated thrust for anti-windup
         self.unsaturated_thrust = thrust_magnitude
         
-        # Validate frame consistency
-        # validate_frame_consistent_operation("fast_control_gravity", self._fast_gravity_vector) # This line was removed
-        
         # Apply thrust limits and detect saturation
         thrust_saturated = False
-        if thrust_magnitude > self.config.max_thrust:
-            thrust_magnitude = self.config.max_thrust
+        if thrust_magnitude > cfg.max_thrust:
+            thrust_magnitude = cfg.max_thrust
             thrust_saturated = True
             self._thrust_saturation_count += 1
         elif thrust_magnitude < self._fast_min_thrust:
@@ -325,25 +395,33 @@ class GeometricController:
         self._update_integral_error(vel_error, dt, thrust_saturated, self.last_torque_saturated)
         
         # Compute desired body z-axis direction
+        b3_des = self._b3_des
         if thrust_magnitude > 1e-6:
-            b3_des = thrust_vector_world / thrust_magnitude
+            np.divide(thrust_vector_world, thrust_magnitude, out=b3_des)
         else:
-            b3_des = np.array([0, 0, 1])
+            b3_des[0] = 0.0
+            b3_des[1] = 0.0
+            b3_des[2] = 1.0
             
         # Check tilt angle constraint
-        tilt_angle = np.arccos(np.clip(b3_des[2], -1, 1))
-        if tilt_angle > self.config.max_tilt_angle:
-            scale_factor = np.cos(self.config.max_tilt_angle) / b3_des[2]
-            b3_des[:2] *= scale_factor
-            b3_des[2] = np.cos(self.config.max_tilt_angle)
-            b3_des = b3_des / np.linalg.norm(b3_des)
+        if math.acos(min(1.0, max(-1.0, b3_des[2]))) > cfg.max_tilt_angle:
+            cos_max_tilt = math.cos(cfg.max_tilt_angle)
+            b3_des[:2] *= cos_max_tilt / b3_des[2]
+            b3_des[2] = cos_max_tilt
+            b3_des /= _norm3(b3_des)
         
         # Geometric attitude control
-        torque = self._fast_geometric_attitude_control(
+        self._fast_geometric_attitude_control(
             att, ang_vel, b3_des, desired_yaw, desired_yaw_rate
         )
         
-        return float(thrust_magnitude), torque
+        return float(thrust_magnitude), self._export_torque(out)
+
+    def _export_torque(self, out: Optional[np.ndarray]) -> np.ndarray:
+        if out is None:
+            return self._torque.copy()
+        np.copyto(out, self._torque)
+        return out
 
     def _fast_geometric_attitude_control(
         self,
@@ -353,58 +431,84 @@ class GeometricController:
         yaw_des: float,
         yaw_rate_des: float,
     ) -> np.ndarray:
-        """Fast geometric attitude control without unit conversions."""
-        # Current rotation matrix
-        R = self._euler_to_rotation_matrix(att)
+        """
+        Fast geometric attitude control without unit conversions.
+
+        The attitude error is evaluated in quaternion form, so a quaternion
+        ``att`` needs no trigonometry at all. Returns the controller's
+        internal torque buffer, which is overwritten on the next call.
+        """
+        # Current attitude as a unit quaternion
+        q = self._q
+        if len(att) == 4:
+            normalize_quaternion_into(att, q)
+        else:
+            euler_to_quaternion_into(att, q)
         
         # Desired rotation matrix with singularity detection
-        yaw_vector = np.array([np.cos(yaw_des), np.sin(yaw_des), 0])
-        b3_des_normalized = b3_des / np.linalg.norm(b3_des)
+        yaw_vector = self._yaw_vector
+        yaw_vector[0] = math.cos(yaw_des)
+        yaw_vector[1] = math.sin(yaw_des)
+        yaw_vector[2] = 0.0
+        b3_des_normalized = np.divide(b3_des, _norm3(b3_des), out=self._b3_unit)
         
         # Detect yaw-alignment singularity
-        current_yaw = att[2] if len(att) >= 3 else 0.0  # Extract yaw from attitude
         is_singular, cos_angle, fallback_method = self._detect_yaw_singularity(yaw_vector, b3_des_normalized)
         
+        b1_des = self._b1_des
+        b2_des = self._b2_des
         if is_singular:
-            # Handle singularity using fallback method
-            b1_des, b2_des, b3_des_normalized = self._handle_yaw_singularity(
+            # Handle singularity using fallback method (rare path, may allocate)
+            current_yaw = quaternion_yaw(q) if len(att) == 4 else att[2]
+            b1_safe, b2_safe, _ = self._handle_yaw_singularity(
                 yaw_vector, b3_des_normalized, current_yaw, fallback_method
             )
+            np.copyto(b1_des, b1_safe)
+            np.copyto(b2_des, b2_safe)
         else:
             # Normal case: compute desired frame using cross product
-            b1_des = np.cross(yaw_vector, b3_des_normalized)
-            b1_des_norm = np.linalg.norm(b1_des)
+            _cross3(yaw_vector, b3_des_normalized, b1_des)
+            b1_des_norm = _norm3(b1_des)
             if b1_des_norm > 1e-6:
-                b1_des = b1_des / b1_des_norm
+                b1_des /= b1_des_norm
             else:
                 # Fallback for numerical issues
-                b1_des = np.array([1, 0, 0])
-            b2_des = np.cross(b3_des_normalized, b1_des)
+                b1_des[0] = 1.0
+                b1_des[1] = 0.0
+                b1_des[2] = 0.0
+            _cross3(b3_des_normalized, b1_des, b2_des)
             
-        R_des = np.column_stack([b1_des, b2_des, b3_des_normalized])
-        
-        # Attitude error
-        eR = 0.5 * self._vee_map(R_des.T @ R - R.T @ R_des)
+        # Attitude error eR = ½ vee(R_desᵀR − RᵀR_des) = 2 w_e v_e, q_e = q_des* ⊗ q
+        eR = frame_attitude_error_into(b1_des, b2_des, b3_des_normalized, q, self._eR, self._q_des)
         
         # Angular velocity error
-        omega_des = np.array([0, 0, yaw_rate_des])
-        eOmega = ang_vel - omega_des
+        eOmega = self._eOmega
+        np.copyto(eOmega, ang_vel)
+        eOmega[2] -= yaw_rate_des
         
         # Control law with coriolis compensation
         # Use matrix multiplication for proper inertia tensor application
-        coriolis = np.cross(ang_vel, self._fast_inertia @ ang_vel)
-        torque = -self.config.kp_att * eR - self.config.kd_att * eOmega + coriolis
+        inertia_omega = np.matmul(self._fast_inertia, ang_vel, out=self._inertia_omega)
+        coriolis = _cross3(ang_vel, inertia_omega, self._coriolis)
+        torque = np.multiply(self.config.kp_att, eR, out=self._torque)
+        np.negative(torque, out=torque)
+        torque -= np.multiply(self.config.kd_att, eOmega, out=self._vec_tmp)
+        torque += coriolis
         
         # Store unsaturated torque for anti-windup
-        self.unsaturated_torque = torque.copy()
+        np.copyto(self.unsaturated_torque, torque)
         
         # Apply torque limits and detect saturation
-        torque_saturated = np.zeros(3, dtype=bool)
+        torque_saturated = self._torque_saturated
+        max_torque = self.config.max_torque_xyz
         for i in range(3):
-            if abs(torque[i]) > self.config.max_torque_xyz[i]:
-                torque[i] = np.sign(torque[i]) * self.config.max_torque_xyz[i]
+            limit = max_torque[i]
+            if abs(torque[i]) > limit:
+                torque[i] = limit if torque[i] > 0 else -limit
                 torque_saturated[i] = True
                 self._torque_saturation_count += 1
+            else:
+                torque_saturated[i] = False
                 
         self.last_torque_saturated = torque_saturated
         
@@ -446,8 +550,7 @@ class GeometricController:
             vel_error = desired_vel_arr - vel
             pos_error_magnitude = float(np.linalg.norm(pos_error))
             vel_error_magnitude = float(np.linalg.norm(vel_error))
-            self.position_errors.append(pos_error_magnitude)
-            self.velocity_errors.append(vel_error_magnitude)
+            self._record_tracking_errors(pos_error_magnitude, vel_error_magnitude)
             
             # Compute desired acceleration (PID + feedforward)
             acc_pid = (
@@ -502,7 +605,7 @@ class GeometricController:
                 thrust_magnitude,
                 float(dt),
             )
-            self.control_outputs.append([thrust_cmd, *torque_cmd])
+            self.control_outputs.append((thrust_cmd, *torque_cmd))
             self.last_valid_thrust = thrust_cmd
             self.failsafe_active = False
             self.failsafe_count = 0
@@ -547,7 +650,7 @@ class GeometricController:
             torque_saturated = np.array([False, False, False])
             
         # Basic integration
-        integral_update = vel_error * dt
+        integral_update = np.multiply(vel_error, dt, out=self._integral_update)
         
         # Apply anti-windup based on method
         if self.config.anti_windup_method == "clamping":
@@ -555,7 +658,7 @@ class GeometricController:
         elif self.config.anti_windup_method == "back_calculation":
             integral_update = self._back_calculation_anti_windup(integral_update, thrust_saturated, torque_saturated)
         else:
-            self.logger.warning(f"Unknown anti-windup method: {self.config.anti_windup_method}")
+            self.diagnostics.record("unknown_anti_windup", message="Unknown anti-windup method, integral not limited")
             
         # Update integral with anti-windup protection
         self.integral_vel_error += integral_update
@@ -594,7 +697,7 @@ class GeometricController:
         if thrust_saturated:
             thrust_feedback = (self.unsaturated_thrust - self.config.max_thrust) * Kb
             # Distribute thrust feedback across all axes (thrust affects all position axes)
-            integral_update -= thrust_feedback * np.array([0.33, 0.33, 0.34])
+            integral_update -= np.multiply(_BACK_CALC_THRUST_SPLIT, thrust_feedback, out=self._vec_tmp)
             
         # Calculate saturation feedback for torque (affects attitude, which affects position)
         for i in range(3):
@@ -615,7 +718,7 @@ class GeometricController:
                 self.integral_vel_error[i] = np.sign(self.integral_vel_error[i]) * max_integral_per_axis[i]
                 
         # Also apply norm-based clamping as backup
-        integral_magnitude = np.linalg.norm(self.integral_vel_error)
+        integral_magnitude = _norm3(self.integral_vel_error)
         if integral_magnitude > self.config.max_integral_pos:
             self.integral_vel_error *= (self.config.max_integral_pos / integral_magnitude)
             
@@ -754,10 +857,12 @@ class GeometricController:
             thrust: Thrust command (N)
             torque: Torque command (N·m)
         """
+        # Euler attitude goes straight through unless an estimator supplied a quaternion
+        attitude = fast_state.attitude if fast_state.quaternion is None else fast_state.quaternion
         return self.compute_control_fast(
             fast_state.position,
             fast_state.velocity,
-            fast_state.attitude,
+            attitude,
             fast_state.angular_velocity,
             desired_pos,
             desired_vel,
@@ -767,34 +872,44 @@ class GeometricController:
             dt,
         )
 
-    def _euler_to_rotation_matrix(self, euler: np.ndarray) -> np.ndarray:
+    def _euler_to_rotation_matrix(self, euler: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         if len(euler) == 4:
-            return self._quaternion_to_rotation_matrix(euler)
+            return self._quaternion_to_rotation_matrix(euler, out)
+        R = np.empty((3, 3)) if out is None else out
         roll, pitch, yaw = euler
-        cr, sr = np.cos(roll), np.sin(roll)
-        cp, sp = np.cos(pitch), np.sin(pitch)
-        cy, sy = np.cos(yaw), np.sin(yaw)
-        R = np.array(
-            [
-                [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
-                [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
-                [-sp, cp * sr, cp * cr],
-            ]
-        )
+        cr, sr = math.cos(roll), math.sin(roll)
+        cp, sp = math.cos(pitch), math.sin(pitch)
+        cy, sy = math.cos(yaw), math.sin(yaw)
+        R[0, 0] = cy * cp
+        R[0, 1] = cy * sp * sr - sy * cr
+        R[0, 2] = cy * sp * cr + sy * sr
+        R[1, 0] = sy * cp
+        R[1, 1] = sy * sp * sr + cy * cr
+        R[1, 2] = sy * sp * cr - cy * sr
+        R[2, 0] = -sp
+        R[2, 1] = cp * sr
+        R[2, 2] = cp * cr
         return R
 
-    def _quaternion_to_rotation_matrix(self, quat: np.ndarray) -> np.ndarray:
+    def _quaternion_to_rotation_matrix(self, quat: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        R = np.empty((3, 3)) if out is None else out
         w, x, y, z = quat
-        norm = np.sqrt(w*w + x*x + y*y + z*z)
+        norm = math.sqrt(w*w + x*x + y*y + z*z)
         if norm > 1e-6:
             w, x, y, z = w/norm, x/norm, y/norm, z/norm
         else:
-            return np.eye(3)
-        R = np.array([
-            [1 - 2*(y*y + z*z), 2*(x*y - w*z), 2*(x*z + w*y)],
-            [2*(x*y + w*z), 1 - 2*(x*x + z*z), 2*(y*z - w*x)],
-            [2*(x*z - w*y), 2*(y*z + w*x), 1 - 2*(x*x + y*y)]
-        ])
+            R[...] = 0.0
+            R[0, 0] = R[1, 1] = R[2, 2] = 1.0
+            return R
+        R[0, 0] = 1 - 2*(y*y + z*z)
+        R[0, 1] = 2*(x*y - w*z)
+        R[0, 2] = 2*(x*z + w*y)
+        R[1, 0] = 2*(x*y + w*z)
+        R[1, 1] = 1 - 2*(x*x + z*z)
+        R[1, 2] = 2*(y*z - w*x)
+        R[2, 0] = 2*(x*z - w*y)
+        R[2, 1] = 2*(y*z + w*x)
+        R[2, 2] = 1 - 2*(x*x + y*y)
         return R
 
     def _vee_map(self, skew_matrix: np.ndarray) -> np.ndarray:
@@ -822,13 +937,15 @@ class GeometricController:
         metrics = {}
         
         # Add basic metrics if available
-        if self.position_errors:
+        if self.position_error_stats.count:
             metrics.update({
-                "mean_position_error": np.mean(self.position_errors),
-                "max_position_error": np.max(self.position_errors),
-                "mean_velocity_error": np.mean(self.velocity_errors),
+                "mean_position_error": self.position_error_stats.mean,
+                "max_position_error": self.position_error_stats.max,
+                "p95_position_error": float(np.percentile(self.position_errors.to_array(), 95)),
+                "mean_velocity_error": self.velocity_error_stats.mean,
+                "max_velocity_error": self.velocity_error_stats.max,
                 "failsafe_activations": self.failsafe_count,
-                "total_samples": len(self.position_errors),
+                "total_samples": self.position_error_stats.count,
             })
         
         # Add anti-windup metrics
@@ -846,6 +963,7 @@ class GeometricController:
             "yaw_singularity_threshold": self.config.yaw_singularity_threshold,
             "yaw_singularity_fallback_method": self.config.yaw_singularity_fallback_method,
             "yaw_singularity_warning_threshold": self.config.yaw_singularity_warning_threshold,
+            "yaw_singularity_count": self.diagnostics.count("yaw_singularity"),
         })
             
         return metrics
@@ -853,9 +971,11 @@ class GeometricController:
     def reset(self):
         self.last_time = None
         self.integral_vel_error = np.zeros(3)
-        self.position_errors = []
-        self.velocity_errors = []
-        self.control_outputs = []
+        self.position_errors.clear()
+        self.velocity_errors.clear()
+        self.control_outputs.clear()
+        self.position_error_stats.reset()
+        self.velocity_error_stats.reset()
         self.failsafe_active = False
         self.failsafe_count = 0
         self.last_valid_thrust = self.config.mass * self.config.gravity
@@ -867,6 +987,8 @@ class GeometricController:
         self.unsaturated_torque = np.zeros(3)
         self._thrust_saturation_count = 0
         self._torque_saturation_count = 0
+        self.diagnostics.flush()
+        self.diagnostics.reset()
         
         self.logger.info("🔄 Controller reset completed")
 
@@ -1,11 +1,16 @@
-import time
 import logging
+from functools import cached_property
+
 import numpy as np
 from typing import Tuple, Optional
-from scipy import signal  # Add for filtering
 
 from dart_planner.common.types import DroneState, Trajectory
 from dart_planner.common.logging_config import get_logger
+from dart_planner.common.clock import Clock, get_clock
+from dart_planner.common.errors import ValidationError
+from dart_planner.common.piecewise_trajectory import INTERPOLATIONS, PiecewiseTrajectory
+
+_MOTION_FIELDS = ("positions", "velocities", "accelerations")
 
 
 class TrajectorySmoother:
@@ -14,9 +19,19 @@ class TrajectorySmoother:
     
     This module smooths trajectory commands to prevent aggressive maneuvers
     that can cause large tracking errors, especially during transitions.
+
+    ``interpolation`` selects how trajectory samples are blended:
+    ``"linear"`` (default) blends position, velocity and acceleration
+    independently; ``"hermite"`` fits position through the velocity and
+    acceleration samples so the three stay consistent.
     """
 
-    def __init__(self, transition_time: float = 0.5, smoothing_factor: float = 0.8):
+    def __init__(self, transition_time: float = 0.5, smoothing_factor: float = 0.8,
+                 clock: Optional[Clock] = None, interpolation: str = "linear"):
+        if interpolation not in INTERPOLATIONS:
+            raise ValidationError(f"Unknown trajectory interpolation '{interpolation}'")
+        self.clock = clock or get_clock()
+        self.interpolation = interpolation
         self.transition_time = transition_time
         self.smoothing_factor = smoothing_factor  # 0-1, higher = more smoothing
         
@@ -27,6 +42,7 @@ class TrajectorySmoother:
         
         # State tracking
         self.current_trajectory: Optional[Trajectory] = None
+        self._compiled_trajectory: Optional[PiecewiseTrajectory] = None
         self.last_cloud_update = 0.0
         self.trajectory_start_time = 0.0
         
@@ -38,9 +54,8 @@ class TrajectorySmoother:
         self.transition_target_pos = np.zeros(3)
         self.transition_target_vel = np.zeros(3)
         
-        # Enhanced filtering for tracking error reduction
-        self.position_filter = self._create_butterworth_filter()
-        self.velocity_filter = self._create_butterworth_filter()
+        # Enhanced filtering for tracking error reduction (position_filter and
+        # velocity_filter are designed on first access)
         self.last_filtered_pos = np.zeros(3)
         self.last_filtered_vel = np.zeros(3)
         self.last_filtered_acc = np.zeros(3)
@@ -53,8 +68,19 @@ class TrajectorySmoother:
         self.logger.info(f"   Velocity limit: {self.velocity_limit} m/s")
         self.logger.info(f"   Acceleration limit: {self.acceleration_limit} m/s²")
 
+    @cached_property
+    def position_filter(self):
+        return self._create_butterworth_filter()
+
+    @cached_property
+    def velocity_filter(self):
+        return self._create_butterworth_filter()
+
     def _create_butterworth_filter(self, cutoff_freq: float = 2.0, order: int = 2):
         """Create Butterworth low-pass filter to smooth trajectory commands"""
+        # scipy.signal is slow to import; filters are designed on first use
+        from scipy import signal
+
         # Normalize frequency for digital filter (assuming 100Hz update rate)
         nyquist = 50.0  # Half of 100Hz
         normalized_cutoff = cutoff_freq / nyquist
@@ -119,12 +145,13 @@ class TrajectorySmoother:
         This method smoothly transitions from the current motion to the new trajectory
         to avoid discontinuities that cause control instabilities.
         """
-        current_time = time.time()
+        current_time = self.clock.time()
         self.last_cloud_update = current_time
 
         if self.current_trajectory is None:
             # First trajectory - no transition needed
             self.current_trajectory = new_trajectory
+            self._compiled_trajectory = self._compile(new_trajectory)
             self.trajectory_start_time = current_time
             self.in_transition = False
             self.logger.info("First trajectory received from cloud")
@@ -139,7 +166,8 @@ class TrajectorySmoother:
             current_time, self.current_trajectory, self.trajectory_start_time
         )
 
-        # Get target state from new trajectory
+        # Get target state from new trajectory (compiled once here, on receipt)
+        self._compiled_trajectory = self._compile(new_trajectory)
         new_start_pos, new_start_vel, new_start_acc = self._interpolate_trajectory(
             current_time, new_trajectory, current_time
         )
@@ -212,70 +240,35 @@ class TrajectorySmoother:
             # No trajectory available - hover
             return current_state.position, np.zeros(3), np.zeros(3)
 
+    def invalidate_trajectory(self) -> None:
+        """Recompile the current trajectory after its arrays were edited in place."""
+        if self._compiled_trajectory is not None:
+            self._compiled_trajectory.invalidate()
+        if self.current_trajectory is not None:
+            self._compiled_trajectory = self._compile(self.current_trajectory)
+
+    def _compile(self, trajectory: Trajectory) -> Optional[PiecewiseTrajectory]:
+        """Piecewise-polynomial form of a trajectory, reusing the current one."""
+        compiled = self._compiled_trajectory
+        if compiled is not None and compiled.compiles(trajectory):
+            return compiled
+        if len(trajectory.timestamps) == 0:
+            return None
+        return PiecewiseTrajectory.from_trajectory(trajectory, fields=_MOTION_FIELDS,
+                                                   interpolation=self.interpolation)
+
     def _interpolate_trajectory(
         self, current_time: float, trajectory: Trajectory, start_time: float
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Interpolate trajectory at given time."""
-        trajectory_time = current_time - start_time
-
-        if len(trajectory.timestamps) == 0:
+        compiled = self._compile(trajectory)
+        if compiled is None:
             return np.zeros(3), np.zeros(3), np.zeros(3)
+        if trajectory is self.current_trajectory:
+            self._compiled_trajectory = compiled
 
-        # Adjust trajectory timestamps to start from trajectory_time = 0
-        traj_times = trajectory.timestamps - trajectory.timestamps[0]
-
-        # Find interpolation indices
-        if trajectory_time <= traj_times[0]:
-            idx = 0
-            pos = trajectory.positions[0]
-            vel = (
-                trajectory.velocities[0]
-                if trajectory.velocities is not None
-                else np.zeros(3)
-            )
-            acc = (
-                trajectory.accelerations[0]
-                if trajectory.accelerations is not None
-                else np.zeros(3)
-            )
-        elif trajectory_time >= traj_times[-1]:
-            idx = len(traj_times) - 1
-            pos = trajectory.positions[-1]
-            vel = (
-                trajectory.velocities[-1]
-                if trajectory.velocities is not None
-                else np.zeros(3)
-            )
-            acc = (
-                trajectory.accelerations[-1]
-                if trajectory.accelerations is not None
-                else np.zeros(3)
-            )
-        else:
-            # Linear interpolation
-            idx = np.searchsorted(traj_times, trajectory_time) - 1
-            t1, t2 = traj_times[idx], traj_times[idx + 1]
-            alpha = (trajectory_time - t1) / (t2 - t1)
-
-            pos = (1 - alpha) * trajectory.positions[
-                idx
-            ] + alpha * trajectory.positions[idx + 1]
-
-            if trajectory.velocities is not None:
-                vel = (1 - alpha) * trajectory.velocities[
-                    idx
-                ] + alpha * trajectory.velocities[idx + 1]
-            else:
-                vel = np.zeros(3)
-
-            if trajectory.accelerations is not None:
-                acc = (1 - alpha) * trajectory.accelerations[
-                    idx
-                ] + alpha * trajectory.accelerations[idx + 1]
-            else:
-                acc = np.zeros(3)
-
-        return pos, vel, acc
+        # Trajectory time runs from the moment the trajectory was received
+        return compiled.sample_motion(compiled.start_time + current_time - start_time)
 
     def _generate_transition_state(
         self, progress: float
@@ -341,7 +334,7 @@ class TrajectorySmoother:
         """Check if current trajectory is valid and recent."""
         return (
             self.current_trajectory is not None
-            and time.time() - self.last_cloud_update < 2.0
+            and self.clock.time() - self.last_cloud_update < 2.0
         )
 
     def get_status(self) -> dict:
@@ -349,6 +342,6 @@ class TrajectorySmoother:
         return {
             "has_trajectory": self.current_trajectory is not None,
             "in_transition": self.in_transition,
-            "last_update_age": time.time() - self.last_cloud_update,
+            "last_update_age": self.clock.time() - self.last_cloud_update,
             "trajectory_valid": self.is_trajectory_valid(),
         }
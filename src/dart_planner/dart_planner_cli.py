@@ -1,22 +1,25 @@
 import argparse
 import os
 import sys
-from .config.frozen_config import get_frozen_config
-
-# Import main entry points
-from dart_planner.cloud.main import main as cloud_main
-from dart_planner.edge.main import main as edge_main
 
 def run(mode: str):
+    # Configuration and the cloud/edge stacks are imported only for the
+    # mode being run, so the CLI itself starts quickly
+    from .config.frozen_config import get_frozen_config
+
     config = get_frozen_config()
     print(f"Loaded config: {config}")
     if mode == "cloud":
         print("[DART-Planner] Running in CLOUD mode.")
         # cloud_main is async
         import asyncio
+        from dart_planner.cloud.main import main as cloud_main
+
         asyncio.run(cloud_main())
     elif mode == "edge":
         print("[DART-Planner] Running in EDGE mode.")
+        from dart_planner.edge.main import main as edge_main
+
         edge_main()
     else:
         print(f"Unknown mode: {mode}. Must be 'cloud' or 'edge'.")
@@ -34,7 +37,29 @@ def main():
         help="Which mode to run: cloud or edge",
     )
 
-    args = parser.parse_args()
+    # Campaign and import-time options are parsed by their own runners
+    subparsers.add_parser(
+        "campaign",
+        help="Run a Monte Carlo simulation campaign (see 'campaign --help')",
+        add_help=False,
+    )
+
+    subparsers.add_parser(
+        "import-time",
+        help="Report per-module import cost against startup budgets (see 'import-time --help')",
+        add_help=False,
+    )
+
+    args, extra = parser.parse_known_args()
+
+    if args.command == "campaign":
+        from dart_planner.utils.monte_carlo_campaign import main as campaign_main
+        sys.exit(campaign_main(extra))
+    if args.command == "import-time":
+        from dart_planner.utils.import_time import main as import_time_main
+        sys.exit(import_time_main(extra))
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
 
     if args.command == "run":
         run(args.mode)
@@ -2,7 +2,6 @@ import asyncio
 import time
 import logging
 import numpy as np
-import csv
 from typing import Optional
 
 from dart_planner.common.di_container_v2 import get_container
@@ -13,9 +12,11 @@ from dart_planner.control.trajectory_smoother import TrajectorySmoother
 from dart_planner.communication.zmq_client import ZmqClient
 from dart_planner.utils.drone_simulator import DroneSimulator
 from dart_planner.common.logging_config import get_logger
+from dart_planner.common.clock import Clock, get_clock
+from dart_planner.common.flight_recorder import FlightRecorder
 
 
-async def main_improved(duration: Optional[float] = 30.0):
+async def main_improved(duration: Optional[float] = 30.0, clock: Optional[Clock] = None):
     """
     Improved edge node main loop implementing proper distributed architecture.
 
@@ -25,7 +26,11 @@ async def main_improved(duration: Optional[float] = 30.0):
     - Robust communication handling with failsafes
     - Clean separation between planning (cloud) and control (edge)
     - Proper real-time timing using TimingManager
+
+    Pass a VirtualClock (or run under ``run_virtual``) to fly the loop in
+    simulated time.
     """
+    clock = clock or get_clock()
     logger = get_logger(__name__)
     logger.info("=== Improved Distributed Edge Controller ===")
 
@@ -66,25 +71,30 @@ async def main_improved(duration: Optional[float] = 30.0):
     state_buffer = create_drone_state_buffer(buffer_size=10)
     
     # Initialize state
-    current_state = DroneState(timestamp=time.time())
+    current_state = DroneState(timestamp=clock.time())
     state_buffer.update_state(current_state, "initialization")
     geometric_controller.reset()
 
-    # Logging for analysis
-    log_data = []
+    # Flight data for analysis: a memory-mapped ring that survives crashes
+    log_filename = f"improved_trajectory_log_{int(time.time())}.fdr"
+    capacity = int(duration * timing_config.control_frequency * 1.1) + 1000 if duration else 600_000
+    recorder = FlightRecorder(log_filename, capacity=capacity,
+                              metadata={"source": "edge.main_improved",
+                                        "control_frequency_hz": timing_config.control_frequency})
 
     # Timing management
     last_comm_time = 0.0
     loop_count = 0
+    previous_loop_start = None
 
     try:
         logger.info(f"Starting improved edge controller for {duration}s")
         logger.info(f"Control frequency: {timing_config.control_frequency}Hz, Communication: {timing_config.planning_frequency}Hz")
 
-        sim_start_time = time.time()
+        sim_start_time = clock.time()
 
         while True:
-            loop_start_time = time.time()
+            loop_start_time = clock.time()
             current_time = loop_start_time
             current_state.timestamp = current_time
 
@@ -155,18 +165,19 @@ async def main_improved(duration: Optional[float] = 30.0):
             state_buffer.update_state(current_state, "simulation")
 
             # === LOGGING ===
-            log_data.append(
-                [
-                    current_state.timestamp,
-                    *current_state.position,
-                    *desired_pos,
-                    *current_state.velocity,
-                    *desired_vel,
-                    control_command.thrust,
-                    np.linalg.norm(control_command.torque),
-                    geometric_controller.failsafe_active,
-                ]
+            recorder.record_control_step(
+                current_state.timestamp,
+                current_state,
+                desired_pos,
+                desired_vel,
+                desired_acc,
+                control_command.thrust,
+                control_command.torque,
+                loop_time_s=0.0 if previous_loop_start is None else loop_start_time - previous_loop_start,
+                compute_time_s=clock.time() - loop_start_time,
+                failsafe_active=geometric_controller.failsafe_active,
             )
+            previous_loop_start = loop_start_time
 
             # Status updates every 100 cycles (0.1s)
             if loop_count % 100 == 0:
@@ -179,13 +190,11 @@ async def main_improved(duration: Optional[float] = 30.0):
                 )
 
             # === TIMING CONTROL ===
-            elapsed_time = time.time() - loop_start_time
+            elapsed_time = clock.time() - loop_start_time
             sleep_time = control_dt - elapsed_time
 
             if sleep_time > 0:
-                # Use quartic scheduler for precise timing
-                from dart_planner.common.timing_utils import high_res_sleep
-                await high_res_sleep(sleep_time)
+                await clock.sleep(sleep_time)
             elif elapsed_time > control_dt * 1.5:
                 logger.warning(f"Warning: Control loop overrun: {elapsed_time*1000:.1f}ms")
 
@@ -196,42 +205,19 @@ async def main_improved(duration: Optional[float] = 30.0):
 
     finally:
         # === SAVE RESULTS ===
-        log_filename = f"improved_trajectory_log_{int(time.time())}.csv"
-        with open(log_filename, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    "timestamp",
-                    "actual_x",
-                    "actual_y",
-                    "actual_z",
-                    "desired_x",
-                    "desired_y",
-                    "desired_z",
-                    "actual_vx",
-                    "actual_vy",
-                    "actual_vz",
-                    "desired_vx",
-                    "desired_vy",
-                    "desired_vz",
-                    "thrust",
-                    "torque_norm",
-                    "failsafe_active",
-                ]
-            )
-            writer.writerows(log_data)
-
-        logger.info(f"Improved log data saved to {log_filename}")
+        failsafe_activations = int(recorder.read()["failsafe_active"].sum())
+        recorder.close()
+        logger.info(f"Improved flight data saved to {log_filename} (load with load_flight_record)")
 
         # Performance summary
-        total_time = time.time() - sim_start_time
+        total_time = clock.time() - sim_start_time
         actual_frequency = loop_count / total_time
         logger.info(f"\nPerformance Summary:")
         logger.info(f"Total runtime: {total_time:.2f}s")
         logger.info(f"Control loops: {loop_count}")
         logger.info(f"Actual frequency: {actual_frequency:.1f}Hz (target: {timing_config.control_frequency}Hz)")
         logger.info(
-            f"Geometric controller failsafe activations: {sum(row[-1] for row in log_data)}"
+            f"Geometric controller failsafe activations: {failsafe_activations}"
         )
 
         # Cleanup
@@ -13,7 +13,6 @@ Features:
 """
 
 import asyncio
-import csv
 import time
 import numpy as np
 from typing import Optional
@@ -22,6 +21,7 @@ import matplotlib.pyplot as plt
 
 from dart_planner.common.config import get_config
 from dart_planner.common.di_container_v2 import get_container
+from dart_planner.common.flight_recorder import FlightRecorder
 from dart_planner.common.types import DroneState
 from dart_planner.common.logging_config import get_logger
 from dart_planner.utils.drone_simulator import DroneSimulator
@@ -30,15 +30,19 @@ from dart_planner.common.quartic_scheduler import (
     quartic_scheduler_context
 )
 from dart_planner.common.real_time_config import TaskPriority
+from dart_planner.common.clock import Clock, get_clock
 
 
-async def main_quartic_improved(duration: Optional[float] = 30.0):
+async def main_quartic_improved(duration: Optional[float] = 30.0, clock: Optional[Clock] = None):
     """
     Main function for improved edge controller with quartic scheduler.
     
     This version uses the quartic cooperative real-time scheduler to provide
     precise timing for hard real-time tasks like 400 Hz control loops.
+    Pass a VirtualClock (or run under ``run_virtual``) to fly the loop in
+    simulated time.
     """
+    clock = clock or get_clock()
     logger = get_logger(__name__)
 
     # === CONFIGURATION ===
@@ -65,26 +69,31 @@ async def main_quartic_improved(duration: Optional[float] = 30.0):
     state_buffer = create_drone_state_buffer(buffer_size=10)
     
     # Initialize state
-    current_state = DroneState(timestamp=time.time())
+    current_state = DroneState(timestamp=clock.time())
     state_buffer.update_state(current_state, "initialization")
     geometric_controller.reset()
 
-    # Logging for analysis
-    log_data = []
-    sim_start_time = time.time()
+    # Flight data for analysis: a memory-mapped ring that survives crashes
+    log_filename = f"quartic_improved_trajectory_log_{int(time.time())}.fdr"
+    capacity = int(duration * control_frequency * 1.1) + 1000 if duration else 600_000
+    recorder = FlightRecorder(log_filename, capacity=capacity,
+                              metadata={"source": "edge.main_quartic_improved",
+                                        "control_frequency_hz": control_frequency})
+    previous_step_start = None
+    sim_start_time = clock.time()
 
     # === QUARTIC SCHEDULER SETUP ===
     logger.info(f"Starting quartic scheduler improved edge controller for {duration}s")
     logger.info(f"Control frequency: {control_frequency}Hz, Planning: {planning_frequency}Hz")
 
-    async with quartic_scheduler_context(enable_monitoring=True, max_jitter_ms=1.0) as scheduler:
+    async with quartic_scheduler_context(enable_monitoring=True, max_jitter_ms=1.0, clock=clock) as scheduler:
         
         # === CONTROL TASK (400 Hz) ===
         def control_step():
             """High-frequency control step."""
-            nonlocal current_state, log_data
+            nonlocal current_state, previous_step_start
             
-            current_time = time.time()
+            current_time = clock.time()
             current_state.timestamp = current_time
 
             # Get desired state from trajectory smoother
@@ -120,21 +129,22 @@ async def main_quartic_improved(duration: Optional[float] = 30.0):
             state_buffer.update_state(current_state, "control")
 
             # Logging
-            log_data.append(
-                [
-                    current_state.timestamp,
-                    *current_state.position,
-                    *desired_pos,
-                    *current_state.velocity,
-                    *desired_vel,
-                    control_command.thrust,
-                    np.linalg.norm(control_command.torque),
-                    geometric_controller.failsafe_active,
-                ]
+            recorder.record_control_step(
+                current_state.timestamp,
+                current_state,
+                desired_pos,
+                desired_vel,
+                desired_acc,
+                control_command.thrust,
+                control_command.torque,
+                loop_time_s=0.0 if previous_step_start is None else current_time - previous_step_start,
+                compute_time_s=clock.time() - current_time,
+                failsafe_active=geometric_controller.failsafe_active,
             )
+            previous_step_start = current_time
 
             # Status updates every 400 cycles (1 second at 400Hz)
-            if len(log_data) % 400 == 0:
+            if recorder.count % 400 == 0:
                 pos_error = np.linalg.norm(current_state.position - desired_pos)
                 vel_error = np.linalg.norm(current_state.velocity - desired_vel)
                 logger.info(
@@ -148,7 +158,7 @@ async def main_quartic_improved(duration: Optional[float] = 30.0):
             """Medium-frequency planning step."""
             nonlocal current_state
             
-            current_time = time.time()
+            current_time = clock.time()
             
             logger.info(f"\n--- Planning Cycle @ {current_time:.2f}s ---")
 
@@ -192,46 +202,24 @@ async def main_quartic_improved(duration: Optional[float] = 30.0):
         
         # Run for specified duration
         try:
-            await asyncio.sleep(duration)
+            await clock.sleep(duration)
         except KeyboardInterrupt:
             logger.info("\nShutting down quartic scheduler improved edge controller.")
 
     # === SAVE RESULTS ===
-    log_filename = f"quartic_improved_trajectory_log_{int(time.time())}.csv"
-    with open(log_filename, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "timestamp",
-                "actual_x",
-                "actual_y",
-                "actual_z",
-                "desired_x",
-                "desired_y",
-                "desired_z",
-                "actual_vx",
-                "actual_vy",
-                "actual_vz",
-                "desired_vx",
-                "desired_vy",
-                "desired_vz",
-                "thrust",
-                "torque_norm",
-                "failsafe_active",
-            ]
-        )
-        writer.writerows(log_data)
-
-    logger.info(f"Quartic improved log data saved to {log_filename}")
+    flight_data = recorder.read()
+    control_loops = recorder.count
+    recorder.close()
+    logger.info(f"Quartic improved flight data saved to {log_filename} (load with load_flight_record)")
 
     # === PERFORMANCE SUMMARY ===
-    total_time = time.time() - sim_start_time
+    total_time = clock.time() - sim_start_time
     logger.info(f"\nQuartic Scheduler Performance Summary:")
     logger.info(f"Total runtime: {total_time:.2f}s")
-    logger.info(f"Control loops: {len(log_data)}")
-    logger.info(f"Actual frequency: {len(log_data)/total_time:.1f}Hz (target: {control_frequency}Hz)")
+    logger.info(f"Control loops: {control_loops}")
+    logger.info(f"Actual frequency: {control_loops/total_time:.1f}Hz (target: {control_frequency}Hz)")
     logger.info(
-        f"Geometric controller failsafe activations: {sum(row[-1] for row in log_data)}"
+        f"Geometric controller failsafe activations: {int(flight_data['failsafe_active'].sum())}"
     )
 
     # Generate jitter analysis
@@ -239,10 +227,9 @@ async def main_quartic_improved(duration: Optional[float] = 30.0):
     results_dir.mkdir(parents=True, exist_ok=True)
     
     # Note: We can't access the scheduler here since it's closed, but we can
-    # analyze the log data for timing patterns
-    if len(log_data) > 1:
-        timestamps = [row[0] for row in log_data]
-        intervals = np.diff(timestamps)
+    # analyze the flight data for timing patterns
+    if len(flight_data) > 1:
+        intervals = np.diff(flight_data["timestamp"])
         expected_interval = 1.0 / control_frequency
         
         jitter_ms = (intervals - expected_interval) * 1000.0
@@ -5,15 +5,7 @@ This module provides interfaces to various hardware platforms and simulators
 for the DART-Planner system.
 """
 
-try:
-    from .airsim_interface import AirSimDroneInterface, AirSimState, AirSimClient
-    from .state import AirSimConfig, AirSimStateManager
-    from .connection import AirSimConnection
-    from .safety import AirSimSafetyManager
-    from .metrics import AirSimMetricsManager
-    from .simulated_vehicle_io import SimulatedVehicleIO
-except ImportError:
-    print("AirSim dependencies not found. AirSim interfaces will not be available.")
+from dart_planner.common.lazy_imports import lazy_exports
 
 __all__ = [
     # Main interface
@@ -34,4 +26,18 @@ __all__ = [
     # Type aliases
     "AirSimState",
     "AirSimClient",
-] 
+]
+
+# AirSim and its client libraries are imported only when one of these names
+# is used; a missing dependency surfaces as an ImportError at that point.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AirSimDroneInterface": "airsim_interface",
+    "AirSimState": "airsim_interface",
+    "AirSimClient": "airsim_interface",
+    "AirSimConfig": "state",
+    "AirSimStateManager": "state",
+    "AirSimConnection": "connection",
+    "AirSimSafetyManager": "safety",
+    "AirSimMetricsManager": "metrics",
+    "SimulatedVehicleIO": "simulated_vehicle_io",
+})
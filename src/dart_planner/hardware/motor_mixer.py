@@ -24,6 +24,7 @@ import logging
 
 from .motor_model import MotorModel, QuadraticMotorModel, create_default_motor_model
 from ..common.units import Q_, Quantity, ensure_units
+from ..common.hot_path_diagnostics import HotPathDiagnostics
 
 logger = logging.getLogger(__name__)
 
@@ -143,6 +144,8 @@ class MotorMixer:
         # Performance tracking
         self.saturation_events = 0
         self.last_motor_commands = np.zeros(4)
+        # Per-command warnings are aggregated into periodic summaries
+        self.diagnostics = HotPathDiagnostics(__name__)
         
         # Validate configuration
         validation_issues = self.validate_configuration()
@@ -185,7 +188,7 @@ class MotorMixer:
         
         # Validate input units (thrust should be positive, torque can be negative)
         if thrust < 0:
-            logger.warning(f"Negative thrust command: {thrust} N - clamping to zero")
+            self.diagnostics.record("negative_thrust", thrust, "Negative thrust command clamped to zero (N)")
             thrust = 0.0
         
         # Construct command vector [thrust, τx, τy, τz] in SI units
@@ -203,8 +206,10 @@ class MotorMixer:
 
         # Check for pre-clip overrun ( >110% of max )
         overrun_limit = self.config.pwm_max * 1.1
-        if np.any(motor_pwms > overrun_limit):
-            logger.warning("Motor PWM exceeds 110% of max before clipping – command will be saturated")
+        peak_pwm = motor_pwms.max()
+        if peak_pwm > overrun_limit:
+            self.diagnostics.record("pwm_overrun", peak_pwm,
+                                    "Motor PWM exceeds 110% of max before clipping – command saturated (peak PWM)")
 
         # Apply saturation and anti-windup
         motor_pwms_saturated = self._saturate_pwm(motor_pwms)
@@ -212,11 +217,13 @@ class MotorMixer:
         # Track saturation events
         if not np.allclose(motor_pwms, motor_pwms_saturated, rtol=1e-6):
             self.saturation_events += 1
-            logger.debug(f"Motor saturation event {self.saturation_events}")
+            self.diagnostics.record("saturation", message="Motor saturation events", level=logging.DEBUG)
 
         # Detect impossible idle saturation when non-trivial thrust requested
         if (motor_pwms_saturated == self.config.pwm_idle).all() and thrust > 0.2:
-            logger.error("All motors at idle despite positive thrust request – possible actuator fault")
+            self.diagnostics.record("idle_with_thrust", thrust,
+                                    "All motors at idle despite positive thrust request – possible actuator fault (N)",
+                                    level=logging.ERROR)
 
         self.last_motor_commands = motor_pwms_saturated
         return motor_pwms_saturated
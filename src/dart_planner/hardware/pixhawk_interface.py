@@ -14,6 +14,8 @@ import numpy as np
 from pymavlink import mavutil  # type: ignore
 
 from dart_planner.common.types import ControlCommand, DroneState, Trajectory, BodyRateCommand
+from dart_planner.common.piecewise_trajectory import PiecewiseTrajectory
+from dart_planner.common.units import tag_units
 from dart_planner.control.geometric_controller import GeometricController
 from dart_planner.planning.se3_mpc_planner import SE3MPCConfig, SE3MPCPlanner
 from dart_planner.common.logging_config import get_logger
@@ -73,6 +75,7 @@ class PixhawkInterface:
         self.planner = SE3MPCPlanner(planner_config)
         self.controller = GeometricController()
         self.current_trajectory: Optional[Trajectory] = None
+        self._compiled_trajectory: Optional[PiecewiseTrajectory] = None
 
         # Hardware connection
         self.mavlink_connection: Optional[Any] = None
@@ -435,19 +438,31 @@ class PixhawkInterface:
         """
         Fast trajectory interpolation that returns unit-stripped arrays.
         
-        This method should be implemented based on the trajectory format
-        and would avoid unit conversions by working with raw arrays.
+        The trajectory is compiled into a piecewise polynomial the first time
+        it is seen; later calls in the control loop only advance its cursor.
         """
-        # Placeholder implementation - this would need to be adapted
-        # based on the actual trajectory format
-        desired_pos = np.array([0.0, 0.0, 1.0])  # meters
-        desired_vel = np.array([0.0, 0.0, 0.0])  # m/s
-        desired_acc = np.array([0.0, 0.0, 0.0])  # m/s²
-        desired_yaw = 0.0  # radians
-        desired_yaw_rate = 0.0  # rad/s
+        compiled = self._compile_trajectory(trajectory)
+        row = compiled.evaluate(current_time)
+        desired_pos = compiled.field(row, "positions")  # meters
+        desired_vel = compiled.field(row, "velocities", np.zeros(3))  # m/s
+        desired_acc = compiled.field(row, "accelerations", np.zeros(3))  # m/s²
+        yaw = compiled.field(row, "yaws")
+        desired_yaw = float(yaw[0]) if yaw is not None else 0.0  # radians
+        yaw_rate = compiled.field(row, "yaw_rates")
+        desired_yaw_rate = float(yaw_rate[0]) if yaw_rate is not None else 0.0  # rad/s
         
         return desired_pos, desired_vel, desired_acc, desired_yaw, desired_yaw_rate
     
+    def _compile_trajectory(self, trajectory) -> PiecewiseTrajectory:
+        """Piecewise-polynomial form of a trajectory, cached by identity."""
+        compiled = self._compiled_trajectory
+        if compiled is None or not compiled.compiles(trajectory):
+            compiled = PiecewiseTrajectory.from_trajectory(
+                trajectory, fields=("positions", "velocities", "accelerations", "yaws", "yaw_rates")
+            )
+            self._compiled_trajectory = compiled
+        return compiled
+    
     def _convert_to_body_rate_cmd(self, thrust: float, torque: np.ndarray):
         """
         Convert thrust and torque to body rate command.
@@ -506,6 +521,9 @@ class PixhawkInterface:
                 self.current_trajectory = self.planner.plan_trajectory(
                     self.current_state, self.planner.goal_position
                 )
+                # Compile on receipt so the control loop only advances the cursor
+                if self.current_trajectory is not None and len(self.current_trajectory.timestamps) > 0:
+                    self._compile_trajectory(self.current_trajectory)
 
                 plan_time = (time.perf_counter() - loop_start) * 1000
                 self.performance_stats["planning_times"].append(plan_time)
@@ -537,14 +555,14 @@ class PixhawkInterface:
             msg_type = msg.get_type()
             self.current_state.timestamp = time.time()
             if msg_type == "ATTITUDE":
-                from dart_planner.common.units import Q_
-                self.current_state.attitude = Q_(np.array([msg.roll, msg.pitch, msg.yaw]), "rad")
-                self.current_state.angular_velocity = Q_(np.array([msg.rollspeed, msg.pitchspeed, msg.yawspeed]), "rad/s")
+                self.current_state.attitude = tag_units(np.array([msg.roll, msg.pitch, msg.yaw]), "rad")
+                self.current_state.angular_velocity = tag_units(
+                    np.array([msg.rollspeed, msg.pitchspeed, msg.yawspeed]), "rad/s")
                 self.last_attitude_msg = time.time()
             elif msg_type == "GLOBAL_POSITION_INT":
-                from dart_planner.common.units import Q_
-                self.current_state.position = Q_(np.array([msg.lat / 1e7, msg.lon / 1e7, msg.alt / 1e3]), "m")
-                self.current_state.velocity = Q_(np.array([msg.vx / 100.0, msg.vy / 100.0, msg.vz / 100.0]), "m/s")
+                self.current_state.position = tag_units(np.array([msg.lat / 1e7, msg.lon / 1e7, msg.alt / 1e3]), "m")
+                self.current_state.velocity = tag_units(
+                    np.array([msg.vx / 100.0, msg.vy / 100.0, msg.vz / 100.0]), "m/s")
             elif msg_type == "HEARTBEAT":
                 self.last_heartbeat = time.time()
                 self.is_armed = (msg.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED) != 0
@@ -65,6 +65,24 @@ class SafetyWatchdog:
         """Mark that a heartbeat was sent"""
         self.heartbeat_monitor.heartbeat_sent_sync()
         
+    def message_received(self, authenticated: bool = False):
+        """
+        Mark that a data message was received
+        
+        Only pass ``authenticated=True`` after the message's signature was
+        verified (SecureSerializer HMAC, MAVLink2 signing); only those count
+        as an implicit heartbeat.
+        """
+        self.heartbeat_monitor.message_received(authenticated)
+        
+    def verified_message_received(self):
+        """Signature-verified data message received (ZmqClient/ZmqServer ``on_verified_message`` hook)"""
+        self.heartbeat_monitor.message_received(True)
+        
+    def message_sent(self):
+        """Mark that a data message was sent (defers the next dedicated heartbeat)"""
+        self.heartbeat_monitor.message_sent()
+        
     def _trigger_emergency_landing(self):
         """Trigger emergency landing procedure"""
         current_time = time.time()
@@ -129,11 +147,26 @@ class MavlinkHeartbeatAdapter:
     """
     Adapter to convert MAVLink heartbeat messages to the internal heartbeat system.
     This allows integration with real hardware that uses MAVLink.
+    
+    MAVLink HEARTBEATs always count as liveness. Other traffic is only an
+    implicit heartbeat when the connection has MAVLink2 signing configured
+    and the message's signature was verified; unsigned traffic can be
+    spoofed. When a connection is given, GCS heartbeats are only sent while
+    the link is idle.
     """
     
-    def __init__(self, safety_watchdog: SafetyWatchdog):
+    # MAV_TYPE_GCS / MAV_AUTOPILOT_INVALID
+    _GCS_TYPE = 6
+    _GCS_AUTOPILOT = 8
+    
+    def __init__(self, safety_watchdog: SafetyWatchdog, mavlink_connection: Any = None):
         self.safety_watchdog = safety_watchdog
+        self.mavlink_connection = mavlink_connection
         self.logger = logging.getLogger(__name__)
+        if mavlink_connection is not None:
+            safety_watchdog.heartbeat_monitor.set_send_callback(
+                lambda: self.send_mavlink_heartbeat(mavlink_connection)
+            )
         
     def on_mavlink_heartbeat(self, msg):
         """Handle incoming MAVLink heartbeat message"""
@@ -146,12 +179,29 @@ class MavlinkHeartbeatAdapter:
         
         self.logger.debug(f"MAVLink heartbeat from system {system_id}, component {component_id}")
         
+    def on_mavlink_message(self, msg):
+        """Handle any incoming MAVLink message; non-heartbeat traffic is an implicit heartbeat"""
+        if msg.get_type() == "HEARTBEAT":
+            self.on_mavlink_heartbeat(msg)
+        else:
+            self.safety_watchdog.message_received(authenticated=self._signature_verified(msg))
+        
+    def _signature_verified(self, msg) -> bool:
+        # pymavlink rejects badly signed messages when a secret key is set and
+        # marks messages whose signature it checked with ``_signed``
+        mav = getattr(self.mavlink_connection, "mav", None)
+        signing = getattr(mav, "signing", None)
+        if getattr(signing, "secret_key", None) is None:
+            return False
+        return getattr(msg, "_signed", False) is True
+        
     def send_mavlink_heartbeat(self, mavlink_connection):
         """Send MAVLink heartbeat message"""
         try:
-            # This would need to be implemented based on the specific MAVLink library
-            # For now, we'll just mark that we sent a heartbeat
+            mav = getattr(mavlink_connection, "mav", None)
+            if mav is not None:
+                mav.heartbeat_send(self._GCS_TYPE, self._GCS_AUTOPILOT, 0, 0, 0)
             self.safety_watchdog.heartbeat_sent()
             self.logger.debug("MAVLink heartbeat sent")
         except Exception as e:
-            self.logger.error(f"Failed to send MAVLink heartbeat: {e}") 
+            self.logger.error(f"Failed to send MAVLink heartbeat: {e}")
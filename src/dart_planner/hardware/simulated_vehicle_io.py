@@ -11,7 +11,7 @@ import time
 import numpy as np
 from typing import Optional, Dict, Any
 
-from .vehicle_io import VehicleIO, VehicleIOFactory
+from .vehicle_io import VehicleIO
 from .simulated_adapter import SimulatedAdapter
 from ..common.types import DroneState, Trajectory, ControlCommand
 from ..common.di_container_v2 import get_container
@@ -323,7 +323,3 @@ class SimulatedVehicleIO(VehicleIO):
             
         except Exception as e:
             self.logger.error(f"Error updating simulation: {e}")
-
-
-# Register with factory
-VehicleIOFactory.register("simulated", SimulatedVehicleIO) 
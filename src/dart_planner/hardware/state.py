@@ -15,7 +15,6 @@ import numpy as np
 
 from ..common.types import DroneState
 from ..common.coordinate_frames import get_coordinate_frame_manager, WorldFrame
-from ..common.units import Q_
 
 
 @dataclass
@@ -192,12 +191,12 @@ class AirSimStateManager:
             attitude = attitude_ned
         
         # Create DroneState with proper units
-        return DroneState(
+        return DroneState.from_si_arrays(
             timestamp=time.time(),
-            position=Q_(position, 'm'),
-            velocity=Q_(velocity, 'm/s'),
-            attitude=Q_(attitude, 'rad'),
-            angular_velocity=Q_(angular_velocity, 'rad/s')
+            position=position,
+            velocity=velocity,
+            attitude=attitude,
+            angular_velocity=angular_velocity
         )
     
     def _transform_attitude_ned_to_enu(self, attitude_ned: np.ndarray) -> np.ndarray:
@@ -8,6 +8,7 @@ abstracting the differences between real hardware (Pixhawk) and simulation (AirS
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List, Tuple
 import asyncio
+import importlib
 import logging
 import time
 import numpy as np
@@ -112,9 +113,19 @@ class VehicleIO(ABC):
 
 
 class VehicleIOFactory:
-    """Factory for creating vehicle I/O instances."""
+    """
+    Factory for creating vehicle I/O instances.
+
+    Adapters shipped with DART-Planner are listed in ``_builtin`` by import
+    path and loaded on first use, so they are available whether or not
+    their modules have been imported.
+    """
     
     _adapters = {}
+    # Adapter name -> "module:class" of the built-in implementation
+    _builtin = {
+        "simulated": "dart_planner.hardware.simulated_vehicle_io:SimulatedVehicleIO",
+    }
     
     @classmethod
     def register(cls, name: str, adapter_class: type):
@@ -122,18 +133,25 @@ class VehicleIOFactory:
         cls._adapters[name] = adapter_class
     
     @classmethod
-    def create(cls, name: str, config: Dict[str, Any]) -> VehicleIO:
-        """Create a vehicle I/O instance by name."""
+    def get_adapter_class(cls, name: str) -> type:
+        """Adapter class registered under ``name``, loading a built-in one on first use."""
+        if name not in cls._adapters and name in cls._builtin:
+            module_name, _, class_name = cls._builtin[name].partition(":")
+            cls.register(name, getattr(importlib.import_module(module_name), class_name))
         if name not in cls._adapters:
             from dart_planner.common.errors import HardwareError
-            raise HardwareError(f"Unknown vehicle I/O adapter: {name}. Available: {list(cls._adapters.keys())}")
-        
-        return cls._adapters[name](config)
+            raise HardwareError(f"Unknown vehicle I/O adapter: {name}. Available: {cls.list_available()}")
+        return cls._adapters[name]
+    
+    @classmethod
+    def create(cls, name: str, config: Dict[str, Any]) -> VehicleIO:
+        """Create a vehicle I/O instance by name."""
+        return cls.get_adapter_class(name)(config)
     
     @classmethod
     def list_available(cls) -> List[str]:
-        """List all available vehicle I/O adapters."""
-        return list(cls._adapters.keys())
+        """List all available vehicle I/O adapters (registered and built-in)."""
+        return list(dict.fromkeys([*cls._adapters, *cls._builtin]))
 
 
 class VehicleIOAdapter:
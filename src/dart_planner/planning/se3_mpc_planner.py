@@ -24,10 +24,15 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from scipy.optimize import minimize  # type: ignore
 from pint import Quantity
 
 from dart_planner.common.types import DroneState, Trajectory
+from dart_planner.common.quaternions import (
+    body_rates_from_quaternions,
+    euler_rates_from_body_rates,
+    quaternion_to_euler,
+    thrust_yaw_to_quaternion,
+)
 from dart_planner.common.units import Q_, ensure_units, to_float
 from dart_planner.planning.base_planner import BasePlanner
 from dart_planner.common.logging_config import get_logger
@@ -253,6 +258,9 @@ class SE3MPCPlanner(BasePlanner):
         result = None
 
         # Fast single-shot optimization for real-time performance
+        # (scipy.optimize is imported on the first solve, not at startup)
+        from scipy.optimize import minimize  # type: ignore
+
         result = minimize(
             fun=self._objective_function,
             x0=x0,
@@ -607,50 +615,29 @@ class SE3MPCPlanner(BasePlanner):
         """
         Compute desired attitudes and body rates from thrust vectors using SO(3) math.
         This is more accurate for aggressive maneuvers than small-angle approximations.
+
+        The whole horizon is processed at once on quaternions: desired attitude
+        from thrust direction and yaw, body rates from the relative rotation
+        between consecutive valid samples.
         """
         N = len(thrust_vectors)
         attitudes = np.zeros((N, 3))  # Roll, Pitch, Yaw
         body_rates = np.zeros((N, 3))  # Roll rate, Pitch rate, Yaw rate
-        prev_R = None
-        dt = self.se3_config.dt
-        for i in range(N):
-            thrust_vec = thrust_vectors[i]
-            thrust_mag = np.linalg.norm(thrust_vec)
-            if thrust_mag > 1e-6:
-                # Desired body z-axis (thrust direction)
-                b3_des = thrust_vec / thrust_mag
-                # Default desired yaw (can be improved to follow a yaw trajectory)
-                desired_yaw = 0.0
-                # Desired body x-axis (perpendicular to b3_des and in yaw direction)
-                yaw_vector = np.array([np.cos(desired_yaw), np.sin(desired_yaw), 0])
-                b1_des = np.cross(yaw_vector, b3_des)
-                b1_des_norm = np.linalg.norm(b1_des)
-                if b1_des_norm > 1e-6:
-                    b1_des = b1_des / b1_des_norm
-                else:
-                    b1_des = np.array([1, 0, 0])
-                b2_des = np.cross(b3_des, b1_des)
-                # Desired rotation matrix
-                R_des = np.column_stack([b1_des, b2_des, b3_des])
-                # Extract roll, pitch, yaw from rotation matrix
-                roll = np.arctan2(R_des[2, 1], R_des[2, 2])
-                pitch = np.arcsin(-R_des[2, 0])
-                yaw = np.arctan2(R_des[1, 0], R_des[0, 0])
-                attitudes[i] = np.array([roll, pitch, yaw])
-                # Compute body rates from rotation matrix derivative
-                if prev_R is not None:
-                    R_dot = (R_des - prev_R) / dt
-                    omega_mat = R_des.T @ R_dot
-                    # Skew-symmetric matrix to vector
-                    body_rates[i] = np.array([
-                        omega_mat[2, 1],
-                        omega_mat[0, 2],
-                        omega_mat[1, 0],
-                    ])
-                prev_R = R_des
-            else:
-                attitudes[i] = np.zeros(3)
-                body_rates[i] = np.zeros(3)
+        thrust_mags = np.linalg.norm(thrust_vectors, axis=1)
+        valid = thrust_mags > 1e-6
+        if not valid.any():
+            return attitudes, body_rates
+
+        # Default desired yaw (can be improved to follow a yaw trajectory)
+        desired_yaw = 0.0
+        b3_des = thrust_vectors[valid] / thrust_mags[valid, None]
+        q_des = thrust_yaw_to_quaternion(b3_des, desired_yaw)
+        attitudes[valid] = quaternion_to_euler(q_des)
+
+        # Rates between consecutive valid samples (near-zero thrust samples are skipped)
+        if len(q_des) > 1:
+            rates = body_rates_from_quaternions(q_des[:-1], q_des[1:], self.se3_config.dt)
+            body_rates[np.flatnonzero(valid)[1:]] = rates
         return attitudes, body_rates
 
     def _create_trajectory_from_solution(
@@ -671,7 +658,9 @@ class SE3MPCPlanner(BasePlanner):
             body_rates=solution["body_rates"],  # Now computed explicitly
             thrusts=solution["thrusts"],  # Thrust magnitudes
             yaws=solution["attitudes"][:, 2] if solution["attitudes"] is not None else None,
-            yaw_rates=solution["body_rates"][:, 2] if solution["body_rates"] is not None else None,
+            # Yaw is an Euler angle: its rate is the ZYX Euler rate, not the body z rate
+            yaw_rates=(euler_rates_from_body_rates(solution["attitudes"], solution["body_rates"])[:, 2]
+                       if solution["body_rates"] is not None else None),
         )
 
     def _generate_emergency_trajectory(self, current_state: DroneState) -> Trajectory:
@@ -5,16 +5,7 @@ Provides authentication, authorization, and input validation for secure
 operation of the autonomous drone navigation system.
 """
 
-from .auth import AuthManager, Role, require_role, UserSession
-from .validation import (
-    InputValidator,
-    validate_waypoint,
-    validate_trajectory,
-    validate_control_command,
-    ValidationError,
-    SafetyLimits,
-)
-from .crypto import SecureCredentialManager
+from dart_planner.common.lazy_imports import lazy_exports
 
 __all__ = [
     'AuthManager',
@@ -28,4 +19,12 @@ __all__ = [
     'ValidationError',
     'SafetyLimits',
     'SecureCredentialManager'
-] 
+]
+
+# auth pulls in FastAPI; load each submodule only when its names are used
+__getattr__, __dir__ = lazy_exports(__name__, {
+    **{name: "auth" for name in ("AuthManager", "Role", "require_role", "UserSession")},
+    **{name: "validation" for name in ("InputValidator", "validate_waypoint", "validate_trajectory",
+                                       "validate_control_command", "ValidationError", "SafetyLimits")},
+    "SecureCredentialManager": "crypto",
+})
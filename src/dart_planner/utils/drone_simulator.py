@@ -1,10 +1,28 @@
-from dataclasses import dataclass
-from typing import Optional
+"""
+Quadrotor Simulators for DART-Planner
+
+- BatchDroneSimulator: vectorized rigid-body core that steps K vehicles at
+  once on struct-of-arrays state (position, velocity, attitude quaternion,
+  body rates), with RK4 or semi-implicit Euler integration, thrust applied
+  along the body z-axis, precomputed inverse inertia, batched wind gusts,
+  drag and sensor noise. State stays in plain SI arrays; ``DroneState``
+  objects are built only on request.
+- DroneSimulator: single-vehicle ``DroneState`` -> ``DroneState`` interface
+  used by tests and examples, backed by a one-vehicle batch core.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Union
 
 import numpy as np
 from numpy.typing import NDArray
 
+from ..common.errors import ConfigurationError
+from ..common.quaternions import euler_to_quaternion, quaternion_multiply, quaternion_to_euler
 from ..common.types import ControlCommand, DroneState
+from ..common.units import to_float
+
+ArrayLike = Union[float, np.ndarray]
 
 # -----------------------------------------------------------------------------
 # Simulator configuration helper
@@ -13,63 +31,285 @@ from ..common.types import ControlCommand, DroneState
 
 @dataclass
 class SimulatorConfig:
-    """Configuration parameters for :class:`DroneSimulator`.  Only a subset
-    is actually used by the simple physics model; the rest are placeholders so
-    that unit-tests and future extensions can pass richer settings without
-    breaking the interface.
+    """Configuration parameters for the simulators.
 
     The defaults mirror the values hard-coded in older experiment scripts so
     that behaviour stays unchanged if callers omit the config.
+
+    Wind is modelled as an air velocity acting through linear drag:
+    ``F_drag = -drag_coefficient * (v - v_wind)`` with
+    ``v_wind = [wind_mean, 0, 0] + N(0, wind_std²)`` per axis, resampled
+    every step. ``sensor_noise_std`` is the standard deviation of the
+    Gaussian noise added by ``observe()``.
     """
 
     # Core physical parameters
     mass: float = 1.0
     gravity: float = 9.81
+    inertia: np.ndarray = field(default_factory=lambda: np.array([0.1, 0.1, 0.2]))  # diagonal or 3x3, kg·m²
+
+    # Actuator limits
+    max_thrust: float = 20.0
+    max_torque: float = 10.0
 
-    # Simple disturbance / environment parameters (currently unused)
+    # Disturbance / environment parameters
     wind_mean: float = 0.0
     wind_std: float = 0.0
     sensor_noise_std: float = 0.0
     drag_coefficient: float = 0.0
 
+    # "rk4" or "semi_implicit"
+    integrator: str = "rk4"
+
+
+class BatchDroneSimulator:
+    """
+    Rigid-body dynamics for K quadrotors stepped together.
+
+    State arrays (base SI units, world frame z-up unless noted):
+    - position, velocity: ``(K, 3)``
+    - quaternion: ``(K, 4)`` body-to-world, ``[w, x, y, z]``
+    - angular_velocity: ``(K, 3)`` body frame
+
+    Args:
+        num_vehicles: Number of vehicles K
+        config: Physical and disturbance parameters
+        seed: Seed for the wind and sensor-noise generator
+    """
+
+    INTEGRATORS = ("rk4", "semi_implicit")
+
+    def __init__(self,
+                 num_vehicles: int,
+                 config: Optional[SimulatorConfig] = None,
+                 seed: Optional[int] = None):
+        if num_vehicles < 1:
+            raise ConfigurationError(f"num_vehicles must be positive, got {num_vehicles}")
+        self.config = config or SimulatorConfig()
+        if self.config.integrator not in self.INTEGRATORS:
+            raise ConfigurationError(
+                f"Unknown integrator '{self.config.integrator}', expected one of {self.INTEGRATORS}"
+            )
+        self.num_vehicles = num_vehicles
+        self.rng = np.random.default_rng(seed)
+
+        inertia = np.asarray(self.config.inertia, dtype=float)
+        self.inertia = np.diag(inertia) if inertia.ndim == 1 else inertia
+        self.inverse_inertia = np.linalg.inv(self.inertia)
+        self._gravity = np.array([0.0, 0.0, -self.config.gravity])
+
+        # Additional external force per vehicle (N), e.g. a steady wind load
+        self.external_force = np.zeros((num_vehicles, 3))
+        self.reset()
+
+    def reset(self,
+              position: Optional[np.ndarray] = None,
+              velocity: Optional[np.ndarray] = None,
+              attitude: Optional[np.ndarray] = None,
+              angular_velocity: Optional[np.ndarray] = None) -> None:
+        """
+        Reset all vehicles; inputs broadcast to ``(K, 3)``.
+
+        ``attitude`` may be ZYX Euler angles ``(..., 3)`` or quaternions ``(..., 4)``.
+        """
+        K = self.num_vehicles
+        self.time = 0.0
+        self.position = self._broadcast(position, 3)
+        self.velocity = self._broadcast(velocity, 3)
+        self.angular_velocity = self._broadcast(angular_velocity, 3)
+        if attitude is None:
+            self.quaternion = np.tile([1.0, 0.0, 0.0, 0.0], (K, 1))
+        else:
+            attitude = np.asarray(attitude, dtype=float)
+            q = attitude if attitude.shape[-1] == 4 else euler_to_quaternion(attitude)
+            self.quaternion = self._broadcast(q / np.linalg.norm(q, axis=-1, keepdims=True), 4)
+
+    def _broadcast(self, value: Optional[np.ndarray], width: int) -> np.ndarray:
+        if value is None:
+            return np.zeros((self.num_vehicles, width))
+        return np.array(np.broadcast_to(np.asarray(value, dtype=float), (self.num_vehicles, width)))
+
+    # ------------------------------------------------------------------
+    # Dynamics
+    # ------------------------------------------------------------------
+
+    def _linear_acceleration(self, velocity: np.ndarray, quaternion: np.ndarray,
+                             thrust: np.ndarray, force: np.ndarray, drag_target: np.ndarray) -> np.ndarray:
+        w, x, y, z = quaternion.T
+        # Body z-axis in the world frame (third column of R(q))
+        acc = np.empty_like(velocity)
+        acc[:, 0] = 2.0 * (x * z + w * y)
+        acc[:, 1] = 2.0 * (y * z - w * x)
+        acc[:, 2] = 1.0 - 2.0 * (x * x + y * y)
+        acc *= thrust[:, None]
+        acc += force
+        if self.config.drag_coefficient:
+            acc -= self.config.drag_coefficient * (velocity - drag_target)
+        acc /= self.config.mass
+        acc += self._gravity
+        return acc
+
+    def _angular_acceleration(self, omega: np.ndarray, torque: np.ndarray) -> np.ndarray:
+        inertia_omega = omega @ self.inertia.T
+        # ω × Iω written out: np.cross has a large fixed cost at small K
+        p, q, r = omega.T
+        a, b, c = inertia_omega.T
+        gyroscopic = np.stack((q * c - r * b, r * a - p * c, p * b - q * a), axis=1)
+        return (torque - gyroscopic) @ self.inverse_inertia.T
+
+    @staticmethod
+    def _quaternion_rate(quaternion: np.ndarray, omega: np.ndarray) -> np.ndarray:
+        # q̇ = ½ q ⊗ [0, ω]
+        w, x, y, z = quaternion.T
+        p, q, r = omega.T
+        return 0.5 * np.stack((
+            -x * p - y * q - z * r,
+            w * p + y * r - z * q,
+            w * q - x * r + z * p,
+            w * r + x * q - y * p,
+        ), axis=1)
+
+    def _derivatives(self, state, thrust, torque, force, drag_target):
+        _, velocity, quaternion, omega = state
+        return (
+            velocity,
+            self._linear_acceleration(velocity, quaternion, thrust, force, drag_target),
+            self._quaternion_rate(quaternion, omega),
+            self._angular_acceleration(omega, torque),
+        )
+
+    def step(self, thrust: ArrayLike, torque: np.ndarray, dt: float) -> None:
+        """
+        Advance every vehicle by ``dt`` with inputs held constant over the step.
+
+        Args:
+            thrust: Collective thrust ``(K,)`` or scalar (N), clipped to [0, max_thrust]
+            torque: Body torques ``(K, 3)`` or ``(3,)`` (N·m), clipped to ±max_torque
+            dt: Time step (s)
+        """
+        cfg = self.config
+        K = self.num_vehicles
+        thrust = np.clip(np.broadcast_to(np.asarray(thrust, dtype=float), (K,)), 0.0, cfg.max_thrust)
+        torque = np.clip(np.broadcast_to(np.asarray(torque, dtype=float), (K, 3)), -cfg.max_torque, cfg.max_torque)
+
+        drag_target = np.zeros((K, 3))
+        if cfg.drag_coefficient:
+            drag_target[:, 0] = cfg.wind_mean
+            if cfg.wind_std > 0.0:
+                drag_target += self.rng.normal(0.0, cfg.wind_std, (K, 3))
+        force = self.external_force
+
+        if cfg.integrator == "rk4":
+            self._step_rk4(thrust, torque, force, drag_target, dt)
+        else:
+            self._step_semi_implicit(thrust, torque, force, drag_target, dt)
+        self.quaternion /= np.linalg.norm(self.quaternion, axis=1, keepdims=True)
+        self.time += dt
+
+    def _step_rk4(self, thrust, torque, force, drag_target, dt) -> None:
+        state = (self.position, self.velocity, self.quaternion, self.angular_velocity)
+
+        def shifted(derivative, h):
+            return tuple(s + h * d for s, d in zip(state, derivative))
+
+        k1 = self._derivatives(state, thrust, torque, force, drag_target)
+        k2 = self._derivatives(shifted(k1, 0.5 * dt), thrust, torque, force, drag_target)
+        k3 = self._derivatives(shifted(k2, 0.5 * dt), thrust, torque, force, drag_target)
+        k4 = self._derivatives(shifted(k3, dt), thrust, torque, force, drag_target)
+        for s, d1, d2, d3, d4 in zip(state, k1, k2, k3, k4):
+            s += (dt / 6.0) * (d1 + 2.0 * d2 + 2.0 * d3 + d4)
+
+    def _step_semi_implicit(self, thrust, torque, force, drag_target, dt) -> None:
+        # Rates first, then exact rotation by the new body rate over dt
+        self.angular_velocity += dt * self._angular_acceleration(self.angular_velocity, torque)
+        rotation_vector = self.angular_velocity * dt
+        angle = np.linalg.norm(rotation_vector, axis=1, keepdims=True)
+        half = 0.5 * angle
+        # sin(θ/2)/θ -> 1/2 as θ -> 0
+        scale = np.where(angle > 1e-12, np.sin(half) / np.where(angle > 1e-12, angle, 1.0), 0.5)
+        delta = np.concatenate((np.cos(half), scale * rotation_vector), axis=1)
+        self.quaternion = quaternion_multiply(self.quaternion, delta)
+        self.velocity += dt * self._linear_acceleration(self.velocity, self.quaternion, thrust, force, drag_target)
+        self.position += dt * self.velocity
+
+    # ------------------------------------------------------------------
+    # Outputs
+    # ------------------------------------------------------------------
+
+    @property
+    def attitude(self) -> np.ndarray:
+        """ZYX Euler angles ``(K, 3)`` of the current attitude."""
+        return quaternion_to_euler(self.quaternion)
+
+    def observe(self) -> dict:
+        """Sensor view of the state with ``sensor_noise_std`` Gaussian noise (position, velocity, attitude, rates)."""
+        std = self.config.sensor_noise_std
+        observation = {
+            "position": self.position.copy(),
+            "velocity": self.velocity.copy(),
+            "attitude": self.attitude,
+            "angular_velocity": self.angular_velocity.copy(),
+        }
+        if std > 0.0:
+            for value in observation.values():
+                value += self.rng.normal(0.0, std, value.shape)
+        return observation
+
+    def to_drone_state(self, index: int = 0) -> DroneState:
+        """Unit-annotated snapshot of one vehicle."""
+        return DroneState.from_si_arrays(
+            timestamp=self.time,
+            position=self.position[index].copy(),
+            velocity=self.velocity[index].copy(),
+            attitude=quaternion_to_euler(self.quaternion[index]),
+            angular_velocity=self.angular_velocity[index].copy(),
+        )
+
+    def to_drone_states(self) -> List[DroneState]:
+        return [self.to_drone_state(k) for k in range(self.num_vehicles)]
+
 
 class DroneSimulator:
     """
     A simple physics simulator for a quadrotor drone.
+
+    Steps one vehicle through :class:`BatchDroneSimulator`: thrust acts
+    along the body z-axis and attitude is integrated on SO(3). ``wind`` is
+    a constant external force (N) and may be changed between steps.
     """
 
-    def __init__(self, wind: Optional[np.ndarray] = None, max_thrust: float = 20.0, max_torque: float = 10.0) -> None:
+    def __init__(self,
+                 wind: Optional[np.ndarray] = None,
+                 max_thrust: float = 20.0,
+                 max_torque: float = 10.0,
+                 config: Optional[SimulatorConfig] = None,
+                 seed: Optional[int] = None) -> None:
         if wind is None:
             self.wind = np.zeros(3)
         else:
             self.wind = np.array(wind)
-        self.max_thrust = max_thrust
-        self.max_torque = max_torque
-        self.mass = 1.5  # kg
-        self.gravity = 9.81
-        self.inertia = np.diag([0.1, 0.1, 0.2])
+        if config is None:
+            config = SimulatorConfig(mass=1.5, max_thrust=max_thrust, max_torque=max_torque)
+        self.config = config
+        self.max_thrust = config.max_thrust
+        self.max_torque = config.max_torque
+        self.mass = config.mass  # kg
+        self.gravity = config.gravity
+        self.inertia = np.diag(config.inertia) if np.ndim(config.inertia) == 1 else np.asarray(config.inertia)
+        # Private copy: the limits above may be changed between steps
+        self._core = BatchDroneSimulator(1, replace(config), seed=seed)
 
     def step(self, state: DroneState, command: ControlCommand, dt: float) -> DroneState:
-        # Apply actuator saturation
-        thrust = np.clip(command.thrust, 0, self.max_thrust)
-        torque = np.clip(command.torque, -self.max_torque, self.max_torque)
-        # Add wind disturbance to acceleration
-        wind_accel = self.wind / self.mass
-        # Simple translational dynamics
-        acc = np.array([0, 0, -self.gravity]) + np.array([0, 0, thrust / self.mass]) + wind_accel
-        new_velocity = state.velocity + acc * dt
-        new_position = state.position + new_velocity * dt
-        # Simple rotational dynamics
-        angular_accel = np.linalg.solve(self.inertia, torque)
-        new_angular_velocity = state.angular_velocity + angular_accel * dt
-        new_attitude = state.attitude + new_angular_velocity * dt
-        return DroneState(
-            timestamp=state.timestamp + dt,
-            position=new_position,
-            velocity=new_velocity,
-            attitude=new_attitude,
-            angular_velocity=new_angular_velocity,
-        )
+        fast_state = state.to_fast_state()
+        core = self._core
+        core.config.max_thrust = self.max_thrust
+        core.config.max_torque = self.max_torque
+        core.reset(fast_state.position, fast_state.velocity, fast_state.get_quaternion(), fast_state.angular_velocity)
+        core.external_force[0] = self.wind
+        core.step(to_float(command.thrust), command.torque.to('N*m').magnitude, dt)
+        new_state = core.to_drone_state(0)
+        new_state.timestamp = state.timestamp + dt
+        return new_state
 
     def _euler_to_rotation_matrix(self, att: np.ndarray) -> NDArray[np.float64]:
         """Converts Euler angles (roll, pitch, yaw) to a rotation matrix."""
@@ -0,0 +1,187 @@
+"""
+Import-Time Profiler for DART-Planner
+
+Measures what importing an entry point costs a fresh interpreter:
+- Runs ``python -X importtime -c "import <module>"`` in a subprocess so
+  nothing is already cached in ``sys.modules``
+- Reports the cumulative cost of the module and the most expensive
+  top-level dependencies it pulled in
+- Checks each module against a time budget and flags heavy optional
+  dependencies (plotting, optimization, simulator and web stacks) that
+  startup paths must not import eagerly
+
+CLI:
+    python -m dart_planner.utils.import_time dart_planner.edge.main --top 15
+    dart planner import-time --budget dart_planner.edge.main=500
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from dart_planner.common.errors import ConfigurationError
+
+# Startup paths and their import budget (milliseconds, cumulative, measured
+# by -X importtime in a fresh interpreter)
+DEFAULT_BUDGETS_MS: Dict[str, float] = {
+    "dart_planner.common": 50.0,
+    "dart_planner.common.types": 700.0,
+    "dart_planner.dart_planner_cli": 50.0,
+    "dart_planner.edge.main": 900.0,
+    "dart_planner.edge.main_improved": 900.0,
+}
+
+# Packages that startup paths must only import on first use
+HEAVY_MODULES: Tuple[str, ...] = (
+    "matplotlib",
+    "scipy.optimize",
+    "scipy.signal",
+    "airsim",
+    "fastapi",
+)
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    """Import cost of one module in a fresh interpreter."""
+    module: str
+    records: List[ImportRecord] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        for record in self.records:
+            if record.name == self.module:
+                return record.cumulative_us / 1000.0
+        return 0.0
+
+    @property
+    def imported(self) -> List[str]:
+        return [record.name for record in self.records]
+
+    def heavy_imports(self, heavy: Sequence[str] = HEAVY_MODULES) -> List[str]:
+        """Heavy packages (or their submodules) that were imported."""
+        loaded = set(self.imported)
+        return [name for name in heavy if name in loaded]
+
+    def top(self, count: int = 10) -> List[ImportRecord]:
+        """Most expensive imports made directly by the module, by cumulative time."""
+        children = []
+        for index, record in enumerate(self.records):
+            if record.name != self.module:
+                continue
+            # -X importtime lists a module's imports just before the module itself
+            for child in reversed(self.records[:index]):
+                if child.depth <= record.depth:
+                    break
+                if child.depth == record.depth + 1:
+                    children.append(child)
+            break
+        return sorted(children, key=lambda child: child.cumulative_us, reverse=True)[:count]
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse the stderr of ``python -X importtime``."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        records.append(ImportRecord(stripped, int(parts[0]), int(parts[1]), (len(name) - len(stripped)) // 2))
+    return records
+
+
+def measure_import(module: str, python: Optional[str] = None,
+                   env: Optional[Dict[str, str]] = None) -> ImportProfile:
+    """
+    Import ``module`` in a fresh interpreter and record the cost.
+
+    Args:
+        module: Dotted module name
+        python: Interpreter to run (default: the current one)
+        env: Environment for the subprocess (default: inherit)
+
+    Raises:
+        ConfigurationError: If the import fails
+    """
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env if env is not None else os.environ.copy(),
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise ConfigurationError(f"Importing {module} failed: {error[0]}")
+    return ImportProfile(module, parse_importtime(result.stderr))
+
+
+def check_budgets(profiles: Iterable[ImportProfile], budgets_ms: Dict[str, float]) -> List[str]:
+    """Budget and heavy-import violations, one message each."""
+    problems = []
+    for profile in profiles:
+        budget = budgets_ms.get(profile.module)
+        if budget is not None and profile.total_ms > budget:
+            problems.append(f"{profile.module}: {profile.total_ms:.0f} ms exceeds budget of {budget:.0f} ms")
+        heavy = profile.heavy_imports()
+        if heavy:
+            problems.append(f"{profile.module}: eagerly imports {', '.join(heavy)}")
+    return problems
+
+
+def _budget(text: str) -> Tuple[str, float]:
+    module, sep, value = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected MODULE=MS, got '{text}'")
+    return module, float(value)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dart planner import-time",
+        description="Report per-module import cost of DART-Planner entry points",
+    )
+    parser.add_argument("modules", nargs="*", help="modules to profile (default: the budgeted startup paths)")
+    parser.add_argument("--top", type=int, default=10, help="dependencies to list per module")
+    parser.add_argument("--budget", type=_budget, action="append", default=[], metavar="MODULE=MS",
+                        help="override or add an import budget in milliseconds")
+    return parser
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    args = build_parser().parse_args(None if argv is None else list(argv))
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    budgets.update(dict(args.budget))
+    modules = args.modules or list(budgets)
+
+    profiles = []
+    for module in modules:
+        profile = measure_import(module)
+        profiles.append(profile)
+        budget = budgets.get(module)
+        limit = f" (budget {budget:.0f} ms)" if budget is not None else ""
+        print(f"{module}: {profile.total_ms:.1f} ms{limit}")
+        for record in profile.top(args.top):
+            print(f"    {record.cumulative_us / 1000.0:8.1f} ms  {record.name}")
+
+    problems = check_budgets(profiles, budgets)
+    for problem in problems:
+        print(f"FAIL {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
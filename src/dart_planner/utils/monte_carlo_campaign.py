@@ -0,0 +1,599 @@
+"""
+Monte Carlo Campaign Runner for DART-Planner
+
+Runs large closed-loop simulation campaigns across a process pool:
+- Trials come from a parameter grid (e.g. wind, sensor noise, controller
+  gains, obstacle density) repeated ``trials_per_point`` times
+- Every trial gets a deterministic seed derived from the campaign seed and
+  its trial id, so results do not depend on worker count or scheduling
+- Results are streamed to a CSV journal (one row per trial) as trials
+  finish, since a crash can only lose the row being written; re-running the
+  same campaign resumes from the trials already recorded
+- When a run finishes, the journal is compacted into a columnar ``.npz``
+  next to it (one array per column, sorted by trial id) for analysis;
+  ``load_results`` reads either file
+- Aggregate success rate and control-latency statistics, overall and per
+  grid point
+
+The default trial (``closed_loop_trial``) flies the geometric controller
+against the batched rigid-body simulator from a start to a goal point
+through randomly placed spherical obstacles. Any picklable callable
+``trial(params, seed) -> dict`` can be used instead.
+
+CLI:
+    python -m dart_planner.utils.monte_carlo_campaign \\
+        --param wind_std=0,0.5,1.0 --param obstacle_density=0,0.02 \\
+        --trials-per-point 100 --workers 8 --output campaign.csv
+"""
+
+import argparse
+import csv
+import importlib
+import itertools
+import json
+import logging
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from dart_planner.common.errors import ConfigurationError
+
+TrialFunction = Callable[[Dict[str, float], int], Dict[str, Any]]
+
+DEFAULT_TRIAL = "dart_planner.utils.monte_carlo_campaign:closed_loop_trial"
+
+# Columns every trial row has, in file order; grid parameters follow
+RESULT_COLUMNS = (
+    "trial_id",
+    "seed",
+    "success",
+    "final_error_m",
+    "max_tracking_error_m",
+    "min_clearance_m",
+    "collided",
+    "latency_mean_us",
+    "latency_p95_us",
+    "latency_max_us",
+    "wall_time_s",
+    "error",
+)
+
+# Parameters understood by closed_loop_trial and their defaults
+CLOSED_LOOP_DEFAULTS: Dict[str, float] = {
+    "wind_mean": 0.0,          # m/s along +x
+    "wind_std": 0.0,           # m/s gust standard deviation per axis
+    "drag_coefficient": 0.3,   # N/(m/s), couples wind into the vehicle
+    "sensor_noise_std": 0.0,   # noise on the state fed to the controller
+    "gain_scale": 1.0,         # multiplier on the position-loop PID gains
+    "obstacle_density": 0.0,   # obstacles per m³ in the start-goal corridor
+    "obstacle_radius": 0.5,    # m
+    "duration_s": 8.0,
+    "dt": 0.005,
+    "distance_m": 8.0,         # start-to-goal distance
+    "goal_tolerance_m": 0.5,
+}
+
+
+# ---------------------------------------------------------------------------
+# Campaign definition
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CampaignConfig:
+    """
+    Monte Carlo campaign definition.
+
+    Args:
+        grid: Parameter name -> values; the campaign covers the Cartesian product
+        trials_per_point: Repetitions (different seeds) per grid point
+        base_seed: Campaign seed all trial seeds are derived from
+        output: CSV results journal (streamed, used for resume); the columnar
+            ``.npz`` is written next to it (see ``columnar_path``)
+        workers: Process count; ``None`` uses all CPUs, ``0``/``1`` runs inline
+        trial: Trial function as ``"module:function"``
+        fixed: Parameters passed unchanged to every trial
+    """
+    grid: Dict[str, Sequence[float]] = field(default_factory=dict)
+    trials_per_point: int = 10
+    base_seed: int = 0
+    output: Union[str, Path] = "monte_carlo_results.csv"
+    workers: Optional[int] = None
+    trial: str = DEFAULT_TRIAL
+    fixed: Dict[str, float] = field(default_factory=dict)
+
+    def manifest(self) -> Dict[str, Any]:
+        """Fields that identify the campaign; resuming requires them to match."""
+        return {
+            "grid": {name: [float(v) for v in values] for name, values in sorted(self.grid.items())},
+            "trials_per_point": self.trials_per_point,
+            "base_seed": self.base_seed,
+            "trial": self.trial,
+            "fixed": {name: float(v) for name, v in sorted(self.fixed.items())},
+        }
+
+
+@dataclass(frozen=True)
+class TrialSpec:
+    trial_id: int
+    seed: int
+    params: Dict[str, float]
+
+
+@dataclass
+class CampaignSummary:
+    total_trials: int
+    completed_trials: int
+    executed_trials: int
+    successes: int
+    success_rate: float
+    errors: int
+    latency_us: Dict[str, float]
+    per_point: List[Dict[str, Any]]
+    wall_time_s: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def expand_grid(grid: Dict[str, Sequence[float]]) -> List[Dict[str, float]]:
+    """Cartesian product of the grid, parameters in sorted name order."""
+    names = sorted(grid)
+    for name in names:
+        if len(grid[name]) == 0:
+            raise ConfigurationError(f"Grid parameter '{name}' has no values")
+    return [dict(zip(names, (float(v) for v in values)))
+            for values in itertools.product(*(grid[name] for name in names))]
+
+
+def trial_seed(base_seed: int, trial_id: int) -> int:
+    """Independent, reproducible 32-bit seed for one trial."""
+    sequence = np.random.SeedSequence(entropy=base_seed, spawn_key=(trial_id,))
+    return int(sequence.generate_state(1)[0])
+
+
+def make_trials(config: CampaignConfig) -> List[TrialSpec]:
+    """All trials of a campaign; trial ids enumerate grid points, then repetitions."""
+    if config.trials_per_point < 1:
+        raise ConfigurationError(f"trials_per_point must be positive, got {config.trials_per_point}")
+    trials = []
+    for point in expand_grid(config.grid):
+        params = {**config.fixed, **point}
+        for _ in range(config.trials_per_point):
+            trial_id = len(trials)
+            trials.append(TrialSpec(trial_id, trial_seed(config.base_seed, trial_id), params))
+    return trials
+
+
+def resolve_trial(trial: Union[str, TrialFunction]) -> TrialFunction:
+    """Import a ``"module:function"`` trial reference (callables pass through)."""
+    if callable(trial):
+        return trial
+    module_name, sep, attribute = trial.partition(":")
+    if not sep:
+        raise ConfigurationError(f"Trial reference must be 'module:function', got '{trial}'")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+# ---------------------------------------------------------------------------
+# Default trial: geometric controller vs. batched simulator
+# ---------------------------------------------------------------------------
+
+def _minimum_jerk(start: np.ndarray, goal: np.ndarray, t: float, duration: float):
+    s = min(max(t / duration, 0.0), 1.0)
+    delta = goal - start
+    pos = start + delta * (10 * s**3 - 15 * s**4 + 6 * s**5)
+    if s >= 1.0:
+        return pos, np.zeros(3), np.zeros(3)
+    vel = delta * (30 * s**2 - 60 * s**3 + 30 * s**4) / duration
+    acc = delta * (60 * s - 180 * s**2 + 120 * s**3) / duration**2
+    return pos, vel, acc
+
+
+def _place_obstacles(rng: np.random.Generator, start: np.ndarray, goal: np.ndarray,
+                     density: float, radius: float) -> np.ndarray:
+    """Uniform obstacles in the corridor box around the start-goal segment."""
+    if density <= 0.0:
+        return np.zeros((0, 3))
+    low = np.minimum(start, goal) - [0.0, 2.0, 1.0]
+    high = np.maximum(start, goal) + [0.0, 2.0, 1.0]
+    count = rng.poisson(density * float(np.prod(high - low)))
+    centers = rng.uniform(low, high, (count, 3))
+    # Start and goal themselves stay free
+    keep_out = radius + 1.0
+    clear = ((np.linalg.norm(centers - start, axis=1) > keep_out)
+             & (np.linalg.norm(centers - goal, axis=1) > keep_out))
+    return centers[clear]
+
+
+def closed_loop_trial(params: Dict[str, float], seed: int) -> Dict[str, Any]:
+    """
+    Fly from hover at the start point to a goal along a minimum-jerk reference.
+
+    Success means reaching ``goal_tolerance_m`` of the goal without coming
+    within ``obstacle_radius`` (+0.25 m airframe) of an obstacle centre.
+    Latency figures are the controller step times.
+    """
+    from dart_planner.common.vehicle_params import get_control_constants
+    from dart_planner.control.geometric_controller import GeometricController, GeometricControllerConfig
+    from dart_planner.utils.drone_simulator import BatchDroneSimulator, SimulatorConfig
+
+    unknown = set(params) - set(CLOSED_LOOP_DEFAULTS)
+    if unknown:
+        raise ConfigurationError(f"Unknown closed-loop trial parameters: {sorted(unknown)}")
+    p = {**CLOSED_LOOP_DEFAULTS, **params}
+    rng = np.random.default_rng(seed)
+
+    constants = get_control_constants()
+    sim_config = SimulatorConfig(
+        mass=constants['mass'],
+        gravity=constants['gravity'],
+        inertia=constants['inertia'],
+        wind_mean=p["wind_mean"],
+        wind_std=p["wind_std"],
+        drag_coefficient=p["drag_coefficient"],
+        sensor_noise_std=p["sensor_noise_std"],
+    )
+    sim = BatchDroneSimulator(1, sim_config, seed=int(rng.integers(2**31)))
+
+    controller_config = GeometricControllerConfig()
+    for gain in ("kp_pos", "ki_pos", "kd_pos"):
+        setattr(controller_config, gain, getattr(controller_config, gain) * p["gain_scale"])
+    controller = GeometricController(config=controller_config, tuning_profile="")
+
+    start = np.array([0.0, 0.0, 2.0])
+    goal = start + [p["distance_m"], 0.0, 1.0]
+    obstacles = _place_obstacles(rng, start, goal, p["obstacle_density"], p["obstacle_radius"])
+    collision_distance = p["obstacle_radius"] + 0.25
+    sim.reset(position=start)
+
+    dt = p["dt"]
+    steps = int(round(p["duration_s"] / dt))
+    travel_time = 0.6 * p["duration_s"]
+    # The controller builds b1 = ψ × b3, so a yaw vector perpendicular to the
+    # direction of travel keeps forward tilt away from the yaw-singularity fallback
+    desired_yaw = math.atan2(goal[1] - start[1], goal[0] - start[0]) + math.pi / 2
+    latencies = np.empty(steps)
+    torque = np.zeros(3)
+    max_tracking_error = 0.0
+    min_clearance = math.inf
+    collided = False
+
+    completed_steps = 0
+    for i in range(steps):
+        desired_pos, desired_vel, desired_acc = _minimum_jerk(start, goal, i * dt, travel_time)
+        observed = sim.observe()
+        t0 = time.perf_counter()
+        thrust, _ = controller.compute_control_fast(
+            observed["position"][0], observed["velocity"][0], observed["attitude"][0],
+            observed["angular_velocity"][0], desired_pos, desired_vel, desired_acc,
+            desired_yaw, 0.0, dt, out=torque,
+        )
+        latencies[i] = time.perf_counter() - t0
+        completed_steps = i + 1
+        sim.step(thrust, torque, dt)
+
+        position = sim.position[0]
+        if not np.all(np.isfinite(position)):
+            break
+        max_tracking_error = max(max_tracking_error, float(np.linalg.norm(position - desired_pos)))
+        if len(obstacles):
+            clearance = float(np.min(np.linalg.norm(obstacles - position, axis=1))) - collision_distance
+            min_clearance = min(min_clearance, clearance)
+            if clearance < 0.0:
+                collided = True
+                break
+
+    final_error = float(np.linalg.norm(sim.position[0] - goal))
+    if not math.isfinite(final_error):
+        final_error = math.inf
+    # NaN latencies when duration_s / dt rounds to zero steps
+    latencies_us = latencies[:completed_steps] * 1e6 if completed_steps else np.full(1, math.nan)
+    return {
+        "success": bool(not collided and final_error < p["goal_tolerance_m"]),
+        "final_error_m": final_error,
+        "max_tracking_error_m": max_tracking_error,
+        "min_clearance_m": min_clearance,
+        "collided": collided,
+        "latency_mean_us": float(latencies_us.mean()),
+        "latency_p95_us": float(np.percentile(latencies_us, 95)),
+        "latency_max_us": float(latencies_us.max()),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+def _init_worker() -> None:
+    # Per-trial set-up and diagnostics would flood the console across
+    # thousands of trials; outcomes are in the results file instead.
+    # Pool initializer only: the level is never restored in the worker
+    logging.getLogger("dart_planner").setLevel(logging.ERROR)
+
+
+@contextmanager
+def _quiet_trial_logging() -> Iterator[None]:
+    """In-process equivalent of _init_worker that restores the level afterwards."""
+    logger = logging.getLogger("dart_planner")
+    previous = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
+
+
+def _execute_trial(trial: Union[str, TrialFunction], spec: TrialSpec) -> Dict[str, Any]:
+    """Run one trial, turning exceptions into a failed row."""
+    start = time.perf_counter()
+    try:
+        result = dict(resolve_trial(trial)(dict(spec.params), spec.seed))
+        result.setdefault("error", "")
+    except Exception as e:
+        result = {"success": False, "error": f"{type(e).__name__}: {e}"}
+    result.update(trial_id=spec.trial_id, seed=spec.seed, wall_time_s=time.perf_counter() - start)
+    result.update(spec.params)
+    return result
+
+
+class ResultsWriter:
+    """Append-only CSV writer with a fixed column set"""
+
+    def __init__(self, path: Path, columns: Sequence[str]):
+        self.path = path
+        self.columns = list(columns)
+        new_file = not path.exists() or path.stat().st_size == 0
+        self._file = path.open("a", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+        if new_file:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._writer.writerow({name: row.get(name, "") for name in self.columns})
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def columnar_path(output: Union[str, Path]) -> Path:
+    """Columnar results file written next to a CSV journal."""
+    return Path(output).with_suffix(".npz")
+
+
+def write_columnar(results: Dict[str, np.ndarray], path: Union[str, Path]) -> Path:
+    """Write loaded result columns as one ``.npz`` array per column."""
+    path = Path(path)
+    arrays = {name: values.astype(str) if values.dtype == object else values
+              for name, values in results.items()}
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+    return path
+
+
+def load_results(path: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """
+    Read a results file (CSV journal or columnar ``.npz``) into columns, sorted by trial id.
+
+    Numeric columns become float arrays (missing values are NaN), ``success``
+    and ``collided`` become bool arrays, ``error`` stays a string array.
+    """
+    path = Path(path)
+    if path.suffix == ".npz":
+        with np.load(path) as data:
+            columns = {name: data[name] for name in data.files}
+        if "error" in columns:
+            columns["error"] = columns["error"].astype(object)
+        return columns
+    with path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    if not rows:
+        return {}
+    rows.sort(key=lambda row: int(row["trial_id"]))
+    columns: Dict[str, np.ndarray] = {}
+    for name in rows[0]:
+        values = [row[name] for row in rows]
+        if name == "error":
+            columns[name] = np.array(values, dtype=object)
+        elif name in ("success", "collided"):
+            columns[name] = np.array([v == "True" for v in values])
+        elif name in ("trial_id", "seed"):
+            columns[name] = np.array([int(v) for v in values], dtype=np.int64)
+        else:
+            columns[name] = np.array([float(v) if v not in ("", None) else math.nan for v in values])
+    return columns
+
+
+def _check_manifest(config: CampaignConfig, output: Path) -> None:
+    manifest_path = output.with_name(output.name + ".manifest.json")
+    manifest = config.manifest()
+    if manifest_path.exists() and output.exists():
+        existing = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if existing != manifest:
+            raise ConfigurationError(
+                f"{output} belongs to a different campaign (see {manifest_path}); "
+                "use a new output file or the original campaign settings to resume"
+            )
+    else:
+        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def run_campaign(config: CampaignConfig,
+                 trial_fn: Optional[TrialFunction] = None,
+                 progress: Optional[Callable[[int, int], None]] = None) -> CampaignSummary:
+    """
+    Run (or resume) a campaign and return its summary.
+
+    Args:
+        config: Campaign definition
+        trial_fn: Picklable trial callable overriding ``config.trial``
+        progress: Called with (completed, total) after each finished trial
+    """
+    started = time.perf_counter()
+    output = Path(config.output)
+    if output.suffix == ".npz":
+        raise ConfigurationError(f"{output}: output is the CSV journal; the .npz is written next to it")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    _check_manifest(config, output)
+
+    trials = make_trials(config)
+    done = set()
+    if output.exists() and output.stat().st_size > 0:
+        existing = load_results(output)
+        if existing:
+            done = set(existing["trial_id"].tolist())
+    pending = [spec for spec in trials if spec.trial_id not in done]
+
+    trial = trial_fn if trial_fn is not None else config.trial
+    columns = list(RESULT_COLUMNS) + sorted(set(config.fixed) | set(config.grid))
+    writer = ResultsWriter(output, columns)
+    completed = len(trials) - len(pending)
+    try:
+        workers = config.workers if config.workers is not None else (os.cpu_count() or 1)
+        if workers <= 1:
+            with _quiet_trial_logging():
+                for spec in pending:
+                    writer.write(_execute_trial(trial, spec))
+                    completed += 1
+                    if progress:
+                        progress(completed, len(trials))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = [pool.submit(_execute_trial, trial, spec) for spec in pending]
+                for future in as_completed(futures):
+                    writer.write(future.result())
+                    completed += 1
+                    if progress:
+                        progress(completed, len(trials))
+    finally:
+        writer.close()
+
+    results = load_results(output)
+    write_columnar(results, columnar_path(output))
+    return summarize(results, total_trials=len(trials), executed_trials=len(pending),
+                     parameters=sorted(config.grid), wall_time_s=time.perf_counter() - started)
+
+
+def summarize(results: Dict[str, np.ndarray],
+              total_trials: Optional[int] = None,
+              executed_trials: int = 0,
+              parameters: Sequence[str] = (),
+              wall_time_s: float = 0.0) -> CampaignSummary:
+    """Aggregate success and latency statistics from loaded results."""
+    n = len(results.get("trial_id", ()))
+    success = results.get("success", np.zeros(0, dtype=bool))
+    errors = int(np.sum(results["error"] != "")) if n else 0
+
+    def latency_stats(mask: np.ndarray) -> Dict[str, float]:
+        if not n or "latency_mean_us" not in results:
+            return {}
+        means = results["latency_mean_us"][mask]
+        p95s = results["latency_p95_us"][mask]
+        maxes = results["latency_max_us"][mask]
+        valid = np.isfinite(means)
+        if not valid.any():
+            return {}
+        return {
+            "median_of_means": float(np.median(means[valid])),
+            "p95_of_p95s": float(np.percentile(p95s[valid], 95)),
+            "max": float(np.max(maxes[valid])),
+        }
+
+    per_point = []
+    if n and parameters:
+        keys = np.stack([results[name] for name in parameters], axis=1)
+        for point in np.unique(keys, axis=0):
+            mask = np.all(keys == point, axis=1)
+            per_point.append({
+                "params": dict(zip(parameters, point.tolist())),
+                "trials": int(mask.sum()),
+                "success_rate": float(success[mask].mean()),
+                "latency_us": latency_stats(mask),
+            })
+
+    return CampaignSummary(
+        total_trials=total_trials if total_trials is not None else n,
+        completed_trials=n,
+        executed_trials=executed_trials,
+        successes=int(success.sum()),
+        success_rate=float(success.mean()) if n else 0.0,
+        errors=errors,
+        latency_us=latency_stats(np.ones(n, dtype=bool)),
+        per_point=per_point,
+        wall_time_s=wall_time_s,
+    )
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _parse_assignment(text: str, multi: bool):
+    name, sep, values = text.partition("=")
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"expected name=value{',...' if multi else ''}, got '{text}'")
+    try:
+        parsed = [float(v) for v in values.split(",")] if multi else float(values)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"non-numeric value in '{text}'")
+    return name.strip(), parsed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dart-monte-carlo",
+        description="Run a resumable Monte Carlo simulation campaign across a process pool.",
+    )
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2,...",
+                        type=lambda s: _parse_assignment(s, multi=True),
+                        help="Grid parameter and its values (repeatable)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        type=lambda s: _parse_assignment(s, multi=False),
+                        help="Fixed trial parameter (repeatable)")
+    parser.add_argument("--trials-per-point", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0, help="Campaign base seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", default="monte_carlo_results.csv", help="Results CSV journal (resumed if present); a columnar .npz is written next to it")
+    parser.add_argument("--trial", default=DEFAULT_TRIAL, help="Trial function as module:function")
+    parser.add_argument("--summary", default=None, help="Also write the JSON summary to this file")
+    parser.add_argument("--quiet", action="store_true", help="No progress output")
+    return parser
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    args = build_parser().parse_args(None if argv is None else list(argv))
+    config = CampaignConfig(
+        grid=dict(args.param),
+        trials_per_point=args.trials_per_point,
+        base_seed=args.seed,
+        output=args.output,
+        workers=args.workers,
+        trial=args.trial,
+        fixed=dict(args.set),
+    )
+
+    def report(done: int, total: int) -> None:
+        if not args.quiet and (done == total or done % max(1, total // 100) == 0):
+            print(f"\r{done}/{total} trials", end="" if done < total else "\n", file=sys.stderr, flush=True)
+
+    summary = run_campaign(config, progress=report)
+    text = json.dumps(summary.to_dict(), indent=2)
+    if args.summary:
+        Path(args.summary).write_text(text, encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
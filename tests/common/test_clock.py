@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from dart_planner.common.clock import Clock, SystemClock, VirtualClock, get_clock, run_virtual
+from dart_planner.common.quartic_scheduler import QuarticScheduler, create_control_task, create_planning_task
+from dart_planner.common.real_time_scheduler import RealTimeLoop
+from dart_planner.common.timing_alignment import TimingConfig, TimingManager
+
+
+def test_asyncio_timers_run_on_virtual_time():
+    clock = VirtualClock()
+
+    async def main():
+        wakeups = []
+        for _ in range(4000):
+            await asyncio.sleep(0.0025)
+            wakeups.append(get_clock().now())
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(asyncio.sleep(60.0), timeout=5.0)
+        return wakeups
+
+    start = time.perf_counter()
+    wakeups = run_virtual(main(), clock)
+    assert time.perf_counter() - start < 5.0
+    assert wakeups[-1] == pytest.approx(10.0)
+    assert clock.now() == pytest.approx(15.0)
+    np.testing.assert_allclose(np.diff(wakeups), 0.0025)
+    # The process default is restored afterwards
+    assert isinstance(get_clock(), SystemClock)
+
+
+def test_clock_interface_is_abstract():
+    with pytest.raises(TypeError):
+        Clock()
+
+    class WallOnly(Clock):
+        def now(self):
+            return 0.0
+
+    with pytest.raises(TypeError):
+        WallOnly()
+
+
+def test_virtual_clock_outside_event_loop_advances_directly():
+    clock = VirtualClock(start=5.0, epoch=1000.0)
+    clock.sleep_sync(0.5)
+    assert clock.now() == 5.5
+    assert clock.time() == 1000.5
+    asyncio.run(clock.sleep(0.25))
+    assert clock.now() == 5.75
+
+
+def _run_scheduler(duration_s):
+    clock = VirtualClock()
+    calls = {"control": [], "planning": []}
+
+    async def main():
+        scheduler = QuarticScheduler(enable_monitoring=True, clock=clock)
+        scheduler.add_task(create_control_task(lambda: calls["control"].append(clock.now()), 400.0))
+        scheduler.add_task(create_planning_task(lambda: calls["planning"].append(clock.now()), 50.0))
+        await scheduler.start()
+        await clock.sleep(duration_s)
+        await scheduler.stop()
+        return scheduler.get_all_stats()
+
+    return run_virtual(main(), clock), calls
+
+
+def test_quartic_scheduler_is_exact_and_deterministic_in_virtual_time():
+    start = time.perf_counter()
+    stats, calls = _run_scheduler(10.0)
+    assert time.perf_counter() - start < 10.0
+
+    # Ticks due exactly at the stop time may or may not run
+    assert 4000 <= len(calls["control"]) <= 4001
+    assert 500 <= len(calls["planning"]) <= 501
+    np.testing.assert_allclose(np.diff(calls["control"]), 0.0025, atol=1e-12)
+    np.testing.assert_allclose(np.diff(calls["planning"]), 0.02, atol=1e-12)
+    assert stats["control_loop"]["missed_deadlines"] == 0
+
+    _, again = _run_scheduler(10.0)
+    assert again == calls
+
+
+def test_real_time_loop_runs_sync_functions_inline_on_virtual_time():
+    clock = VirtualClock()
+    ticks = []
+
+    async def main():
+        loop = RealTimeLoop(100.0, "virtual", clock=clock)
+        async with loop.real_time_loop():
+            for _ in range(200):
+                await loop.iterate(lambda: ticks.append(clock.now()))
+        return loop.get_stats()
+
+    stats = run_virtual(main(), clock)
+    assert len(ticks) == 200
+    assert stats["actual_frequency_hz"] == pytest.approx(100.0, rel=0.02)
+    assert stats["missed_deadlines"] == 0
+
+
+def test_timing_manager_defaults_to_its_clock():
+    clock = VirtualClock()
+    manager = TimingManager(TimingConfig(control_frequency=100.0), clock=clock)
+    clock.advance(0.01)
+    assert manager.should_control()
+    assert not manager.should_control()
+    clock.advance(0.01)
+    assert manager.should_control()
@@ -0,0 +1,112 @@
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+from dart_planner.common.errors import ConfigurationError
+from dart_planner.common.flight_recorder import (
+    TRAJECTORY_LOG_COLUMNS, FlightRecorder, flight_log_as_csv, load_flight_record, read_flight_header,
+)
+from dart_planner.common.types import DroneState, FastDroneState
+from dart_planner.common.units import Q_
+
+
+def _record_steps(recorder, start, stop):
+    for i in range(start, stop):
+        state = FastDroneState(timestamp=i * 0.001, position=np.array([i, 0.0, 1.0]),
+                               velocity=np.array([0.0, i, 0.0]))
+        recorder.record_control_step(state.timestamp, state, np.array([i, 0.0, 1.5]), np.zeros(3), np.zeros(3),
+                                     thrust=9.81, torque=np.array([0.0, 0.0, i]), loop_time_s=0.001,
+                                     compute_time_s=0.0002, failsafe_active=i % 10 == 0)
+
+
+def test_records_load_as_structured_arrays(tmp_path):
+    path = tmp_path / "flight.fdr"
+    with FlightRecorder(path, capacity=100, metadata={"vehicle": "sim"}) as recorder:
+        _record_steps(recorder, 0, 40)
+        recorder.record_control_step(1.0, DroneState(timestamp=1.0, position=Q_(np.array([1.0, 2.0, 3.0]), "m")),
+                                     np.zeros(3), np.zeros(3), np.zeros(3), 9.0, np.zeros(3))
+        assert len(recorder) == 41
+        in_memory = recorder.read()
+
+    data = load_flight_record(path)
+    assert data.dtype.names[:3] == ("timestamp", "position", "velocity")
+    assert len(data) == 41 and data["position"].shape == (41, 3)
+    np.testing.assert_array_equal(data["position"][:40, 0], np.arange(40))
+    np.testing.assert_array_equal(data["position"][40], [1.0, 2.0, 3.0])
+    assert data["failsafe_active"].sum() == 4
+    np.testing.assert_array_equal(data, in_memory)
+    header = read_flight_header(path)
+    assert header["count"] == 41 and header["capacity"] == 100 and header["metadata"] == {"vehicle": "sim"}
+
+
+def test_ring_keeps_most_recent_records(tmp_path):
+    path = tmp_path / "ring.fdr"
+    layout = (("timestamp", 1), ("value", 2))
+    with FlightRecorder(path, capacity=16, layout=layout) as recorder:
+        for i in range(50):
+            recorder.append_row([float(i), i * 2.0, i * 3.0])
+        recorder.append(timestamp=50.0)
+        with pytest.raises(ConfigurationError):
+            recorder.append(altitude=1.0)
+        with pytest.raises(ConfigurationError):
+            recorder.record_control_step(0.0, FastDroneState(timestamp=0.0), 0, 0, 0, 0.0, 0)
+
+    data = load_flight_record(path)
+    np.testing.assert_array_equal(data["timestamp"][:-1], np.arange(35, 50))
+    assert data["timestamp"][-1] == 50.0 and np.isnan(data["value"][-1]).all()
+    np.testing.assert_array_equal(data["value"][0], [70.0, 105.0])
+
+
+def _crash_after_writing(path, count):
+    recorder = FlightRecorder(path, capacity=1000)
+    _record_steps(recorder, 0, count)
+    os._exit(1)  # no close(), no flush()
+
+
+def test_records_survive_a_crashed_writer(tmp_path):
+    path = tmp_path / "crash.fdr"
+    writer = multiprocessing.Process(target=_crash_after_writing, args=(str(path), 250))
+    writer.start()
+    writer.join()
+    assert writer.exitcode == 1
+    data = load_flight_record(path)
+    assert len(data) == 250
+    np.testing.assert_array_equal(data["torque"][:, 2], np.arange(250))
+    with pytest.raises(ConfigurationError):
+        read_flight_header(__file__)
+
+
+def test_record_being_overwritten_is_not_returned(tmp_path):
+    path = tmp_path / "wrap.fdr"
+    layout = (("timestamp", 1), ("value", 1))
+    with FlightRecorder(path, capacity=8, layout=layout) as recorder:
+        for i in range(20):
+            recorder.append_row([float(i), float(i)])
+        # A writer stopped halfway through overwriting the oldest record (12)
+        recorder._begin()[0] = -1.0
+        data = load_flight_record(path)
+        header = read_flight_header(path)
+    assert header["count"] == 20 and header["started"] == 21
+    np.testing.assert_array_equal(data["timestamp"], np.arange(13, 20))
+
+
+def test_csv_export_uses_trajectory_log_columns(tmp_path):
+    import csv
+
+    path = tmp_path / "improved_trajectory_log_1.fdr"
+    with FlightRecorder(path, capacity=100) as recorder:
+        _record_steps(recorder, 0, 20)
+
+    csv_path = flight_log_as_csv(path)
+    assert csv_path == path.with_suffix(".csv")
+    with open(csv_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0])[:len(TRAJECTORY_LOG_COLUMNS)] == list(TRAJECTORY_LOG_COLUMNS)
+    assert "attitude_x" in rows[0] and "compute_time_s" in rows[0]
+    assert len(rows) == 20
+    assert float(rows[5]["actual_x"]) == 5.0 and float(rows[5]["desired_z"]) == 1.5
+    assert float(rows[7]["torque_norm"]) == 7.0
+    assert [row["failsafe_active"] for row in rows[:2]] == ["True", "False"]
+    assert flight_log_as_csv(csv_path) == csv_path
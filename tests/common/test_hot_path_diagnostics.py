@@ -0,0 +1,138 @@
+import io
+import logging
+import threading
+
+import numpy as np
+
+from dart_planner.common import hot_path_diagnostics
+from dart_planner.common.hot_path_diagnostics import HotPathDiagnostics, flush_all
+from dart_planner.control.geometric_controller import GeometricController, GeometricControllerConfig
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_events_are_aggregated_per_interval(caplog):
+    clock = FakeClock()
+    diagnostics = HotPathDiagnostics("test.diagnostics", interval_s=1.0, clock=clock)
+
+    with caplog.at_level(logging.WARNING, logger="test.diagnostics"):
+        for i in range(1000):
+            clock.now = i * 0.001  # 1 kHz for one second
+            diagnostics.record("near_limit", float(i), "Value near limit")
+        clock.now = 1.0
+        diagnostics.record("near_limit", 5.0, "Value near limit")
+
+    lines = [r.getMessage() for r in caplog.records]
+    # Onset reported immediately, then one summary for the rest of the interval
+    assert len(lines) == 2
+    assert "x1 " in lines[0]
+    assert "x1000 " in lines[1] and "min=1 " in lines[1] and "max=999" in lines[1]
+    assert diagnostics.count("near_limit") == 1001
+
+
+def test_flush_reports_pending_events_once(caplog):
+    clock = FakeClock()
+    diagnostics = HotPathDiagnostics("test.diagnostics", interval_s=10.0, clock=clock)
+    with caplog.at_level(logging.DEBUG, logger="test.diagnostics"):
+        diagnostics.record("a")
+        diagnostics.record("a")
+        diagnostics.record("b", level=logging.ERROR)
+        diagnostics.flush()
+        diagnostics.flush()
+
+    levels = [(r.levelno, "[b]" in r.getMessage()) for r in caplog.records]
+    assert levels == [(logging.WARNING, False), (logging.WARNING, False), (logging.ERROR, True)]
+    assert diagnostics.get_stats()["a"]["total"] == 2
+
+
+def test_burst_followed_by_quiet_ticks_is_still_summarized(caplog):
+    clock = FakeClock()
+    diagnostics = HotPathDiagnostics("test.diagnostics", interval_s=1.0, clock=clock)
+    with caplog.at_level(logging.WARNING, logger="test.diagnostics"):
+        for i in range(50):
+            clock.now = i * 0.001
+            diagnostics.record("burst", message="Burst")
+        diagnostics.flush_due()  # interval not over yet
+        assert len(caplog.records) == 1
+
+        clock.now = 5.0  # no further record() calls
+        diagnostics.flush_due()
+        assert "x49 " in caplog.records[-1].getMessage()
+
+        diagnostics.record("burst", message="Burst")
+        clock.now = 5.5
+        flush_all()  # interpreter-exit path
+    lines = [r.getMessage() for r in caplog.records if r.name == "test.diagnostics"]
+    assert len(lines) == 3
+    assert "x1 " in lines[-1]
+
+
+def test_controller_yaw_singularity_warnings_are_rate_limited(caplog):
+    controller = GeometricController(config=GeometricControllerConfig(), tuning_profile="")
+    # Thrust tilted toward the desired yaw direction triggers the singularity check every tick
+    args = (np.zeros(3), np.zeros(3), np.zeros(3), np.zeros(3),
+            np.array([0.0, 0.0, 0.0]), np.zeros(3), np.array([6.0, 0.0, 0.0]))
+    with caplog.at_level(logging.WARNING, logger="dart_planner.control.geometric_controller"):
+        for _ in range(500):
+            controller.compute_control_fast(*args, desired_yaw=0.0, dt=0.001)
+
+    singularity_lines = [r for r in caplog.records if "yaw singularity" in r.getMessage().lower()]
+    assert 1 <= len(singularity_lines) <= 4
+    assert controller.get_performance_metrics()["yaw_singularity_count"] == 500
+
+
+def test_concurrent_flushes_do_not_lose_counts():
+    diagnostics = HotPathDiagnostics("test.diagnostics.threads", interval_s=0.0)
+    reported = []
+    diagnostics.logger.propagate = False
+    diagnostics.logger.setLevel(logging.WARNING)
+
+    class Collect(logging.Handler):
+        def emit(self, record):
+            reported.append(int(record.getMessage().split(" x")[1].split(" ")[0]))
+
+    handler = Collect()
+    diagnostics.logger.addHandler(handler)
+    try:
+        def worker():
+            for _ in range(5000):
+                diagnostics.record("hit")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(200):
+            diagnostics.flush()
+        for thread in threads:
+            thread.join()
+        diagnostics.flush()
+    finally:
+        diagnostics.logger.removeHandler(handler)
+    assert sum(reported) == diagnostics.count("hit") == 20000
+
+
+def test_exit_flush_skips_closed_handlers_without_touching_raise_exceptions(monkeypatch):
+    diagnostics = HotPathDiagnostics("test.diagnostics.exit", interval_s=10.0)
+    logger = diagnostics.logger
+    logger.propagate = False
+    closed_stream, open_stream = io.StringIO(), io.StringIO()
+    closed_stream.close()
+    handlers = [logging.StreamHandler(closed_stream), logging.StreamHandler(open_stream)]
+    for handler in handlers:
+        logger.addHandler(handler)
+    monkeypatch.setattr(logging, "raiseExceptions", True)
+    try:
+        diagnostics.record("late", message="Late event")
+        diagnostics.record("late", message="Late event")
+        hot_path_diagnostics._flush_at_exit()
+    finally:
+        for handler in handlers:
+            logger.removeHandler(handler)
+    assert logging.raiseExceptions is True
+    assert "Late event [late] x1 " in open_stream.getvalue()
@@ -0,0 +1,106 @@
+import json
+import logging
+import threading
+
+from dart_planner.common import logging_config
+from dart_planner.common.logging_config import AsyncLogHandler, StructuredFormatter, StructuredLogger
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, gate=None):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5.0)
+        self.threads.add(threading.current_thread().name)
+        self.lines.append(self.format(record))
+
+
+def _isolated_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_structured_records_are_formatted_on_the_writer_thread(monkeypatch):
+    sink = ListHandler()
+    sink.setFormatter(StructuredFormatter())
+    handler = AsyncLogHandler([sink])
+    monkeypatch.setattr(logging_config, "_async_handler", handler)
+    try:
+        stdlib = _isolated_logger("dart_planner.tests.async_log", handler)
+        log = StructuredLogger("dart_planner.tests.async_log", correlation_id="abc")
+        log.info("control step", extra_fields={"step": 3})
+        stdlib.warning("plain %s", "record")
+        log.debug("below threshold")
+        stdlib.setLevel(logging.INFO)
+        log.debug("filtered out")
+        handler.flush()
+    finally:
+        handler.close()
+
+    entries = [json.loads(line) for line in sink.lines]
+    assert [e['message'] for e in entries] == ["control step", "plain record", "below threshold"]
+    assert entries[0]['step'] == 3 and entries[0]['correlation_id'] == "abc"
+    assert entries[0]['level'] == "INFO" and entries[1]['level'] == "WARNING"
+    assert sink.threads == {"dart-log-writer"}
+
+
+def test_full_queue_drops_and_reports(monkeypatch):
+    gate = threading.Event()
+    sink = ListHandler(gate)
+    handler = AsyncLogHandler([sink], capacity=64)
+    monkeypatch.setattr(logging_config, "_async_handler", handler)
+    try:
+        _isolated_logger("dart_planner.tests.async_drop", handler)
+        log = StructuredLogger("dart_planner.tests.async_drop")
+        for i in range(500):
+            log.info("burst", i=i)
+        assert handler.queue.dropped >= 500 - 2 * 64
+        gate.set()
+        handler.flush(timeout=5.0)
+    finally:
+        handler.close()
+    assert len(sink.lines) == 500 - handler.queue.dropped + 1
+    assert f"dropped {handler.queue.dropped} records" in sink.lines[-1]
+
+
+def test_other_handlers_keep_synchronous_records(caplog):
+    caplog.set_level(logging.INFO)
+    StructuredLogger("dart_planner.tests.caplog").info("seen synchronously", value=7)
+    record = caplog.records[-1]
+    assert record.getMessage() == "seen synchronously" and record.value == 7
+
+
+def test_multiprocessing_child_drains_queue_on_exit(monkeypatch, tmp_path):
+    import multiprocessing
+
+    import pytest
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("needs the fork start method")
+    log_file = tmp_path / "child.log"
+    sink = logging.FileHandler(log_file)
+    # A long flush interval: only the exit drain writes the child's record
+    handler = AsyncLogHandler([sink], flush_interval_s=60.0)
+    monkeypatch.setattr(logging_config, "_async_handler", handler)
+    logging_config._install_worker_exit_flush()
+    _isolated_logger("dart_planner.tests.async_child", handler)
+    try:
+        child = multiprocessing.get_context("fork").Process(target=_log_from_child)
+        child.start()
+        child.join(10.0)
+    finally:
+        handler.close()
+    assert child.exitcode == 0
+    assert log_file.read_text().splitlines() == ["from child"]
+
+
+def _log_from_child():
+    StructuredLogger("dart_planner.tests.async_child").info("from child")
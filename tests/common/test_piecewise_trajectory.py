@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from dart_planner.common.errors import ValidationError
+from dart_planner.common.piecewise_trajectory import PiecewiseTrajectory
+from dart_planner.common.types import Trajectory
+from dart_planner.common.units import Q_
+from dart_planner.control.trajectory_smoother import TrajectorySmoother
+
+
+def _samples(t):
+    return {
+        "positions": np.stack([np.sin(3 * t), t ** 3, np.cos(t)], axis=1),
+        "velocities": np.stack([3 * np.cos(3 * t), 3 * t ** 2, -np.sin(t)], axis=1),
+        "accelerations": np.stack([-9 * np.sin(3 * t), 6 * t, -np.cos(t)], axis=1),
+    }
+
+
+def test_hermite_fit_matches_smooth_motion_and_its_derivatives():
+    knots = np.linspace(0.0, 2.0, 21)
+    compiled = PiecewiseTrajectory(knots, _samples(knots))
+    query = np.linspace(0.0, 2.0, 997)
+    rows = compiled.evaluate_many(query)
+    expected = _samples(query)
+    for name, tolerance in (("positions", 1e-7), ("velocities", 1e-5), ("accelerations", 1e-3)):
+        assert np.abs(compiled.field(rows, name) - expected[name]).max() < tolerance
+
+    # Velocities only: cubic Hermite, still exact at the knots
+    cubic = PiecewiseTrajectory(knots, {name: _samples(knots)[name] for name in ("positions", "velocities")})
+    assert np.abs(cubic.evaluate_many(query)[:, :3] - expected["positions"]).max() < 1e-4
+    assert np.allclose(cubic.evaluate_many(knots), cubic.data)
+
+
+def test_cursor_evaluation_matches_batch_in_any_order():
+    knots = np.cumsum(np.random.default_rng(3).uniform(0.01, 0.2, 50))
+    compiled = PiecewiseTrajectory(knots, _samples(knots))
+    forward = np.linspace(knots[0] - 1.0, knots[-1] + 1.0, 2000)
+    shuffled = np.random.default_rng(4).permutation(forward)
+    for query in (forward, shuffled):
+        rows = np.array([compiled.evaluate(t) for t in query])
+        assert np.allclose(rows, compiled.evaluate_many(query), atol=1e-12)
+    # Clamped to the exact end samples
+    assert np.array_equal(compiled.evaluate(knots[-1] + 5.0), compiled.data[-1])
+    assert np.array_equal(compiled.evaluate(knots[0] - 5.0), compiled.data[0])
+
+    linear = PiecewiseTrajectory([0.0, 1.0], {"positions": [[0.0], [1.0]], "velocities": [[0.0], [1.0]]},
+                                 interpolation="linear")
+    assert linear.evaluate(0.5) == pytest.approx([0.5, 0.5])
+    with pytest.raises(ValidationError):
+        PiecewiseTrajectory([0.0, 1.0], {"positions": [[0.0], [1.0]]}, interpolation="cubic")
+
+
+def test_repeated_and_unsorted_timestamps_keep_the_last_sample():
+    compiled = PiecewiseTrajectory([0.0, 1.0, 1.0, 3.0, 2.0], {"positions": [[0.0], [5.0], [1.0], [3.0], [2.0]]},
+                                   interpolation="linear")
+    assert np.array_equal(compiled.timestamps, [0.0, 1.0, 2.0, 3.0])
+    assert np.array_equal(compiled.data[:, 0], [0.0, 1.0, 2.0, 3.0])
+    assert compiled.evaluate(1.5) == pytest.approx([1.5])
+
+
+def test_trajectory_consumers_share_compiled_form():
+    knots = np.linspace(0.0, 1.0, 11)
+    samples = _samples(knots)
+    trajectory = Trajectory(
+        timestamps=knots,
+        positions=Q_(samples["positions"] * 100.0, "cm"),
+        velocities=samples["velocities"],
+        accelerations=samples["accelerations"],
+        yaws=Q_(np.degrees(knots), "deg"),
+    )
+    compiled = PiecewiseTrajectory.from_trajectory(trajectory)
+    assert compiled.compiles(trajectory) and set(compiled.columns) == {
+        "positions", "velocities", "accelerations", "yaws"}
+    assert np.allclose(compiled.data[:, compiled.columns["positions"]], samples["positions"])
+    assert compiled.field(compiled.evaluate(0.55), "yaws") == pytest.approx([0.55])
+
+    smoother = TrajectorySmoother(interpolation="hermite")
+    smoother.update_trajectory(trajectory, current_state=None)
+    assert smoother._compiled_trajectory.compiles(trajectory)
+    pos, vel, acc = smoother._interpolate_trajectory(
+        smoother.trajectory_start_time + 0.35, trajectory, smoother.trajectory_start_time)
+    expected = _samples(np.array([0.35]))
+    assert np.allclose(pos, expected["positions"][0], atol=1e-6)
+    assert np.allclose(acc, expected["accelerations"][0], atol=1e-3)
+
+
+def test_smoother_blends_linearly_by_default_and_recompiles_on_invalidate():
+    knots = np.linspace(0.0, 1.0, 11)
+    samples = _samples(knots)
+    trajectory = Trajectory(timestamps=knots, positions=samples["positions"].copy(),
+                            velocities=samples["velocities"], accelerations=samples["accelerations"])
+    smoother = TrajectorySmoother()
+    smoother.update_trajectory(trajectory, current_state=None)
+    start = smoother.trajectory_start_time
+    pos, _, _ = smoother._interpolate_trajectory(start + 0.35, trajectory, start)
+    assert np.allclose(pos, 0.5 * (samples["positions"][3] + samples["positions"][4]))
+
+    compiled = smoother._compiled_trajectory
+    trajectory.positions[4] += 1.0
+    assert compiled.compiles(trajectory)  # identity-keyed: in-place edits need invalidate()
+    pos, _, _ = smoother._interpolate_trajectory(start + 0.4, trajectory, start)
+    assert np.allclose(pos, samples["positions"][4])
+
+    smoother.invalidate_trajectory()
+    assert not compiled.compiles(trajectory)
+    assert smoother._compiled_trajectory is not compiled and smoother._compiled_trajectory.compiles(trajectory)
+    pos, _, _ = smoother._interpolate_trajectory(start + 0.4, trajectory, start)
+    assert np.allclose(pos, samples["positions"][4] + 1.0)
+    with pytest.raises(ValidationError):
+        TrajectorySmoother(interpolation="spline")
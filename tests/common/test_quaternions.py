@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from dart_planner.common.quaternions import (
+    attitude_error,
+    body_rates_from_quaternions,
+    euler_rates_from_body_rates,
+    euler_to_quaternion,
+    euler_to_quaternion_into,
+    frame_attitude_error_into,
+    quaternion_multiply,
+    quaternion_to_euler,
+    quaternion_to_rotation_matrix,
+    rotation_matrix_to_quaternion,
+    thrust_yaw_to_quaternion,
+)
+from dart_planner.common.types import FastDroneState
+from dart_planner.control.geometric_controller import GeometricController, GeometricControllerConfig
+
+
+def _euler_to_matrix(euler):
+    roll, pitch, yaw = euler
+    cr, sr = np.cos(roll), np.sin(roll)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    Rz = np.array([[cy, -sy, 0], [sy, cy, 0], [0, 0, 1]])
+    Ry = np.array([[cp, 0, sp], [0, 1, 0], [-sp, 0, cp]])
+    Rx = np.array([[1, 0, 0], [0, cr, -sr], [0, sr, cr]])
+    return Rz @ Ry @ Rx
+
+
+def _random_euler(rng, n):
+    return np.column_stack((rng.uniform(-np.pi, np.pi, n),
+                            rng.uniform(-1.4, 1.4, n),
+                            rng.uniform(-np.pi, np.pi, n)))
+
+
+def test_conversions_round_trip_batch_and_single():
+    rng = np.random.default_rng(0)
+    euler = _random_euler(rng, 200)
+    q = euler_to_quaternion(euler)
+    R = quaternion_to_rotation_matrix(q)
+
+    np.testing.assert_allclose(R, np.array([_euler_to_matrix(e) for e in euler]), atol=1e-12)
+    np.testing.assert_allclose(quaternion_to_euler(q), euler, atol=1e-9)
+    # Shepperd conversion recovers the same rotation (up to sign)
+    q_back = rotation_matrix_to_quaternion(R)
+    np.testing.assert_allclose(np.abs(np.sum(q_back * q, axis=1)), 1.0, atol=1e-12)
+    # Single quaternions use the same code path
+    np.testing.assert_allclose(euler_to_quaternion(euler[0]), q[0])
+    np.testing.assert_allclose(euler_to_quaternion_into(euler[0], np.zeros(4)), q[0], atol=1e-15)
+    # Composition matches matrix products
+    np.testing.assert_allclose(quaternion_to_rotation_matrix(quaternion_multiply(q[:-1], q[1:])),
+                               R[:-1] @ R[1:], atol=1e-12)
+
+
+def test_attitude_error_matches_rotation_matrix_form():
+    rng = np.random.default_rng(1)
+    euler = _random_euler(rng, 100)
+    euler_des = _random_euler(rng, 100)
+    R = np.array([_euler_to_matrix(e) for e in euler])
+    R_des = np.array([_euler_to_matrix(e) for e in euler_des])
+    E = np.transpose(R_des, (0, 2, 1)) @ R - np.transpose(R, (0, 2, 1)) @ R_des
+    expected = 0.5 * np.stack((E[:, 2, 1], E[:, 0, 2], E[:, 1, 0]), axis=1)
+
+    q = euler_to_quaternion(euler)
+    q_des = euler_to_quaternion(euler_des)
+    np.testing.assert_allclose(attitude_error(q_des, q), expected, atol=1e-12)
+    np.testing.assert_allclose(attitude_error(-q_des, q), expected, atol=1e-12)
+
+    out = np.zeros(3)
+    for k in range(len(q)):
+        b1, b2, b3 = R_des[k].T
+        frame_attitude_error_into(b1, b2, b3, q[k], out)
+        np.testing.assert_allclose(out, expected[k], atol=1e-12)
+
+
+def test_body_rates_recover_constant_rotation():
+    omega = np.array([0.3, -0.2, 0.5])
+    dt = 0.05
+    angle = np.linalg.norm(omega) * dt
+    step = np.concatenate(([np.cos(angle / 2)], np.sin(angle / 2) * omega / np.linalg.norm(omega)))
+    q0 = euler_to_quaternion(np.array([0.1, 0.2, -0.3]))
+    q1 = quaternion_multiply(q0, step)
+    np.testing.assert_allclose(body_rates_from_quaternions(q0, -q1, dt), omega, atol=1e-12)
+    np.testing.assert_allclose(body_rates_from_quaternions(q0, q0, dt), np.zeros(3), atol=1e-15)
+
+
+def test_euler_rates_match_finite_differences_of_rotated_attitude():
+    rng = np.random.default_rng(11)
+    euler = _random_euler(rng, 50)
+    omega = rng.uniform(-1.0, 1.0, (50, 3))
+    dt = 1e-6
+    angle = np.linalg.norm(omega, axis=1, keepdims=True) * dt
+    step = np.hstack((np.cos(angle / 2), np.sin(angle / 2) * omega / np.linalg.norm(omega, axis=1, keepdims=True)))
+    moved = quaternion_to_euler(quaternion_multiply(euler_to_quaternion(euler), step))
+    finite = (np.angle(np.exp(1j * (moved - euler)))) / dt
+    np.testing.assert_allclose(euler_rates_from_body_rates(euler, omega), finite, atol=1e-4)
+    # Level attitude: the yaw rate is the body z rate
+    np.testing.assert_allclose(euler_rates_from_body_rates(np.zeros(3), omega[0]), omega[0])
+
+
+def test_thrust_yaw_frame_matches_controller_construction():
+    rng = np.random.default_rng(2)
+    b3 = rng.normal(0.0, 0.3, (50, 3)) + [0.0, 0.0, 1.0]
+    b3 /= np.linalg.norm(b3, axis=1, keepdims=True)
+    yaw = rng.uniform(-np.pi, np.pi, 50)
+    R = quaternion_to_rotation_matrix(thrust_yaw_to_quaternion(b3, yaw))
+    for k in range(50):
+        yaw_vector = np.array([np.cos(yaw[k]), np.sin(yaw[k]), 0.0])
+        b1 = np.cross(yaw_vector, b3[k])
+        b1 /= np.linalg.norm(b1)
+        np.testing.assert_allclose(R[k], np.column_stack((b1, np.cross(b3[k], b1), b3[k])), atol=1e-12)
+
+
+@pytest.mark.parametrize("fallback", ["skip_yaw", "maintain_current"])
+def test_controller_quaternion_and_euler_inputs_agree(fallback):
+    config = dict(yaw_singularity_fallback_method=fallback)
+    euler_ctrl = GeometricController(config=GeometricControllerConfig(**config), tuning_profile="")
+    quat_ctrl = GeometricController(config=GeometricControllerConfig(**config), tuning_profile="")
+    rng = np.random.default_rng(4)
+    for _ in range(50):
+        state = FastDroneState(timestamp=0.0, position=rng.normal(0, 1, 3), velocity=rng.normal(0, 1, 3),
+                               attitude=_random_euler(rng, 1)[0] * 0.3, angular_velocity=rng.normal(0, 1, 3))
+        reference = (rng.normal(0, 1, 3), rng.normal(0, 1, 3), rng.normal(0, 5, 3), float(rng.uniform(-3, 3)))
+        thrust_e, torque_e = euler_ctrl.compute_control_fast(
+            state.position, state.velocity, state.attitude, state.angular_velocity, *reference, 0.0, 0.01)
+        thrust_q, torque_q = quat_ctrl.compute_control_from_fast_state(state, *reference, 0.0, 0.01)
+        assert thrust_q == pytest.approx(thrust_e, rel=1e-12)
+        np.testing.assert_allclose(torque_q, torque_e, rtol=1e-9, atol=1e-12)
+
+
+def test_fast_state_quaternion_follows_attitude():
+    state = FastDroneState(timestamp=0.0)
+    assert state.quaternion is None
+    np.testing.assert_allclose(state.get_quaternion(), [1.0, 0.0, 0.0, 0.0])
+
+    state.attitude = np.array([0.0, 0.0, np.pi / 2])
+    np.testing.assert_allclose(state.get_quaternion(), euler_to_quaternion(state.attitude))
+    state.attitude[2] = -np.pi / 2  # in-place update
+    out = np.empty(4)
+    assert state.get_quaternion(out) is out
+    np.testing.assert_allclose(out, euler_to_quaternion(state.attitude))
+
+    supplied = np.array([0.0, 1.0, 0.0, 0.0])
+    estimated = FastDroneState(timestamp=0.0, quaternion=supplied)
+    assert estimated.get_quaternion() is supplied
+    np.testing.assert_array_equal(estimated.get_quaternion(out), supplied)
@@ -0,0 +1,114 @@
+import multiprocessing
+import pickle
+import time
+
+import numpy as np
+import pytest
+
+from dart_planner.common.errors import CommunicationError, ConfigurationError
+from dart_planner.common.multiprocess_control_loop import ProcessControlLoop
+from dart_planner.common.shared_state_channel import SeqlockBlock, SharedControlChannel
+from dart_planner.common.types import FastDroneState
+
+
+def _state(t, z=1.0):
+    return FastDroneState(timestamp=t, position=np.array([0.5, -0.5, z]),
+                          velocity=np.array([0.1, 0.2, 0.3]), attitude=np.array([0.0, 0.1, 0.2]))
+
+
+def hover_control(state):
+    """Module level so the control process can run it under any start method."""
+    return 9.81 + state.position[2], state.velocity * 2.0
+
+
+def _uniform_writer(name, count):
+    channel = SharedControlChannel(name)
+    for i in range(1, count + 1):
+        channel.write_command(float(i), np.full(3, float(i)), state_timestamp=float(i),
+                              compute_time_s=float(i), timestamp=float(i))
+    channel.close()
+
+
+def test_state_and_command_roundtrip():
+    with SharedControlChannel() as channel:
+        assert channel.read_state() == (0, None)
+        assert channel.read_command() is None
+
+        state = _state(12.5)
+        assert channel.write_state(state) == 1
+        version, copy = channel.read_state()
+        assert version == 1 and copy.timestamp == 12.5
+        np.testing.assert_array_equal(copy.position, state.position)
+        np.testing.assert_array_equal(copy.quaternion, state.get_quaternion())
+
+        channel.write_command(10.0, np.array([0.1, 0.2, 0.3]), state_timestamp=12.5, state_version=1,
+                              iteration=7)
+        command = channel.read_command()
+        assert command.version == 1 and command.iteration == 7 and command.state_version == 1
+        np.testing.assert_array_equal(command.torque, [0.1, 0.2, 0.3])
+
+        # Pickles by name and attaches to the same segment
+        other = pickle.loads(pickle.dumps(channel))
+        assert other.read_state()[1].timestamp == 12.5
+        other.close()
+        assert channel.read_state()[0] == 1
+
+
+def test_torn_reads_are_detected():
+    buffer = bytearray(128)
+    block = SeqlockBlock(buffer, 0, 4)
+    block.write(np.arange(4.0))
+    assert block.read()[0] == 1
+
+    # Payload changed without the matching checksum (a store seen out of order)
+    np.ndarray((4,), dtype=np.float64, buffer=buffer, offset=8)[2] = 99.0
+    with pytest.raises(CommunicationError):
+        block.read(max_retries=20)
+    assert block.torn_reads == 20
+
+    # Writer stuck mid-write
+    block.write(np.arange(4.0))
+    np.ndarray((1,), dtype=np.uint64, buffer=buffer, offset=0)[0] += 1
+    with pytest.raises(CommunicationError):
+        block.read(max_retries=20)
+
+
+def test_reads_never_see_a_partial_write_from_another_process():
+    with SharedControlChannel() as channel:
+        writer = multiprocessing.Process(target=_uniform_writer, args=(channel.name, 20000))
+        writer.start()
+        seen = 0
+        while writer.is_alive() or seen == 0:
+            command = channel.read_command()
+            if command is not None:
+                seen += 1
+                values = {command.thrust, command.state_timestamp, command.compute_time_s,
+                          command.timestamp, *command.torque}
+                assert len(values) == 1, command
+            time.sleep(0.0001)
+        writer.join()
+        assert channel.read_command().thrust == 20000.0
+
+
+def test_process_control_loop_shares_state_and_commands():
+    loop = ProcessControlLoop(hover_control, 1000.0, shared_memory=True, cpu_affinity=[0])
+    loop.start()
+    try:
+        for i in range(1, 21):
+            version = loop.write_state(_state(float(i), z=float(i)))
+            deadline = time.perf_counter() + 2.0
+            command = loop.get_command()
+            while (command is None or command.state_version < version) and time.perf_counter() < deadline:
+                time.sleep(0.0002)
+                command = loop.get_command()
+            assert command is not None and command.state_version == version
+            assert command.thrust == pytest.approx(9.81 + i)
+            np.testing.assert_allclose(command.torque, [0.2, 0.4, 0.6])
+            assert command.state_timestamp == float(i)
+        assert command.iteration >= 20
+    finally:
+        loop.stop()
+    assert not loop.process.is_alive()
+
+    with pytest.raises(ConfigurationError):
+        ProcessControlLoop(hover_control, 100.0).write_state(_state(0.0))
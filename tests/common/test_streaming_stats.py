@@ -0,0 +1,139 @@
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from dart_planner.common.clock import VirtualClock, run_virtual
+from dart_planner.common.quartic_scheduler import QuarticScheduler, QuarticTask
+from dart_planner.common.streaming_stats import QuantileSketch, WindowedQuantileSketch
+
+
+def _sketch_of(values, **kwargs):
+    sketch = QuantileSketch(**kwargs)
+    for value in values:
+        sketch.record(float(value))
+    return sketch
+
+
+def test_quantiles_match_numpy_within_relative_error():
+    rng = np.random.default_rng(7)
+    values = np.concatenate((rng.lognormal(-2.0, 1.0, 20000), -rng.lognormal(-3.0, 0.5, 5000)))
+    sketch = _sketch_of(values)
+
+    assert sketch.count == values.size
+    assert sketch.mean == pytest.approx(values.mean())
+    assert sketch.std == pytest.approx(values.std())
+    assert (sketch.min, sketch.max) == (values.min(), values.max())
+    for q in (0.01, 0.25, 0.5, 0.9, 0.99, 0.999):
+        exact = np.quantile(values, q)
+        # 5 sub-bucket bits: within 1/16 of the value, plus one resolution step
+        assert sketch.quantile(q) == pytest.approx(exact, rel=1 / 16, abs=1e-3)
+    assert sketch.quantile(0.0) == values.min() and sketch.quantile(1.0) == values.max()
+
+    hist, edges = sketch.histogram(bins=20)
+    assert hist.sum() == values.size and edges[0] == values.min() and edges[-1] == values.max()
+
+
+def test_merge_and_pickle_combine_sketches():
+    rng = np.random.default_rng(3)
+    a_values, b_values = rng.normal(0.0, 0.2, 3000), rng.normal(1.0, 0.1, 5000)
+    a, b = _sketch_of(a_values), _sketch_of(b_values)
+    merged = pickle.loads(pickle.dumps(a)).merge(pickle.loads(pickle.dumps(b)))
+    combined = _sketch_of(np.concatenate((a_values, b_values)))
+
+    assert merged.summary() == pytest.approx(combined.summary())
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(resolution=1e-6))
+
+
+def test_counts_cover_only_the_occupied_span():
+    rng = np.random.default_rng(5)
+    narrow, wide = rng.normal(0.05, 0.01, 2000), rng.normal(-50.0, 1.0, 10)
+    sketch = _sketch_of(narrow)
+    assert sketch._counts.size < 200
+    reference = _sketch_of(np.concatenate((narrow, wide)))
+    sketch.merge(_sketch_of(wide))  # widens the stored span downwards
+    assert sketch.summary() == pytest.approx(reference.summary())
+
+    window = WindowedQuantileSketch()
+    window.record_many(narrow, now=0.5)
+    window.record_many(iter(wide), now=0.6)
+    assert window.snapshot().summary() == pytest.approx(reference.summary())
+
+
+def test_empty_and_non_finite_samples():
+    sketch = QuantileSketch()
+    assert math.isnan(sketch.quantile(0.5)) and sketch.summary()["count"] == 0
+    sketch.record(float("nan"))
+    sketch.record(float("inf"))
+    sketch.record(2e9)  # beyond max_value: counted in the last bucket
+    assert sketch.count == 2 and sketch.max == float("inf")
+    # Both share the last bucket; the exact minimum bounds its estimate
+    assert sketch.quantile(0.5) == 2e9
+
+
+def test_window_forgets_old_slices():
+    window = WindowedQuantileSketch(window_s=1.0, slices=10)
+    for i in range(1000):
+        window.record(5.0, now=i * 0.001)           # t in [0, 1)
+    for i in range(100):
+        window.record(1.0, now=1.0 + i * 0.001)     # t in [1, 1.1)
+    assert window.snapshot().count == 1000           # [0.1, 1.1) still in the window
+    assert window.snapshot(now=1.95).summary()["max"] == 1.0
+    assert window.snapshot(now=5.0).count == 0
+
+
+def test_batched_samples_keep_their_own_times():
+    window = WindowedQuantileSketch(window_s=1.0, slices=10)
+    times = np.arange(1000) * 0.001 + 0.5005         # taken over [0.5, 1.5)
+    values = np.where(times < 1.0, 5.0, 1.0)
+    window.record_many(values, now=times)            # fed once, at the end
+    assert window.snapshot().count == 1000
+    # Samples taken before 0.6 have expired although they were fed at 1.5
+    assert window.snapshot(now=1.55).count == 900
+    assert window.snapshot(now=2.05).summary()["max"] == 1.0
+    with pytest.raises(ValueError):
+        window.record_many(values, now=times[:10])
+
+
+def test_scheduler_sketches_use_sample_times():
+    clock = VirtualClock()
+
+    async def main():
+        scheduler = QuarticScheduler(enable_monitoring=False, clock=clock)
+        task = QuarticTask(name="control", func=lambda: None, frequency_hz=100.0)
+        scheduler.add_task(task)
+        await scheduler.start()
+        await clock.sleep(1.0)
+        await scheduler.stop()
+        scheduler._feed_sketches(clock.now())
+        return task
+
+    task = run_virtual(main(), clock)
+    assert len(task.execution_sample_times) == len(task.execution_times)
+    assert len(task.jitter_sample_times) == len(task.jitter_samples)
+    # Samples of the first half second leave a 10 s window 10 s after they were taken
+    assert len(task.jitter_stats) == task.release_count
+    assert len(task.jitter_stats.snapshot(10.55)) < 0.6 * task.release_count
+
+
+def test_scheduler_reports_windowed_percentiles():
+    clock = VirtualClock()
+
+    async def main():
+        scheduler = QuarticScheduler(enable_monitoring=False, clock=clock)
+        scheduler.add_task(QuarticTask(name="control", func=lambda: None, frequency_hz=100.0))
+        await scheduler.start()
+        await clock.sleep(2.0)
+        await scheduler.stop()
+        return scheduler
+
+    scheduler = run_virtual(main(), clock)
+    stats = scheduler.get_task_stats("control")
+    jitter = stats["jitter_analysis"]
+    assert jitter["samples_count"] >= 190
+    # Simulated time has no wakeup latency
+    assert jitter["p99_jitter_ms"] == pytest.approx(0.0, abs=1e-3)
+    assert sum(jitter["jitter_histogram"].values()) == jitter["samples_count"]
+    assert "p99_execution_time_ms" in stats
@@ -0,0 +1,245 @@
+import asyncio
+import random
+
+import pytest
+
+from dart_planner.common.clock import VirtualClock, run_virtual
+from dart_planner.common.errors import SchedulingError
+from dart_planner.common.real_time_config import RealTimeTask, TaskPriority, TaskType
+from dart_planner.common.real_time_scheduler import RealTimeLoop, RealTimeScheduler, run_periodic_task
+from dart_planner.common.timer_service import (
+    PeriodicTimer,
+    TimerService,
+    TimerWheel,
+    close_timer_service,
+    get_timer_service,
+)
+
+
+def test_wheel_expires_entries_in_tick_order():
+    rng = random.Random(7)
+    wheel = TimerWheel(levels=2, current=12345)
+    live = {}
+    for _ in range(2000):
+        if rng.random() < 0.5:
+            entry = PeriodicTimer("t", None, 0.0)
+            tick = wheel.current + 1 + int(rng.expovariate(1.0 / rng.choice([3, 300, 10 ** 5])))
+            wheel.add(entry, tick)
+            live[id(entry)] = (entry, tick)
+        elif rng.random() < 0.2 and live:
+            wheel.remove(live.pop(rng.choice(list(live)))[0])
+        else:
+            target = wheel.current + int(rng.expovariate(1.0 / rng.choice([1, 100, 10 ** 4])))
+            expired = {id(entry) for entry in wheel.advance(target)}
+            assert expired == {key for key, (_, tick) in live.items() if tick <= target}
+            for key in expired:
+                del live[key]
+            if live:
+                earliest = min(tick for _, tick in live.values())
+                assert earliest in [entry._tick for entry in wheel.next_slot()]
+        assert len(wheel) == len(live)
+
+
+def test_periodic_timers_share_one_wakeup_source():
+    clock = VirtualClock()
+    fired = []
+
+    async def main():
+        service = get_timer_service()
+        assert get_timer_service() is service and service.clock is clock
+        service.call_every(0.001, lambda: fired.append(("fast", clock.now())), name="fast")
+        service.call_every(0.01, lambda: fired.append(("slow", clock.now())), name="slow",
+                           priority=TaskPriority.CRITICAL)
+        service.call_later(0.0055, lambda: fired.append(("once", clock.now())))
+        await clock.sleep(1.0)
+        return service.get_stats()
+
+    stats = run_virtual(main(), clock)
+    fast = [t for name, t in fired if name == "fast"]
+    slow = [t for name, t in fired if name == "slow"]
+    assert len(fast) == 1000 and len(slow) == 100
+    assert fast == pytest.approx([0.001 * (i + 1) for i in range(1000)])
+    assert [t for name, t in fired if name == "once"] == pytest.approx([0.0055])
+    # Shared deadlines dispatch once, critical timer first
+    assert stats['wakeups'] == 1001
+    assert stats['dispatched'] == 1101
+    assert fired.index(("slow", slow[0])) < fired.index(("fast", slow[0]))
+    assert stats['timer_stats']['fast']['p99_lateness_ms'] == pytest.approx(0.0, abs=1e-3)
+    assert 'once' not in stats['timer_stats']
+
+
+def test_overruns_skip_missed_periods_and_cancel_stops_timer():
+    clock = VirtualClock()
+
+    async def main():
+        service = TimerService()
+        runs = []
+
+        def slow_callback():
+            runs.append(clock.now())
+            if len(runs) == 3:
+                clock.advance(0.035)  # overrun by three and a half periods
+            if len(runs) == 6:
+                timer.cancel()
+
+        timer = service.call_every(0.01, slow_callback, start=0.0)
+        await clock.sleep(1.0)
+        with pytest.raises(SchedulingError):
+            service.call_every(0.0, slow_callback)
+        return runs, timer
+
+    runs, timer = run_virtual(main(), clock)
+    assert runs == pytest.approx([0.0, 0.01, 0.02, 0.06, 0.07, 0.08])
+    assert timer.missed_periods == 3 and not timer.active
+
+
+def test_timer_cancelled_during_dispatch_does_not_fire():
+    clock = VirtualClock()
+    fired = []
+
+    async def main():
+        service = TimerService()
+
+        def first():
+            fired.append("a")
+            second.cancel()
+
+        service.call_later(0.01, first, name="a", priority=TaskPriority.CRITICAL)
+        second = service.call_later(0.01, lambda: fired.append("b"), name="b")
+        await clock.sleep(0.1)
+        return service.get_stats()
+
+    stats = run_virtual(main(), clock)
+    assert fired == ["a"]
+    assert stats['dispatched'] == 1
+
+
+def test_real_time_loop_registers_with_timer_service():
+    clock = VirtualClock()
+    ticks = []
+
+    async def main():
+        loop = RealTimeLoop(200.0, "registered", clock)
+        timer = loop.register(lambda: ticks.append(clock.now()), priority=TaskPriority.HIGH)
+        await clock.sleep(0.5)
+        timer.cancel()
+
+        async def coroutine_tick():
+            ticks.append(clock.now())
+
+        task = asyncio.ensure_future(run_periodic_task(coroutine_tick, 100.0, clock=clock))
+        await clock.sleep(0.095)
+        task.cancel()
+        return loop.get_stats()
+
+    stats = run_virtual(main(), clock)
+    assert stats['loop_count'] == 101 and stats['missed_deadlines'] == 0
+    assert len(ticks) == 101 + 10
+    assert ticks[-1] == pytest.approx(0.59)
+
+
+def test_timer_service_on_system_clock():
+    async def main():
+        service = get_timer_service()
+        counts = [0, 0, 0]
+
+        def make(i):
+            def tick():
+                counts[i] += 1
+            return tick
+
+        timers = [service.call_every(0.002, make(i), name=f"t{i}") for i in range(3)]
+        await asyncio.sleep(0.2)
+        for timer in timers:
+            timer.cancel()
+        return counts, service.get_stats()
+
+    counts, stats = asyncio.run(main())
+    assert all(60 <= count <= 101 for count in counts)
+    # Timers with the same deadline share a wakeup
+    assert stats['wakeups'] <= max(counts) + 5
+    assert stats['timers'] == 0
+
+
+def test_each_event_loop_has_its_own_service():
+    import threading
+
+    results = {}
+    first_ready = threading.Event()
+    second_done = threading.Event()
+
+    async def first():
+        service = get_timer_service()
+        ticks = []
+        timer = service.call_every(0.002, lambda: ticks.append(1), name="first")
+        first_ready.set()
+        await asyncio.get_running_loop().run_in_executor(None, second_done.wait, 5.0)
+        before = len(ticks)
+        await asyncio.sleep(0.05)
+        results["first"] = (service, timer.active, len(ticks) - before)
+        close_timer_service()
+        results["first_closed"] = not timer.active
+
+    async def second():
+        service = get_timer_service()
+        service.call_later(0.001, lambda: None)
+        await asyncio.sleep(0.01)
+        close_timer_service()
+        results["second"] = service
+
+    def run_second():
+        first_ready.wait(5.0)
+        try:
+            asyncio.run(second())
+        finally:
+            second_done.set()
+
+    thread = threading.Thread(target=run_second)
+    thread.start()
+    asyncio.run(first())
+    thread.join()
+
+    service, active, ticks = results["first"]
+    assert service is not results["second"]
+    assert active and ticks > 0
+    assert results["first_closed"]
+
+
+def test_real_time_scheduler_runs_periodic_tasks_on_timer_service():
+    clock = VirtualClock()
+    runs = []
+
+    async def main():
+        scheduler = RealTimeScheduler(clock=clock)
+        scheduler.add_task(RealTimeTask(name="control", func=lambda: runs.append(clock.now()),
+                                        priority=TaskPriority.HIGH, task_type=TaskType.PERIODIC,
+                                        period_ms=10.0, deadline_ms=10.0))
+        await scheduler.start()
+        service = get_timer_service()
+        names = sorted(timer.name for timer in service.timers)
+        await clock.sleep(0.1)
+        await scheduler.stop()
+        return names, service.get_stats()
+
+    names, stats = run_virtual(main(), clock)
+    assert names == ["control", "rt_scheduler_monitor"]
+    assert runs == pytest.approx([0.01 * (i + 1) for i in range(10)])
+    # The 100 Hz monitor and the 100 Hz task share each wakeup
+    assert stats['wakeups'] == 10 and stats['timers'] == 0
+
+
+def test_real_time_loop_close_releases_private_service():
+    clock = VirtualClock()
+    other = VirtualClock()
+    ticks = []
+
+    async def main():
+        loop = RealTimeLoop(100.0, "private", other)
+        timer = loop.register(lambda: ticks.append(clock.now()), service=TimerService(clock=clock))
+        private = loop._private_service
+        assert private is not None and private.clock is other
+        loop.close()
+        return timer.active, private.get_stats()['timers'], loop._private_service
+
+    active, timers, private = run_virtual(main(), clock)
+    assert not active and timers == 0 and private is None
@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+import pytest
+
+from dart_planner.common import timing_utils
+from dart_planner.common.clock import SystemClock
+from dart_planner.common.timing_utils import (
+    calibrate_backend,
+    get_sleep_backend,
+    high_res_sleep,
+    high_res_sleep_until,
+    set_sleep_backend,
+    set_spin_threshold,
+)
+
+requires_timerfd = pytest.mark.skipif(timing_utils._timerfd_create is None, reason="timerfd not available")
+
+
+@pytest.fixture
+def timerfd_backend():
+    previous = get_sleep_backend()
+    set_sleep_backend("timerfd")
+    yield
+    set_sleep_backend(previous)
+
+
+def _no_executor(*args, **kwargs):
+    raise AssertionError("high_res_sleep must not use the executor")
+
+
+@requires_timerfd
+def test_sleep_until_wakes_after_deadline_without_executor(timerfd_backend):
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.run_in_executor = _no_executor
+        lateness = []
+        for _ in range(50):
+            deadline = time.perf_counter() + 0.0005
+            await high_res_sleep_until(deadline)
+            lateness.append(time.perf_counter() - deadline)
+        # Every sleep reuses the same pooled timer descriptor
+        assert len(timing_utils._get_pool(loop)._all) == 1
+        return lateness
+
+    lateness = asyncio.run(main())
+    assert min(lateness) >= 0.0
+    assert sorted(lateness)[len(lateness) // 2] < 0.005
+
+
+def test_past_deadline_returns_immediately():
+    async def main():
+        start = time.perf_counter()
+        await high_res_sleep_until(start - 1.0)
+        await high_res_sleep(0.0)
+        await high_res_sleep(-1.0)
+        return time.perf_counter() - start
+
+    assert asyncio.run(main()) < 0.01
+
+
+@requires_timerfd
+def test_cancelled_sleep_returns_timer_to_pool(timerfd_backend):
+    async def main():
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(high_res_sleep(10.0))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        pool = timing_utils._get_pool(loop)
+        assert pool._free == pool._all and len(pool._all) == 1
+
+        # The disarmed descriptor works for the next sleep
+        start = time.perf_counter()
+        await high_res_sleep(0.002)
+        return time.perf_counter() - start
+
+    assert 0.002 <= asyncio.run(main()) < 0.5
+
+
+def test_spin_covers_the_last_microseconds():
+    set_spin_threshold(0.0002)
+    try:
+        async def main():
+            deadline = time.perf_counter() + 0.001
+            await high_res_sleep_until(deadline)
+            return time.perf_counter() - deadline
+
+        assert 0.0 <= asyncio.run(main()) < 0.05
+    finally:
+        set_spin_threshold(0.0)
+
+
+def test_system_clock_sleep_until():
+    clock = SystemClock()
+
+    async def main():
+        deadline = clock.now() + 0.003
+        await clock.sleep_until(deadline)
+        return clock.now() - deadline
+
+    assert asyncio.run(main()) >= 0.0
+
+
+def test_executor_backend_is_the_default():
+    assert get_sleep_backend() == "executor"
+    with pytest.raises(ValueError):
+        set_sleep_backend("busy")
+
+    async def main():
+        deadline = time.perf_counter() + 0.001
+        await high_res_sleep_until(deadline)
+        return time.perf_counter() - deadline
+
+    assert asyncio.run(main()) >= 0.0
+
+
+def test_calibrate_backend_keeps_a_measured_backend():
+    previous = get_sleep_backend()
+    try:
+        selected = asyncio.run(calibrate_backend(samples=20))
+        assert selected in timing_utils.SLEEP_BACKENDS
+        assert get_sleep_backend() == selected
+    finally:
+        set_sleep_backend(previous)
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+
+from dart_planner.communication.heartbeat import HeartbeatConfig, HeartbeatMonitor
+from dart_planner.communication.heartbeat_service import HeartbeatService
+
+
+@pytest.mark.asyncio
+async def test_many_links_share_one_timer():
+    service = HeartbeatService()
+    expired = []
+    for i in range(200):
+        service.register_link(f"vehicle-{i}", timeout_s=0.05, on_timeout=lambda link: expired.append(link.link_id))
+
+    # Keep half the links alive with data traffic only
+    for _ in range(8):
+        for i in range(0, 200, 2):
+            service.message_received(f"vehicle-{i}", authenticated=True)
+        await asyncio.sleep(0.01)
+
+    assert sorted(expired) == sorted(f"vehicle-{i}" for i in range(1, 200, 2))
+    # One wakeup per deadline batch, not per link per 10 ms
+    assert service.wakeups < 20
+    service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_unauthenticated_traffic_is_not_a_heartbeat():
+    service = HeartbeatService()
+    expired = []
+    service.register_link("gcs", timeout_s=0.03, on_timeout=lambda link: expired.append(link.link_id))
+    for _ in range(5):
+        service.message_received("gcs")  # unauthenticated unless stated
+        service.message_received("gcs", authenticated=False)
+        await asyncio.sleep(0.01)
+    assert expired == ["gcs"]
+    service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_dedicated_heartbeats_only_on_idle_links():
+    service = HeartbeatService()
+    sent = []
+    for name in ("busy", "idle"):
+        service.register_link(name, timeout_s=1.0, send_interval_s=0.05,
+                              send_heartbeat=lambda link: sent.append(link.link_id))
+
+    for _ in range(20):
+        service.message_sent("busy")
+        await asyncio.sleep(0.01)
+
+    assert "busy" not in sent
+    assert sent.count("idle") >= 2
+    service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_lost_link_recovers_and_rearms():
+    service = HeartbeatService()
+    expired = []
+    service.register_link("link", timeout_s=0.02, on_timeout=lambda link: expired.append(1))
+    await asyncio.sleep(0.05)
+    assert service.get_link("link").lost
+
+    service.heartbeat_received("link")
+    assert not service.get_link("link").lost
+    await asyncio.sleep(0.05)
+    assert len(expired) == 2
+    service.shutdown()
+
+
+def test_monitor_without_event_loop_uses_service_thread():
+    service = HeartbeatService()
+    emergencies = []
+    monitor = HeartbeatMonitor(
+        HeartbeatConfig(timeout_ms=50, emergency_callback=lambda: emergencies.append(1)),
+        service=service,
+    )
+    monitor.start_monitoring()
+    for _ in range(5):
+        monitor.heartbeat_received_sync()
+        time.sleep(0.01)
+    assert not emergencies
+
+    time.sleep(0.12)
+    assert emergencies == [1]
+    assert monitor.get_status()["lost"]
+    monitor.stop_monitoring()
+    service.shutdown()
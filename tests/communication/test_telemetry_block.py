@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from dart_planner.common.errors import CommunicationError
+from dart_planner.communication.telemetry_block import (
+    TelemetryBlock,
+    TelemetryHistory,
+    decode_telemetry_block,
+)
+from dart_planner.communication.telemetry_compression import (
+    CompressionType,
+    TelemetryCompressor,
+)
+
+
+def _samples(n, t0=1000.0):
+    samples = []
+    for i in range(n):
+        sample = {
+            'timestamp': t0 + i * 0.02,
+            'position': [0.1 * i, np.sin(i * 0.01), 10.0],
+            'velocity': {'x': 5.0, 'y': 0.0, 'z': 0.0},
+            'system_status': 'mission',
+        }
+        if i % 10 == 0:
+            sample['battery_voltage'] = 16.0 - i * 1e-3
+        samples.append(sample)
+    return samples
+
+
+def test_block_roundtrip_to_numpy():
+    samples = _samples(200)
+    data = TelemetryBlock.from_samples(samples).encode()
+    arrays = decode_telemetry_block(data)
+
+    assert arrays['timestamp'].shape == (200,)
+    assert arrays['position'].shape == (200, 3)
+    np.testing.assert_allclose(arrays['timestamp'], [s['timestamp'] for s in samples], atol=1e-4)
+    np.testing.assert_allclose(arrays['position'], [s['position'] for s in samples], atol=1e-3)
+    # Sparse field keeps NaN where absent
+    assert np.isnan(arrays['battery_voltage'][1, 0])
+    assert arrays['battery_voltage'][10, 0] == pytest.approx(15.99, abs=1e-2)
+
+
+def test_block_is_smaller_than_per_sample_packets():
+    compressor = TelemetryCompressor()
+    samples = _samples(500)
+    per_sample = sum(
+        len(compressor.compress_telemetry(s, CompressionType.BINARY_GZIP).data) for s in samples
+    )
+    block = compressor.compress_telemetry_block(samples)
+    assert block.compression == CompressionType.COLUMNAR
+    assert len(block.data) * 10 < per_sample
+    decoded = compressor.decompress_telemetry_block(block).to_samples()
+    assert decoded[3]['system_status'] == 'mission'
+    assert decoded[3]['velocity']['x'] == pytest.approx(5.0)
+
+
+def test_history_range_query_across_wraparound():
+    history = TelemetryHistory(capacity=100)
+    for sample in _samples(250):
+        history.append(sample)
+
+    assert len(history) == 100
+    oldest, newest = history.time_range()
+    assert oldest == pytest.approx(1000.0 + 150 * 0.02)
+    assert newest == pytest.approx(1000.0 + 249 * 0.02)
+
+    block = history.query(1000.0 + 195 * 0.02, 1000.0 + 205 * 0.02)
+    assert len(block) == 11
+    assert np.all(np.diff(block.timestamps) > 0)
+    np.testing.assert_allclose(block.columns['position'][:, 0], 0.1 * np.arange(195, 206))
+
+    assert len(history.query(0.0, 1.0)) == 0
+
+
+def test_decode_rejects_garbage():
+    with pytest.raises(CommunicationError):
+        TelemetryBlock.decode(b'not a telemetry block at all, definitely')
@@ -0,0 +1,165 @@
+import asyncio
+import json
+
+import pytest
+
+from dart_planner.communication.telemetry_broadcast import TelemetryBroadcaster
+from dart_planner.communication.telemetry_compression import (
+    CompressionType,
+    TelemetryCompressor,
+    TelemetryPacket,
+    WebSocketTelemetryManager,
+)
+
+
+class FakeWebSocket:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.messages = []
+
+    async def send_text(self, message):
+        await self._send(message)
+
+    async def send_bytes(self, message):
+        await self._send(message)
+
+    async def _send(self, message):
+        if self.fail:
+            raise ConnectionError("client went away")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.messages.append(message)
+
+
+class CountingCompressor(TelemetryCompressor):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def compress_telemetry(self, telemetry_data, compression_type=CompressionType.GZIP, packet_type="telemetry"):
+        self.calls.append(compression_type)
+        return super().compress_telemetry(telemetry_data, compression_type, packet_type)
+
+
+@pytest.mark.asyncio
+async def test_encodes_once_per_format():
+    compressor = CountingCompressor()
+    broadcaster = TelemetryBroadcaster(WebSocketTelemetryManager(compressor))
+    sockets = {f"c{i}": FakeWebSocket() for i in range(10)}
+    for i, (client_id, ws) in enumerate(sockets.items()):
+        broadcaster.add_client(client_id, ws, CompressionType.BINARY if i % 2 else CompressionType.NONE)
+
+    assert broadcaster.broadcast({"timestamp": 1.0, "position": [1.0, 2.0, 3.0]}) == 10
+    await asyncio.sleep(0.01)
+
+    assert sorted(c.value for c in compressor.calls) == ["binary", "none"]
+    assert all(len(ws.messages) == 1 for ws in sockets.values())
+    assert isinstance(sockets["c1"].messages[0], bytes)
+    assert json.loads(sockets["c0"].messages[0])["data"]["position"] == [1.0, 2.0, 3.0]
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_drops_stale_frames_without_blocking_others():
+    broadcaster = TelemetryBroadcaster(queue_size=2, send_timeout=None)
+    fast, slow = FakeWebSocket(), FakeWebSocket(delay=0.05)
+    broadcaster.add_client("fast", fast)
+    broadcaster.add_client("slow", slow)
+
+    for i in range(20):
+        broadcaster.broadcast_raw({"tick": i})
+        await asyncio.sleep(0.001)
+    await asyncio.sleep(0.2)
+
+    assert [json.loads(m)["tick"] for m in fast.messages] == list(range(20))
+    # Slow client only sees a bounded backlog, ending with the newest frame
+    assert json.loads(slow.messages[-1])["tick"] == 19
+    metrics = broadcaster.get_client_metrics()
+    assert metrics["slow"]["frames_dropped"] > 0
+    assert metrics["slow"]["max_send_lag_ms"] > metrics["fast"]["max_send_lag_ms"]
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_client_is_removed():
+    broadcaster = TelemetryBroadcaster()
+    broadcaster.add_client("ok", FakeWebSocket())
+    broadcaster.add_client("broken", FakeWebSocket(fail=True))
+
+    broadcaster.broadcast_raw("hello")
+    await asyncio.sleep(0.01)
+
+    assert broadcaster.client_count == 1
+    assert "broken" not in broadcaster.get_client_metrics()
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_delta_client_resynchronizes_after_drops():
+    broadcaster = TelemetryBroadcaster(queue_size=2, send_timeout=None)
+    fast, slow = FakeWebSocket(), FakeWebSocket(delay=0.02)
+    broadcaster.add_client("fast", fast, CompressionType.DELTA)
+    broadcaster.add_client("slow", slow, CompressionType.DELTA)
+
+    for i in range(30):
+        broadcaster.broadcast({"timestamp": 1.0 + i * 0.02, "position": [0.0, 0.0, i * 0.1]}, "vehicle_7")
+        await asyncio.sleep(0.002)
+    await asyncio.sleep(0.2)
+
+    assert broadcaster.get_client_metrics()["slow"]["frames_dropped"] > 0
+    for ws in (fast, slow):
+        receiver = TelemetryCompressor()
+        decoder = receiver._get_stream_decoder("vehicle_7")
+        decoded = [decoder.decode(frame) for frame in ws.messages]  # never out of sequence
+        assert ws.messages[0][0] & 0x01  # first frame of a non-default stream is a keyframe
+        assert decoded[-1]["position"]["z"] == pytest.approx(2.9, abs=1e-3)
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_client_reported_to_owner():
+    removed = []
+    broadcaster = TelemetryBroadcaster(on_client_removed=removed.append)
+    broadcaster.add_client("broken", FakeWebSocket(fail=True))
+
+    broadcaster.broadcast_raw("hello")
+    await asyncio.sleep(0.01)
+
+    assert removed == ["broken"]
+    await broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_mixed_delta_and_batch_clients_keep_separate_sequences():
+    broadcaster = TelemetryBroadcaster(queue_size=2, send_timeout=None)
+    delta, batch, slow_batch = FakeWebSocket(), FakeWebSocket(), FakeWebSocket(delay=0.02)
+    broadcaster.add_client("delta", delta, CompressionType.DELTA)
+    broadcaster.add_client("batch", batch, CompressionType.DELTA_BATCH)
+    broadcaster.add_client("slow_batch", slow_batch, CompressionType.DELTA_BATCH)
+
+    for i in range(30):
+        broadcaster.broadcast({"timestamp": 1.0 + i * 0.02, "position": [0.0, 0.0, i * 0.1]}, "vehicle_7")
+        await asyncio.sleep(0.002)
+    await asyncio.sleep(0.2)
+
+    metrics = broadcaster.get_client_metrics()
+    assert metrics["slow_batch"]["frames_dropped"] > 0
+    # The lagging batch client never forces keyframes onto the DELTA sequence
+    assert metrics["delta"]["frames_dropped"] == 0
+    assert sum(frame[0] & 0x01 for frame in delta.messages) == 1
+
+    receiver = TelemetryCompressor()
+    decoder = receiver._get_stream_decoder("vehicle_7")
+    decoded = [decoder.decode(frame) for frame in delta.messages]  # never out of sequence
+    assert len(decoded) == 30
+    assert decoded[-1]["position"]["z"] == pytest.approx(2.9, abs=1e-3)
+
+    for ws in (batch, slow_batch):
+        receiver = TelemetryCompressor()
+        decoded = []
+        for payload in ws.messages:
+            packet = TelemetryPacket(0.0, "vehicle_7", payload, CompressionType.DELTA_BATCH)
+            decoded.extend(receiver.decompress_telemetry_batch(packet))
+        assert decoded[-1]["position"]["z"] == pytest.approx(2.9, abs=1e-3)
+    await broadcaster.close()
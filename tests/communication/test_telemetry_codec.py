@@ -0,0 +1,141 @@
+import math
+
+import pytest
+
+from dart_planner.common.errors import CommunicationError
+from dart_planner.communication.telemetry_codec import (
+    TelemetryBatchPacker,
+    TelemetryStreamDecoder,
+    TelemetryStreamEncoder,
+)
+from dart_planner.communication.telemetry_compression import (
+    CompressionType,
+    TelemetryCompressor,
+)
+
+
+def _sample(i):
+    t = 1.7e9 + i * 0.02  # 50 Hz
+    return {
+        'timestamp': t,
+        'position': [10 * math.sin(i * 0.002), 5 * math.cos(i * 0.002), 20 + 0.01 * i],
+        'velocity': [math.cos(i * 0.002), -0.5 * math.sin(i * 0.002), 0.5],
+        'attitude': {'roll': 0.01 * math.sin(i * 0.02), 'pitch': 0.02, 'yaw': 1.0},
+        'battery_voltage': 16.1 - i * 1e-4,
+        'battery_remaining': 87.0 - i * 1e-3,
+        'gps': {'latitude': 47.1 + i * 1e-7, 'longitude': 8.5, 'altitude': 500.0},
+        'system_status': 'mission',
+        'performance': {'avg_planning_time_ms': 8.3, 'autonomous_operation_time_s': i * 0.02},
+    }
+
+
+def test_roundtrip_within_quantization():
+    encoder = TelemetryStreamEncoder(keyframe_interval=10)
+    decoder = TelemetryStreamDecoder()
+    for i in range(40):
+        sample = _sample(i)
+        decoded = decoder.decode(encoder.encode(sample))
+        assert decoded['timestamp'] == pytest.approx(sample['timestamp'], abs=1e-4)
+        assert decoded['position']['z'] == pytest.approx(sample['position'][2], abs=1e-3)
+        assert decoded['attitude']['roll'] == pytest.approx(sample['attitude']['roll'], abs=1e-4)
+        assert decoded['gps']['latitude'] == pytest.approx(sample['gps']['latitude'], abs=1e-7)
+        assert decoded['system_status'] == 'mission'
+
+
+def test_presence_bitmap_keeps_optional_fields_unambiguous():
+    encoder = TelemetryStreamEncoder()
+    decoder = TelemetryStreamDecoder()
+    # Only GPS present: the legacy binary format would misread it as position
+    decoded = decoder.decode(encoder.encode({'timestamp': 1.0, 'gps': {'latitude': 1.5}}))
+    assert set(decoded) == {'timestamp', 'gps'}
+    assert decoded['gps']['latitude'] == pytest.approx(1.5)
+
+
+def test_delta_frame_after_gap_requires_keyframe():
+    encoder = TelemetryStreamEncoder(keyframe_interval=5)
+    decoder = TelemetryStreamDecoder()
+    frames = encoder.encode_batch([_sample(i) for i in range(6)])
+
+    decoder.decode(frames[0])
+    with pytest.raises(CommunicationError):
+        decoder.decode(frames[2])  # frames[1] lost
+    assert not decoder.synchronized
+    with pytest.raises(CommunicationError):
+        decoder.decode(frames[3])
+
+    decoded = decoder.decode(frames[5])  # periodic keyframe resynchronizes
+    assert decoded['timestamp'] == pytest.approx(_sample(5)['timestamp'], abs=1e-4)
+
+
+def test_batch_packer_with_shared_dictionary():
+    encoder = TelemetryStreamEncoder()
+    dictionary = TelemetryBatchPacker.build_dictionary(
+        TelemetryStreamEncoder().encode_batch([_sample(i) for i in range(20)])
+    )
+    sender = TelemetryBatchPacker(dictionary=dictionary)
+    receiver = TelemetryBatchPacker(dictionary=dictionary)
+
+    frames = encoder.encode_batch([_sample(i) for i in range(25)])
+    assert receiver.unpack(sender.pack(frames)) == frames
+
+
+def test_bandwidth_reduction_vs_binary_gzip():
+    compressor = TelemetryCompressor()
+    n = 500
+    baseline = sum(
+        len(compressor.compress_telemetry(_sample(i), CompressionType.BINARY_GZIP).data)
+        for i in range(n)
+    )
+    delta = sum(
+        len(compressor.compress_telemetry(_sample(i), CompressionType.DELTA).data)
+        for i in range(n)
+    )
+    batched = sum(
+        len(compressor.compress_telemetry_batch([_sample(i) for i in range(k, k + 50)], "batch").data)
+        for k in range(0, n, 50)
+    )
+    assert baseline / delta > 5.0
+    assert baseline / batched > 5.0
+
+
+def test_compressor_delta_streams_are_independent():
+    sender = TelemetryCompressor()
+    receiver = TelemetryCompressor()
+    for i in range(10):
+        for stream in ("vehicle_1", "vehicle_2"):
+            sample = _sample(i if stream == "vehicle_1" else 100 + i)
+            packet = sender.compress_telemetry(sample, CompressionType.DELTA, packet_type=stream)
+            decoded = receiver.decompress_telemetry(packet)
+            assert decoded['timestamp'] == pytest.approx(sample['timestamp'], abs=1e-4)
+
+
+def test_non_finite_values_raise_communication_error():
+    encoder = TelemetryStreamEncoder()
+    for bad in ({'battery_voltage': float('nan')}, {'position': [0.0, float('inf'), 1.0]}):
+        with pytest.raises(CommunicationError, match="Non-finite"):
+            encoder.encode({'timestamp': 1.0, **bad})
+
+
+def test_field_set_change_forces_keyframe():
+    encoder = TelemetryStreamEncoder(keyframe_interval=100)
+    decoder = TelemetryStreamDecoder()
+    decoder.decode(encoder.encode(_sample(0)))
+    unchanged = decoder.decode(encoder.encode(_sample(0)))
+    assert unchanged['gps']['longitude'] == pytest.approx(8.5)
+
+    reduced = {key: value for key, value in _sample(1).items() if key != 'gps'}
+    frame = encoder.encode(reduced)
+    assert frame[0] & 0x01  # keyframe
+    assert 'gps' not in decoder.decode(frame)
+
+
+def test_multi_sample_batch_rejected_by_single_sample_api():
+    sender = TelemetryCompressor()
+    receiver = TelemetryCompressor()
+    single = sender.compress_telemetry(_sample(0), CompressionType.DELTA_BATCH, packet_type="batch")
+    assert receiver.decompress_telemetry(single)['system_status'] == 'mission'
+
+    batch = sender.compress_telemetry_batch([_sample(i) for i in range(1, 4)], "batch")
+    with pytest.raises(CommunicationError, match="decompress_telemetry_batch"):
+        receiver.decompress_telemetry(batch)
+    assert len(receiver.decompress_telemetry_batch(batch)) == 3
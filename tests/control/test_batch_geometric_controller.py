@@ -0,0 +1,118 @@
+"""
+Equivalence tests for the vectorized BatchGeometricController.
+
+Each row of the batch controller must track an independent
+GeometricController fed the same inputs, including saturation,
+anti-windup, tilt limiting and yaw-singularity fallbacks.
+"""
+
+import numpy as np
+import pytest
+
+from dart_planner.common.errors import ControlError
+from dart_planner.control.batch_geometric_controller import BatchGeometricController
+from dart_planner.control.geometric_controller import GeometricController, GeometricControllerConfig
+
+
+def _make_config(**overrides):
+    return GeometricControllerConfig(max_thrust=25.0, **overrides)
+
+
+def _random_inputs(rng, K):
+    return dict(
+        pos=rng.normal(0.0, 2.0, (K, 3)),
+        vel=rng.normal(0.0, 1.5, (K, 3)),
+        att=rng.normal(0.0, 0.3, (K, 3)),
+        ang_vel=rng.normal(0.0, 1.0, (K, 3)),
+        desired_pos=rng.normal(0.0, 2.0, (K, 3)),
+        desired_vel=rng.normal(0.0, 1.0, (K, 3)),
+        desired_acc=rng.normal(0.0, 3.0, (K, 3)),
+        desired_yaw=rng.uniform(-np.pi, np.pi, K),
+        desired_yaw_rate=rng.normal(0.0, 0.5, K),
+    )
+
+
+@pytest.mark.parametrize("anti_windup_method", ["clamping", "back_calculation"])
+@pytest.mark.parametrize("fallback", ["skip_yaw", "default_heading", "maintain_current"])
+def test_batch_matches_independent_controllers(anti_windup_method, fallback):
+    K = 16
+    overrides = dict(anti_windup_method=anti_windup_method, yaw_singularity_fallback_method=fallback)
+    batch = BatchGeometricController(K, config=_make_config(**overrides), tuning_profile="")
+    singles = [GeometricController(config=_make_config(**overrides), tuning_profile="") for _ in range(K)]
+
+    rng = np.random.default_rng(7)
+    for _ in range(25):
+        inputs = _random_inputs(rng, K)
+        thrust, torque = batch.compute_control_batch(dt=0.01, **inputs)
+        assert thrust.shape == (K,) and torque.shape == (K, 3)
+
+        for k, controller in enumerate(singles):
+            expected_thrust, expected_torque = controller.compute_control_fast(
+                inputs['pos'][k], inputs['vel'][k], inputs['att'][k], inputs['ang_vel'][k],
+                inputs['desired_pos'][k], inputs['desired_vel'][k], inputs['desired_acc'][k],
+                float(inputs['desired_yaw'][k]), float(inputs['desired_yaw_rate'][k]), 0.01,
+            )
+            assert thrust[k] == pytest.approx(expected_thrust, rel=1e-9, abs=1e-9)
+            np.testing.assert_allclose(torque[k], expected_torque, rtol=1e-9, atol=1e-9)
+            np.testing.assert_allclose(batch.integral_vel_error[k], controller.integral_vel_error,
+                                       rtol=1e-9, atol=1e-12)
+
+    # Large random references must have exercised the saturation paths
+    assert batch.thrust_saturation_count.sum() > 0
+    assert batch.torque_saturation_count.sum() > 0
+
+
+def test_quaternion_attitude_matches_euler():
+    K = 4
+    rng = np.random.default_rng(3)
+    inputs = _random_inputs(rng, K)
+    euler = np.zeros((K, 3))
+    inputs['att'] = euler
+    quat = np.tile([1.0, 0.0, 0.0, 0.0], (K, 1))
+
+    a = BatchGeometricController(K, config=_make_config(), tuning_profile="")
+    b = BatchGeometricController(K, config=_make_config(), tuning_profile="")
+    _, torque_euler = a.compute_control_batch(dt=0.01, **inputs)
+    inputs['att'] = quat
+    _, torque_quat = b.compute_control_batch(dt=0.01, **inputs)
+    # Identity attitude: only the maintain_current fallback could differ, which is not in use
+    np.testing.assert_allclose(torque_euler, torque_quat, atol=1e-12)
+
+
+def test_invalid_dt_returns_hover_and_keeps_state():
+    K = 3
+    batch = BatchGeometricController(K, config=_make_config(), tuning_profile="")
+    zeros = np.zeros((K, 3))
+    thrust, torque = batch.compute_control_batch(zeros, zeros, zeros, zeros,
+                                                 np.ones((K, 3)), zeros, zeros, dt=0.5)
+    assert np.allclose(thrust, batch._hover_thrust)
+    assert not torque.any()
+    assert not batch.integral_vel_error.any()
+
+
+def test_partial_reset_and_shape_validation():
+    K = 4
+    batch = BatchGeometricController(K, config=_make_config(), tuning_profile="")
+    zeros = np.zeros((K, 3))
+    for _ in range(10):
+        batch.compute_control_batch(zeros, zeros, zeros, zeros, zeros, np.full((K, 3), 0.5), zeros, dt=0.01)
+    assert np.all(np.linalg.norm(batch.integral_vel_error, axis=1) > 0)
+
+    batch.reset(np.array([True, False, True, False]))
+    assert not batch.integral_vel_error[[0, 2]].any()
+    assert batch.integral_vel_error[[1, 3]].any()
+
+    with pytest.raises(ControlError):
+        batch.compute_control_batch(np.zeros((2, 3)), zeros, zeros, zeros, zeros, zeros, zeros)
+
+
+def test_per_tick_warnings_are_aggregated(caplog):
+    K = 4
+    batch = BatchGeometricController(K, config=_make_config(anti_windup_method="bogus"), tuning_profile="")
+    inputs = _random_inputs(np.random.default_rng(11), K)
+    with caplog.at_level("WARNING", logger="dart_planner.control.batch_geometric_controller"):
+        for _ in range(200):
+            batch.compute_control_batch(dt=0.01, **inputs)
+
+    assert batch.diagnostics.count("unknown_anti_windup") == 200
+    assert len([r for r in caplog.records if "anti-windup" in r.getMessage()]) <= 2
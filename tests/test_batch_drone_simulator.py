@@ -0,0 +1,108 @@
+import time
+
+import numpy as np
+import pytest
+
+from dart_planner.common.errors import ConfigurationError
+from dart_planner.common.types import ControlCommand, DroneState
+from dart_planner.common.units import Q_
+from dart_planner.control.batch_geometric_controller import BatchGeometricController
+from dart_planner.control.geometric_controller import GeometricControllerConfig
+from dart_planner.utils.drone_simulator import BatchDroneSimulator, DroneSimulator, SimulatorConfig
+
+
+@pytest.mark.parametrize("integrator", ["rk4", "semi_implicit"])
+def test_hover_is_an_equilibrium(integrator):
+    config = SimulatorConfig(mass=1.2, integrator=integrator)
+    sim = BatchDroneSimulator(8, config)
+    sim.reset(position=[0.0, 0.0, 2.0])
+    for _ in range(1000):
+        sim.step(config.mass * config.gravity, np.zeros(3), 0.01)
+    np.testing.assert_allclose(sim.position, np.tile([0.0, 0.0, 2.0], (8, 1)), atol=1e-9)
+    assert sim.time == pytest.approx(10.0)
+
+
+def test_thrust_acts_along_body_axis():
+    config = SimulatorConfig()
+    sim = BatchDroneSimulator(2, config)
+    pitch = 0.2
+    sim.reset(attitude=[[0.0, pitch, 0.0], [pitch, 0.0, 0.0]])
+    thrust = config.mass * config.gravity / np.cos(pitch)
+    sim.step(thrust, np.zeros(3), 0.01)
+    acc = sim.velocity / 0.01
+    expected = config.gravity * np.tan(pitch)
+    # Positive pitch tilts thrust toward +x, positive roll toward -y; altitude held
+    np.testing.assert_allclose(acc[0], [expected, 0.0, 0.0], atol=1e-9)
+    np.testing.assert_allclose(acc[1], [0.0, -expected, 0.0], atol=1e-9)
+
+
+def test_rk4_rotation_matches_analytic_spin_up():
+    inertia = np.array([0.1, 0.1, 0.2])
+    sim = BatchDroneSimulator(1, SimulatorConfig(inertia=inertia))
+    torque = np.array([0.0, 0.0, 0.05])
+    dt, steps = 0.01, 100
+    for _ in range(steps):
+        sim.step(0.0, torque, dt)
+    t = dt * steps
+    alpha = torque[2] / inertia[2]
+    assert sim.angular_velocity[0, 2] == pytest.approx(alpha * t, rel=1e-12)
+    assert sim.attitude[0, 2] == pytest.approx(0.5 * alpha * t ** 2, rel=1e-9)
+    assert np.linalg.norm(sim.quaternion[0]) == pytest.approx(1.0)
+
+
+def test_rows_are_independent_and_match_single_vehicle_simulator():
+    rng = np.random.default_rng(0)
+    K = 5
+    config = SimulatorConfig(mass=1.5)
+    batch = BatchDroneSimulator(K, config)
+    singles = [DroneSimulator() for _ in range(K)]
+    states = [DroneState(timestamp=0.0) for _ in range(K)]
+    for _ in range(20):
+        thrust = rng.uniform(10.0, 20.0, K)
+        torque = rng.normal(0.0, 0.05, (K, 3))
+        batch.step(thrust, torque, 0.01)
+        states = [sim.step(state, ControlCommand(thrust=Q_(float(f), 'N'), torque=Q_(tau, 'N*m')), 0.01)
+                  for sim, state, f, tau in zip(singles, states, thrust, torque)]
+    for k, state in enumerate(states):
+        expected = batch.to_drone_state(k)
+        np.testing.assert_allclose(state.position.magnitude, expected.position.magnitude, atol=1e-9)
+        np.testing.assert_allclose(state.attitude.magnitude, expected.attitude.magnitude, atol=1e-9)
+        assert state.timestamp == pytest.approx(0.2)
+
+
+def test_wind_drag_and_noise_are_seeded():
+    config = SimulatorConfig(wind_mean=5.0, wind_std=1.0, drag_coefficient=0.5, sensor_noise_std=0.01)
+    a = BatchDroneSimulator(4, config, seed=3)
+    b = BatchDroneSimulator(4, config, seed=3)
+    for sim in (a, b):
+        for _ in range(200):
+            sim.step(config.mass * config.gravity, np.zeros(3), 0.01)
+    np.testing.assert_array_equal(a.position, b.position)
+    np.testing.assert_array_equal(a.observe()["position"], b.observe()["position"])
+    # Drag pushes every vehicle downwind
+    assert np.all(a.velocity[:, 0] > 0.5)
+
+    with pytest.raises(ConfigurationError):
+        BatchDroneSimulator(1, SimulatorConfig(integrator="euler"))
+
+
+@pytest.mark.performance
+def test_many_vehicle_closed_loop_runs_faster_than_real_time():
+    K, dt, steps = 64, 0.002, 500
+    config = SimulatorConfig(max_thrust=25.0)
+    sim = BatchDroneSimulator(K, config, seed=1)
+    controller = BatchGeometricController(K, config=GeometricControllerConfig(max_thrust=25.0), tuning_profile="")
+    targets = np.random.default_rng(1).uniform(-1.0, 1.0, (K, 3)) + [0.0, 0.0, 2.0]
+    zeros = np.zeros((K, 3))
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        thrust, torque = controller.compute_control_batch(
+            sim.position, sim.velocity, sim.quaternion, sim.angular_velocity, targets, zeros, zeros,
+            desired_yaw=np.pi / 2, dt=dt)
+        sim.step(thrust, torque, dt)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < steps * dt  # 1 s of flight for 64 vehicles
+    # Every vehicle climbed from the origin toward its target
+    assert np.max(np.linalg.norm(sim.position - targets, axis=1)) < 1.5
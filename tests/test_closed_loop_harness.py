@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from dart_planner.common.clock import VirtualClock
+from dart_planner.common.types import Trajectory
+from dart_planner.utils.closed_loop_harness import ClosedLoopHarness, HarnessConfig
+
+START = np.array([0.0, 0.0, 1.0])
+GOAL = np.array([3.0, 0.0, 2.0])
+TRAVEL_TIME = 3.0
+
+
+def _reference(t):
+    s = np.clip(t / TRAVEL_TIME, 0.0, 1.0)[:, None]
+    delta = GOAL - START
+    return (START + delta * (10 * s**3 - 15 * s**4 + 6 * s**5),
+            delta * (30 * s**2 - 60 * s**3 + 30 * s**4) / TRAVEL_TIME,
+            delta * (60 * s - 180 * s**2 + 120 * s**3) / TRAVEL_TIME**2)
+
+
+def replanning_planner(state, t):
+    """Re-issue the remaining minimum-jerk reference from the current time."""
+    timestamps = t + np.arange(20) * 0.05
+    positions, velocities, accelerations = _reference(timestamps)
+    return Trajectory(timestamps=timestamps, positions=positions,
+                      velocities=velocities, accelerations=accelerations)
+
+
+def _run():
+    config = HarnessConfig(duration_s=5.0, initial_position=START)
+    return ClosedLoopHarness(replanning_planner, config=config, clock=VirtualClock()).run()
+
+
+def test_virtual_time_flight_reaches_goal_faster_than_real_time():
+    result = _run()
+
+    assert 2000 <= result.control_steps <= 2001
+    assert 250 <= result.planning_steps <= 252
+    assert result.sim_time_s == pytest.approx(5.0)
+    np.testing.assert_allclose(np.diff(result.times), 0.0025, atol=1e-12)
+    assert np.linalg.norm(result.final_position - GOAL) < 0.1
+    assert result.tracking_errors.max() < 0.5
+    assert result.real_time_factor > 1.0
+
+
+def test_virtual_time_runs_are_reproducible():
+    first = _run()
+    second = _run()
+    np.testing.assert_array_equal(first.positions, second.positions)
+    np.testing.assert_array_equal(first.thrusts, second.thrusts)
@@ -49,22 +49,23 @@ def test_edge_to_cloud_communication(cloud_server_thread):
         timestamp=time.time(), position=np.array([0.0, 0.0, 0.0])
     )
 
-    # 2. Perform one communication cycle
-    print("Edge: Sending state to cloud...")
-    trajectory = client.send_state_and_receive_trajectory(initial_state)
-    print("Edge: Received response from cloud.")
-
-    # 3. Assert the result
-    assert trajectory is not None
-    assert hasattr(trajectory, "timestamps")
-    assert hasattr(trajectory, "positions")
-    assert isinstance(trajectory.positions, np.ndarray)
-    assert trajectory.positions.shape[0] > 0
+    try:
+        # 2. Perform one communication cycle
+        print("Edge: Sending state to cloud...")
+        trajectory = client.send_state_and_receive_trajectory(initial_state)
+        print("Edge: Received response from cloud.")
 
-    print(
-        f"Edge: Successfully received trajectory with {trajectory.positions.shape[0]} waypoints."
-    )
+        # 3. Assert the result
+        assert trajectory is not None
+        assert hasattr(trajectory, "timestamps")
+        assert hasattr(trajectory, "positions")
+        assert isinstance(trajectory.positions, np.ndarray)
+        assert trajectory.positions.shape[0] > 0
 
-    # 4. Clean up
-    client.close()
+        print(
+            f"Edge: Successfully received trajectory with {trajectory.positions.shape[0]} waypoints."
+        )
+    finally:
+        # 4. Clean up (also on failure, so the ZMQ context is never left to the GC)
+        client.close()
     print("--- Integration Test Finished ---")
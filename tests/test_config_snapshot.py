@@ -0,0 +1,109 @@
+"""
+Tests for compiled configuration snapshots.
+
+Covers the flat read-only view, the source-keyed snapshot cache, and
+handing a snapshot to worker processes.
+"""
+
+import os
+
+import pytest
+import yaml
+
+from dart_planner.config import frozen_config
+from dart_planner.config.frozen_config import (
+    ConfigSnapshot,
+    ConfigurationError,
+    ConfigurationManager,
+    load_config_snapshot,
+)
+
+JWT_KEY = "snapshot_test_secret_key_that_is_long_enough"
+
+
+@pytest.fixture
+def config_env(monkeypatch, tmp_path):
+    for name in frozen_config.SNAPSHOT_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("DART_JWT_SECRET_KEY", JWT_KEY)
+    monkeypatch.setenv("DART_ENVIRONMENT", "testing")
+    config_file = tmp_path / "dart.yaml"
+    config_file.write_text(yaml.safe_dump({"real_time": {"control_loop_frequency_hz": 800.0}}))
+    return config_file, tmp_path / "cache"
+
+
+def test_snapshot_flat_read_only_view(config_env):
+    config_file, _ = config_env
+    snapshot = ConfigurationManager(str(config_file)).get_snapshot()
+
+    assert snapshot["real_time.control_loop_frequency_hz"] == 800.0
+    assert snapshot.get("communication.heartbeat_interval_ms") == 100
+    assert snapshot.real_time is snapshot.config.real_time
+    with pytest.raises(TypeError):
+        snapshot.values["debug"] = True
+
+
+def test_cached_snapshot_skips_validation_until_sources_change(config_env, monkeypatch):
+    config_file, cache_dir = config_env
+    first = ConfigurationManager(str(config_file), cache_dir=str(cache_dir)).load_config()
+    assert len(list(cache_dir.glob("config-*.pickle"))) == 1
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("cached snapshot should not be re-validated")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ConfigurationManager, "_load_from_file", fail_validation)
+        cached = ConfigurationManager(str(config_file), cache_dir=str(cache_dir)).load_config()
+    assert cached == first
+
+    monkeypatch.setenv("DART_MAX_VELOCITY_MPS", "7.5")
+    changed = ConfigurationManager(str(config_file), cache_dir=str(cache_dir)).load_config()
+    assert changed.hardware.max_velocity_mps == 7.5
+    assert len(list(cache_dir.glob("config-*.pickle"))) == 2
+
+
+def test_exported_snapshot_installs_in_worker(config_env, monkeypatch, tmp_path):
+    config_file, _ = config_env
+    monkeypatch.setattr(frozen_config, "_config_manager", None)
+    path = ConfigurationManager(str(config_file)).export_snapshot(tmp_path / "worker.pickle")
+
+    snapshot = load_config_snapshot(path)
+    assert isinstance(snapshot, ConfigSnapshot)
+    assert frozen_config.get_config_snapshot()["real_time.control_loop_frequency_hz"] == 800.0
+
+    if hasattr(os, "getuid"):
+        os.chmod(path, 0o666)
+        with pytest.raises(ConfigurationError, match="untrusted"):
+            load_config_snapshot(path)
+
+
+def test_snapshots_never_store_secrets(config_env, monkeypatch, tmp_path):
+    config_file, cache_dir = config_env
+    monkeypatch.setattr(frozen_config, "_config_manager", None)
+    first = ConfigurationManager(str(config_file), cache_dir=str(cache_dir)).load_config()
+    exported = ConfigurationManager(str(config_file)).export_snapshot(tmp_path / "worker.pickle")
+    for path in [exported, *cache_dir.glob("config-*.pickle")]:
+        assert JWT_KEY.encode() not in path.read_bytes()
+
+    # Secrets come back from the environment on load
+    cached = ConfigurationManager(str(config_file), cache_dir=str(cache_dir)).load_config()
+    assert cached == first and cached.security.jwt_secret_key == JWT_KEY
+    assert load_config_snapshot(exported).config.security.jwt_secret_key == JWT_KEY
+
+    monkeypatch.delenv("DART_JWT_SECRET_KEY")
+    with pytest.raises(ConfigurationError, match="DART_JWT_SECRET_KEY"):
+        load_config_snapshot(exported)
+
+
+def test_secret_from_config_file_is_reread_on_load(config_env, monkeypatch, tmp_path):
+    config_file, _ = config_env
+    monkeypatch.delenv("DART_JWT_SECRET_KEY")
+    config_file.write_text(yaml.safe_dump({"security": {"jwt_secret_key": JWT_KEY}}))
+    path = ConfigurationManager(str(config_file)).export_snapshot(tmp_path / "worker.pickle")
+    assert JWT_KEY.encode() not in path.read_bytes()
+    assert load_config_snapshot(path).config.security.jwt_secret_key == JWT_KEY
+
+
+def test_schema_fingerprint_covers_every_schema_module():
+    modules = {os.path.basename(path) for path in frozen_config._schema_modules()}
+    assert {"frozen_config.py", "coordinate_frames.py"} <= modules
@@ -463,4 +463,54 @@ class TestGraphValidation:
         
         assert info['node_count'] >= 0
         assert isinstance(info['cycles'], list)
-        assert isinstance(info['resolution_order'], list) 
\ No newline at end of file
+        assert isinstance(info['resolution_order'], list)
+
+
+class _NoLock:
+    """Stand-in lock that fails if the resolve path tries to take it."""
+    def __enter__(self):
+        raise AssertionError("resolve took the container lock")
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestResolutionPlan:
+    """Test the compiled resolution plan of a finalized container."""
+
+    def test_finalized_resolve_is_lock_free(self):
+        container = DIContainerV2(ContainerConfig())
+        container.register_singleton(TestConfig, TestConfig)
+        container.register_factory(TestService, TestService)
+        container.finalize()
+
+        plan = container.get_plan()
+        order = plan.order
+        assert order.index(TestConfig) < order.index(TestService)
+        config = container.resolve(TestConfig)
+        service = container.resolve(TestService)
+
+        lock, container._lock = container._lock, _NoLock()
+        try:
+            assert container.resolve(TestConfig) is config
+            assert container.resolve(TestService) is not service
+        finally:
+            container._lock = lock
+        assert container.get_plan() is not plan
+        assert container._lifecycle_managers[TestConfig].is_ready()
+
+    def test_dynamic_registration_recompiles_plan(self):
+        container = DIContainerV2(ContainerConfig())
+        container.register_singleton(TestCircularA, TestCircularA)
+        container.finalize()
+
+        with pytest.raises(DependencyError, match="Circular dependency"):
+            container.register_singleton(TestCircularB, TestCircularB, stage=RegistrationStage.DYNAMIC)
+        assert not container.has_dependency(TestCircularB)
+
+        first = TestConfig()
+        container.register_instance(TestConfig, first, stage=RegistrationStage.DYNAMIC)
+        assert container.resolve(TestConfig) is first
+        replacement = TestConfig()
+        container.register_instance(TestConfig, replacement, stage=RegistrationStage.DYNAMIC)
+        assert container.resolve(TestConfig) is replacement
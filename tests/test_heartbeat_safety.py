@@ -255,6 +255,30 @@ class TestMavlinkHeartbeatAdapter:
         # Check that heartbeat was received
         status = watchdog.get_status()
         assert status["heartbeat_status"]["time_since_last_received_ms"] < 100  # Should be recent
+        
+    def test_only_signed_mavlink_traffic_is_implicit_heartbeat(self):
+        """Unsigned MAVLink data must not refresh authenticated liveness"""
+        watchdog = SafetyWatchdog({"heartbeat_timeout_ms": 500})
+        link = watchdog.heartbeat_monitor._link
+        message = Mock()
+        message.get_type.return_value = "ATTITUDE"
+        message._signed = True
+        
+        unsigned_connection = Mock()
+        unsigned_connection.mav.signing.secret_key = None
+        MavlinkHeartbeatAdapter(watchdog).on_mavlink_message(message)
+        MavlinkHeartbeatAdapter(watchdog, unsigned_connection).on_mavlink_message(message)
+        assert link.implicit_heartbeats == 0
+        
+        signed_connection = Mock()
+        signed_connection.mav.signing.secret_key = b"k" * 32
+        adapter = MavlinkHeartbeatAdapter(watchdog, signed_connection)
+        message._signed = False
+        adapter.on_mavlink_message(message)
+        assert link.implicit_heartbeats == 0
+        message._signed = True
+        adapter.on_mavlink_message(message)
+        assert link.implicit_heartbeats == 1
 
 
 if __name__ == "__main__":
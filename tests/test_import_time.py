@@ -0,0 +1,76 @@
+"""
+Startup import budgets for DART-Planner entry points.
+
+Each module is imported in a fresh interpreter. Eager imports of heavy
+optional dependencies always fail; the wall-clock budgets depend on the
+machine and are opt-in (``DART_IMPORT_BUDGETS=1``).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import dart_planner
+from dart_planner.utils.import_time import (
+    DEFAULT_BUDGETS_MS,
+    ImportProfile,
+    check_budgets,
+    measure_import,
+    parse_importtime,
+)
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     numpy.core
+import time:       200 |        300 |   numpy
+import time:        50 |         50 |     pint.util
+import time:      1000 |       1050 |   pint
+import time:    134640 |     136000 | dart_planner.common.units
+"""
+
+
+def _env():
+    env = os.environ.copy()
+    src = str(Path(dart_planner.__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return env
+
+
+def test_parse_importtime_and_direct_children():
+    profile = ImportProfile("dart_planner.common.units", parse_importtime(SAMPLE))
+    assert profile.total_ms == pytest.approx(136.0)
+    assert [record.name for record in profile.top(5)] == ["pint", "numpy"]
+    assert profile.records[0].depth == 2
+    assert check_budgets([profile], {"dart_planner.common.units": 100.0}) == [
+        "dart_planner.common.units: 136 ms exceeds budget of 100 ms"]
+
+
+@pytest.mark.parametrize("module", sorted(DEFAULT_BUDGETS_MS))
+def test_entry_points_do_not_import_heavy_dependencies(module):
+    assert measure_import(module, env=_env()).heavy_imports() == []
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.environ.get("DART_IMPORT_BUDGETS"),
+                    reason="wall-clock import budgets are opt-in (DART_IMPORT_BUDGETS=1)")
+@pytest.mark.parametrize("module", sorted(DEFAULT_BUDGETS_MS))
+def test_entry_points_stay_within_import_budget(module):
+    profile = measure_import(module, env=_env())
+    assert check_budgets([profile], DEFAULT_BUDGETS_MS) == []
+
+
+def test_builtin_vehicle_io_does_not_depend_on_import_side_effects():
+    code = (
+        "import sys\n"
+        "import dart_planner.hardware\n"
+        "from dart_planner.hardware.vehicle_io import VehicleIOFactory\n"
+        "assert 'dart_planner.hardware.simulated_vehicle_io' not in sys.modules\n"
+        "assert 'simulated' in VehicleIOFactory.list_available()\n"
+        "print(VehicleIOFactory.get_adapter_class('simulated').__name__)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=_env())
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["SimulatedVehicleIO"]
@@ -0,0 +1,165 @@
+import csv
+import logging
+import math
+
+import numpy as np
+import pytest
+
+from dart_planner.common.errors import ConfigurationError
+from dart_planner.utils.monte_carlo_campaign import (
+    CampaignConfig,
+    closed_loop_trial,
+    columnar_path,
+    expand_grid,
+    load_results,
+    main,
+    make_trials,
+    run_campaign,
+)
+
+
+def cheap_trial(params, seed):
+    """Deterministic stand-in for a simulation; module level so it pickles."""
+    rng = np.random.default_rng(seed)
+    value = rng.normal(params["offset"], 1.0)
+    if params.get("explode") and value > params["offset"]:
+        raise RuntimeError("trial blew up")
+    return {"success": bool(value > 0.0), "final_error_m": float(value),
+            "latency_mean_us": 10.0, "latency_p95_us": 20.0, "latency_max_us": 30.0}
+
+
+def _config(tmp_path, **overrides):
+    values = dict(grid={"offset": [-1.0, 0.0, 1.0]}, trials_per_point=4, base_seed=7,
+                  output=tmp_path / "results.csv", workers=0)
+    values.update(overrides)
+    return CampaignConfig(**values)
+
+
+def test_grid_and_seeds_are_deterministic():
+    grid = {"wind_std": [0.0, 1.0], "gain_scale": [0.5, 1.0, 2.0]}
+    points = expand_grid(grid)
+    assert len(points) == 6
+    assert points[0] == {"gain_scale": 0.5, "wind_std": 0.0}
+
+    config = CampaignConfig(grid=grid, trials_per_point=3, base_seed=1)
+    trials = make_trials(config)
+    assert [t.trial_id for t in trials] == list(range(18))
+    assert [t.seed for t in trials] == [t.seed for t in make_trials(config)]
+    assert len({t.seed for t in trials}) == 18
+    assert trials[0].seed != make_trials(CampaignConfig(grid=grid, trials_per_point=3, base_seed=2))[0].seed
+
+    with pytest.raises(ConfigurationError):
+        expand_grid({"wind_std": []})
+
+
+def test_results_do_not_depend_on_worker_count(tmp_path):
+    inline = run_campaign(_config(tmp_path / "inline"), trial_fn=cheap_trial)
+    pooled = run_campaign(_config(tmp_path / "pooled", workers=2), trial_fn=cheap_trial)
+
+    assert inline.completed_trials == pooled.completed_trials == 12
+    a = load_results(tmp_path / "inline" / "results.csv")
+    b = load_results(tmp_path / "pooled" / "results.csv")
+    np.testing.assert_array_equal(a["trial_id"], np.arange(12))
+    np.testing.assert_array_equal(a["final_error_m"], b["final_error_m"])
+    np.testing.assert_array_equal(a["offset"], np.repeat([-1.0, 0.0, 1.0], 4))
+    assert inline.success_rate == pooled.success_rate
+    assert [p["params"]["offset"] for p in inline.per_point] == [-1.0, 0.0, 1.0]
+    assert inline.latency_us["max"] == 30.0
+
+
+def test_resume_only_runs_missing_trials(tmp_path):
+    config = _config(tmp_path)
+    run_campaign(config, trial_fn=cheap_trial)
+    reference = load_results(config.output)
+
+    # Simulate an interrupted run: keep the header and the first five rows
+    with open(config.output, newline="") as f:
+        lines = f.readlines()
+    with open(config.output, "w", newline="") as f:
+        f.writelines(lines[:6])
+
+    summary = run_campaign(config, trial_fn=cheap_trial)
+    assert summary.executed_trials == 7
+    assert summary.completed_trials == 12
+    resumed = load_results(config.output)
+    np.testing.assert_array_equal(resumed["trial_id"], reference["trial_id"])
+    np.testing.assert_array_equal(resumed["final_error_m"], reference["final_error_m"])
+
+    assert run_campaign(config, trial_fn=cheap_trial).executed_trials == 0
+
+
+def test_finished_campaign_writes_columnar_results(tmp_path):
+    config = _config(tmp_path, fixed={"explode": 1.0})
+    run_campaign(config, trial_fn=cheap_trial)
+    journal = load_results(config.output)
+    columns = load_results(columnar_path(config.output))
+
+    assert columnar_path(config.output) == tmp_path / "results.npz"
+    assert set(columns) == set(journal)
+    for name, values in journal.items():
+        assert columns[name].dtype == values.dtype, name
+        np.testing.assert_array_equal(columns[name], values)
+    with np.load(columnar_path(config.output)) as data:
+        assert data["final_error_m"].shape == (12,)
+
+    with pytest.raises(ConfigurationError):
+        run_campaign(_config(tmp_path, output=tmp_path / "results.npz"), trial_fn=cheap_trial)
+
+
+def test_resume_with_different_campaign_is_rejected(tmp_path):
+    run_campaign(_config(tmp_path), trial_fn=cheap_trial)
+    with pytest.raises(ConfigurationError):
+        run_campaign(_config(tmp_path, base_seed=8), trial_fn=cheap_trial)
+
+
+def test_trial_errors_are_recorded_not_raised(tmp_path):
+    config = _config(tmp_path, fixed={"explode": 1.0})
+    summary = run_campaign(config, trial_fn=cheap_trial)
+    results = load_results(config.output)
+    failed = results["error"] != ""
+    assert summary.errors == int(failed.sum()) > 0
+    assert not results["success"][failed].any()
+    assert all(e.startswith("RuntimeError") for e in results["error"][failed])
+
+
+def test_cli_writes_results_and_summary(tmp_path, capsys):
+    output = tmp_path / "cli.csv"
+    code = main(["--param", "offset=0,1", "--trials-per-point", "2", "--workers", "0", "--quiet",
+                 "--trial", f"{__name__}:cheap_trial", "--output", str(output),
+                 "--summary", str(tmp_path / "summary.json")])
+    assert code == 0
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 4 and "offset" in rows[0]
+    assert '"total_trials": 4' in capsys.readouterr().out
+    assert (tmp_path / "summary.json").exists()
+
+
+def test_serial_campaign_restores_package_log_level(tmp_path):
+    logger = logging.getLogger("dart_planner")
+    previous = logger.level
+    logger.setLevel(logging.INFO)
+    try:
+        main(["--param", "offset=0", "--workers", "0", "--quiet",
+              "--trial", f"{__name__}:cheap_trial", "--output", str(tmp_path / "levels.csv")])
+        assert logger.level == logging.INFO
+    finally:
+        logger.setLevel(previous)
+
+
+def test_closed_loop_trial_reaches_goal_in_calm_conditions():
+    result = closed_loop_trial({"duration_s": 5.0, "distance_m": 4.0}, seed=3)
+    assert result["success"], result
+    assert result["final_error_m"] < 0.5
+    assert not result["collided"]
+    assert result["latency_max_us"] > 0.0
+
+
+def test_closed_loop_trial_rejects_unknown_parameters():
+    with pytest.raises(ConfigurationError):
+        closed_loop_trial({"wind_speed": 1.0}, seed=0)
+
+
+def test_closed_loop_trial_with_zero_steps():
+    result = closed_loop_trial({"duration_s": 0.001, "dt": 0.01}, seed=0)
+    assert math.isnan(result["latency_mean_us"])
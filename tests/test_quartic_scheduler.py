@@ -17,6 +17,7 @@ from dart_planner.common.quartic_scheduler import (
     create_control_task, create_planning_task, create_safety_task,
     quartic_scheduler_context
 )
+from dart_planner.common.clock import VirtualClock, run_virtual
 from dart_planner.common.real_time_config import TaskPriority
 from dart_planner.common.errors import SchedulingError
 
@@ -246,6 +247,50 @@ class TestQuarticScheduler:
         # High priority task should be selected
         assert next_task == task2
     
+    def test_find_next_task_earliest_deadline_within_priority(self, scheduler):
+        """Among ready tasks of equal priority the earliest deadline wins."""
+        now = time.perf_counter()
+        for name, lateness in [("late", 0.01), ("later", 0.05), ("latest", 0.02)]:
+            task = QuarticTask(name=name, func=lambda: None, frequency_hz=10.0)
+            scheduler.add_task(task)
+            task.next_execution = now - lateness
+            scheduler.reschedule_task(name)
+        
+        assert scheduler._find_next_task(now).name == "later"
+        
+        # Re-enabling puts a disabled task back in the dispatch order
+        scheduler.disable_task("later")
+        assert scheduler._find_next_task(now).name == "latest"
+        scheduler.enable_task("later")
+        assert scheduler._find_next_task(now).name == "later"
+    
+    def test_invalid_executor_rejected(self):
+        """Only inline, thread and process executors are supported."""
+        with pytest.raises(SchedulingError):
+            QuarticTask(name="bad", func=lambda: None, frequency_hz=10.0, executor="gpu")
+    
+    def test_unpicklable_process_task_rejected(self, scheduler):
+        """Process-executor tasks must have a picklable function."""
+        task = QuarticTask(name="proc", func=lambda: None, frequency_hz=10.0, executor="process")
+        with pytest.raises(SchedulingError, match="cannot be pickled"):
+            scheduler.add_task(task)
+        assert "proc" not in scheduler.tasks
+    
+    def test_direct_priority_change_is_honoured(self, scheduler):
+        """Changing a ready task's priority directly reorders dispatch."""
+        now = time.perf_counter()
+        for name in ("a", "b"):
+            scheduler.add_task(QuarticTask(name=name, func=lambda: None, frequency_hz=10.0))
+            scheduler.tasks[name].next_execution = now - 0.01
+            scheduler.reschedule_task(name)
+        scheduler.tasks["a"].next_execution = now - 0.02
+        scheduler.reschedule_task("a")
+        assert scheduler._find_next_task(now).name == "a"
+        
+        scheduler.tasks["b"].priority = TaskPriority.CRITICAL
+        scheduler.tasks["a"].priority = TaskPriority.LOW
+        assert scheduler._find_next_task(now).name == "b"
+    
     @pytest.mark.asyncio
     async def test_execute_task_sync(self, scheduler, mock_task):
         """Test executing a synchronous task."""
@@ -574,6 +619,62 @@ class TestPerformanceValidation:
             assert stats['missed_deadlines'] > 0
             assert scheduler.total_missed_deadlines > 0
     
+    def test_many_tasks_dispatch_in_virtual_time(self):
+        """Hundreds of tasks each run at their own rate."""
+        clock = VirtualClock()
+        counts = {}
+        
+        async def main():
+            scheduler = QuarticScheduler(enable_monitoring=False, clock=clock)
+            for i in range(300):
+                counts[i] = 0
+                def tick(i=i):
+                    counts[i] += 1
+                scheduler.add_task(QuarticTask(name=f"vehicle_{i}", func=tick,
+                                               frequency_hz=10.0 + (i % 3) * 10.0))
+            await scheduler.start()
+            await clock.sleep(1.0)
+            await scheduler.stop()
+            return scheduler
+        
+        scheduler = run_virtual(main(), clock)
+        for i, count in counts.items():
+            expected = 10 + (i % 3) * 10
+            assert expected <= count <= expected + 1
+        assert scheduler.total_missed_deadlines == 0
+        # Rescheduling leaves stale heap entries behind; they stay bounded
+        assert len(scheduler._release_heap) + len(scheduler._ready_heap) <= 4 * 300 + 64
+    
+    @pytest.mark.asyncio
+    async def test_thread_executor_keeps_loop_responsive(self):
+        """A slow sync task on its own thread does not delay the control task."""
+        async with quartic_scheduler_context(enable_monitoring=False) as scheduler:
+            control_count = 0
+            
+            def control_func():
+                nonlocal control_count
+                control_count += 1
+            
+            scheduler.add_task(create_control_task(control_func, frequency_hz=100.0))
+            scheduler.add_task(QuarticTask(
+                name="slow_planner",
+                func=lambda: time.sleep(0.03),
+                frequency_hz=20.0,
+                deadline_ms=10.0,
+                executor="thread"
+            ))
+            
+            await asyncio.sleep(0.5)
+            
+            stats = scheduler.get_task_stats("slow_planner")
+            assert stats['executor'] == "thread"
+            assert stats['execution_count'] > 0
+            # Deadline accounting sees the offloaded execution time
+            assert stats['missed_deadlines'] > 0
+            assert stats['mean_execution_time_ms'] >= 25.0
+            # Inline, 30 ms of blocking per 50 ms would starve the 100 Hz task
+            assert control_count >= 35
+    
     @pytest.mark.asyncio
     async def test_multiple_tasks_coordination(self):
         """Test coordination between multiple tasks."""
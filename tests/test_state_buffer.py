@@ -232,6 +232,135 @@ class TestThreadSafeStateBuffer:
         assert stats['current_version'] == 0
 
 
+def _fast_state(t, x, yaw=0.0):
+    return FastDroneState(
+        timestamp=t,
+        position=np.array([x, 0.0, 1.0]),
+        velocity=np.array([x, 0.0, 0.0]),
+        attitude=np.array([0.0, 0.0, yaw]),
+    )
+
+
+class TestStateHistory:
+    """Test the timestamped history ring and interpolated lookups."""
+    
+    def test_ring_keeps_most_recent_samples(self):
+        """The ring holds buffer_size samples and evicts the oldest."""
+        buffer = FastDroneStateBuffer(buffer_size=4)
+        for i in range(10):
+            buffer.update_state(_fast_state(float(i), float(i)))
+        
+        history = buffer.get_history()
+        assert [s.timestamp for s in history] == [6.0, 7.0, 8.0, 9.0]
+        assert [s.version for s in history] == [7, 8, 9, 10]
+        assert buffer.get_latest_state().timestamp == 9.0
+        assert buffer.get_statistics()['history_length'] == 4
+    
+    def test_interpolates_between_samples(self):
+        """Positions are lerped and attitude is slerped."""
+        buffer = FastDroneStateBuffer(buffer_size=8)
+        buffer.update_state(_fast_state(1.0, 0.0, yaw=0.0), "a")
+        buffer.update_state(_fast_state(1.1, 1.0, yaw=np.pi / 2), "b")
+        
+        snapshot = buffer.get_state_at_time(1.025)
+        assert snapshot.timestamp == 1.025
+        assert snapshot.version == 2
+        assert snapshot.metadata['interpolated']
+        np.testing.assert_allclose(snapshot.state.position, [0.25, 0.0, 1.0])
+        np.testing.assert_allclose(snapshot.state.velocity, [0.25, 0.0, 0.0])
+        np.testing.assert_allclose(snapshot.state.attitude, [0.0, 0.0, np.pi / 8], atol=1e-12)
+        assert np.linalg.norm(snapshot.state.quaternion) == pytest.approx(1.0)
+        
+        nearest = buffer.get_state_at_time(1.025, interpolate=False)
+        assert nearest.timestamp == 1.0 and nearest.source == "a"
+    
+    def test_interpolates_drone_states_with_units(self):
+        """DroneState histories return DroneState interpolants."""
+        buffer = DroneStateBuffer(buffer_size=4)
+        for t, x in [(0.0, 0.0), (0.1, 2.0)]:
+            buffer.update_state(DroneState(timestamp=t, position=Q_(np.array([x, 0.0, 0.0]), 'm')))
+        
+        snapshot = buffer.get_state_at_time(0.05)
+        assert isinstance(snapshot.state, DroneState)
+        assert snapshot.state.position.to('m').magnitude[0] == pytest.approx(1.0)
+    
+    def test_gap_larger_than_max_age_is_stale(self):
+        """No sample within max_age of the target time yields None."""
+        buffer = FastDroneStateBuffer(buffer_size=4)
+        buffer.update_state(_fast_state(0.0, 0.0))
+        buffer.update_state(_fast_state(1.0, 1.0))
+        
+        assert buffer.get_state_at_time(0.5, max_age=0.1) is None
+        assert buffer.get_state_at_time(0.5, max_age=0.6) is not None
+        assert buffer.get_statistics()['stale_reads'] == 1
+    
+    def test_out_of_order_samples_are_sorted(self):
+        """Late samples are kept; history and lookups are in timestamp order."""
+        buffer = FastDroneStateBuffer(buffer_size=3)
+        buffer.update_state(_fast_state(1.0, 1.0))
+        buffer.update_state(_fast_state(3.0, 3.0))
+        buffer.update_state(_fast_state(2.0, 2.0))
+        assert [s.timestamp for s in buffer.get_history()] == [1.0, 2.0, 3.0]
+        assert buffer.get_latest_state().timestamp == 2.0
+        assert buffer.get_state_at_time(2.5, max_age=1.0).state.position[0] == pytest.approx(2.5)
+        
+        # A full ring evicts the oldest write, not the oldest timestamp
+        buffer.update_state(_fast_state(2.5, 2.5))
+        assert [s.timestamp for s in buffer.get_history()] == [2.0, 2.5, 3.0]
+    
+    def test_backwards_clock_jump_keeps_accepting_samples(self):
+        """After the clock jumps back, new samples still become the latest."""
+        buffer = FastDroneStateBuffer(buffer_size=3)
+        for t in (100.0, 101.0, 102.0):
+            buffer.update_state(_fast_state(t, t))
+        
+        version = buffer.update_state(_fast_state(5.0, 5.0))
+        assert version == 4
+        latest = buffer.get_latest_state()
+        assert latest.timestamp == 5.0 and latest.version == version
+        
+        result = {}
+        waiter = threading.Thread(target=lambda: result.update(snapshot=buffer.wait_for_update(timeout=1.0)))
+        waiter.start()
+        time.sleep(0.01)
+        buffer.update_state(_fast_state(5.01, 5.01))
+        waiter.join()
+        assert result['snapshot'].timestamp == 5.01
+        assert [s.timestamp for s in buffer.get_history()] == [5.0, 5.01, 102.0]
+    
+    def test_concurrent_readers_see_consistent_samples(self):
+        """Readers never observe a torn sample while the writer fills the ring."""
+        buffer = FastDroneStateBuffer(buffer_size=16)
+        errors = []
+        
+        def writer():
+            for i in range(2000):
+                buffer.update_state(_fast_state(i * 0.01, float(i)))
+                if i % 20 == 0:
+                    time.sleep(0.0001)
+        
+        def reader():
+            for _ in range(300):
+                latest = buffer.get_latest_state()
+                if latest is not None:
+                    if abs(latest.state.position[0] - latest.timestamp * 100) > 1e-6:
+                        errors.append(latest)
+                    snapshot = buffer.get_state_at_time(latest.timestamp - 0.005)
+                    if snapshot is not None and \
+                            abs(snapshot.state.position[0] - snapshot.timestamp * 100) > 1e-6:
+                        errors.append(snapshot)
+                time.sleep(0.0001)
+        
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert not errors
+        assert buffer.get_statistics()['reads'] > 0
+
+
 class TestDroneStateBuffer:
     """Test the DroneState-specific buffer."""
     
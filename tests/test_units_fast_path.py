@@ -0,0 +1,54 @@
+"""
+Tests for the cached unit-conversion fast path and DroneState.from_si_arrays.
+"""
+
+import numpy as np
+import pytest
+from pint.errors import DimensionalityError
+
+from dart_planner.common.types import DroneState
+from dart_planner.common.units import Q_, ensure_units, tag_units
+
+
+def test_ensure_units_passes_through_and_converts_with_cached_factors():
+    position = Q_(np.array([1.0, 2.0, 3.0]), 'm')
+    assert ensure_units(position, 'm') is position
+    # Spelling of the expected unit does not matter
+    assert ensure_units(position, 'meter') is position
+
+    assert np.allclose(ensure_units(Q_(np.array([10.0, 20.0]), 'cm'), 'm').magnitude, [0.1, 0.2])
+    for _ in range(2):  # second call hits the cached factor
+        angle = ensure_units(Q_(90.0, 'deg'), 'rad')
+        assert angle.units == 'radian'
+        assert angle.magnitude == pytest.approx(np.pi / 2)
+    # Offset units still go through pint
+    assert ensure_units(Q_(20.0, 'degC'), 'kelvin').magnitude == pytest.approx(293.15)
+
+    with pytest.raises(DimensionalityError, match="DroneState.position"):
+        ensure_units(Q_(1.0, 's'), 'm', 'DroneState.position')
+
+
+def test_tag_units_behaves_like_a_quantity():
+    magnitude = np.array([1.0, 2.0, 3.0])
+    tagged = tag_units(magnitude, 'm/s')
+    assert tagged.magnitude is magnitude
+    assert np.all(tagged == Q_(magnitude, 'm/s'))
+    assert np.allclose((tagged * Q_(2.0, 's')).to('cm').magnitude, [200.0, 400.0, 600.0])
+    assert tag_units(5.0, 'N').to('kN').magnitude == pytest.approx(0.005)
+
+
+def test_from_si_arrays_matches_validated_construction():
+    position = np.array([1.0, -2.0, 3.0])
+    velocity = np.array([0.5, 0.0, -0.5])
+    fast = DroneState.from_si_arrays(1.5, position, velocity, angular_velocity=[0.1, 0.2, 0.3])
+    slow = DroneState(
+        timestamp=1.5,
+        position=Q_(position, 'm'),
+        velocity=Q_(velocity, 'm/s'),
+        angular_velocity=Q_(np.array([0.1, 0.2, 0.3]), 'rad/s'),
+    )
+    for name in ('position', 'velocity', 'attitude', 'angular_velocity'):
+        assert getattr(fast, name).units == getattr(slow, name).units
+        assert np.allclose(getattr(fast, name).magnitude, getattr(slow, name).magnitude)
+    assert np.allclose(fast.to_fast_state().angular_velocity, [0.1, 0.2, 0.3])
+    assert fast.position.magnitude is position